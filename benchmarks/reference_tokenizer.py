@@ -0,0 +1,33 @@
+"""Compiled reference tokenizer vs the character loop it replaced.
+
+Usage: python benchmarks/reference_tokenizer.py [parts]
+
+The character loop lives in tests/test_reference_tokenizer.py, where it
+serves as the equivalence oracle.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import timeit
+from pathlib import Path
+
+from ilograph_cli.core.references import split_reference_list
+
+
+def main(argv: list[str]) -> None:
+    parts = int(argv[0]) if argv else 200
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "tests"))
+    legacy = importlib.import_module("test_reference_tokenizer")._legacy_split_reference_list
+
+    raw = ", ".join(f"../Platform {n}/[Service {n}]/handler({n}, x) *copy{n}" for n in range(parts))
+    assert split_reference_list(raw) == legacy(raw)
+    compiled = min(timeit.repeat(lambda: split_reference_list(raw), number=20, repeat=5)) / 20
+    loop = min(timeit.repeat(lambda: legacy(raw), number=20, repeat=5)) / 20
+    print(f"{parts} parts: compiled {compiled * 1e3:.3f} ms, character loop {loop * 1e3:.3f} ms")
+    print(f"speedup: {loop / compiled:.1f}x")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,74 @@
+"""Per-node cost of the deep-tree walks at two nesting depths.
+
+Usage: python benchmarks/traversal_depth.py [shallow_depth] [deep_depth]
+
+Walks, indexing and validation should cost the same per node however deep
+the tree is; a ratio well above 1 means some step went quadratic in depth.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from ilograph_cli.core.index import DocumentIndex, build_resource_locations
+from ilograph_cli.core.reference_fields import iter_reference_fields
+from ilograph_cli.core.validation_snapshot import ValidationSnapshot
+from ilograph_cli.core.validators import validate_document
+from ilograph_cli.core.yaml_types import YamlMapping
+
+_CHAINS = 2
+_ROUNDS = 3
+
+
+def deep_document(depth: int, chains: int = _CHAINS) -> YamlMapping:
+    resources: list[YamlMapping] = []
+    steps: list[YamlMapping] = []
+    for chain in range(chains):
+        node: YamlMapping = {"id": f"c{chain}-0", "instanceOf": "Base"}
+        step: YamlMapping = {"to": f"c{chain}-0"}
+        resources.append(node)
+        steps.append(step)
+        for level in range(1, depth):
+            child: YamlMapping = {"id": f"c{chain}-{level}", "instanceOf": "Base"}
+            node["children"] = [child]
+            node = child
+            nested: YamlMapping = {"to": f"c{chain}-{level}"}
+            step["subSequence"] = {"steps": [nested]}
+            step = nested
+    return {
+        "resources": resources,
+        "perspectives": [{"id": "Flow", "sequence": {"start": "c0-0", "steps": steps}}],
+    }
+
+
+def walk(document: YamlMapping) -> None:
+    locations = build_resource_locations(document)
+    list(iter_reference_fields(document))
+    index = DocumentIndex(document)
+    index.is_descendant(locations[-1].node, ancestor=locations[0].node)
+    sum(1 for _ in index.explicit_ids_below(locations[0].node))
+    ValidationSnapshot(document)
+    validate_document(document, mode="strict")
+
+
+def per_node_seconds(depth: int) -> float:
+    document = deep_document(depth)
+    best = float("inf")
+    for _ in range(_ROUNDS):
+        started = time.perf_counter()
+        walk(document)
+        best = min(best, time.perf_counter() - started)
+    return best / (depth * _CHAINS)
+
+
+def main(argv: list[str]) -> None:
+    shallow, deep = (int(arg) for arg in argv) if argv else (500, 5_000)
+    costs = {depth: per_node_seconds(depth) for depth in (shallow, deep)}
+    for depth, cost in costs.items():
+        print(f"depth {depth:>6}: {cost * 1e6:8.2f} us/node")
+    print(f"ratio deep/shallow: {costs[deep] / costs[shallow]:.2f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
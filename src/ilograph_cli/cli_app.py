@@ -5,7 +5,8 @@ from __future__ import annotations
 import typer
 from rich.console import Console
 
-from ilograph_cli.cli_support import CliGuard, MutationRunner, handle_error
+from ilograph_cli.cli_options import output_format_option
+from ilograph_cli.cli_support import CliGuard, MutationRunner, OutputSink, handle_error
 from ilograph_cli.commands import alias as alias_commands
 from ilograph_cli.commands import apply as apply_commands
 from ilograph_cli.commands import batch as batch_commands
@@ -31,7 +32,8 @@ def build_app(*, console: Console | None = None) -> typer.Typer:
 
     resolved_console = console or Console()
     guard = CliGuard(console=resolved_console)
-    runner = MutationRunner(console=resolved_console)
+    output = OutputSink(console=resolved_console)
+    runner = MutationRunner(console=resolved_console, output=output)
 
     app = typer.Typer(
         help="Validate and safely mutate Ilograph YAML diagrams.",
@@ -94,11 +96,11 @@ def build_app(*, console: Console | None = None) -> typer.Typer:
     app.add_typer(sequence_app, name="sequence")
     app.add_typer(walkthrough_app, name="walkthrough")
 
-    check_commands.register(app, console=resolved_console, guard=guard)
+    check_commands.register(app, guard=guard, output=output)
     apply_commands.register(app, guard=guard, runner=runner)
     batch_commands.register(app, guard=guard, runner=runner)
-    impact_commands.register(app, console=resolved_console, guard=guard)
-    resolve_commands.register(app, console=resolved_console, guard=guard)
+    impact_commands.register(app, guard=guard, output=output)
+    resolve_commands.register(app, guard=guard, output=output)
     fmt_commands.register(app, console=resolved_console, guard=guard)
 
     rename_commands.register(rename_app, guard=guard, runner=runner)
@@ -106,51 +108,54 @@ def build_app(*, console: Console | None = None) -> typer.Typer:
     group_commands.register(group_app, guard=guard, runner=runner)
     relation_commands.register(
         relation_app,
-        console=resolved_console,
         guard=guard,
         runner=runner,
+        output=output,
     )
     resource_commands.register(resource_app, guard=guard, runner=runner)
     perspective_commands.register(
         perspective_app,
-        console=resolved_console,
         guard=guard,
         runner=runner,
+        output=output,
     )
     context_commands.register(
         context_app,
-        console=resolved_console,
         guard=guard,
         runner=runner,
+        output=output,
     )
     alias_commands.register(
         alias_app,
-        console=resolved_console,
         guard=guard,
         runner=runner,
+        output=output,
     )
     override_commands.register(
         override_app,
-        console=resolved_console,
         guard=guard,
         runner=runner,
+        output=output,
     )
     sequence_commands.register(
         sequence_app,
-        console=resolved_console,
         guard=guard,
         runner=runner,
+        output=output,
     )
     walkthrough_commands.register(
         walkthrough_app,
-        console=resolved_console,
         guard=guard,
         runner=runner,
+        output=output,
     )
 
     @app.callback()
-    def main_callback() -> None:
-        """Typer callback placeholder."""
+    def main_callback(output_format: str | None = output_format_option) -> None:
+        """Apply global options."""
+
+        with guard:
+            output.select_format(output_format)
 
     return app
 
@@ -41,3 +41,12 @@ diff_mode_option = typer.Option(
     "--diff",
     help="Diff output mode: full | summary | none (default: summary).",
 )
+
+output_format_option = typer.Option(
+    None,
+    "--format",
+    help=(
+        "Output format for listings and diffs: table | plain | tsv | ndjson "
+        "(default: table on a terminal, plain otherwise)."
+    ),
+)
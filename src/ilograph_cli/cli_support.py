@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Iterable, Mapping
 from contextlib import AbstractContextManager
 from dataclasses import dataclass
+from itertools import chain, islice
 from pathlib import Path
 from types import TracebackType
 from typing import Literal, NoReturn, cast
@@ -13,34 +14,57 @@ import typer
 from pydantic import BaseModel
 from pydantic import ValidationError as PydanticValidationError
 from rich.console import Console
-from ruamel.yaml.comments import CommentedMap
+from rich.table import Table
+from ruamel.yaml.comments import CommentedMap, CommentedSeq
 
 from ilograph_cli.core.errors import ValidationError
-from ilograph_cli.core.validators import validate_document
+from ilograph_cli.core.validation_snapshot import ValidationSnapshot
+from ilograph_cli.core.validators import (
+    WRITE_EXEMPT_RULES,
+    UnitKey,
+    ValidationIssue,
+    validate_document,
+)
+from ilograph_cli.core.yaml_types import YamlMapping
 from ilograph_cli.io.diff import (
     SectionDiff,
-    build_unified_diff,
+    build_diff,
     print_diff,
-    summarize_diff,
-    summarize_touched_sections,
 )
+from ilograph_cli.io.output import (
+    MACHINE_FORMATS,
+    OUTPUT_FORMATS,
+    OutputFormat,
+    TableView,
+    table_lines,
+    write_lines,
+)
+from ilograph_cli.io.parse_cache import (
+    cache_directory,
+    load_validation_cached,
+    parse_text_cached,
+    store_document_cached,
+)
+from ilograph_cli.io.yaml_incremental import emit_document
 from ilograph_cli.io.yaml_io import (
+    ScannedSource,
+    YamlFormatProfile,
     detect_format_profile,
-    dump_document,
     file_lock,
-    load_document,
-    read_text,
+    parse_document,
+    read_text_fingerprinted,
+    scan_source,
     write_text_atomic,
 )
-from ilograph_cli.io.yaml_style import (
-    restore_document_anchors,
-    restore_style_only_replacements,
-    snapshot_document_anchors,
-)
+from ilograph_cli.io.yaml_sections import ScopedSource, SectionScope, split_scoped_source
+from ilograph_cli.io.yaml_style import restore_document_anchors, snapshot_document_anchors
+from ilograph_cli.io.yaml_tracking import SectionLayout, track_mutations
 
 type DiffMode = Literal["full", "summary", "none"]
 Mutator = Callable[[CommentedMap], bool | None]
 
+_WRITE_PREVIEW_LIMIT = 8
+
 
 def validate_payload[TModel: BaseModel](
     model_type: type[TModel], payload: Mapping[str, object]
@@ -89,11 +113,72 @@ class CliGuard(AbstractContextManager[None]):
         handle_error(self.console, exc)
 
 
+@dataclass(slots=True)
+class OutputSink:
+    """Routes listings and diffs to rich rendering or plain buffered stdout lines."""
+
+    console: Console
+    requested_format: OutputFormat | None = None
+
+    def select_format(self, raw: str | None) -> None:
+        """Apply the global `--format` value; `None` auto-selects per stdout."""
+
+        self.requested_format = None if raw is None else _normalize_output_format(raw)
+
+    @property
+    def format(self) -> OutputFormat:
+        if self.requested_format is not None:
+            return self.requested_format
+        return "table" if self.console.is_terminal else "plain"
+
+    def note(self, message: str) -> None:
+        """Print a human-facing message; machine formats stay row-only."""
+
+        if self.format not in MACHINE_FORMATS:
+            self.console.print(message)
+
+    def print_table(
+        self,
+        view: TableView,
+        *,
+        footer: str | None = None,
+        no_truncate: bool = False,
+    ) -> None:
+        """Render `view` in the selected format."""
+
+        output_format = self.format
+        if output_format != "table":
+            lines = table_lines(view, output_format)
+            if footer is not None and output_format == "plain":
+                lines = chain(lines, (footer,))
+            write_lines(self.console.file, lines)
+            return
+
+        overflow_mode: Literal["ignore", "fold"] = "ignore" if no_truncate else "fold"
+        table = Table(title=view.title)
+        for column in view.columns:
+            table.add_column(column, overflow=overflow_mode, no_wrap=no_truncate)
+        for row in view.rows:
+            table.add_row(*row)
+        self.console.print(table)
+        if footer is not None:
+            self.console.print(footer)
+
+    def print_diff(self, lines: Iterable[str]) -> None:
+        """Print unified diff lines, colored only for the table format."""
+
+        if self.format == "table":
+            print_diff(self.console, lines)
+            return
+        write_lines(self.console.file, lines)
+
+
 @dataclass(slots=True)
 class MutationRunner:
     """Reusable read/mutate/diff/write flow for mutating commands."""
 
     console: Console
+    output: OutputSink
     diff_preview_limit: int = 120
     lock_wait_seconds: float = 0.0
 
@@ -104,7 +189,10 @@ class MutationRunner:
         dry_run: bool,
         diff_mode: str,
         mutator: Mutator,
+        scope: SectionScope | None = None,
     ) -> None:
+        """Run mutation; `scope` lets it load/re-emit only the sections it touches."""
+
         normalized_diff_mode = _normalize_diff_mode(diff_mode)
         if dry_run:
             self._run_once(
@@ -112,6 +200,7 @@ class MutationRunner:
                 dry_run=True,
                 diff_mode=normalized_diff_mode,
                 mutator=mutator,
+                scope=scope,
             )
             return
 
@@ -121,6 +210,7 @@ class MutationRunner:
                 dry_run=False,
                 diff_mode=normalized_diff_mode,
                 mutator=mutator,
+                scope=scope,
             )
 
     def _run_once(
@@ -130,20 +220,26 @@ class MutationRunner:
         dry_run: bool,
         diff_mode: DiffMode,
         mutator: Mutator,
+        scope: SectionScope | None,
     ) -> None:
-        before = read_text(file_path)
-        format_profile = detect_format_profile(before)
-        document = load_document(file_path, format_profile=format_profile)
-        anchor_snapshot = snapshot_document_anchors(document)
-        changed_hint = mutator(document)
-        if changed_hint is False:
+        before, fingerprint = read_text_fingerprinted(file_path)
+        scanned = scan_source(before)
+        result: _MutationResult | None = None
+        if scope is not None:
+            result = _mutate_scoped(
+                before,
+                file_path=file_path,
+                format_profile=scanned.format_profile,
+                mutator=mutator,
+                scope=scope,
+            )
+        if result is None:
+            result = _mutate_full(before, file_path=file_path, scanned=scanned, mutator=mutator)
+        if result.after is None:
             self.console.print("no changes (document already matches requested state)")
             return
 
-        restore_document_anchors(document, anchor_snapshot)
-        _ensure_document_valid_for_write(document)
-        after = dump_document(document, format_profile=format_profile)
-        after = restore_style_only_replacements(before, after)
+        after = result.after
         changed = self._render_diff(before, after, file_path, diff_mode=diff_mode)
         if not changed:
             return
@@ -151,7 +247,14 @@ class MutationRunner:
             self.console.print("dry-run: changes were not written")
             return
 
-        write_text_atomic(file_path, after, expected_before=before)
+        write_text_atomic(file_path, after, expected=fingerprint)
+        store_document_cached(
+            file_path,
+            after,
+            result.document,
+            format_profile=detect_format_profile(after),
+            validation=result.validation,
+        )
         self.console.print(f"updated: {file_path}")
 
     def _render_diff(self, before: str, after: str, path: Path, *, diff_mode: DiffMode) -> bool:
@@ -159,10 +262,9 @@ class MutationRunner:
             self.console.print("no changes (serialized YAML is unchanged)")
             return False
 
-        diff_lines = build_unified_diff(before, after, str(path))
-        summary = summarize_diff(diff_lines)
-        touched_sections = summarize_touched_sections(before, after)
-        section_summary = _format_touched_sections(touched_sections)
+        diff = build_diff(before, after, str(path))
+        summary = diff.summary()
+        section_summary = _format_touched_sections(diff.touched_sections())
 
         if diff_mode == "none":
             self.console.print(
@@ -171,13 +273,13 @@ class MutationRunner:
             )
             return True
 
-        if diff_mode == "summary" and len(diff_lines) > self.diff_preview_limit:
+        if diff_mode == "summary" and diff.line_count() > self.diff_preview_limit:
             self.console.print(
                 f"diff summary: +{summary.added} -{summary.deleted} "
                 f"({summary.hunks} hunks); {section_summary}; "
                 f"showing first {self.diff_preview_limit} lines"
             )
-            print_diff(self.console, diff_lines[: self.diff_preview_limit])
+            self.output.print_diff(islice(diff.iter_lines(), self.diff_preview_limit))
             self.console.print("... diff truncated (use --diff full to print all)")
             return True
 
@@ -185,10 +287,127 @@ class MutationRunner:
             f"diff summary: +{summary.added} -{summary.deleted} "
             f"({summary.hunks} hunks); {section_summary}"
         )
-        print_diff(self.console, diff_lines)
+        self.output.print_diff(diff.iter_lines())
         return True
 
 
+@dataclass(slots=True)
+class _MutationResult:
+    after: str | None
+    document: YamlMapping
+    validation: ValidationSnapshot | None = None
+
+
+def _mutate_full(
+    before: str,
+    *,
+    file_path: Path,
+    scanned: ScannedSource,
+    mutator: Mutator,
+) -> _MutationResult:
+    format_profile = scanned.format_profile
+    document = parse_document(
+        before,
+        path=file_path,
+        format_profile=format_profile,
+        scanned=scanned,
+    )
+    anchor_snapshot = snapshot_document_anchors(document)
+    layout = SectionLayout(document)
+    with track_mutations() as mutations:
+        changed_hint = mutator(document)
+    # Mutators may report a change that rewrote equal values; skip the dump then.
+    if changed_hint is False or mutations.is_noop():
+        return _MutationResult(after=None, document=document)
+
+    restore_document_anchors(document, anchor_snapshot, mutations=mutations)
+    # An anchored node may sit in several units at once, so nothing is ruled out.
+    touched = None if anchor_snapshot else layout.touched_units(mutations)
+    validation = _validate_for_write(document, file_path=file_path, before=before, touched=touched)
+    after = emit_document(
+        document,
+        before,
+        mutations=mutations,
+        format_profile=format_profile,
+    )
+    return _MutationResult(after=after, document=document, validation=validation)
+
+
+def _mutate_scoped(
+    before: str,
+    *,
+    file_path: Path,
+    format_profile: YamlFormatProfile,
+    mutator: Mutator,
+    scope: SectionScope,
+) -> _MutationResult | None:
+    """Mutate only the scoped sections; None means the full path must run instead."""
+
+    scoped = split_scoped_source(before, scope)
+    if scoped is None:
+        return None
+    editable = scoped.editable_text()
+    try:
+        partial = parse_document(editable, path=file_path, format_profile=format_profile)
+    except ValidationError:
+        return None
+    names = list(partial)
+    if names != scoped.section_names:
+        return None
+    item = partial["perspectives"][0] if scoped.item_index is not None else None
+
+    layout = SectionLayout(partial)
+    with track_mutations() as mutations:
+        changed_hint = mutator(partial)
+    if list(partial) != names:
+        return None
+    if item is not None:
+        items = partial["perspectives"]
+        if not isinstance(items, CommentedSeq) or len(items) != 1 or items[0] is not item:
+            return None
+
+    if changed_hint is False or mutations.is_noop():
+        return _MutationResult(after=None, document=partial)
+
+    document = _merge_scoped_sections(parse_text_cached(file_path, before), partial, scoped)
+    if document is None:
+        return None
+
+    touched = layout.touched_units(mutations)
+    if scoped.item_index is not None:
+        touched = {("perspectives", scoped.item_index)} if touched else set()
+    validation = _validate_for_write(document, file_path=file_path, before=before, touched=touched)
+    edited = emit_document(
+        partial,
+        editable,
+        mutations=mutations,
+        format_profile=format_profile,
+    )
+    after = scoped.splice(edited)
+    if after is None:
+        return None
+    return _MutationResult(after=after, document=document, validation=validation)
+
+
+def _merge_scoped_sections(
+    base: YamlMapping,
+    partial: CommentedMap,
+    scoped: ScopedSource,
+) -> YamlMapping | None:
+    merged = dict(base)
+    if scoped.item_index is None:
+        merged.update(partial)
+        return merged
+
+    perspectives = base.get("perspectives")
+    if not isinstance(perspectives, list) or len(perspectives) != scoped.item_count:
+        return None
+    merged_perspectives = list(perspectives)
+    merged_perspectives[scoped.item_index] = partial["perspectives"][0]
+    merged["perspectives"] = merged_perspectives
+    return merged
+
+
 def _normalize_diff_mode(mode: str) -> DiffMode:
     normalized = mode.strip().lower()
     if normalized not in {"full", "summary", "none"}:
@@ -198,6 +417,15 @@ def _normalize_diff_mode(mode: str) -> DiffMode:
     return cast(DiffMode, normalized)
 
 
+def _normalize_output_format(raw: str) -> OutputFormat:
+    normalized = raw.strip().lower()
+    if normalized not in OUTPUT_FORMATS:
+        raise ValidationError(
+            f"unknown output format: {raw} (expected: {'|'.join(OUTPUT_FORMATS)})"
+        )
+    return normalized
+
+
 def _format_touched_sections(sections: list[SectionDiff]) -> str:
     if not sections:
         return "touched sections: none"
@@ -208,21 +436,65 @@ def _format_touched_sections(sections: list[SectionDiff]) -> str:
     return f"touched sections: {rendered}"
 
 
-def _ensure_document_valid_for_write(document: CommentedMap) -> None:
-    issues = validate_document(document, mode="strict").issues
-    if not issues:
-        return
+def _validate_for_write(
+    document: YamlMapping,
+    *,
+    file_path: Path,
+    before: str,
+    touched: set[UnitKey] | None,
+) -> ValidationSnapshot | None:
+    """Strict check before a write; returns the snapshot to cache with the new text.
+
+    With a cached snapshot of `before` and known `touched` units, only those
+    units (and the perspectives depending on identifiers they define) are
+    re-checked.
+    """
+
+    if cache_directory() is None:
+        _ensure_document_valid_for_write(document)
+        return None
+    snapshot = None if touched is None else load_validation_cached(file_path, before)
+    if (
+        touched is None
+        or snapshot is None
+        or snapshot.mode != "strict"
+        or snapshot.ignore_rules != WRITE_EXEMPT_RULES
+    ):
+        snapshot = ValidationSnapshot(document, mode="strict", ignore_rules=WRITE_EXEMPT_RULES)
+    else:
+        snapshot.update(document, touched)
+    if not snapshot.ok:
+        _raise_invalid_for_write(snapshot.issues(), complete=True)
+    return snapshot
+
+
+def _ensure_document_valid_for_write(document: YamlMapping) -> None:
+    preview_limit = _WRITE_PREVIEW_LIMIT
+    # One past the preview tells "more" apart without validating the rest.
+    result = validate_document(
+        document,
+        mode="strict",
+        ignore_rules=WRITE_EXEMPT_RULES,
+        max_issues=preview_limit + 1,
+    )
+    if result.issues:
+        _raise_invalid_for_write(result.issues, complete=result.complete)
 
-    preview_limit = 8
+
+def _raise_invalid_for_write(issues: list[ValidationIssue], *, complete: bool) -> NoReturn:
+    preview_limit = _WRITE_PREVIEW_LIMIT
+    count = str(len(issues)) if complete else f"{preview_limit}+"
     lines = [
         (
             "mutation would produce invalid document "
-            f"({len(issues)} issue(s), strict mode):"
+            f"({count} issue(s), strict mode):"
         )
     ]
     for issue in issues[:preview_limit]:
         lines.append(f"- {issue.code} at {issue.path}: {issue.message}")
-    if len(issues) > preview_limit:
+    if not complete:
+        lines.append("- ... and more")
+    elif len(issues) > preview_limit:
         lines.append(f"- ... and {len(issues) - preview_limit} more")
     raise ValidationError("\n".join(lines))
 
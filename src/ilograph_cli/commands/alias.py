@@ -4,29 +4,28 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Literal
 
 import typer
-from rich.console import Console
-from rich.table import Table
 from ruamel.yaml.comments import CommentedMap
 
 from ilograph_cli.cli_options import diff_mode_option, file_option
-from ilograph_cli.cli_support import CliGuard, MutationRunner, validate_payload
+from ilograph_cli.cli_support import CliGuard, MutationRunner, OutputSink, validate_payload
 from ilograph_cli.core.arg_models import (
     AliasAddArgs,
     AliasEditArgs,
     AliasRemoveArgs,
     PerspectiveScopeArgs,
 )
-from ilograph_cli.io.yaml_io import load_document
+from ilograph_cli.io.output import TableView
+from ilograph_cli.io.parse_cache import load_document_cached
+from ilograph_cli.io.yaml_sections import scope_perspective
 from ilograph_cli.ops.alias_ops import add_alias, edit_alias, list_aliases, remove_alias
 
 
 def register(
     app: typer.Typer,
     *,
-    console: Console,
+    output: OutputSink,
     guard: CliGuard,
     runner: MutationRunner,
 ) -> None:
@@ -48,7 +47,7 @@ def register(
 
         with guard:
             args = validate_payload(PerspectiveScopeArgs, {"perspective": perspective})
-            document = load_document(file_path)
+            document = load_document_cached(file_path)
             rows = list_aliases(document, perspective=args.perspective)
 
             if json_output:
@@ -62,23 +61,25 @@ def register(
                 return
 
             if not rows:
-                console.print("no aliases")
+                output.note("no aliases")
                 return
 
-            overflow_mode: Literal["ignore", "fold"] = "ignore" if no_truncate else "fold"
-            table = Table(title=f"Aliases: {args.perspective}")
-            table.add_column("Index", overflow=overflow_mode, no_wrap=no_truncate)
-            table.add_column("Alias", overflow=overflow_mode, no_wrap=no_truncate)
-            table.add_column("For", overflow=overflow_mode, no_wrap=no_truncate)
-
+            view = TableView(
+                title=f"Aliases: {args.perspective}",
+                columns=[
+                    "Index",
+                    "Alias",
+                    "For",
+                ],
+            )
             for row in rows:
-                table.add_row(
+                view.add_row(
                     str(row["index"]),
                     str(row["alias"]),
                     str(row["for"] or "-"),
+                    record=row,
                 )
-            console.print(table)
-            console.print(f"total: {len(rows)}")
+            output.print_table(view, footer=f"total: {len(rows)}", no_truncate=no_truncate)
 
     @app.command("add")
     def alias_add_cmd(
@@ -121,6 +122,7 @@ def register(
                 dry_run=dry_run,
                 diff_mode=diff_mode,
                 mutator=mutate,
+                scope=scope_perspective(args.perspective),
             )
 
     @app.command("edit")
@@ -160,6 +162,7 @@ def register(
                 dry_run=dry_run,
                 diff_mode=diff_mode,
                 mutator=mutate,
+                scope=scope_perspective(args.perspective),
             )
 
     @app.command("remove")
@@ -193,4 +196,5 @@ def register(
                 dry_run=dry_run,
                 diff_mode=diff_mode,
                 mutator=mutate,
+                scope=scope_perspective(args.perspective),
             )
@@ -4,26 +4,45 @@ from __future__ import annotations
 
 import json
 from collections import Counter
+from itertools import islice
 from pathlib import Path
 from typing import cast
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
-from ilograph_cli.cli_options import file_option, ignore_rule_option, only_rule_option
-from ilograph_cli.cli_support import CliGuard
+from ilograph_cli.cli_options import ignore_rule_option, only_rule_option
+from ilograph_cli.cli_support import CliGuard, OutputSink
 from ilograph_cli.core.errors import ValidationError
-from ilograph_cli.core.validators import ValidationIssue, ValidationMode, validate_document
-from ilograph_cli.io.yaml_io import load_document
-
-
-def register(app: typer.Typer, *, console: Console, guard: CliGuard) -> None:
+from ilograph_cli.core.validators import (
+    RULES,
+    ValidationIssue,
+    ValidationMode,
+    stream_validation,
+    unknown_rule_names,
+)
+from ilograph_cli.io.output import TableView
+from ilograph_cli.io.parse_cache import load_document_cached
+from ilograph_cli.io.rule_costs import load_rule_costs, store_rule_costs
+
+# Optional here (unlike the shared `file_option`) so `--list-rules` runs without a diagram.
+check_file_option = typer.Option(
+    None,
+    "--file",
+    "-f",
+    help="Path to the Ilograph diagram YAML file.",
+    exists=True,
+    readable=True,
+    dir_okay=False,
+    resolve_path=False,
+)
+
+
+def register(app: typer.Typer, *, guard: CliGuard, output: OutputSink) -> None:
     """Register `check` command."""
 
     @app.command("check")
     def check(
-        file_path: Path = file_option,
+        file_path: Path | None = check_file_option,
         mode: str = typer.Option(
             "ilograph-native",
             "--mode",
@@ -39,44 +58,98 @@ def register(app: typer.Typer, *, console: Console, guard: CliGuard) -> None:
             "--json",
             help="Emit machine-readable JSON (includes summary and issue list).",
         ),
+        ndjson_output: bool = typer.Option(
+            False,
+            "--ndjson",
+            help="Stream one JSON object per issue as found, then a summary object.",
+        ),
+        fail_fast: bool = typer.Option(
+            False,
+            "--fail-fast",
+            help="Stop at the first issue (same as --max-issues 1).",
+        ),
+        max_issues: int | None = typer.Option(
+            None,
+            "--max-issues",
+            help="Stop validating after N issues.",
+        ),
+        list_rules: bool = typer.Option(
+            False,
+            "--list-rules",
+            help="List validation rules with their cost in the last run, then exit.",
+        ),
     ) -> None:
         """Parse + validate document."""
 
         with guard:
+            if list_rules:
+                _print_rules(output, json_output=json_output)
+                return
+            if file_path is None:
+                raise ValidationError("missing --file (required unless --list-rules)")
+
             normalized_mode = mode.strip().lower()
             if normalized_mode not in {"strict", "ilograph-native"}:
                 raise ValidationError(
                     f"unknown mode: {mode} (expected: strict|ilograph-native)"
                 )
 
-            document = load_document(file_path)
-            result = validate_document(document, mode=cast(ValidationMode, normalized_mode))
+            if max_issues is not None and max_issues < 1:
+                raise ValidationError(f"invalid --max-issues: {max_issues} (expected >= 1)")
+            if fail_fast:
+                max_issues = 1
+            if json_output and ndjson_output:
+                raise ValidationError("--json and --ndjson are mutually exclusive")
 
             ignore_rules = _normalize_rule_names(ignore_rule or [])
             only_rules = _normalize_rule_names(only_rule or [])
-            issues = _filter_issues(
-                result.issues,
-                ignore_rules=ignore_rules,
+            # Named rules may be gone or not yet exist; CI invocations keep working.
+            for name in unknown_rule_names(only_rules | ignore_rules):
+                typer.echo(
+                    f"warning: unknown rule: {name} (ignored; see `check --list-rules`)",
+                    err=True,
+                )
+            document = load_document_cached(file_path)
+            run = stream_validation(
+                document,
+                mode=cast(ValidationMode, normalized_mode),
                 only_rules=only_rules,
+                ignore_rules=ignore_rules,
             )
+            found = islice(run, max_issues)
+
+            if ndjson_output:
+                issues = []
+                for issue in found:
+                    issues.append(issue)
+                    typer.echo(json.dumps(_issue_record(issue), ensure_ascii=False))
+            else:
+                issues = list(found)
+            # A cut-short run would record partial costs as if they were the whole.
+            if run.complete:
+                store_rule_costs(run.costs)
             ok = not issues
+            summary = {"total": len(issues), "by_code": _issues_summary(issues)}
+
+            if ndjson_output:
+                final = {
+                    "ok": ok,
+                    "mode": normalized_mode,
+                    "complete": run.complete,
+                    "summary": summary,
+                }
+                typer.echo(json.dumps(final, ensure_ascii=False))
+                if not ok:
+                    raise typer.Exit(code=1)
+                return
 
             if json_output:
                 payload = {
                     "ok": ok,
                     "mode": normalized_mode,
-                    "summary": {
-                        "total": len(issues),
-                        "by_code": _issues_summary(issues),
-                    },
-                    "issues": [
-                        {
-                            "code": issue.code,
-                            "path": issue.path,
-                            "message": issue.message,
-                        }
-                        for issue in issues
-                    ],
+                    "complete": run.complete,
+                    "summary": summary,
+                    "issues": [_issue_record(issue) for issue in issues],
                 }
                 typer.echo(json.dumps(payload, ensure_ascii=False, indent=2))
                 if not ok:
@@ -84,16 +157,17 @@ def register(app: typer.Typer, *, console: Console, guard: CliGuard) -> None:
                 return
 
             if ok:
-                console.print("check ok: 0 issues found")
+                output.note("check ok: 0 issues found")
                 return
 
-            table = Table(title=f"Validation issues ({len(issues)})")
-            table.add_column("Code", overflow="fold")
-            table.add_column("Path", overflow="fold")
-            table.add_column("Message", overflow="fold")
+            shown = f"{len(issues)}" if run.complete else f"first {len(issues)}"
+            view = TableView(
+                title=f"Validation issues ({shown})",
+                columns=["Code", "Path", "Message"],
+            )
             for issue in issues:
-                table.add_row(issue.code, issue.path, issue.message)
-            console.print(table)
+                view.add_row(issue.code, issue.path, issue.message)
+            output.print_table(view)
             raise typer.Exit(code=1)
 
 
@@ -107,20 +181,44 @@ def _normalize_rule_names(raw: list[str]) -> set[str]:
     return names
 
 
-def _filter_issues(
-    issues: list[ValidationIssue],
-    *,
-    ignore_rules: set[str],
-    only_rules: set[str],
-) -> list[ValidationIssue]:
-    filtered: list[ValidationIssue] = []
-    for issue in issues:
-        if only_rules and issue.code not in only_rules:
-            continue
-        if issue.code in ignore_rules:
-            continue
-        filtered.append(issue)
-    return filtered
+def _print_rules(output: OutputSink, *, json_output: bool) -> None:
+    costs = load_rule_costs()
+    view = TableView(
+        title=f"Validation rules ({len(RULES)})",
+        columns=["Rule", "Modes", "Needs", "Last ms", "Last issues", "Summary"],
+    )
+    records: list[dict[str, object]] = []
+    for rule in RULES:
+        cost = costs.get(rule.name)
+        last_ms = None if cost is None else round(cost.seconds * 1000, 3)
+        last_issues = None if cost is None else cost.issues
+        record: dict[str, object] = {
+            "rule": rule.name,
+            "modes": sorted(rule.modes),
+            "needs": sorted(rule.needs),
+            "summary": rule.summary,
+            "lastMs": last_ms,
+            "lastIssues": last_issues,
+        }
+        records.append(record)
+        view.add_row(
+            rule.name,
+            ",".join(sorted(rule.modes)),
+            ",".join(sorted(rule.needs)),
+            "-" if last_ms is None else f"{last_ms:.3f}",
+            "-" if last_issues is None else str(last_issues),
+            rule.summary,
+            record=record,
+        )
+
+    if json_output:
+        typer.echo(json.dumps({"rules": records}, ensure_ascii=False, indent=2))
+        return
+    output.print_table(view)
+
+
+def _issue_record(issue: ValidationIssue) -> dict[str, str]:
+    return {"code": issue.code, "path": issue.path, "message": issue.message}
 
 
 def _issues_summary(issues: list[ValidationIssue]) -> dict[str, int]:
@@ -4,15 +4,12 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Literal
 
 import typer
-from rich.console import Console
-from rich.table import Table
 from ruamel.yaml.comments import CommentedMap
 
 from ilograph_cli.cli_options import diff_mode_option, file_option
-from ilograph_cli.cli_support import CliGuard, MutationRunner, validate_payload
+from ilograph_cli.cli_support import CliGuard, MutationRunner, OutputSink, validate_payload
 from ilograph_cli.core.arg_models import (
     ContextCopyArgs,
     ContextCreateArgs,
@@ -20,7 +17,9 @@ from ilograph_cli.core.arg_models import (
     ContextRenameArgs,
     ContextReorderArgs,
 )
-from ilograph_cli.io.yaml_io import load_document
+from ilograph_cli.io.output import TableView
+from ilograph_cli.io.parse_cache import load_document_cached
+from ilograph_cli.io.yaml_sections import scope_sections
 from ilograph_cli.ops.context_ops import (
     copy_context,
     create_context,
@@ -34,7 +33,7 @@ from ilograph_cli.ops.context_ops import (
 def register(
     app: typer.Typer,
     *,
-    console: Console,
+    output: OutputSink,
     guard: CliGuard,
     runner: MutationRunner,
 ) -> None:
@@ -54,7 +53,7 @@ def register(
         """List contexts."""
 
         with guard:
-            document = load_document(file_path)
+            document = load_document_cached(file_path)
             rows = list_contexts(document)
 
             if json_output:
@@ -68,27 +67,29 @@ def register(
                 return
 
             if not rows:
-                console.print("no contexts")
+                output.note("no contexts")
                 return
 
-            overflow_mode: Literal["ignore", "fold"] = "ignore" if no_truncate else "fold"
-            table = Table(title="Contexts")
-            table.add_column("Index", overflow=overflow_mode, no_wrap=no_truncate)
-            table.add_column("Name", overflow=overflow_mode, no_wrap=no_truncate)
-            table.add_column("Extends", overflow=overflow_mode, no_wrap=no_truncate)
-            table.add_column("Hidden", overflow=overflow_mode, no_wrap=no_truncate)
-            table.add_column("Roots", overflow=overflow_mode, no_wrap=no_truncate)
-
+            view = TableView(
+                title="Contexts",
+                columns=[
+                    "Index",
+                    "Name",
+                    "Extends",
+                    "Hidden",
+                    "Roots",
+                ],
+            )
             for row in rows:
-                table.add_row(
+                view.add_row(
                     str(row["index"]),
                     str(row["name"]),
                     str(row["extends"] or "-"),
                     "yes" if row["hidden"] else "no",
                     "yes" if row["hasRoots"] else "no",
+                    record=row,
                 )
-            console.print(table)
-            console.print(f"total: {len(rows)}")
+            output.print_table(view, footer=f"total: {len(rows)}", no_truncate=no_truncate)
 
     @app.command("create")
     def context_create_cmd(
@@ -135,6 +136,7 @@ def register(
                 dry_run=dry_run,
                 diff_mode=diff_mode,
                 mutator=mutate,
+                scope=scope_sections("contexts"),
             )
 
     @app.command("rename")
@@ -161,6 +163,7 @@ def register(
                 dry_run=dry_run,
                 diff_mode=diff_mode,
                 mutator=mutate,
+                scope=scope_sections("contexts"),
             )
 
     @app.command("delete")
@@ -188,6 +191,7 @@ def register(
                 dry_run=dry_run,
                 diff_mode=diff_mode,
                 mutator=mutate,
+                scope=scope_sections("contexts"),
             )
 
     @app.command("reorder")
@@ -211,6 +215,7 @@ def register(
                 dry_run=dry_run,
                 diff_mode=diff_mode,
                 mutator=mutate,
+                scope=scope_sections("contexts"),
             )
 
     @app.command("copy")
@@ -247,4 +252,5 @@ def register(
                 dry_run=dry_run,
                 diff_mode=diff_mode,
                 mutator=mutate,
+                scope=scope_sections("contexts"),
             )
@@ -4,22 +4,21 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Literal
 
 import typer
-from rich.console import Console
-from rich.table import Table
 from ruamel.yaml.comments import CommentedMap
 
 from ilograph_cli.cli_options import diff_mode_option, file_option
-from ilograph_cli.cli_support import CliGuard, MutationRunner, validate_payload
+from ilograph_cli.cli_support import CliGuard, MutationRunner, OutputSink, validate_payload
 from ilograph_cli.core.arg_models import (
     OverrideAddArgs,
     OverrideEditArgs,
     OverrideRemoveArgs,
     PerspectiveScopeArgs,
 )
-from ilograph_cli.io.yaml_io import load_document
+from ilograph_cli.io.output import TableView
+from ilograph_cli.io.parse_cache import load_document_cached
+from ilograph_cli.io.yaml_sections import scope_perspective
 from ilograph_cli.ops.override_ops import (
     add_override,
     edit_override,
@@ -31,7 +30,7 @@ from ilograph_cli.ops.override_ops import (
 def register(
     app: typer.Typer,
     *,
-    console: Console,
+    output: OutputSink,
     guard: CliGuard,
     runner: MutationRunner,
 ) -> None:
@@ -53,7 +52,7 @@ def register(
 
         with guard:
             args = validate_payload(PerspectiveScopeArgs, {"perspective": perspective})
-            document = load_document(file_path)
+            document = load_document_cached(file_path)
             rows = list_overrides(document, perspective=args.perspective)
 
             if json_output:
@@ -67,25 +66,27 @@ def register(
                 return
 
             if not rows:
-                console.print("no overrides")
+                output.note("no overrides")
                 return
 
-            overflow_mode: Literal["ignore", "fold"] = "ignore" if no_truncate else "fold"
-            table = Table(title=f"Overrides: {args.perspective}")
-            table.add_column("Index", overflow=overflow_mode, no_wrap=no_truncate)
-            table.add_column("Resource", overflow=overflow_mode, no_wrap=no_truncate)
-            table.add_column("Parent", overflow=overflow_mode, no_wrap=no_truncate)
-            table.add_column("Scale", overflow=overflow_mode, no_wrap=no_truncate)
-
+            view = TableView(
+                title=f"Overrides: {args.perspective}",
+                columns=[
+                    "Index",
+                    "Resource",
+                    "Parent",
+                    "Scale",
+                ],
+            )
             for row in rows:
-                table.add_row(
+                view.add_row(
                     str(row["index"]),
                     str(row["resourceId"]),
                     str(row["parentId"] or "-"),
                     str(row["scale"] if row["scale"] is not None else "-"),
+                    record=row,
                 )
-            console.print(table)
-            console.print(f"total: {len(rows)}")
+            output.print_table(view, footer=f"total: {len(rows)}", no_truncate=no_truncate)
 
     @app.command("add")
     def override_add_cmd(
@@ -131,6 +132,7 @@ def register(
                 dry_run=dry_run,
                 diff_mode=diff_mode,
                 mutator=mutate,
+                scope=scope_perspective(args.perspective),
             )
 
     @app.command("edit")
@@ -179,6 +181,7 @@ def register(
                 dry_run=dry_run,
                 diff_mode=diff_mode,
                 mutator=mutate,
+                scope=scope_perspective(args.perspective),
             )
 
     @app.command("remove")
@@ -212,4 +215,5 @@ def register(
                 dry_run=dry_run,
                 diff_mode=diff_mode,
                 mutator=mutate,
+                scope=scope_perspective(args.perspective),
             )
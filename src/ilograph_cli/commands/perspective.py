@@ -4,15 +4,12 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Literal
 
 import typer
-from rich.console import Console
-from rich.table import Table
 from ruamel.yaml.comments import CommentedMap
 
 from ilograph_cli.cli_options import diff_mode_option, file_option
-from ilograph_cli.cli_support import CliGuard, MutationRunner, validate_payload
+from ilograph_cli.cli_support import CliGuard, MutationRunner, OutputSink, validate_payload
 from ilograph_cli.core.arg_models import (
     PerspectiveCopyArgs,
     PerspectiveCreateArgs,
@@ -20,7 +17,9 @@ from ilograph_cli.core.arg_models import (
     PerspectiveRenameArgs,
     PerspectiveReorderArgs,
 )
-from ilograph_cli.io.yaml_io import load_document
+from ilograph_cli.io.output import TableView
+from ilograph_cli.io.parse_cache import load_document_cached
+from ilograph_cli.io.yaml_sections import scope_sections
 from ilograph_cli.ops.perspective_ops import (
     copy_perspective,
     create_perspective,
@@ -34,7 +33,7 @@ from ilograph_cli.ops.perspective_ops import (
 def register(
     app: typer.Typer,
     *,
-    console: Console,
+    output: OutputSink,
     guard: CliGuard,
     runner: MutationRunner,
 ) -> None:
@@ -54,7 +53,7 @@ def register(
         """List perspectives."""
 
         with guard:
-            document = load_document(file_path)
+            document = load_document_cached(file_path)
             rows = list_perspectives(document)
 
             if json_output:
@@ -68,21 +67,23 @@ def register(
                 return
 
             if not rows:
-                console.print("no perspectives")
+                output.note("no perspectives")
                 return
 
-            overflow_mode: Literal["ignore", "fold"] = "ignore" if no_truncate else "fold"
-            table = Table(title="Perspectives")
-            table.add_column("Index", overflow=overflow_mode, no_wrap=no_truncate)
-            table.add_column("Identifier", overflow=overflow_mode, no_wrap=no_truncate)
-            table.add_column("Name", overflow=overflow_mode, no_wrap=no_truncate)
-            table.add_column("Extends", overflow=overflow_mode, no_wrap=no_truncate)
-            table.add_column("Orientation", overflow=overflow_mode, no_wrap=no_truncate)
-            table.add_column("Relations", overflow=overflow_mode, no_wrap=no_truncate)
-            table.add_column("Sequence", overflow=overflow_mode, no_wrap=no_truncate)
-
+            view = TableView(
+                title="Perspectives",
+                columns=[
+                    "Index",
+                    "Identifier",
+                    "Name",
+                    "Extends",
+                    "Orientation",
+                    "Relations",
+                    "Sequence",
+                ],
+            )
             for row in rows:
-                table.add_row(
+                view.add_row(
                     str(row["index"]),
                     str(row["identifier"]),
                     str(row["name"] or "-"),
@@ -90,9 +91,9 @@ def register(
                     str(row["orientation"] or "-"),
                     "yes" if row["hasRelations"] else "no",
                     "yes" if row["hasSequence"] else "no",
+                    record=row,
                 )
-            console.print(table)
-            console.print(f"total: {len(rows)}")
+            output.print_table(view, footer=f"total: {len(rows)}", no_truncate=no_truncate)
 
     @app.command("create")
     def perspective_create_cmd(
@@ -142,6 +143,7 @@ def register(
                 dry_run=dry_run,
                 diff_mode=diff_mode,
                 mutator=mutate,
+                scope=scope_sections("perspectives"),
             )
 
     @app.command("rename")
@@ -178,6 +180,7 @@ def register(
                 dry_run=dry_run,
                 diff_mode=diff_mode,
                 mutator=mutate,
+                scope=scope_sections("perspectives"),
             )
 
     @app.command("delete")
@@ -208,6 +211,7 @@ def register(
                 dry_run=dry_run,
                 diff_mode=diff_mode,
                 mutator=mutate,
+                scope=scope_sections("perspectives"),
             )
 
     @app.command("reorder")
@@ -238,6 +242,7 @@ def register(
                 dry_run=dry_run,
                 diff_mode=diff_mode,
                 mutator=mutate,
+                scope=scope_sections("perspectives"),
             )
 
     @app.command("copy")
@@ -281,4 +286,5 @@ def register(
                 dry_run=dry_run,
                 diff_mode=diff_mode,
                 mutator=mutate,
+                scope=scope_sections("perspectives"),
             )
@@ -4,15 +4,13 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Literal, TypedDict
+from typing import TypedDict
 
 import typer
-from rich.console import Console
-from rich.table import Table
-from ruamel.yaml.comments import CommentedMap, CommentedSeq
+from ruamel.yaml.comments import CommentedMap
 
 from ilograph_cli.cli_options import diff_mode_option, file_option
-from ilograph_cli.cli_support import CliGuard, MutationRunner, validate_payload
+from ilograph_cli.cli_support import CliGuard, MutationRunner, OutputSink, validate_payload
 from ilograph_cli.core.arg_models import RelationAddArgs, RelationEditArgs, RelationRemoveArgs
 from ilograph_cli.core.errors import ValidationError
 from ilograph_cli.core.index import build_perspective_locations, get_single_perspective
@@ -22,7 +20,10 @@ from ilograph_cli.core.relation_types import (
     RelationClearField,
     RelationTemplate,
 )
-from ilograph_cli.io.yaml_io import load_document
+from ilograph_cli.core.yaml_types import YamlMapping
+from ilograph_cli.io.output import TableView
+from ilograph_cli.io.parse_cache import load_document_cached
+from ilograph_cli.io.yaml_sections import scope_perspective, scope_sections
 from ilograph_cli.ops.relation_ops import (
     add_relation,
     edit_relation,
@@ -61,7 +62,7 @@ class RelationRow(TypedDict):
 def register(
     app: typer.Typer,
     *,
-    console: Console,
+    output: OutputSink,
     guard: CliGuard,
     runner: MutationRunner,
 ) -> None:
@@ -94,7 +95,7 @@ def register(
         """List perspective relations with filters."""
 
         with guard:
-            document = load_document(file_path)
+            document = load_document_cached(file_path)
             selected_perspectives = _resolve_perspectives(
                 document,
                 _parse_multi_values(perspective),
@@ -121,38 +122,35 @@ def register(
                 return
 
             if not rows:
-                console.print("no relations found")
+                output.note("no relations found")
                 return
 
-            overflow_mode: Literal["ignore", "fold"] = "ignore" if no_truncate else "fold"
-            table = Table(title="Relations")
-            table.add_column("Perspective", overflow=overflow_mode, no_wrap=no_truncate)
-            table.add_column("Index", overflow=overflow_mode, no_wrap=no_truncate)
-            table.add_column("From", overflow=overflow_mode, no_wrap=no_truncate)
-            table.add_column("To", overflow=overflow_mode, no_wrap=no_truncate)
-            table.add_column("Via", overflow=overflow_mode, no_wrap=no_truncate)
-            table.add_column("Label", overflow=overflow_mode, no_wrap=no_truncate)
-            table.add_column("Direction", overflow=overflow_mode, no_wrap=no_truncate)
-            table.add_column("Secondary", overflow=overflow_mode, no_wrap=no_truncate)
-
+            view = TableView(
+                title="Relations",
+                columns=[
+                    "Perspective",
+                    "Index",
+                    "From",
+                    "To",
+                    "Via",
+                    "Label",
+                    "Direction",
+                    "Secondary",
+                ],
+            )
             for row in rows:
-                from_value = row["from_"] or "-"
-                to_value = row["to"] or "-"
-                via_value = row["via"] or "-"
-                label_value = row["label"] or "-"
-                direction_value = row["arrow_direction"] or "-"
-                table.add_row(
+                view.add_row(
                     row["perspective"],
                     str(row["index"]),
-                    from_value,
-                    to_value,
-                    via_value,
-                    label_value,
-                    direction_value,
+                    row["from_"] or "-",
+                    row["to"] or "-",
+                    row["via"] or "-",
+                    row["label"] or "-",
+                    row["arrow_direction"] or "-",
                     str(row["secondary"]),
+                    record=row,
                 )
-            console.print(table)
-            console.print(f"total: {len(rows)}")
+            output.print_table(view, footer=f"total: {len(rows)}", no_truncate=no_truncate)
 
     @app.command("add")
     def relation_add_cmd(
@@ -206,6 +204,7 @@ def register(
                 dry_run=dry_run,
                 diff_mode=diff_mode,
                 mutator=mutate,
+                scope=scope_perspective(args.perspective),
             )
 
     @app.command("remove")
@@ -236,6 +235,7 @@ def register(
                 dry_run=dry_run,
                 diff_mode=diff_mode,
                 mutator=mutate,
+                scope=scope_perspective(args.perspective),
             )
 
     @app.command("remove-match")
@@ -296,6 +296,7 @@ def register(
                 dry_run=dry_run,
                 diff_mode=diff_mode,
                 mutator=mutate,
+                scope=scope_sections("perspectives", "contexts"),
             )
 
     @app.command("edit")
@@ -368,6 +369,7 @@ def register(
                 dry_run=dry_run,
                 diff_mode=diff_mode,
                 mutator=mutate,
+                scope=scope_perspective(args.perspective),
             )
 
     @app.command("edit-match")
@@ -482,11 +484,12 @@ def register(
                 dry_run=dry_run,
                 diff_mode=diff_mode,
                 mutator=mutate,
+                scope=scope_sections("perspectives", "contexts"),
             )
 
 
 def _list_relations(
-    document: CommentedMap,
+    document: YamlMapping,
     selected_perspectives: list[str],
     *,
     filters: RelationTemplate,
@@ -495,11 +498,11 @@ def _list_relations(
     for perspective_id in selected_perspectives:
         perspective = get_single_perspective(document, perspective_id)
         relations = perspective.node.get("relations")
-        if not isinstance(relations, CommentedSeq):
+        if not isinstance(relations, list):
             continue
 
         for index, relation in enumerate(relations, start=1):
-            if not isinstance(relation, CommentedMap):
+            if not isinstance(relation, dict):
                 continue
             if not _relation_matches_filters(relation, filters):
                 continue
@@ -522,7 +525,7 @@ def _list_relations(
     return rows
 
 
-def _relation_matches_filters(relation: CommentedMap, filters: RelationTemplate) -> bool:
+def _relation_matches_filters(relation: YamlMapping, filters: RelationTemplate) -> bool:
     for key, expected in filters.items():
         if key == "secondary":
             actual = relation.get("secondary")
@@ -535,7 +538,7 @@ def _relation_matches_filters(relation: CommentedMap, filters: RelationTemplate)
     return True
 
 
-def _resolve_perspectives(document: CommentedMap, selected: list[str]) -> list[str]:
+def _resolve_perspectives(document: YamlMapping, selected: list[str]) -> list[str]:
     if selected:
         return [get_single_perspective(document, item).identifier for item in selected]
     return [item.identifier for item in build_perspective_locations(document)]
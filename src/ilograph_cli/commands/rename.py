@@ -9,8 +9,33 @@ from ruamel.yaml.comments import CommentedMap
 
 from ilograph_cli.cli_options import diff_mode_option, file_option
 from ilograph_cli.cli_support import CliGuard, MutationRunner, validate_payload
-from ilograph_cli.core.arg_models import RenameResourceArgs, RenameResourceIdArgs
-from ilograph_cli.ops.resource_ops import rename_resource, rename_resource_id
+from ilograph_cli.core.arg_models import (
+    RenameResourceArgs,
+    RenameResourceIdArgs,
+    RenameResourceIdsArgs,
+)
+from ilograph_cli.core.errors import ValidationError
+from ilograph_cli.io.id_mapping import load_id_mapping
+from ilograph_cli.ops.resource_ops import (
+    rename_resource,
+    rename_resource_id,
+    rename_resource_ids,
+)
+
+map_option = typer.Option(
+    None,
+    "--map",
+    help="old=new id pair. Repeat flag or pass comma-separated pairs.",
+)
+
+mapping_file_option = typer.Option(
+    None,
+    "--mapping-file",
+    help="CSV (old,new rows; optional from,to header) or JSON object of old -> new ids.",
+    exists=True,
+    readable=True,
+    dir_okay=False,
+)
 
 
 def register(app: typer.Typer, *, guard: CliGuard, runner: MutationRunner) -> None:
@@ -73,3 +98,51 @@ def register(app: typer.Typer, *, guard: CliGuard, runner: MutationRunner) -> No
                 diff_mode=diff_mode,
                 mutator=mutate,
             )
+
+    @app.command("resource-ids")
+    def rename_resource_ids_cmd(
+        file_path: Path = file_option,
+        pairs: list[str] | None = map_option,
+        mapping_file: Path | None = mapping_file_option,
+        dry_run: bool = typer.Option(
+            False,
+            "--dry-run",
+            help="Preview diff and validation results without writing.",
+        ),
+        diff_mode: str = diff_mode_option,
+    ) -> None:
+        """Rename many resource ids at once + update references (swaps allowed)."""
+
+        with guard:
+            mapping_pairs = _inline_pairs(pairs or [])
+            if mapping_file is not None:
+                mapping_pairs.extend(load_id_mapping(mapping_file))
+            mapping: dict[str, str] = {}
+            for old, new in mapping_pairs:
+                if old in mapping:
+                    raise ValidationError(f"duplicate --from id: {old} (map each id once)")
+                mapping[old] = new
+            args = validate_payload(RenameResourceIdsArgs, {"mapping": mapping})
+
+            def mutate(document: CommentedMap) -> bool:
+                return rename_resource_ids(document, mapping=args.mapping)
+
+            runner.run(
+                file_path=file_path,
+                dry_run=dry_run,
+                diff_mode=diff_mode,
+                mutator=mutate,
+            )
+
+
+def _inline_pairs(raw_pairs: list[str]) -> list[tuple[str, str]]:
+    pairs: list[tuple[str, str]] = []
+    for raw in raw_pairs:
+        for item in raw.split(","):
+            if not item.strip():
+                continue
+            old, separator, new = item.partition("=")
+            if not separator:
+                raise ValidationError(f"invalid --map pair: {item.strip()} (expected old=new)")
+            pairs.append((old.strip(), new.strip()))
+    return pairs
@@ -4,20 +4,18 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Literal
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
 from ilograph_cli.cli_options import file_option
-from ilograph_cli.cli_support import CliGuard
-from ilograph_cli.core.index import get_single_perspective
+from ilograph_cli.cli_support import CliGuard, OutputSink
+from ilograph_cli.core.index import get_single_perspective, get_single_resource_by_id
 from ilograph_cli.core.reference_resolution import resolve_reference
-from ilograph_cli.io.yaml_io import load_document
+from ilograph_cli.io.output import TableView
+from ilograph_cli.io.parse_cache import load_document_cached
 
 
-def register(app: typer.Typer, *, console: Console, guard: CliGuard) -> None:
+def register(app: typer.Typer, *, guard: CliGuard, output: OutputSink) -> None:
     """Register `resolve`/`find` commands."""
 
     @app.command("resolve")
@@ -35,6 +33,11 @@ def register(app: typer.Typer, *, console: Console, guard: CliGuard) -> None:
             "--perspective",
             help="Perspective id/name for alias context.",
         ),
+        relative_to: str | None = typer.Option(
+            None,
+            "--relative-to",
+            help="Resource id that `../` and `.../` paths start from.",
+        ),
         json_output: bool = typer.Option(
             False,
             "--json",
@@ -49,7 +52,7 @@ def register(app: typer.Typer, *, console: Console, guard: CliGuard) -> None:
         """Inspect how a reference expression resolves."""
 
         with guard:
-            document = load_document(file_path)
+            document = load_document_cached(file_path)
             resolved_perspective: str | None = None
             if perspective is not None and perspective.strip():
                 resolved_perspective = get_single_perspective(
@@ -57,10 +60,15 @@ def register(app: typer.Typer, *, console: Console, guard: CliGuard) -> None:
                     perspective.strip(),
                 ).identifier
 
+            anchor = None
+            if relative_to is not None and relative_to.strip():
+                anchor = get_single_resource_by_id(document, relative_to.strip()).node
+
             resolved_perspective, rows = resolve_reference(
                 document,
                 reference=reference,
                 perspective=resolved_perspective,
+                relative_to=anchor,
             )
 
             if json_output:
@@ -80,14 +88,11 @@ def register(app: typer.Typer, *, console: Console, guard: CliGuard) -> None:
                 typer.echo(json.dumps(payload, ensure_ascii=False, indent=2))
                 return
 
-            overflow_mode: Literal["ignore", "fold"] = "ignore" if no_truncate else "fold"
             perspective_label = resolved_perspective if resolved_perspective is not None else "-"
-            table = Table(title=f"Resolve: {reference} (perspective: {perspective_label})")
-            table.add_column("Part", overflow=overflow_mode, no_wrap=no_truncate)
-            table.add_column("Token", overflow=overflow_mode, no_wrap=no_truncate)
-            table.add_column("Status", overflow=overflow_mode, no_wrap=no_truncate)
-            table.add_column("Details", overflow=overflow_mode, no_wrap=no_truncate)
+            view = TableView(
+                title=f"Resolve: {reference} (perspective: {perspective_label})",
+                columns=["Part", "Token", "Status", "Details"],
+            )
             for row in rows:
-                table.add_row(row.part, row.token, row.status, row.details)
-
-            console.print(table)
+                view.add_row(row.part, row.token, row.status, row.details)
+            output.print_table(view, no_truncate=no_truncate)
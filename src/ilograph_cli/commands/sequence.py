@@ -4,22 +4,21 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Literal
 
 import typer
-from rich.console import Console
-from rich.table import Table
 from ruamel.yaml.comments import CommentedMap
 
 from ilograph_cli.cli_options import diff_mode_option, file_option
-from ilograph_cli.cli_support import CliGuard, MutationRunner, validate_payload
+from ilograph_cli.cli_support import CliGuard, MutationRunner, OutputSink, validate_payload
 from ilograph_cli.core.arg_models import (
     PerspectiveScopeArgs,
     SequenceAddArgs,
     SequenceEditArgs,
     SequenceRemoveArgs,
 )
-from ilograph_cli.io.yaml_io import load_document
+from ilograph_cli.io.output import TableView
+from ilograph_cli.io.parse_cache import load_document_cached
+from ilograph_cli.io.yaml_sections import scope_perspective
 from ilograph_cli.ops.sequence_ops import (
     add_sequence_step,
     edit_sequence_step,
@@ -31,7 +30,7 @@ from ilograph_cli.ops.sequence_ops import (
 def register(
     app: typer.Typer,
     *,
-    console: Console,
+    output: OutputSink,
     guard: CliGuard,
     runner: MutationRunner,
 ) -> None:
@@ -53,7 +52,7 @@ def register(
 
         with guard:
             args = validate_payload(PerspectiveScopeArgs, {"perspective": perspective})
-            document = load_document(file_path)
+            document = load_document_cached(file_path)
             rows = list_sequence_steps(document, perspective=args.perspective)
 
             if json_output:
@@ -67,30 +66,32 @@ def register(
                 return
 
             if not rows:
-                console.print("no sequence steps")
+                output.note("no sequence steps")
                 return
 
-            overflow_mode: Literal["ignore", "fold"] = "ignore" if no_truncate else "fold"
-            table = Table(title=f"Sequence: {args.perspective}")
-            table.add_column("Index", overflow=overflow_mode, no_wrap=no_truncate)
-            table.add_column("Action", overflow=overflow_mode, no_wrap=no_truncate)
-            table.add_column("Target", overflow=overflow_mode, no_wrap=no_truncate)
-            table.add_column("Label", overflow=overflow_mode, no_wrap=no_truncate)
-            table.add_column("Bidirectional", overflow=overflow_mode, no_wrap=no_truncate)
-            table.add_column("Color", overflow=overflow_mode, no_wrap=no_truncate)
-
+            view = TableView(
+                title=f"Sequence: {args.perspective}",
+                columns=[
+                    "Index",
+                    "Action",
+                    "Target",
+                    "Label",
+                    "Bidirectional",
+                    "Color",
+                ],
+            )
             for row in rows:
                 action, target = _action_and_target(row)
-                table.add_row(
+                view.add_row(
                     str(row["index"]),
                     action,
                     target,
                     str(row["label"] or "-"),
                     "yes" if row["bidirectional"] else "no",
                     str(row["color"] or "-"),
+                    record=row,
                 )
-            console.print(table)
-            console.print(f"total: {len(rows)}")
+            output.print_table(view, footer=f"total: {len(rows)}", no_truncate=no_truncate)
 
     @app.command("add")
     def sequence_add_cmd(
@@ -161,6 +162,7 @@ def register(
                 dry_run=dry_run,
                 diff_mode=diff_mode,
                 mutator=mutate,
+                scope=scope_perspective(args.perspective),
             )
 
     @app.command("edit")
@@ -230,6 +232,7 @@ def register(
                 dry_run=dry_run,
                 diff_mode=diff_mode,
                 mutator=mutate,
+                scope=scope_perspective(args.perspective),
             )
 
     @app.command("remove")
@@ -260,6 +263,7 @@ def register(
                 dry_run=dry_run,
                 diff_mode=diff_mode,
                 mutator=mutate,
+                scope=scope_perspective(args.perspective),
             )
 
 
@@ -4,22 +4,21 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Literal
 
 import typer
-from rich.console import Console
-from rich.table import Table
 from ruamel.yaml.comments import CommentedMap
 
 from ilograph_cli.cli_options import diff_mode_option, file_option
-from ilograph_cli.cli_support import CliGuard, MutationRunner, validate_payload
+from ilograph_cli.cli_support import CliGuard, MutationRunner, OutputSink, validate_payload
 from ilograph_cli.core.arg_models import (
     PerspectiveScopeArgs,
     WalkthroughAddArgs,
     WalkthroughEditArgs,
     WalkthroughRemoveArgs,
 )
-from ilograph_cli.io.yaml_io import load_document
+from ilograph_cli.io.output import TableView
+from ilograph_cli.io.parse_cache import load_document_cached
+from ilograph_cli.io.yaml_sections import scope_perspective
 from ilograph_cli.ops.walkthrough_ops import (
     add_walkthrough_slide,
     edit_walkthrough_slide,
@@ -31,7 +30,7 @@ from ilograph_cli.ops.walkthrough_ops import (
 def register(
     app: typer.Typer,
     *,
-    console: Console,
+    output: OutputSink,
     guard: CliGuard,
     runner: MutationRunner,
 ) -> None:
@@ -53,7 +52,7 @@ def register(
 
         with guard:
             args = validate_payload(PerspectiveScopeArgs, {"perspective": perspective})
-            document = load_document(file_path)
+            document = load_document_cached(file_path)
             rows = list_walkthrough_slides(document, perspective=args.perspective)
 
             if json_output:
@@ -67,21 +66,23 @@ def register(
                 return
 
             if not rows:
-                console.print("no walkthrough slides")
+                output.note("no walkthrough slides")
                 return
 
-            overflow_mode: Literal["ignore", "fold"] = "ignore" if no_truncate else "fold"
-            table = Table(title=f"Walkthrough: {args.perspective}")
-            table.add_column("Index", overflow=overflow_mode, no_wrap=no_truncate)
-            table.add_column("Text", overflow=overflow_mode, no_wrap=no_truncate)
-            table.add_column("Select", overflow=overflow_mode, no_wrap=no_truncate)
-            table.add_column("Expand", overflow=overflow_mode, no_wrap=no_truncate)
-            table.add_column("Highlight", overflow=overflow_mode, no_wrap=no_truncate)
-            table.add_column("Hide", overflow=overflow_mode, no_wrap=no_truncate)
-            table.add_column("Detail", overflow=overflow_mode, no_wrap=no_truncate)
-
+            view = TableView(
+                title=f"Walkthrough: {args.perspective}",
+                columns=[
+                    "Index",
+                    "Text",
+                    "Select",
+                    "Expand",
+                    "Highlight",
+                    "Hide",
+                    "Detail",
+                ],
+            )
             for row in rows:
-                table.add_row(
+                view.add_row(
                     str(row["index"]),
                     str(row["text"] or "-"),
                     str(row["select"] or "-"),
@@ -89,9 +90,9 @@ def register(
                     str(row["highlight"] or "-"),
                     str(row["hide"] or "-"),
                     str(row["detail"] if row["detail"] is not None else "-"),
+                    record=row,
                 )
-            console.print(table)
-            console.print(f"total: {len(rows)}")
+            output.print_table(view, footer=f"total: {len(rows)}", no_truncate=no_truncate)
 
     @app.command("add")
     def walkthrough_add_cmd(
@@ -146,6 +147,7 @@ def register(
                 dry_run=dry_run,
                 diff_mode=diff_mode,
                 mutator=mutate,
+                scope=scope_perspective(args.perspective),
             )
 
     @app.command("edit")
@@ -215,6 +217,7 @@ def register(
                 dry_run=dry_run,
                 diff_mode=diff_mode,
                 mutator=mutate,
+                scope=scope_perspective(args.perspective),
             )
 
     @app.command("remove")
@@ -245,4 +248,5 @@ def register(
                 dry_run=dry_run,
                 diff_mode=diff_mode,
                 mutator=mutate,
+                scope=scope_perspective(args.perspective),
             )
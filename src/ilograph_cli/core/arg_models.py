@@ -126,6 +126,35 @@ class RenameResourceIdArgs(BaseModel):
         return self
 
 
+class RenameResourceIdsArgs(BaseModel):
+    """Args for rename resource-ids."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    mapping: dict[str, str]
+
+    @model_validator(mode="after")
+    def _validate(self) -> RenameResourceIdsArgs:
+        clean: dict[str, str] = {}
+        for raw_old, raw_new in self.mapping.items():
+            old = normalize_required_str(raw_old, field_name="from")
+            new = validate_resource_id(raw_new, field_name="to")
+            if old == new:
+                raise ValueError(f"--from and --to must be different: {old}")
+            if old in clean:
+                raise ValueError(f"duplicate --from id: {old} (map each id once)")
+            clean[old] = new
+        if not clean:
+            raise ValueError("mapping must include at least one old=new pair")
+        seen: set[str] = set()
+        for new in clean.values():
+            if new in seen:
+                raise ValueError(f"duplicate --to id: {new} (each new id must be unique)")
+            seen.add(new)
+        self.mapping = clean
+        return self
+
+
 class MoveResourceArgs(BaseModel):
     """Args for move resource."""
 
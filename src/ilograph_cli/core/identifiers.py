@@ -0,0 +1,29 @@
+"""Identifier fallbacks shared by resources and perspectives."""
+
+from __future__ import annotations
+
+from ilograph_cli.core.yaml_types import YamlMapping
+
+
+def resource_identifier(resource: YamlMapping) -> str | None:
+    """Resource identifier: id or fallback name."""
+
+    resource_id = resource.get("id")
+    if isinstance(resource_id, str) and resource_id.strip():
+        return resource_id.strip()
+    resource_name = resource.get("name")
+    if isinstance(resource_name, str) and resource_name.strip():
+        return resource_name.strip()
+    return None
+
+
+def perspective_identifier(perspective: YamlMapping) -> str | None:
+    """Perspective identifier: id or fallback name."""
+
+    perspective_id = perspective.get("id")
+    if isinstance(perspective_id, str) and perspective_id.strip():
+        return perspective_id.strip()
+    perspective_name = perspective.get("name")
+    if isinstance(perspective_name, str) and perspective_name.strip():
+        return perspective_name.strip()
+    return None
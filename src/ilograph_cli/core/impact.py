@@ -4,112 +4,129 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from ruamel.yaml.comments import CommentedMap, CommentedSeq
-
-from ilograph_cli.core.index import build_resource_locations, perspective_identifier
-from ilograph_cli.core.reference_fields import ReferenceField, iter_reference_fields
-from ilograph_cli.core.references import contains_identifier
+from ilograph_cli.core.constants import SPECIAL_REFERENCE_TOKENS
+from ilograph_cli.core.identifiers import perspective_identifier
+from ilograph_cli.core.index import ResourceLocation
+from ilograph_cli.core.reference_fields import FieldPath, ReferenceField
+from ilograph_cli.core.reference_index import ReferenceIndex
+from ilograph_cli.core.references import contains_identifier, split_reference_list
+from ilograph_cli.core.resource_tree import ResourceTree
+from ilograph_cli.core.wildcards import compile_wildcard
+from ilograph_cli.core.yaml_types import YamlMapping
 
 
 @dataclass(slots=True)
 class ImpactHit:
-    """Single impact hit."""
+    """Single impact hit; `path` is formatted from `at` on access."""
 
     perspective: str | None
     section: str
-    path: str
+    at: ResourceLocation | ReferenceField | FieldPath
     field: str
     value: str
+    target: str
+
+    @property
+    def path(self) -> str:
+        return str(self.at) if isinstance(self.at, FieldPath) else self.at.path
 
 
 def impact_for_resource(
-    document: CommentedMap,
+    document: YamlMapping,
     resource_id: str,
 ) -> list[ImpactHit]:
-    """Find all references and ownership spots for resource."""
+    """Find all references and ownership spots for resource.
+
+    `target` is the resource path each hit's reference walks to (`-` when it
+    resolves to nothing, e.g. wildcards or unanchored `../` paths).
+    """
 
     hits: list[ImpactHit] = []
+    tree = ResourceTree(document)
+    # Wildcard tokens reach the resource through its id or its name.
+    matchable = {resource_id}
 
-    for location in build_resource_locations(document):
+    for node in tree.lookup(resource_id):
+        location = tree.location(node)
         if location.identifier != resource_id:
             continue
+        name = location.node.get("name")
+        if isinstance(name, str) and name.strip():
+            matchable.add(name.strip())
         perspective = None
         hits.append(
             ImpactHit(
                 perspective=perspective,
                 section="resource",
-                path=location.path,
+                at=location,
                 field="id/name",
                 value=location.identifier,
+                target=location.path,
             )
         )
 
-    for field in iter_reference_fields(document):
-        if not _field_matches(field, resource_id):
-            continue
+    references = ReferenceIndex(document)
+    wildcard_hits = _matching_wildcard_tokens(references, matchable)
+    for field in references.fields_mentioning(resource_id, *wildcard_hits):
         hits.append(
             ImpactHit(
                 perspective=field.perspective,
                 section=field.section,
-                path=field.path,
+                at=field,
                 field=field.key,
                 value=field.value,
+                target=_reference_target(tree, field, resource_id),
             )
         )
 
-    hits.extend(_collect_context_hits(document, resource_id))
+    hits.extend(_collect_perspective_hits(document, resource_id))
     return hits
 
 
-def _field_matches(field: ReferenceField, resource_id: str) -> bool:
-    return contains_identifier(field.value, resource_id)
+def _reference_target(tree: ResourceTree, field: ReferenceField, resource_id: str) -> str:
+    anchor = field.container if field.section == "resource.instanceOf" else None
+    targets: list[str] = []
+    for part in split_reference_list(field.value):
+        if not contains_identifier(part, resource_id):
+            continue
+        resolution = tree.resolve(part, anchor=anchor)
+        targets.extend(tree.location(node).path for node in resolution.nodes)
+    return ", ".join(dict.fromkeys(targets)) or "-"
 
 
-def _collect_context_hits(
-    document: CommentedMap,
+def _matching_wildcard_tokens(references: ReferenceIndex, identifiers: set[str]) -> list[str]:
+    matched: list[str] = []
+    for token in references.tokens():
+        if "*" not in token or "::" in token or token.lower() in SPECIAL_REFERENCE_TOKENS:
+            continue
+        pattern = compile_wildcard(token)
+        if any(pattern.matches(identifier) for identifier in identifiers):
+            matched.append(token)
+    return matched
+
+
+def _collect_perspective_hits(
+    document: YamlMapping,
     resource_id: str,
 ) -> list[ImpactHit]:
     hits: list[ImpactHit] = []
-    contexts = document.get("contexts")
-    if not isinstance(contexts, CommentedSeq):
-        return hits
-
-    for context_index, context in enumerate(contexts):
-        if not isinstance(context, CommentedMap):
-            continue
-        context_id = context.get("id") or context.get("name")
-        if not isinstance(context_id, str):
-            context_id = f"context[{context_index}]"
-        for key, value in context.items():
-            if not isinstance(value, str):
-                continue
-            if not contains_identifier(value, resource_id):
-                continue
-            hits.append(
-                ImpactHit(
-                    perspective=None,
-                    section=f"contexts:{context_id}",
-                    path=f"contexts[{context_index}].{key}",
-                    field=key,
-                    value=value,
-                )
-            )
-
     perspectives = document.get("perspectives")
-    if isinstance(perspectives, CommentedSeq):
+    if isinstance(perspectives, list):
         for perspective_index, perspective in enumerate(perspectives):
-            if not isinstance(perspective, CommentedMap):
+            if not isinstance(perspective, dict):
                 continue
             perspective_id = perspective_identifier(perspective)
             if perspective_id != resource_id:
                 continue
+            at = FieldPath(None, "perspectives", perspective_index)
             hits.append(
                 ImpactHit(
                     perspective=perspective_id,
                     section="perspective",
-                    path=f"perspectives[{perspective_index}]",
+                    at=at,
                     field="id/name",
                     value=perspective_id,
+                    target=str(at),
                 )
             )
 
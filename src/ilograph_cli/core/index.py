@@ -2,24 +2,34 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterator
-from dataclasses import dataclass
+from array import array
+from collections.abc import Iterable, Iterator, KeysView
+from dataclasses import dataclass, field
 
-from ruamel.yaml.comments import CommentedMap, CommentedSeq
+from ruamel.yaml.comments import CommentedSeq
 
 from ilograph_cli.core.errors import ValidationError
+from ilograph_cli.core.identifiers import perspective_identifier, resource_identifier
+from ilograph_cli.core.reference_index import ReferenceIndex
+from ilograph_cli.core.traversal import walk_preorder
+from ilograph_cli.core.yaml_types import YamlMapping, YamlSequence
 
 
 @dataclass(slots=True)
 class ResourceLocation:
-    """Resource node location inside tree."""
+    """Resource node location inside tree; `path` is rebuilt from `tree` on demand."""
 
     identifier: str
-    node: CommentedMap
-    parent: CommentedMap | None
-    container: CommentedSeq
+    node: YamlMapping
+    parent: YamlMapping | None
+    container: YamlSequence
     index: int
-    path: str
+    tree: PreorderTree = field(repr=False, compare=False)
+    order: int = field(repr=False, compare=False)
+
+    @property
+    def path(self) -> str:
+        return self.tree.path(self.order)
 
 
 @dataclass(slots=True)
@@ -27,44 +37,113 @@ class PerspectiveLocation:
     """Perspective location."""
 
     identifier: str
-    node: CommentedMap
+    node: YamlMapping
     index: int
 
 
-def resource_identifier(resource: CommentedMap) -> str | None:
-    """Resource identifier: id or fallback name."""
+class PreorderTree:
+    """Resources of one walk flattened in preorder into parallel `array` buffers.
+
+    A node's order is its preorder enter number and its subtree is
+    `range(order, end)`, so ancestry is an interval test and a path is
+    rebuilt by following parent orders up to a root. Walks only append
+    locations; the buffers are filled in on the first query.
+    """
+
+    __slots__ = ("_depths", "_ends", "_orders", "_parents", "locations", "prefix")
+
+    def __init__(self, prefix: str = "resources") -> None:
+        self.prefix = prefix
+        self.locations: list[ResourceLocation] = []
+        self._orders: dict[int, int] = {}
+        self._parents = array("l")
+        self._depths = array("l")
+        self._ends = array("l")
+
+    def __len__(self) -> int:
+        return len(self.locations)
+
+    def order(self, node: YamlMapping) -> int | None:
+        self._link()
+        return self._orders.get(id(node))
+
+    def parent(self, order: int) -> int:
+        """Parent order, or -1 for a root of the walk."""
+
+        self._link()
+        return self._parents[order]
+
+    def depth(self, order: int) -> int:
+        self._link()
+        return self._depths[order]
+
+    def subtree(self, order: int) -> range:
+        """Orders of the node and everything below it."""
 
-    resource_id = resource.get("id")
-    if isinstance(resource_id, str) and resource_id.strip():
-        return resource_id.strip()
-    resource_name = resource.get("name")
-    if isinstance(resource_name, str) and resource_name.strip():
-        return resource_name.strip()
-    return None
+        return range(order, self._bounds()[order])
 
+    def contains(self, ancestor: int, order: int) -> bool:
+        """Whether `order` sits strictly below `ancestor`."""
 
-def perspective_identifier(perspective: CommentedMap) -> str | None:
-    """Perspective identifier: id or fallback name."""
+        return ancestor < order < self._bounds()[ancestor]
 
-    perspective_id = perspective.get("id")
-    if isinstance(perspective_id, str) and perspective_id.strip():
-        return perspective_id.strip()
-    perspective_name = perspective.get("name")
-    if isinstance(perspective_name, str) and perspective_name.strip():
-        return perspective_name.strip()
-    return None
+    def path(self, order: int) -> str:
+        self._link()
+        positions: list[int] = []
+        while order >= 0:
+            positions.append(self.locations[order].index)
+            order = self._parents[order]
+        return self.prefix + ".children".join(f"[{position}]" for position in reversed(positions))
+
+    def _link(self) -> None:
+        # Parents precede children in preorder, so new locations extend the
+        # buffers without revisiting earlier ones, even mid-walk.
+        orders, parents, depths = self._orders, self._parents, self._depths
+        for location in self.locations[len(parents) :]:
+            orders[id(location.node)] = location.order
+            parent = -1 if location.parent is None else orders.get(id(location.parent), -1)
+            parents.append(parent)
+            depths.append(depths[parent] + 1 if parent >= 0 else 0)
+
+    def _bounds(self) -> array[int]:
+        if len(self._ends) != len(self.locations):
+            self._link()
+            ends = array("l", range(1, len(self.locations) + 1))
+            for order in reversed(range(len(self.locations))):
+                parent = self._parents[order]
+                if parent >= 0 and ends[order] > ends[parent]:
+                    ends[parent] = ends[order]
+            self._ends = ends
+        return self._ends
 
 
 def iter_resources(
-    resources: CommentedSeq,
+    resources: YamlSequence,
     *,
-    parent: CommentedMap | None = None,
+    parent: YamlMapping | None = None,
     path_prefix: str = "resources",
+    indexes: Iterable[int] | None = None,
 ) -> Iterator[ResourceLocation]:
-    """Depth-first resource iterator with structural metadata."""
+    """Depth-first resource iterator with structural metadata.
+
+    `indexes` limits the walk to those items of `resources` (and their subtrees).
+    Every yielded location shares one `PreorderTree` of the walk so far.
+    """
+
+    tree = PreorderTree(path_prefix)
+    items = enumerate(resources) if indexes is None else ((i, resources[i]) for i in indexes)
+    return walk_preorder(_resource_level(tree, resources, parent, items), _child_level)
+
 
-    for index, raw in enumerate(resources):
-        if not isinstance(raw, CommentedMap):
+def _resource_level(
+    tree: PreorderTree,
+    container: YamlSequence,
+    owner: YamlMapping | None,
+    items: Iterator[tuple[int, object]],
+) -> Iterator[ResourceLocation]:
+    locations = tree.locations
+    for index, raw in items:
+        if not isinstance(raw, dict):
             continue
         identifier = resource_identifier(raw)
         if identifier is None:
@@ -72,28 +151,40 @@ def iter_resources(
         location = ResourceLocation(
             identifier=identifier,
             node=raw,
-            parent=parent,
-            container=resources,
+            parent=owner,
+            container=container,
             index=index,
-            path=f"{path_prefix}[{index}]",
+            tree=tree,
+            order=len(locations),
         )
+        locations.append(location)
         yield location
-        children = raw.get("children")
-        if isinstance(children, CommentedSeq):
-            child_prefix = f"{location.path}.children"
-            yield from iter_resources(children, parent=raw, path_prefix=child_prefix)
 
 
-def build_resource_locations(document: CommentedMap) -> list[ResourceLocation]:
+def _child_level(location: ResourceLocation) -> Iterator[ResourceLocation] | None:
+    children = location.node.get("children")
+    if not isinstance(children, list):
+        return None
+    return _resource_level(location.tree, children, location.node, enumerate(children))
+
+
+def _resource_children(node: YamlMapping) -> Iterator[YamlMapping] | None:
+    children = node.get("children")
+    if not isinstance(children, list):
+        return None
+    return (child for child in children if isinstance(child, dict))
+
+
+def build_resource_locations(document: YamlMapping) -> list[ResourceLocation]:
     """Collect all resource locations."""
 
     resources = document.get("resources")
-    if not isinstance(resources, CommentedSeq):
+    if not isinstance(resources, list):
         return []
     return list(iter_resources(resources))
 
 
-def build_resource_index(document: CommentedMap) -> dict[str, list[ResourceLocation]]:
+def build_resource_index(document: YamlMapping) -> dict[str, list[ResourceLocation]]:
     """Map resource identifier to all locations."""
 
     index: dict[str, list[ResourceLocation]] = {}
@@ -102,7 +193,7 @@ def build_resource_index(document: CommentedMap) -> dict[str, list[ResourceLocat
     return index
 
 
-def build_resource_id_index(document: CommentedMap) -> dict[str, list[ResourceLocation]]:
+def build_resource_id_index(document: YamlMapping) -> dict[str, list[ResourceLocation]]:
     """Map explicit resource ids to all locations."""
 
     index: dict[str, list[ResourceLocation]] = {}
@@ -117,64 +208,40 @@ def build_resource_id_index(document: CommentedMap) -> dict[str, list[ResourceLo
     return index
 
 
-def get_single_resource(document: CommentedMap, identifier: str) -> ResourceLocation:
+def get_single_resource(document: YamlMapping, identifier: str) -> ResourceLocation:
     """Return single resource by identifier or raise."""
 
     index = build_resource_index(document)
-    found = index.get(identifier, [])
-    if not found:
-        raise ValidationError(
-            f"resource not found: {identifier} "
-            "(lookup checks id first, then name)"
-        )
-    if len(found) > 1:
-        paths = ", ".join(item.path for item in found)
-        raise ValidationError(
-            f"resource id not unique: {identifier} ({paths}) "
-            "(set explicit unique ids)"
-        )
-    return found[0]
+    return _single_resource(index.get(identifier, []), identifier)
 
 
-def get_single_resource_by_id(document: CommentedMap, resource_id: str) -> ResourceLocation:
+def get_single_resource_by_id(document: YamlMapping, resource_id: str) -> ResourceLocation:
     """Return single resource by explicit id or raise."""
 
     index = build_resource_id_index(document)
-    found = index.get(resource_id, [])
-    if not found:
-        raise ValidationError(
-            f"resource id not found: {resource_id} "
-            "(expected exact match in resources[].id)"
-        )
-    if len(found) > 1:
-        paths = ", ".join(item.path for item in found)
-        raise ValidationError(
-            f"resource id not unique: {resource_id} ({paths}) "
-            "(set explicit unique ids)"
-        )
-    return found[0]
+    return _single_resource_by_id(index.get(resource_id, []), resource_id)
 
 
-def ensure_children(resource: CommentedMap) -> CommentedSeq:
+def ensure_children(resource: YamlMapping) -> YamlSequence:
     """Ensure `children` list exists and return it."""
 
     children = resource.get("children")
-    if isinstance(children, CommentedSeq):
+    if isinstance(children, list):
         return children
     new_children = CommentedSeq()
     resource["children"] = new_children
     return new_children
 
 
-def build_perspective_locations(document: CommentedMap) -> list[PerspectiveLocation]:
+def build_perspective_locations(document: YamlMapping) -> list[PerspectiveLocation]:
     """Collect perspectives."""
 
     perspectives = document.get("perspectives")
-    if not isinstance(perspectives, CommentedSeq):
+    if not isinstance(perspectives, list):
         return []
     locations: list[PerspectiveLocation] = []
     for index, raw in enumerate(perspectives):
-        if not isinstance(raw, CommentedMap):
+        if not isinstance(raw, dict):
             continue
         identifier = perspective_identifier(raw)
         if identifier is None:
@@ -184,7 +251,7 @@ def build_perspective_locations(document: CommentedMap) -> list[PerspectiveLocat
 
 
 def get_single_perspective(
-    document: CommentedMap,
+    document: YamlMapping,
     identifier: str,
 ) -> PerspectiveLocation:
     """Return unique perspective by id/name."""
@@ -194,6 +261,345 @@ def get_single_perspective(
         for item in build_perspective_locations(document)
         if item.identifier == identifier
     ]
+    return _single_perspective(candidates, identifier)
+
+
+class DocumentIndex:
+    """Resource/perspective lookups built once per transaction.
+
+    Ops that add, move, remove or re-identify resources report it through the
+    `record_*` methods, so later lookups never walk the tree again. Both halves
+    are built lazily on first use. The preorder tree of the first walk answers
+    ancestry and subtree queries until the first structural change.
+    """
+
+    def __init__(self, document: YamlMapping) -> None:
+        self.document = document
+        self._resources_built = False
+        self._by_id: dict[str, list[YamlMapping]] = {}
+        self._by_identifier: dict[str, list[YamlMapping]] = {}
+        self._keys: dict[int, tuple[str | None, str]] = {}
+        self._nodes: dict[int, YamlMapping] = {}
+        self._parents: dict[int, YamlMapping | None] = {}
+        self._containers: dict[int, YamlSequence] = {}
+        self._positions: dict[int, tuple[YamlSequence, dict[int, int]]] = {}
+        self._preorder: PreorderTree | None = None
+        self._perspectives: list[PerspectiveLocation] = []
+        self._perspectives_source: tuple[object, int] | None = None
+        self._references: ReferenceIndex | None = None
+
+    def resource(self, identifier: str) -> ResourceLocation:
+        """Index-backed `get_single_resource`."""
+
+        self._ensure_resources()
+        found = self._locations(self._by_identifier.get(identifier, []))
+        return _single_resource(found, identifier)
+
+    def resource_by_id(self, resource_id: str) -> ResourceLocation:
+        """Index-backed `get_single_resource_by_id`."""
+
+        self._ensure_resources()
+        found = self._locations(self._by_id.get(resource_id, []))
+        return _single_resource_by_id(found, resource_id)
+
+    def has_resource_id(self, resource_id: str) -> bool:
+        self._ensure_resources()
+        return resource_id in self._by_id
+
+    def resource_ids(self) -> KeysView[str]:
+        """Live view of explicit resource ids."""
+
+        self._ensure_resources()
+        return self._by_id.keys()
+
+    def is_descendant(self, node: YamlMapping, *, ancestor: YamlMapping) -> bool:
+        """Whether `node` sits anywhere below `ancestor`."""
+
+        self._ensure_resources()
+        if self._preorder is not None:
+            order = self._preorder.order(node)
+            ancestor_order = self._preorder.order(ancestor)
+            if order is None or ancestor_order is None:
+                return False
+            return self._preorder.contains(ancestor_order, order)
+        current = self._parents.get(id(node))
+        while current is not None:
+            if current is ancestor:
+                return True
+            current = self._parents.get(id(current))
+        return False
+
+    def explicit_ids_below(self, node: YamlMapping) -> Iterator[str]:
+        """Explicit ids of the resources below `node`, in document order."""
+
+        self._ensure_resources()
+        if self._preorder is not None and (order := self._preorder.order(node)) is not None:
+            nodes = self._preorder.locations
+            below = (nodes[item].node for item in self._preorder.subtree(order)[1:])
+        else:
+            children = node.get("children")
+            found = iter_resources(children) if isinstance(children, list) else iter(())
+            below = (location.node for location in found)
+        for item in below:
+            explicit_id = self._keys[id(item)][0]
+            if explicit_id is not None:
+                yield explicit_id
+
+    def perspective(self, identifier: str) -> PerspectiveLocation:
+        """Index-backed `get_single_perspective`."""
+
+        candidates = [
+            item for item in self.perspective_locations() if item.identifier == identifier
+        ]
+        return _single_perspective(candidates, identifier)
+
+    def perspective_locations(self) -> list[PerspectiveLocation]:
+        """Index-backed `build_perspective_locations`."""
+
+        perspectives = self.document.get("perspectives")
+        source = (perspectives, len(perspectives) if isinstance(perspectives, list) else -1)
+        if self._perspectives_source is None or (
+            self._perspectives_source[0] is not source[0]
+            or self._perspectives_source[1] != source[1]
+        ):
+            self._perspectives = build_perspective_locations(self.document)
+            self._perspectives_source = source
+        return self._perspectives
+
+    def references(self) -> ReferenceIndex:
+        """Reverse reference index; rewrite through it so it stays current."""
+
+        if self._references is None:
+            self._references = ReferenceIndex(self.document)
+        return self._references
+
+    def record_added(
+        self,
+        node: YamlMapping,
+        *,
+        parent: YamlMapping | None,
+        container: YamlSequence,
+    ) -> None:
+        """`node` (with its subtree) was inserted into `container`."""
+
+        self._positions.pop(id(container), None)
+        self._preorder = None
+        if _declares_instance_of(node):
+            self._references = None
+        if self._resources_built:
+            self._add_tree(node, parent=parent, container=container)
+
+    def record_removed(self, node: YamlMapping, *, container: YamlSequence) -> None:
+        """`node` (with its subtree) was taken out of `container`."""
+
+        self._positions.pop(id(container), None)
+        self._preorder = None
+        if _declares_instance_of(node):
+            self._references = None
+        if self._resources_built:
+            self._remove_tree(node)
+
+    def record_moved(
+        self,
+        node: YamlMapping,
+        *,
+        parent: YamlMapping | None,
+        container: YamlSequence,
+        previous_container: YamlSequence,
+    ) -> None:
+        """`node` moved from `previous_container` into `container` under `parent`."""
+
+        self._positions.pop(id(previous_container), None)
+        self._positions.pop(id(container), None)
+        self._preorder = None
+        if self._resources_built and id(node) in self._keys:
+            self._parents[id(node)] = parent
+            self._containers[id(node)] = container
+
+    def record_renamed(self, node: YamlMapping) -> None:
+        """`node`'s id or name changed."""
+
+        if not self._resources_built or id(node) not in self._keys:
+            return
+        self._preorder = None
+        parent = self._parents[id(node)]
+        container = self._containers[id(node)]
+        self._unregister(node)
+        identifier = resource_identifier(node)
+        if identifier is not None:
+            self._register(node, identifier, parent=parent, container=container)
+
+    def record_references_changed(self) -> None:
+        """Reference fields were added, removed or edited outside `references()`."""
+
+        self._references = None
+
+    def _ensure_resources(self) -> None:
+        if self._resources_built:
+            return
+        self._resources_built = True
+        locations = build_resource_locations(self.document)
+        self._preorder = locations[0].tree if locations else PreorderTree()
+        for location in locations:
+            self._register(
+                location.node,
+                location.identifier,
+                parent=location.parent,
+                container=location.container,
+            )
+
+    def _add_tree(
+        self,
+        node: YamlMapping,
+        *,
+        parent: YamlMapping | None,
+        container: YamlSequence,
+    ) -> None:
+        identifier = resource_identifier(node)
+        if identifier is None:
+            return
+        self._register(node, identifier, parent=parent, container=container)
+        children = node.get("children")
+        if isinstance(children, list):
+            for location in iter_resources(children, parent=node):
+                self._register(
+                    location.node,
+                    location.identifier,
+                    parent=location.parent,
+                    container=location.container,
+                )
+
+    def _remove_tree(self, node: YamlMapping) -> None:
+        def registered_children(item: YamlMapping) -> Iterator[YamlMapping] | None:
+            children = _resource_children(item)
+            return None if children is None else (c for c in children if id(c) in self._keys)
+
+        roots = (node,) if id(node) in self._keys else ()
+        for item in walk_preorder(roots, registered_children):
+            self._unregister(item)
+
+    def _register(
+        self,
+        node: YamlMapping,
+        identifier: str,
+        *,
+        parent: YamlMapping | None,
+        container: YamlSequence,
+    ) -> None:
+        raw_id = node.get("id")
+        explicit_id = raw_id.strip() if isinstance(raw_id, str) and raw_id.strip() else None
+        key = id(node)
+        self._keys[key] = (explicit_id, identifier)
+        self._nodes[key] = node
+        self._parents[key] = parent
+        self._containers[key] = container
+        self._by_identifier.setdefault(identifier, []).append(node)
+        if explicit_id is not None:
+            self._by_id.setdefault(explicit_id, []).append(node)
+
+    def _unregister(self, node: YamlMapping) -> None:
+        key = id(node)
+        explicit_id, identifier = self._keys.pop(key)
+        del self._nodes[key], self._parents[key], self._containers[key]
+        _discard_node(self._by_identifier, identifier, node)
+        if explicit_id is not None:
+            _discard_node(self._by_id, explicit_id, node)
+
+    def _locations(self, nodes: list[YamlMapping]) -> list[ResourceLocation]:
+        locations = [self._location(node) for node in nodes]
+        if len(locations) > 1 and self._preorder is not None:
+            locations.sort(key=lambda location: location.order)
+        elif len(locations) > 1:
+            locations.sort(key=lambda location: self._tree_position(location.node))
+        return locations
+
+    def _location(self, node: YamlMapping) -> ResourceLocation:
+        if self._preorder is not None and (order := self._preorder.order(node)) is not None:
+            return self._preorder.locations[order]
+        # After a structural change, rebuild just the chain from the root.
+        chain: list[YamlMapping] = []
+        current: YamlMapping | None = node
+        while current is not None:
+            chain.append(current)
+            current = self._parents[id(current)]
+        tree = PreorderTree()
+        for item in reversed(chain):
+            location = ResourceLocation(
+                identifier=self._keys[id(item)][1],
+                node=item,
+                parent=self._parents[id(item)],
+                container=self._containers[id(item)],
+                index=self._position(self._containers[id(item)], item),
+                tree=tree,
+                order=len(tree),
+            )
+            tree.locations.append(location)
+        return tree.locations[-1]
+
+    def _tree_position(self, node: YamlMapping) -> tuple[int, ...]:
+        positions: list[int] = []
+        current: YamlMapping | None = node
+        while current is not None:
+            positions.append(self._position(self._containers[id(current)], current))
+            current = self._parents[id(current)]
+        positions.reverse()
+        return tuple(positions)
+
+    def _position(self, container: YamlSequence, node: YamlMapping) -> int:
+        cached = self._positions.get(id(container))
+        if cached is None or cached[0] is not container:
+            cached = (container, {id(item): index for index, item in enumerate(container)})
+            self._positions[id(container)] = cached
+        return cached[1][id(node)]
+
+
+def _declares_instance_of(node: YamlMapping) -> bool:
+    return any("instanceOf" in item for item in walk_preorder((node,), _resource_children))
+
+
+def _discard_node(mapping: dict[str, list[YamlMapping]], key: str, node: YamlMapping) -> None:
+    nodes = mapping.get(key)
+    if nodes is None:
+        return
+    nodes[:] = [item for item in nodes if item is not node]
+    if not nodes:
+        del mapping[key]
+
+
+def _single_resource(found: list[ResourceLocation], identifier: str) -> ResourceLocation:
+    if not found:
+        raise ValidationError(
+            f"resource not found: {identifier} "
+            "(lookup checks id first, then name)"
+        )
+    if len(found) > 1:
+        paths = ", ".join(item.path for item in found)
+        raise ValidationError(
+            f"resource id not unique: {identifier} ({paths}) "
+            "(set explicit unique ids)"
+        )
+    return found[0]
+
+
+def _single_resource_by_id(found: list[ResourceLocation], resource_id: str) -> ResourceLocation:
+    if not found:
+        raise ValidationError(
+            f"resource id not found: {resource_id} "
+            "(expected exact match in resources[].id)"
+        )
+    if len(found) > 1:
+        paths = ", ".join(item.path for item in found)
+        raise ValidationError(
+            f"resource id not unique: {resource_id} ({paths}) "
+            "(set explicit unique ids)"
+        )
+    return found[0]
+
+
+def _single_perspective(
+    candidates: list[PerspectiveLocation],
+    identifier: str,
+) -> PerspectiveLocation:
     if not candidates:
         raise ValidationError(
             f"perspective not found: {identifier} "
@@ -16,6 +16,7 @@ from ilograph_cli.core.arg_models import (
     RelationRemoveArgs,
     RenameResourceArgs,
     RenameResourceIdArgs,
+    RenameResourceIdsArgs,
     ResourceCloneArgs,
     ResourceCreateArgs,
     ResourceDeleteArgs,
@@ -153,6 +154,18 @@ class RenameResourceIdOp(BaseModel):
         return self
 
 
+class RenameResourceIdsOp(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    op: Literal["rename.resource-ids"]
+    mapping: dict[str, str]
+
+    @model_validator(mode="after")
+    def _validate(self) -> RenameResourceIdsOp:
+        RenameResourceIdsArgs.model_validate({"mapping": self.mapping})
+        return self
+
+
 class MoveResourceOp(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
@@ -474,6 +487,7 @@ Operation = Annotated[
     | ResourceCloneOp
     | RenameResourceOp
     | RenameResourceIdOp
+    | RenameResourceIdsOp
     | MoveResourceOp
     | GroupCreateOp
     | MoveManyOp
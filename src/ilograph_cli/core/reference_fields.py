@@ -3,24 +3,49 @@
 from __future__ import annotations
 
 from collections.abc import Iterator
-from dataclasses import dataclass
-
-from ruamel.yaml.comments import CommentedMap, CommentedSeq
+from dataclasses import dataclass, field
 
 from ilograph_cli.core.constants import WALKTHROUGH_REFERENCE_KEYS
-from ilograph_cli.core.index import perspective_identifier
+from ilograph_cli.core.identifiers import perspective_identifier
+from ilograph_cli.core.traversal import walk_preorder
+from ilograph_cli.core.yaml_types import YamlMapping, YamlSequence
+
+
+@dataclass(slots=True)
+class FieldPath:
+    """One `name[index]` step of a document path, linked to the step that holds it.
+
+    Sibling fields share their steps, and the string is only built when asked for.
+    """
+
+    parent: FieldPath | None = field(repr=False)
+    name: str
+    index: int | None = None
+
+    def __str__(self) -> str:
+        steps: list[str] = []
+        current: FieldPath | None = self
+        while current is not None:
+            index = current.index
+            steps.append(current.name if index is None else f"{current.name}[{index}]")
+            current = current.parent
+        return ".".join(reversed(steps))
 
 
 @dataclass(slots=True)
 class ReferenceField:
-    """Mutable reference-bearing field."""
+    """Mutable reference-bearing field; `path` is `{at}.{key}`, formatted on access."""
 
-    container: CommentedMap
+    container: YamlMapping
     key: str
-    path: str
+    at: FieldPath
     perspective: str | None
     section: str
 
+    @property
+    def path(self) -> str:
+        return f"{self.at}.{self.key}"
+
     @property
     def value(self) -> str:
         raw = self.container.get(self.key)
@@ -30,118 +55,138 @@ class ReferenceField:
 
 
 def iter_reference_fields(
-    document: CommentedMap,
+    document: YamlMapping,
     *,
     include_instance_of: bool = True,
 ) -> Iterator[ReferenceField]:
     """Yield reference-like string fields from document."""
 
     resources = document.get("resources")
-    if isinstance(resources, CommentedSeq):
+    if isinstance(resources, list):
         yield from _iter_resource_reference_fields(
             resources,
-            "resources",
             include_instance_of=include_instance_of,
         )
 
     perspectives = document.get("perspectives")
-    if isinstance(perspectives, CommentedSeq):
+    if isinstance(perspectives, list):
         for index, raw in enumerate(perspectives):
-            if not isinstance(raw, CommentedMap):
+            if not isinstance(raw, dict):
                 continue
             perspective = perspective_identifier(raw)
-            base = f"perspectives[{index}]"
-            yield from _iter_perspective_reference_fields(raw, perspective, base)
+            base = FieldPath(None, "perspectives", index)
+            yield from iter_perspective_reference_fields(raw, perspective, base)
+
+
+def iter_context_fields(document: YamlMapping) -> Iterator[ReferenceField]:
+    """Yield every string value of every context (any of them may name a resource)."""
+
+    contexts = document.get("contexts")
+    if not isinstance(contexts, list):
+        return
+    for index, context in enumerate(contexts):
+        if not isinstance(context, dict):
+            continue
+        context_id = context.get("id") or context.get("name")
+        if not isinstance(context_id, str):
+            context_id = f"context[{index}]"
+        at = FieldPath(None, "contexts", index)
+        for key, value in context.items():
+            if not isinstance(value, str):
+                continue
+            yield ReferenceField(
+                container=context,
+                key=key,
+                at=at,
+                perspective=None,
+                section=f"contexts:{context_id}",
+            )
 
 
 def _iter_resource_reference_fields(
-    resources: CommentedSeq,
-    base_path: str,
+    resources: YamlSequence,
     *,
     include_instance_of: bool,
 ) -> Iterator[ReferenceField]:
-    for index, raw in enumerate(resources):
-        if not isinstance(raw, CommentedMap):
-            continue
-        path = f"{base_path}[{index}]"
+    if not include_instance_of:
+        return
+    for owner, name, index, raw in walk_preorder(
+        _entries(None, "resources", resources),
+        _resource_children,
+    ):
         instance_of = raw.get("instanceOf")
-        if include_instance_of and isinstance(instance_of, str):
+        if isinstance(instance_of, str):
             yield ReferenceField(
                 container=raw,
                 key="instanceOf",
-                path=f"{path}.instanceOf",
+                at=FieldPath(owner, name, index),
                 perspective=None,
                 section="resource.instanceOf",
             )
-        children = raw.get("children")
-        if isinstance(children, CommentedSeq):
-            yield from _iter_resource_reference_fields(
-                children,
-                f"{path}.children",
-                include_instance_of=include_instance_of,
-            )
 
 
-def _iter_perspective_reference_fields(
-    perspective_node: CommentedMap,
+def iter_perspective_reference_fields(
+    perspective_node: YamlMapping,
     perspective: str | None,
-    base_path: str,
+    base: FieldPath,
 ) -> Iterator[ReferenceField]:
+    """Yield reference fields of one perspective (`base` is its own path)."""
+
     relations = perspective_node.get("relations")
-    if isinstance(relations, CommentedSeq):
+    if isinstance(relations, list):
         for index, relation in enumerate(relations):
-            if not isinstance(relation, CommentedMap):
+            if not isinstance(relation, dict):
                 continue
-            relation_path = f"{base_path}.relations[{index}]"
+            at = FieldPath(base, "relations", index)
             for key in ("from", "to", "via"):
                 value = relation.get(key)
                 if isinstance(value, str):
                     yield ReferenceField(
                         container=relation,
                         key=key,
-                        path=f"{relation_path}.{key}",
+                        at=at,
                         perspective=perspective,
                         section="relations",
                     )
 
     overrides = perspective_node.get("overrides")
-    if isinstance(overrides, CommentedSeq):
+    if isinstance(overrides, list):
         for index, override in enumerate(overrides):
-            if not isinstance(override, CommentedMap):
+            if not isinstance(override, dict):
                 continue
-            override_path = f"{base_path}.overrides[{index}]"
+            at = FieldPath(base, "overrides", index)
             for key in ("resourceId", "parentId"):
                 value = override.get(key)
                 if isinstance(value, str):
                     yield ReferenceField(
                         container=override,
                         key=key,
-                        path=f"{override_path}.{key}",
+                        at=at,
                         perspective=perspective,
                         section="overrides",
                     )
 
     aliases = perspective_node.get("aliases")
-    if isinstance(aliases, CommentedSeq):
+    if isinstance(aliases, list):
         for index, alias in enumerate(aliases):
-            if not isinstance(alias, CommentedMap):
+            if not isinstance(alias, dict):
                 continue
             alias_for = alias.get("for")
             if isinstance(alias_for, str):
                 yield ReferenceField(
                     container=alias,
                     key="for",
-                    path=f"{base_path}.aliases[{index}].for",
+                    at=FieldPath(base, "aliases", index),
                     perspective=perspective,
                     section="aliases",
                 )
 
     walkthrough = perspective_node.get("walkthrough")
-    if isinstance(walkthrough, CommentedSeq):
+    if isinstance(walkthrough, list):
         for slide_index, slide in enumerate(walkthrough):
-            if not isinstance(slide, CommentedMap):
+            if not isinstance(slide, dict):
                 continue
-            slide_path = f"{base_path}.walkthrough[{slide_index}]"
+            at = FieldPath(base, "walkthrough", slide_index)
             for key, value in slide.items():
                 if key not in WALKTHROUGH_REFERENCE_KEYS:
                     continue
@@ -149,57 +194,74 @@ def _iter_perspective_reference_fields(
                     yield ReferenceField(
                         container=slide,
                         key=key,
-                        path=f"{slide_path}.{key}",
+                        at=at,
                         perspective=perspective,
                         section="walkthrough",
                     )
 
     sequence = perspective_node.get("sequence")
-    if isinstance(sequence, CommentedMap):
+    if isinstance(sequence, dict):
         start = sequence.get("start")
         if isinstance(start, str):
             yield ReferenceField(
                 container=sequence,
                 key="start",
-                path=f"{base_path}.sequence.start",
+                at=FieldPath(base, "sequence"),
                 perspective=perspective,
                 section="sequence",
             )
         steps = sequence.get("steps")
-        if isinstance(steps, CommentedSeq):
-            yield from _iter_steps_reference_fields(
-                steps,
-                perspective,
-                f"{base_path}.sequence.steps",
-            )
+        if isinstance(steps, list):
+            yield from _iter_steps_reference_fields(steps, perspective, base)
 
 
 def _iter_steps_reference_fields(
-    steps: CommentedSeq,
+    steps: YamlSequence,
     perspective: str | None,
-    base_path: str,
+    base: FieldPath,
 ) -> Iterator[ReferenceField]:
-    for index, step in enumerate(steps):
-        if not isinstance(step, CommentedMap):
-            continue
-        step_path = f"{base_path}[{index}]"
+    for owner, name, index, step in walk_preorder(
+        _entries(base, "sequence.steps", steps),
+        _sub_steps,
+    ):
+        at = FieldPath(owner, name, index)
         for key in ("to", "toAndBack", "toAsync", "restartAt"):
             value = step.get(key)
             if isinstance(value, str):
                 yield ReferenceField(
                     container=step,
                     key=key,
-                    path=f"{step_path}.{key}",
+                    at=at,
                     perspective=perspective,
                     section="sequence",
                 )
 
-        sub_sequence = step.get("subSequence")
-        if isinstance(sub_sequence, CommentedMap):
-            sub_steps = sub_sequence.get("steps")
-            if isinstance(sub_steps, CommentedSeq):
-                yield from _iter_steps_reference_fields(
-                    sub_steps,
-                    perspective,
-                    f"{step_path}.subSequence.steps",
-                )
+
+# Where a nested mapping sits (holder step, list name, index) and the mapping itself;
+# the holder's `FieldPath` is only built for entries that have something below them.
+type _Entry = tuple[FieldPath | None, str, int, YamlMapping]
+
+
+def _entries(owner: FieldPath | None, name: str, items: YamlSequence) -> Iterator[_Entry]:
+    return (
+        (owner, name, index, item) for index, item in enumerate(items) if isinstance(item, dict)
+    )
+
+
+def _resource_children(entry: _Entry) -> Iterator[_Entry] | None:
+    owner, name, index, raw = entry
+    children = raw.get("children")
+    if not isinstance(children, list):
+        return None
+    return _entries(FieldPath(owner, name, index), "children", children)
+
+
+def _sub_steps(entry: _Entry) -> Iterator[_Entry] | None:
+    owner, name, index, step = entry
+    sub_sequence = step.get("subSequence")
+    if not isinstance(sub_sequence, dict):
+        return None
+    sub_steps = sub_sequence.get("steps")
+    if not isinstance(sub_steps, list):
+        return None
+    return _entries(FieldPath(owner, name, index), "subSequence.steps", sub_steps)
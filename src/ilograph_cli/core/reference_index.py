@@ -0,0 +1,123 @@
+"""Reverse index: identifier -> reference fields that mention it."""
+
+from __future__ import annotations
+
+from collections.abc import KeysView, Mapping
+
+from ilograph_cli.core.reference_fields import (
+    ReferenceField,
+    iter_context_fields,
+    iter_reference_fields,
+)
+from ilograph_cli.core.references import (
+    compile_identifier_rewrite,
+    identifier_words,
+    is_identifier_word,
+    parse_reference_components,
+)
+from ilograph_cli.core.yaml_types import YamlMapping
+
+
+class ReferenceIndex:
+    """Reference fields (and context values) of one document, keyed by what they mention.
+
+    Built in one traversal. Fields come back in traversal order: resources and
+    perspectives first, then contexts. Edits made through `replace_identifiers`
+    keep the index current; any other edit to reference fields makes it stale.
+    """
+
+    def __init__(
+        self,
+        document: YamlMapping,
+        *,
+        include_instance_of: bool = True,
+        include_contexts: bool = True,
+    ) -> None:
+        self._fields: list[ReferenceField] = []
+        self._values: list[str] = []
+        # component token -> field positions (`contains_identifier` semantics)
+        self._by_token: dict[str, set[int]] = {}
+        # identifier-character run -> field positions (`replace_reference_identifier` hits)
+        self._by_word: dict[str, set[int]] = {}
+
+        for field in iter_reference_fields(document, include_instance_of=include_instance_of):
+            self._add(field)
+        if include_contexts:
+            for field in iter_context_fields(document):
+                self._add(field)
+
+    def tokens(self) -> KeysView[str]:
+        """Every component token mentioned by at least one field."""
+
+        return self._by_token.keys()
+
+    def fields_mentioning(self, *identifiers: str) -> list[ReferenceField]:
+        """Fields with a reference component equal to any of `identifiers`."""
+
+        positions: set[int] = set()
+        for identifier in identifiers:
+            positions.update(self._by_token.get(identifier, ()))
+        return [self._fields[position] for position in sorted(positions)]
+
+    def replace_identifier(self, old: str, new: str) -> int:
+        """Rewrite `old` to `new` in every field that mentions it; returns fields changed."""
+
+        return self.replace_identifiers({old: new})
+
+    def replace_identifiers(self, mapping: Mapping[str, str]) -> int:
+        """Apply all `old -> new` pairs at once in one pass; returns fields changed."""
+
+        renames = {old: new for old, new in mapping.items() if old != new}
+        if not renames:
+            return 0
+        positions: set[int] = set()
+        for old in renames:
+            if not is_identifier_word(old):
+                positions = set(range(len(self._fields)))
+                break
+            positions.update(self._by_word.get(old, ()))
+
+        rewrite = compile_identifier_rewrite(renames)
+        changed = 0
+        for position in sorted(positions):
+            field = self._fields[position]
+            value = field.container.get(field.key)
+            if not isinstance(value, str):
+                continue
+            updated = rewrite(value)
+            if updated == value:
+                continue
+            field.container[field.key] = updated
+            self._unkey(position)
+            self._key(position, updated)
+            changed += 1
+        return changed
+
+    def _add(self, field: ReferenceField) -> None:
+        position = len(self._fields)
+        self._fields.append(field)
+        self._values.append("")
+        self._key(position, field.value)
+
+    def _key(self, position: int, value: str) -> None:
+        self._values[position] = value
+        for component in parse_reference_components(value):
+            self._by_token.setdefault(component.token, set()).add(position)
+        for word in identifier_words(value):
+            self._by_word.setdefault(word, set()).add(position)
+
+    def _unkey(self, position: int) -> None:
+        value = self._values[position]
+        for component in parse_reference_components(value):
+            _discard(self._by_token, component.token, position)
+        for word in identifier_words(value):
+            _discard(self._by_word, word, position)
+
+
+def _discard(keyed: dict[str, set[int]], key: str, position: int) -> None:
+    positions = keyed.get(key)
+    if positions is None:
+        return
+    positions.discard(position)
+    if not positions:
+        del keyed[key]
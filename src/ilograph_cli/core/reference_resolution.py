@@ -5,15 +5,22 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Literal
 
-from ruamel.yaml.comments import CommentedMap, CommentedSeq
-
-from ilograph_cli.core.index import build_resource_locations, perspective_identifier
-from ilograph_cli.core.references import parse_reference_components, split_reference_list
+from ilograph_cli.core.identifiers import perspective_identifier
+from ilograph_cli.core.references import (
+    ReferenceComponent,
+    parse_reference_components,
+    split_reference_list,
+)
+from ilograph_cli.core.resource_tree import ResourceTree
+from ilograph_cli.core.wildcards import WildcardIndex
+from ilograph_cli.core.yaml_types import YamlMapping
 
 ResolveStatus = Literal[
     "resolved",
+    "relative",
     "special",
     "wildcard",
+    "unmatched-wildcard",
     "alias",
     "imported-namespace",
     "unresolved-namespace",
@@ -32,16 +39,22 @@ class ResolveRow:
 
 
 def resolve_reference(
-    document: CommentedMap,
+    document: YamlMapping,
     *,
     reference: str,
     perspective: str | None,
+    relative_to: YamlMapping | None = None,
 ) -> tuple[str | None, list[ResolveRow]]:
-    """Resolve reference expression into per-token status rows."""
+    """Resolve reference expression into per-token status rows.
+
+    Paths walk the resource tree one child lookup per component; `../` and
+    `.../` parts start from `relative_to` and stay `relative` without it.
+    """
 
-    resource_index = _collect_resource_reference_index(document)
+    tree = ResourceTree(document)
     aliases = _resolve_aliases_for_perspective(document, perspective)
     import_namespaces = _collect_import_namespaces(document)
+    wildcards: WildcardIndex | None = None
 
     rows: list[ResolveRow] = []
     parts = split_reference_list(reference)
@@ -55,6 +68,10 @@ def resolve_reference(
             rows.append(ResolveRow(part=part, token="-", status="empty", details="-"))
             continue
 
+        if all(_is_tree_component(component, aliases) for component in components):
+            rows.extend(_path_rows(tree, part, components, relative_to))
+            continue
+
         for component in components:
             token = component.token
             status: ResolveStatus = "resolved"
@@ -62,8 +79,19 @@ def resolve_reference(
 
             if component.special:
                 status = "special"
-            elif component.wildcard:
-                status = "wildcard"
+            elif component.wildcard and not component.namespaced:
+                if wildcards is None:
+                    wildcards = WildcardIndex(tree.identifiers())
+                matched = [
+                    tree.location(node).path
+                    for identifier in wildcards.matches(token)
+                    for node in tree.lookup(identifier)
+                ]
+                if matched:
+                    status = "wildcard"
+                    details = ", ".join(dict.fromkeys(matched))
+                else:
+                    status = "unmatched-wildcard"
             elif token in aliases:
                 status = "alias"
                 details = aliases[token]
@@ -74,14 +102,7 @@ def resolve_reference(
                 else:
                     status = "unresolved-namespace"
             else:
-                paths = resource_index.get(token, [])
-                if not paths:
-                    status = "unresolved"
-                elif len(paths) > 1:
-                    status = "ambiguous"
-                    details = ", ".join(paths)
-                else:
-                    details = paths[0]
+                status, details = _nodes_status(tree, tree.lookup(token))
 
             rows.append(
                 ResolveRow(
@@ -95,42 +116,66 @@ def resolve_reference(
     return perspective, rows
 
 
-def _collect_resource_reference_index(document: CommentedMap) -> dict[str, list[str]]:
-    index: dict[str, list[str]] = {}
-    for location in build_resource_locations(document):
-        resource_id = location.node.get("id")
-        if isinstance(resource_id, str) and resource_id.strip():
-            index.setdefault(resource_id.strip(), []).append(location.path)
-        resource_name = location.node.get("name")
-        if isinstance(resource_name, str) and resource_name.strip():
-            index.setdefault(resource_name.strip(), []).append(location.path)
-    return index
+def _is_tree_component(component: ReferenceComponent, aliases: dict[str, str]) -> bool:
+    return not (
+        component.special
+        or component.wildcard
+        or component.namespaced
+        or component.token in aliases
+    )
+
+
+def _path_rows(
+    tree: ResourceTree,
+    part: str,
+    components: tuple[ReferenceComponent, ...],
+    relative_to: YamlMapping | None,
+) -> list[ResolveRow]:
+    resolution = tree.resolve(part, anchor=relative_to)
+    rows: list[ResolveRow] = []
+    for position, component in enumerate(components):
+        status: ResolveStatus = "relative"
+        details = "-"
+        if resolution.status != "relative":
+            nodes = resolution.steps[position] if position < len(resolution.steps) else []
+            status, details = _nodes_status(tree, nodes)
+        rows.append(ResolveRow(part=part, token=component.token, status=status, details=details))
+    return rows
+
+
+def _nodes_status(tree: ResourceTree, nodes: list[YamlMapping]) -> tuple[ResolveStatus, str]:
+    if not nodes:
+        return "unresolved", "-"
+    paths = [tree.location(node).path for node in nodes]
+    if len(paths) > 1:
+        return "ambiguous", ", ".join(paths)
+    return "resolved", paths[0]
 
 
 def _resolve_aliases_for_perspective(
-    document: CommentedMap,
+    document: YamlMapping,
     perspective: str | None,
 ) -> dict[str, str]:
     if perspective is None:
         return {}
 
     perspectives = document.get("perspectives")
-    if not isinstance(perspectives, CommentedSeq):
+    if not isinstance(perspectives, list):
         return {}
 
     for node in perspectives:
-        if not isinstance(node, CommentedMap):
+        if not isinstance(node, dict):
             continue
         perspective_id = perspective_identifier(node)
         if perspective_id != perspective:
             continue
         aliases = node.get("aliases")
-        if not isinstance(aliases, CommentedSeq):
+        if not isinstance(aliases, list):
             return {}
 
         result: dict[str, str] = {}
         for alias in aliases:
-            if not isinstance(alias, CommentedMap):
+            if not isinstance(alias, dict):
                 continue
             alias_name = alias.get("alias")
             alias_for = alias.get("for")
@@ -141,14 +186,14 @@ def _resolve_aliases_for_perspective(
     return {}
 
 
-def _collect_import_namespaces(document: CommentedMap) -> set[str]:
+def _collect_import_namespaces(document: YamlMapping) -> set[str]:
     namespaces: set[str] = set()
     imports = document.get("imports")
-    if not isinstance(imports, CommentedSeq):
+    if not isinstance(imports, list):
         return namespaces
 
     for item in imports:
-        if not isinstance(item, CommentedMap):
+        if not isinstance(item, dict):
             continue
         namespace = item.get("namespace")
         if isinstance(namespace, str) and namespace.strip():
@@ -3,14 +3,38 @@
 from __future__ import annotations
 
 import re
+import sys
+from collections.abc import Callable, Iterable, Mapping
 from dataclasses import dataclass
+from functools import lru_cache
 
 from ilograph_cli.core.constants import SPECIAL_REFERENCE_TOKENS
 
 _IDENT_BOUNDARY_CHARS = r"A-Za-z0-9_.:-"
-
-
-@dataclass(slots=True)
+_IDENT_WORD = re.compile(rf"[{_IDENT_BOUNDARY_CHARS}]+")
+
+# Quote-free text whose brackets are flat and balanced splits with one regex;
+# anything else (quotes, escapes, nesting, stray closers) takes the state machine.
+_FLAT_ATOM = r"""(?:[^\[\]()'"\\{sep}]|\[[^\[\]()'"\\]*\]|\([^\[\]()'"\\]*\))"""
+_FLAT_LIST = re.compile(rf"{_FLAT_ATOM.format(sep=',')}*(?:,{_FLAT_ATOM.format(sep=',')}*)*")
+_FLAT_LIST_SEGMENT = re.compile(rf"({_FLAT_ATOM.format(sep=',')}*)(?:,|\Z)")
+_FLAT_PATH = re.compile(rf"{_FLAT_ATOM.format(sep='/')}*(?:/{_FLAT_ATOM.format(sep='/')}*)*")
+_FLAT_PATH_SEGMENT = re.compile(rf"({_FLAT_ATOM.format(sep='/')}*)(?:/|\Z)")
+_LIST_OPENERS = re.compile(r"""[\\'"\[(]""")
+_LIST_SPECIALS = re.compile(r"""[\\'"\[\](),]""")
+_PATH_SPECIALS = re.compile(r"[\[\]()/]")
+_BRACKETS = re.compile(r"[\[\]()]")
+_CLONE_BLOCKERS = re.compile(r"[\s/,]")
+_RELATIVE_PREFIX = re.compile(r"(?:\.\.\.?/\s*)+")
+_RELATIVE_STEP = re.compile(r"\.\.\.?")
+
+type _TrieNode = dict[str, _TrieNode]
+
+# Distinct reference strings kept parsed; diagrams repeat the same few heavily.
+_PARSE_CACHE_SIZE = 16_384
+
+
+@dataclass(frozen=True, slots=True)
 class ReferenceComponent:
     """Single parsed component from an Ilograph reference expression."""
 
@@ -22,84 +46,123 @@ class ReferenceComponent:
     special: bool
 
 
+@dataclass(frozen=True, slots=True)
+class ReferenceCacheStats:
+    """Counters of the shared reference parse cache."""
+
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+
+@dataclass(frozen=True, slots=True)
+class _ParsedReference:
+    components: tuple[ReferenceComponent, ...]
+    # every component token / only tokens that can name a resource
+    component_tokens: frozenset[str]
+    tokens: frozenset[str]
+
+
 def split_reference_list(raw: str) -> list[str]:
     """Split comma-separated references with []/()/" awareness."""
 
+    if "," not in raw:
+        return _stripped_segments([raw])
+    if _LIST_OPENERS.search(raw) is None:
+        # Unmatched closers never change depth, so every comma separates.
+        return _stripped_segments(raw.split(","))
+    if _FLAT_LIST.fullmatch(raw) is not None:
+        return _stripped_segments(_FLAT_LIST_SEGMENT.findall(raw))
+
     parts: list[str] = []
-    current: list[str] = []
+    start = 0
     square_depth = 0
     paren_depth = 0
     in_single = False
     in_double = False
-    escaped = False
+    escaped_until = -1
 
-    for char in raw:
-        if escaped:
-            current.append(char)
-            escaped = False
+    # Only quotes, brackets, commas and backslashes change state; hop between them.
+    for match in _LIST_SPECIALS.finditer(raw):
+        position = match.start()
+        if position < escaped_until:
             continue
+        char = match.group()
 
-        if char == "\\" and (in_single or in_double):
-            current.append(char)
-            escaped = True
+        if char == "\\":
+            if in_single or in_double:
+                escaped_until = position + 2
             continue
-
         if char == "'" and not in_double:
             in_single = not in_single
-            current.append(char)
             continue
         if char == '"' and not in_single:
             in_double = not in_double
-            current.append(char)
+            continue
+        if in_single or in_double:
             continue
 
-        if not in_single and not in_double:
-            if char == "[":
-                square_depth += 1
-            elif char == "]" and square_depth > 0:
+        if char == "[":
+            square_depth += 1
+        elif char == "]":
+            if square_depth > 0:
                 square_depth -= 1
-            elif char == "(":
-                paren_depth += 1
-            elif char == ")" and paren_depth > 0:
+        elif char == "(":
+            paren_depth += 1
+        elif char == ")":
+            if paren_depth > 0:
                 paren_depth -= 1
-            elif char == "," and square_depth == 0 and paren_depth == 0:
-                segment = "".join(current).strip()
-                if segment:
-                    parts.append(segment)
-                current = []
-                continue
-
-        current.append(char)
+        elif square_depth == 0 and paren_depth == 0:
+            segment = raw[start:position].strip()
+            if segment:
+                parts.append(segment)
+            start = position + 1
 
-    tail = "".join(current).strip()
+    tail = raw[start:].strip()
     if tail:
         parts.append(tail)
     return parts
 
 
-def parse_reference_components(raw: str) -> list[ReferenceComponent]:
-    """Parse an expression into comparable components."""
+def parse_reference_components(raw: str) -> tuple[ReferenceComponent, ...]:
+    """Parse an expression into comparable components (cached, shared result)."""
 
-    components: list[ReferenceComponent] = []
-    for part in split_reference_list(raw):
-        part_components = _parse_part_components(part)
-        components.extend(part_components)
-    return components
+    return _parse(raw).components
+
+
+def relative_steps(raw: str) -> tuple[str, ...]:
+    """Leading `../` and `.../` steps of one reference part, as `".."`/`"..."` in order."""
+
+    base = _strip_clone_suffix(raw.strip())
+    prefix = _RELATIVE_PREFIX.match(base) if base.startswith(".") else None
+    if prefix is None:
+        return ()
+    return tuple(_RELATIVE_STEP.findall(prefix.group()))
 
 
-def extract_reference_tokens(raw: str) -> set[str]:
+def extract_reference_tokens(raw: str) -> frozenset[str]:
     """Extract candidate resource identifiers from a reference expression."""
 
-    tokens: set[str] = set()
-    for component in parse_reference_components(raw):
-        if component.special:
-            continue
-        if component.wildcard:
-            continue
-        if not component.token:
-            continue
-        tokens.add(component.token)
-    return tokens
+    return _parse(raw).tokens
+
+
+def reference_cache_stats() -> ReferenceCacheStats:
+    """Hit/miss counters of the parse cache behind the reference helpers."""
+
+    info = _parse.cache_info()
+    return ReferenceCacheStats(
+        hits=info.hits,
+        misses=info.misses,
+        size=info.currsize,
+        max_size=info.maxsize or 0,
+    )
+
+
+def clear_reference_cache() -> None:
+    """Drop cached parses and reset counters."""
+
+    _parse.cache_clear()
 
 
 def replace_reference_identifier(raw: str, old: str, new: str) -> str:
@@ -115,10 +178,56 @@ def replace_reference_identifier(raw: str, old: str, new: str) -> str:
     return pattern.sub(new, raw)
 
 
+def compile_identifier_rewrite(mapping: Mapping[str, str]) -> Callable[[str], str]:
+    """One-pass rewriter for many identifiers; all pairs apply at once (swaps, chains)."""
+
+    replacements = {old: new for old, new in mapping.items() if old != new}
+    if not replacements:
+        return lambda raw: raw
+    pattern = re.compile(
+        rf"(?<![{_IDENT_BOUNDARY_CHARS}])"
+        rf"{_trie_pattern(replacements)}"
+        rf"(?![{_IDENT_BOUNDARY_CHARS}])"
+    )
+
+    def rewrite(raw: str) -> str:
+        return pattern.sub(lambda match: replacements[match.group()], raw)
+
+    return rewrite
+
+
+def identifier_words(raw: str) -> set[str]:
+    """Maximal identifier-character runs; every exact `replace_reference_identifier` hit is one."""
+
+    return set(_IDENT_WORD.findall(raw))
+
+
+def is_identifier_word(text: str) -> bool:
+    """True if `text` is made only of identifier characters."""
+
+    return _IDENT_WORD.fullmatch(text) is not None
+
+
 def contains_identifier(raw: str, identifier: str) -> bool:
     """True if identifier appears as reference component."""
 
-    return any(component.token == identifier for component in parse_reference_components(raw))
+    return identifier in _parse(raw).component_tokens
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse(raw: str) -> _ParsedReference:
+    components: list[ReferenceComponent] = []
+    for part in split_reference_list(raw):
+        components.extend(_parse_part_components(part))
+    return _ParsedReference(
+        components=tuple(components),
+        component_tokens=frozenset(component.token for component in components),
+        tokens=frozenset(
+            component.token
+            for component in components
+            if component.token and not component.special and not component.wildcard
+        ),
+    )
 
 
 def _parse_part_components(part: str) -> list[ReferenceComponent]:
@@ -127,16 +236,10 @@ def _parse_part_components(part: str) -> list[ReferenceComponent]:
         return []
 
     relative = False
-    while True:
-        if base.startswith("../"):
-            relative = True
-            base = base[3:].lstrip()
-            continue
-        if base.startswith(".../"):
-            relative = True
-            base = base[4:].lstrip()
-            continue
-        break
+    prefix = _RELATIVE_PREFIX.match(base) if base.startswith(".") else None
+    if prefix is not None:
+        relative = True
+        base = base[prefix.end() :]
 
     if not base:
         return []
@@ -159,7 +262,7 @@ def _parse_part_components(part: str) -> list[ReferenceComponent]:
         is_wildcard = "*" in token and not is_special
         parsed.append(
             ReferenceComponent(
-                token=token,
+                token=sys.intern(token),
                 raw=raw_component,
                 relative=relative,
                 wildcard=is_wildcard,
@@ -173,77 +276,106 @@ def _parse_part_components(part: str) -> list[ReferenceComponent]:
 def _split_path(raw: str) -> list[str]:
     """Split a reference path by / and // while respecting []/()."""
 
+    if "/" not in raw:
+        return _stripped_segments([raw])
+    if "[" not in raw and "(" not in raw:
+        return _stripped_segments(raw.split("/"))
+    if _FLAT_PATH.fullmatch(raw) is not None:
+        # `//` only yields an empty segment, which is dropped either way.
+        return _stripped_segments(_FLAT_PATH_SEGMENT.findall(raw))
+
     parts: list[str] = []
-    current: list[str] = []
+    start = 0
     square_depth = 0
     paren_depth = 0
-    i = 0
-    while i < len(raw):
-        char = raw[i]
+    skip_until = -1
+    for match in _PATH_SPECIALS.finditer(raw):
+        position = match.start()
+        if position < skip_until:
+            continue
+        char = match.group()
         if char == "[":
             square_depth += 1
-        elif char == "]" and square_depth > 0:
-            square_depth -= 1
+        elif char == "]":
+            if square_depth > 0:
+                square_depth -= 1
         elif char == "(":
             paren_depth += 1
-        elif char == ")" and paren_depth > 0:
-            paren_depth -= 1
-
-        if char == "/" and square_depth == 0 and paren_depth == 0:
-            segment = "".join(current).strip()
+        elif char == ")":
+            if paren_depth > 0:
+                paren_depth -= 1
+        elif square_depth == 0 and paren_depth == 0:
+            segment = raw[start:position].strip()
             if segment:
                 parts.append(segment)
-            current = []
-            if i + 1 < len(raw) and raw[i + 1] == "/":
-                i += 1
-            i += 1
-            continue
+            # `//` is one separator.
+            start = position + 2 if raw.startswith("/", position + 1) else position + 1
+            skip_until = start
 
-        current.append(char)
-        i += 1
-
-    tail = "".join(current).strip()
+    tail = raw[start:].strip()
     if tail:
         parts.append(tail)
     return parts
 
 
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Alternation over `words` as a prefix trie; longer words are tried first."""
+
+    root: _TrieNode = {}
+    for word in words:
+        node = root
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    return _trie_node_pattern(root)
+
+
+def _trie_node_pattern(node: _TrieNode) -> str:
+    branches = [
+        re.escape(char) + _trie_node_pattern(child) for char, child in sorted(node.items()) if char
+    ]
+    terminal = "" in node
+    if not branches:
+        return ""
+    if len(branches) == 1 and not terminal:
+        return branches[0]
+    group = f"(?:{'|'.join(branches)})"
+    return f"{group}?" if terminal else group
+
+
+def _stripped_segments(segments: list[str]) -> list[str]:
+    return [segment for segment in map(str.strip, segments) if segment]
+
+
 def _strip_clone_suffix(raw: str) -> str:
     """Remove trailing clone marker (`*id`) from a reference part."""
 
     text = raw.rstrip()
-    if not text:
-        return text
+    index = text.rfind("*")
+    while index > 0:
+        suffix = text[index + 1 :].strip()
+        # A blocked suffix stays blocked for every `*` further left.
+        if _CLONE_BLOCKERS.search(suffix) is not None:
+            break
+        if suffix and text[index - 1].isspace() and _outside_brackets(text, index):
+            return text[: index - 1].rstrip()
+        index = text.rfind("*", 0, index)
+    return text
+
+
+def _outside_brackets(text: str, index: int) -> bool:
+    """Whether `text[index]` sits outside []/() when matched right to left."""
 
     square_depth = 0
     paren_depth = 0
-    for index in range(len(text) - 1, -1, -1):
-        char = text[index]
+    for char in reversed(_BRACKETS.findall(text, index + 1)):
         if char == "]":
             square_depth += 1
-            continue
-        if char == "[" and square_depth > 0:
-            square_depth -= 1
-            continue
-        if char == ")":
+        elif char == "[":
+            if square_depth > 0:
+                square_depth -= 1
+        elif char == ")":
             paren_depth += 1
-            continue
-        if char == "(" and paren_depth > 0:
+        elif paren_depth > 0:
             paren_depth -= 1
-            continue
-        if square_depth > 0 or paren_depth > 0:
-            continue
-        if char != "*":
-            continue
-        if index == 0:
-            continue
-        if not text[index - 1].isspace():
-            continue
-        suffix = text[index + 1 :].strip()
-        if not suffix:
-            continue
-        if any(ch.isspace() or ch in {"/", ","} for ch in suffix):
-            continue
-        return text[: index - 1].rstrip()
-
-    return text
+    return square_depth == 0 and paren_depth == 0
@@ -0,0 +1,144 @@
+"""Resource tree with per-parent child maps for hierarchical reference paths."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, KeysView
+from dataclasses import dataclass
+from typing import Literal
+
+from ilograph_cli.core.index import ResourceLocation, build_resource_locations
+from ilograph_cli.core.references import parse_reference_components, relative_steps
+from ilograph_cli.core.yaml_types import YamlMapping
+
+PathStatus = Literal["resolved", "ambiguous", "unresolved", "relative"]
+
+# Children are keyed by both id and name, like top-level lookups.
+type _ChildMap = dict[str, list[YamlMapping]]
+
+
+@dataclass(slots=True)
+class PathResolution:
+    """Outcome of walking one reference part down the resource tree.
+
+    `steps[i]` holds the nodes reached after component `i`; it stops after the
+    first component that matched nothing. `relative` means a `../` or `.../`
+    part had no anchor resource to start from.
+    """
+
+    status: PathStatus
+    steps: list[list[YamlMapping]]
+
+    @property
+    def nodes(self) -> list[YamlMapping]:
+        if self.status in ("resolved", "ambiguous"):
+            return self.steps[-1]
+        return []
+
+
+class ResourceTree:
+    """Read-only snapshot of the resource tree; each path step is one dict lookup."""
+
+    def __init__(
+        self,
+        document: YamlMapping,
+        *,
+        locations: Iterable[ResourceLocation] | None = None,
+    ) -> None:
+        """Index `document`'s resources, or `locations` when a walk already collected them."""
+
+        self._locations: dict[int, ResourceLocation] = {}
+        self._by_identifier: _ChildMap = {}
+        self._roots: _ChildMap = {}
+        self._children: dict[int, _ChildMap] = {}
+
+        if locations is None:
+            locations = build_resource_locations(document)
+        for location in locations:
+            node = location.node
+            self._locations[id(node)] = location
+            siblings = (
+                self._roots
+                if location.parent is None
+                else self._children.setdefault(id(location.parent), {})
+            )
+            for key in _lookup_keys(node):
+                self._by_identifier.setdefault(key, []).append(node)
+                siblings.setdefault(key, []).append(node)
+
+    def location(self, node: YamlMapping) -> ResourceLocation:
+        return self._locations[id(node)]
+
+    def identifiers(self) -> KeysView[str]:
+        """Every resource id and name."""
+
+        return self._by_identifier.keys()
+
+    def lookup(self, identifier: str) -> list[YamlMapping]:
+        """Resources anywhere in the tree whose id or name is `identifier`."""
+
+        return self._by_identifier.get(identifier, [])
+
+    def resolve(self, part: str, *, anchor: YamlMapping | None = None) -> PathResolution:
+        """Walk `a/b/c`, `../b` or `.../b` from the top (or from `anchor` when relative).
+
+        `..` climbs one level from the anchor; `...` then searches the children
+        of each ancestor upwards, nearest first.
+        """
+
+        tokens = [component.token for component in parse_reference_components(part)]
+        if not tokens:
+            return PathResolution(status="unresolved", steps=[])
+
+        steps = relative_steps(part)
+        if not steps:
+            current = self.lookup(tokens[0])
+        elif anchor is None or id(anchor) not in self._locations:
+            return PathResolution(status="relative", steps=[])
+        else:
+            current = self._relative_start(anchor, steps, tokens[0])
+
+        walked = [current]
+        for token in tokens[1:]:
+            if not current:
+                break
+            current = [child for node in current for child in self._child_map(node).get(token, [])]
+            walked.append(current)
+
+        if not current or len(walked) < len(tokens):
+            return PathResolution(status="unresolved", steps=walked)
+        return PathResolution(status="resolved" if len(current) == 1 else "ambiguous", steps=walked)
+
+    def _relative_start(
+        self,
+        anchor: YamlMapping,
+        steps: tuple[str, ...],
+        token: str,
+    ) -> list[YamlMapping]:
+        scope: YamlMapping | None = anchor
+        search_up = False
+        for step in steps:
+            if scope is None:
+                return []
+            scope = self._locations[id(scope)].parent
+            search_up = search_up or step == "..."
+
+        while True:
+            found = self._scope_children(scope).get(token, [])
+            if found or not search_up or scope is None:
+                return found
+            scope = self._locations[id(scope)].parent
+
+    def _scope_children(self, scope: YamlMapping | None) -> _ChildMap:
+        return self._roots if scope is None else self._child_map(scope)
+
+    def _child_map(self, node: YamlMapping) -> _ChildMap:
+        return self._children.get(id(node), {})
+
+
+def _lookup_keys(node: YamlMapping) -> set[str]:
+    keys: set[str] = set()
+    for field in ("id", "name"):
+        value = node.get(field)
+        if isinstance(value, str) and value.strip():
+            keys.add(value.strip())
+    return keys
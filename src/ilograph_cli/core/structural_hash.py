@@ -0,0 +1,67 @@
+"""Digests of YAML data that ignore presentation: comments, quoting, anchors, flow style."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from hashlib import blake2b
+from itertools import chain
+
+_OPEN_MAPPING = b"{"
+_OPEN_SEQUENCE = b"["
+_CLOSE = b"]"
+
+
+def structural_digest(node: object, *, opaque: Callable[[object], bool] | None = None) -> bytes:
+    """Digest of `node`'s data: mapping order, nesting and scalar values.
+
+    Containers below `node` for which `opaque` holds contribute their identity
+    instead of their content. The walk keeps an explicit stack, so nesting
+    depth is free.
+    """
+
+    digest = blake2b(digest_size=16)
+    update = digest.update
+    if not isinstance(node, (dict, list)):
+        update(_scalar_token(node))
+        return digest.digest()
+
+    update(_OPEN_MAPPING if isinstance(node, dict) else _OPEN_SEQUENCE)
+    stack: list[Iterator[object]] = [_entries(node)]
+    while stack:
+        for item in stack[-1]:
+            if not isinstance(item, (dict, list)):
+                update(_scalar_token(item))
+            elif opaque is not None and opaque(item):
+                update(b"@%d;" % id(item))
+            else:
+                update(_OPEN_MAPPING if isinstance(item, dict) else _OPEN_SEQUENCE)
+                stack.append(_entries(item))
+                break
+        else:
+            stack.pop()
+            update(_CLOSE)
+    return digest.digest()
+
+
+def _entries(node: dict[object, object] | list[object]) -> Iterator[object]:
+    if isinstance(node, dict):
+        return chain.from_iterable(node.items())
+    return iter(node)
+
+
+def _scalar_token(value: object) -> bytes:
+    # Loaded scalars are str/int/float subclasses carrying their source style;
+    # only the value they load as counts.
+    if value is None:
+        return b"n;"
+    if isinstance(value, bool):
+        return b"b1;" if value else b"b0;"
+    if isinstance(value, str):
+        text = str.__str__(value).encode("utf-8", "surrogatepass")
+        return b"s%d:%s" % (len(text), text)
+    if isinstance(value, int):
+        return b"i%d;" % int(value)
+    if isinstance(value, float):
+        return b"f%s;" % repr(float(value)).encode()
+    # Dates, tagged scalars and the like only match themselves.
+    return b"@%d;" % id(value)
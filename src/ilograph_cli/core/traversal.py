@@ -0,0 +1,40 @@
+"""Explicit-stack tree walks: nesting depth costs neither recursion nor generator chains."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator
+
+from ilograph_cli.core.yaml_types import YamlMapping, YamlSequence
+
+
+def walk_preorder[T](
+    roots: Iterable[T],
+    expand: Callable[[T], Iterable[T] | None],
+) -> Iterator[T]:
+    """Yield `roots`, each followed by everything below it via `expand`.
+
+    `expand(item)` runs when the consumer resumes after `item`, and the
+    iterable it returns is consumed lazily.
+    """
+
+    stack = [iter(roots)]
+    while stack:
+        for item in stack[-1]:
+            yield item
+            children = expand(item)
+            if children is not None:
+                stack.append(iter(children))
+                break
+        else:
+            stack.pop()
+
+
+def iter_containers(node: YamlMapping | YamlSequence) -> Iterator[YamlMapping | YamlSequence]:
+    """`node` and every mapping/sequence nested in it, in preorder."""
+
+    return walk_preorder((node,), _nested_containers)
+
+
+def _nested_containers(node: YamlMapping | YamlSequence) -> Iterator[YamlMapping | YamlSequence]:
+    values = node.values() if isinstance(node, dict) else node
+    return (value for value in values if isinstance(value, (dict, list)))
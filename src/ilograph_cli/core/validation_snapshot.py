@@ -0,0 +1,441 @@
+"""Validation issues kept per top-level unit, so an edit re-checks only what it touched."""
+
+from __future__ import annotations
+
+import re
+from array import array
+from collections import Counter
+from collections.abc import Collection, Iterable, Iterator
+from hashlib import blake2b
+
+from ilograph_cli.core.identifiers import perspective_identifier
+from ilograph_cli.core.index import ResourceLocation
+from ilograph_cli.core.reference_fields import ReferenceField
+from ilograph_cli.core.validators import (
+    DocumentFacts,
+    UnitKey,
+    ValidationIssue,
+    ValidationMode,
+    ValidationRule,
+    ValidationRun,
+    select_rules,
+)
+from ilograph_cli.core.wildcards import compile_wildcard
+from ilograph_cli.core.yaml_types import YamlMapping, YamlSequence
+
+# Duplicate ids compare units with each other; holder maps stand in for those rules.
+_CROSS_UNIT_RULES = frozenset({"duplicate-resource-id", "duplicate-perspective-id"})
+_UNIT_PATH = re.compile(r"(resources|perspectives)\[(\d+)\]")
+_INDEX = re.compile(r"\[(\d+)\]")
+
+# A resource id/name with a digest of the id/name sets of its ancestors, outermost
+# first: references and paths to it resolve the same as long as this is unchanged.
+# Each digest extends its parent's, so deep trees cost O(1) per resource.
+type _Chain = bytes
+type _Definition = tuple[str, _Chain]
+# (top-level resource index, preorder position inside that resource's subtree)
+type _Holder = tuple[int, int]
+
+
+class _ResourceUnit:
+    __slots__ = ("definitions", "explicit_ids", "issues", "parents", "positions")
+
+    def __init__(self) -> None:
+        self.definitions: Counter[_Definition] = Counter()
+        self.explicit_ids: list[tuple[str, int]] = []
+        self.issues: list[ValidationIssue] = []
+        # Per resource of the subtree, in preorder: parent position and child index.
+        self.parents = array("l")
+        self.positions = array("l")
+
+    def path(self, index: int, order: int) -> str:
+        steps: list[int] = []
+        while order > 0:
+            steps.append(self.positions[order])
+            order = self.parents[order]
+        return f"resources[{index}]" + "".join(f".children[{step}]" for step in reversed(steps))
+
+
+class _PerspectiveUnit:
+    __slots__ = ("explicit_id", "identifier", "issues", "tokens", "wildcards")
+
+    def __init__(self, identifier: str | None, explicit_id: str | None) -> None:
+        self.identifier = identifier
+        self.explicit_id = explicit_id
+        self.issues: list[ValidationIssue] = []
+        self.tokens: set[str] = set()
+        self.wildcards: set[str] = set()
+
+
+class _UnitRecorder(ValidationRule):
+    """Collects the snapshot's bookkeeping on the same walk the rules use."""
+
+    name = "unit-recorder"
+    summary = "internal: per-unit definitions and reference tokens"
+    needs = frozenset({"resources", "perspectives", "references"})
+
+    def __init__(self, *, mode: ValidationMode) -> None:
+        super().__init__(mode=mode)
+        self.resources: dict[int, _ResourceUnit] = {}
+        self.perspectives: dict[int, _PerspectiveUnit] = {}
+        self._unit = _ResourceUnit()
+        self._perspective = _PerspectiveUnit(None, None)
+        # id(node) -> (the chain shared by its children, its preorder position in the unit)
+        self._scopes: dict[int, tuple[_Chain, int]] = {}
+
+    def visit_resource(
+        self,
+        location: ResourceLocation,
+        facts: DocumentFacts,
+    ) -> Iterator[ValidationIssue]:
+        node = location.node
+        if location.parent is None:
+            self._unit = self.resources.setdefault(location.index, _ResourceUnit())
+            chain, parent = b"", -1
+        else:
+            chain, parent = self._scopes[id(location.parent)]
+        unit = self._unit
+        order = len(unit.parents)
+        unit.parents.append(parent)
+        unit.positions.append(location.index)
+        keys = _keys(node)
+        self._scopes[id(node)] = (_extend_chain(chain, keys), order)
+        for key in keys:
+            unit.definitions[(key, chain)] += 1
+        raw_id = node.get("id")
+        if isinstance(raw_id, str) and raw_id.strip():
+            unit.explicit_ids.append((raw_id.strip(), order))
+        return iter(())
+
+    def visit_perspective(
+        self,
+        index: int,
+        perspective: YamlMapping,
+        facts: DocumentFacts,
+    ) -> Iterator[ValidationIssue]:
+        raw_id = perspective.get("id")
+        explicit_id = raw_id.strip() if isinstance(raw_id, str) and raw_id.strip() else None
+        self._perspective = _PerspectiveUnit(perspective_identifier(perspective), explicit_id)
+        self.perspectives[index] = self._perspective
+        return iter(())
+
+    def visit_reference(
+        self,
+        field: ReferenceField,
+        aliases: set[str],
+        facts: DocumentFacts,
+    ) -> Iterator[ValidationIssue]:
+        unit = self._perspective
+        for component in facts.components(field.value):
+            unit.tokens.add(component.token)
+            if component.wildcard and not component.namespaced:
+                unit.wildcards.add(component.token)
+        return iter(())
+
+
+class ValidationSnapshot:
+    """Issues of one document per top-level resource and perspective.
+
+    Alongside the issues it keeps what they depend on: which identifiers each
+    unit defines (and under which parents), and which tokens each perspective
+    references. `update` re-checks the touched units plus the perspectives
+    that reference an identifier whose definition changed. Re-checked `a/b`
+    paths still resolve against a tree of the whole document.
+    """
+
+    def __init__(
+        self,
+        document: YamlMapping,
+        *,
+        mode: ValidationMode = "strict",
+        ignore_rules: Collection[str] = (),
+    ) -> None:
+        self.mode: ValidationMode = mode
+        self.ignore_rules = frozenset(ignore_rules)
+        self._resources: dict[int, _ResourceUnit] = {}
+        self._perspectives: dict[int, _PerspectiveUnit] = {}
+        self._identifier_counts: Counter[str] = Counter()
+        self._identifiers: set[str] = set()
+        self._perspective_identifiers: Counter[str] = Counter()
+        self._imports: set[str] = set()
+        self._resource_holders: dict[str, list[_Holder]] = {}
+        self._perspective_holders: dict[str, list[int]] = {}
+        self._duplicate_resource_ids: set[str] = set()
+        self._duplicate_perspective_ids: set[str] = set()
+        # token -> perspectives whose reference fields mention it
+        self._by_token: dict[str, set[int]] = {}
+        self._unit_issues = 0
+        self.update(document, _all_units(document))
+
+    @property
+    def ok(self) -> bool:
+        return (
+            not self._unit_issues
+            and not self._duplicate_resource_ids
+            and not self._duplicate_perspective_ids
+        )
+
+    def issues(self) -> list[ValidationIssue]:
+        """All issues, unit by unit: resources first, then perspectives."""
+
+        found = [
+            ValidationIssue(
+                code="duplicate-resource-id",
+                path=self._resources[index].path(index, order),
+                message=f"duplicate resource id: {identifier} (ids must be unique)",
+            )
+            for identifier in self._duplicate_resource_ids
+            for index, order in self._resource_holders[identifier]
+        ]
+        for index in sorted(self._resources):
+            found.extend(self._resources[index].issues)
+        found.extend(
+            ValidationIssue(
+                code="duplicate-perspective-id",
+                path=f"perspectives[{index}]",
+                message=f"duplicate perspective id: {identifier} (ids must be unique)",
+            )
+            for identifier in self._duplicate_perspective_ids
+            for index in self._perspective_holders[identifier]
+        )
+        for index in sorted(self._perspectives):
+            found.extend(self._perspectives[index].issues)
+        return sorted(found, key=_unit_order)
+
+    def update(self, document: YamlMapping, touched: Iterable[UnitKey]) -> list[UnitKey]:
+        """Bring the snapshot in line with `document` after an edit; return re-checked units.
+
+        `touched` must name every unit whose content may differ from the
+        document the snapshot describes, including units added or removed at
+        the end of a section.
+        """
+
+        touched = set(touched)
+        resource_units = sorted(unit for unit in touched if unit[0] == "resources")
+        perspective_units = sorted(unit for unit in touched if unit[0] == "perspectives")
+
+        # Resources first: the perspectives to re-check depend on what they define.
+        old_definitions: Counter[_Definition] = Counter()
+        for _, index in resource_units:
+            old_definitions.update(self._drop_resource_unit(index))
+        new_definitions: Counter[_Definition] = Counter()
+        for index, resource in self._run(document, resource_units).resources.items():
+            self._add_resource_unit(index, resource)
+            new_definitions.update(resource.definitions)
+        changed, appeared_or_gone = self._apply_definitions(old_definitions, new_definitions)
+
+        for _, index in perspective_units:
+            changed.update(self._drop_perspective_unit(index))
+        # Perspective ids are known before the walk, as in a full run.
+        perspectives = _section(document, "perspectives")
+        for _, index in perspective_units:
+            perspective = perspectives[index] if index < len(perspectives) else None
+            if isinstance(perspective, dict):
+                identifier = perspective_identifier(perspective)
+                if identifier is not None:
+                    if identifier not in self._perspective_identifiers:
+                        changed.add(identifier)
+                    self._perspective_identifiers[identifier] += 1
+
+        recheck = {index for _, index in perspective_units}
+        imports = _import_namespaces(document)
+        if imports != self._imports:
+            self._imports = imports
+            recheck.update(self._perspectives)
+        for token in changed:
+            recheck.update(self._by_token.get(token, ()))
+        if appeared_or_gone:
+            recheck.update(
+                index
+                for index, unit in self._perspectives.items()
+                if unit.wildcards and _any_match(unit.wildcards, appeared_or_gone)
+            )
+        for index in recheck.difference(index for _, index in perspective_units):
+            self._drop_perspective_unit(index, keep_identifier=True)
+
+        units: list[UnitKey] = [("perspectives", index) for index in sorted(recheck)]
+        for index, perspective in self._run(document, units).perspectives.items():
+            self._add_perspective_unit(index, perspective)
+        return [*resource_units, *units]
+
+    def _run(
+        self,
+        document: YamlMapping,
+        units: list[UnitKey],
+    ) -> _UnitRecorder:
+        recorder = _UnitRecorder(mode=self.mode)
+        facts = DocumentFacts(
+            document,
+            resource_identifiers=self._identifiers,
+            perspective_identifiers=set(self._perspective_identifiers),
+            import_namespaces=self._imports,
+        )
+        if not units:
+            return recorder
+        rules: list[ValidationRule] = [recorder]
+        rules.extend(
+            rule(mode=self.mode)
+            for rule in select_rules(self.mode, ignore_rules=_CROSS_UNIT_RULES | self.ignore_rules)
+        )
+        for issue in ValidationRun(document, rules, facts=facts, units=units):
+            match = _UNIT_PATH.match(issue.path)
+            if match is None:
+                continue
+            index = int(match.group(2))
+            unit = (
+                recorder.resources.get(index)
+                if match.group(1) == "resources"
+                else recorder.perspectives.get(index)
+            )
+            if unit is not None:
+                unit.issues.append(issue)
+        return recorder
+
+    def _drop_resource_unit(self, index: int) -> Counter[_Definition]:
+        old = self._resources.pop(index, None)
+        if old is None:
+            return Counter()
+        self._unit_issues -= len(old.issues)
+        for identifier, order in old.explicit_ids:
+            self._resource_holders[identifier].remove((index, order))
+            self._refresh_resource_duplicate(identifier)
+        return old.definitions
+
+    def _add_resource_unit(self, index: int, unit: _ResourceUnit) -> None:
+        self._resources[index] = unit
+        self._unit_issues += len(unit.issues)
+        for identifier, order in unit.explicit_ids:
+            self._resource_holders.setdefault(identifier, []).append((index, order))
+            self._refresh_resource_duplicate(identifier)
+
+    def _apply_definitions(
+        self,
+        old: Counter[_Definition],
+        new: Counter[_Definition],
+    ) -> tuple[set[str], set[str]]:
+        """Swap `old` definitions for `new`; return changed keys and keys that came or went."""
+
+        changed = {key for key, _ in (old - new) + (new - old)}
+        counts = self._identifier_counts
+        was_defined = {key: key in counts for key in changed}
+        counts.subtract(Counter(key for key, _ in old.elements()))
+        counts.update(key for key, _ in new.elements())
+        appeared_or_gone: set[str] = set()
+        for key, before in was_defined.items():
+            now = counts[key] > 0
+            if not now:
+                del counts[key]
+                self._identifiers.discard(key)
+            elif not before:
+                self._identifiers.add(key)
+            if now != before:
+                appeared_or_gone.add(key)
+        return changed, appeared_or_gone
+
+    def _drop_perspective_unit(self, index: int, *, keep_identifier: bool = False) -> set[str]:
+        """Forget perspective `index`; return its identifier if nothing else defines it now."""
+
+        old = self._perspectives.pop(index, None)
+        if old is None:
+            return set()
+        self._unit_issues -= len(old.issues)
+        for token in old.tokens:
+            holders = self._by_token[token]
+            holders.discard(index)
+            if not holders:
+                del self._by_token[token]
+        if old.explicit_id is not None:
+            self._perspective_holders[old.explicit_id].remove(index)
+            self._refresh_perspective_duplicate(old.explicit_id)
+        if keep_identifier or old.identifier is None:
+            return set()
+        self._perspective_identifiers[old.identifier] -= 1
+        if self._perspective_identifiers[old.identifier]:
+            return set()
+        del self._perspective_identifiers[old.identifier]
+        return {old.identifier}
+
+    def _add_perspective_unit(self, index: int, unit: _PerspectiveUnit) -> None:
+        self._perspectives[index] = unit
+        self._unit_issues += len(unit.issues)
+        for token in unit.tokens:
+            self._by_token.setdefault(token, set()).add(index)
+        if unit.explicit_id is not None:
+            holders = self._perspective_holders.setdefault(unit.explicit_id, [])
+            holders.append(index)
+            holders.sort()
+            self._refresh_perspective_duplicate(unit.explicit_id)
+
+    def _refresh_resource_duplicate(self, identifier: str) -> None:
+        holders = self._resource_holders[identifier]
+        if len(holders) > 1:
+            holders.sort()
+            self._duplicate_resource_ids.add(identifier)
+            return
+        self._duplicate_resource_ids.discard(identifier)
+        if not holders:
+            del self._resource_holders[identifier]
+
+    def _refresh_perspective_duplicate(self, identifier: str) -> None:
+        holders = self._perspective_holders[identifier]
+        if len(holders) > 1:
+            self._duplicate_perspective_ids.add(identifier)
+            return
+        self._duplicate_perspective_ids.discard(identifier)
+        if not holders:
+            del self._perspective_holders[identifier]
+
+
+def _extend_chain(chain: _Chain, keys: frozenset[str]) -> _Chain:
+    # A stable digest, unlike hash(): snapshots are compared across processes.
+    return blake2b(chain + "\0".join(sorted(keys)).encode(), digest_size=16).digest()
+
+
+def _keys(node: YamlMapping) -> frozenset[str]:
+    keys = set()
+    for field in ("id", "name"):
+        value = node.get(field)
+        if isinstance(value, str) and value.strip():
+            keys.add(value.strip())
+    return frozenset(keys)
+
+
+def _section(document: YamlMapping, name: str) -> YamlSequence:
+    items = document.get(name)
+    return items if isinstance(items, list) else []
+
+
+def _all_units(document: YamlMapping) -> list[UnitKey]:
+    units: list[UnitKey] = [
+        ("resources", index) for index in range(len(_section(document, "resources")))
+    ]
+    units.extend(
+        ("perspectives", index) for index in range(len(_section(document, "perspectives")))
+    )
+    return units
+
+
+def _import_namespaces(document: YamlMapping) -> set[str]:
+    namespaces: set[str] = set()
+    for item in _section(document, "imports"):
+        if isinstance(item, dict):
+            namespace = item.get("namespace")
+            if isinstance(namespace, str) and namespace.strip():
+                namespaces.add(namespace.strip())
+    return namespaces
+
+
+def _any_match(wildcards: set[str], identifiers: set[str]) -> bool:
+    patterns = [compile_wildcard(token) for token in wildcards]
+    return any(pattern.matches(identifier) for pattern in patterns for identifier in identifiers)
+
+
+def _path_order(path: str) -> tuple[int, ...]:
+    # Index chains compare like a preorder walk: resources[0] < resources[0].children[1].
+    return tuple(int(index) for index in _INDEX.findall(path))
+
+
+def _unit_order(issue: ValidationIssue) -> tuple[bool, int]:
+    # Stable: within a unit, duplicate ids first, then issues in walk order.
+    order = _path_order(issue.path)
+    return (issue.path.startswith("perspectives"), order[0] if order else -1)
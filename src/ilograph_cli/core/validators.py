@@ -1,22 +1,44 @@
-"""Document validation for `check` command."""
+"""Document validation for `check` command.
+
+Every rule is a visitor over one shared walk of the document: resources
+first, then imports, then each perspective with its aliases and reference
+fields. Hooks yield issues as soon as they are certain, so a caller can
+stream them and stop the walk early.
+"""
 
 from __future__ import annotations
 
-from collections import Counter
+from collections.abc import Collection, Iterator
 from dataclasses import dataclass
-from typing import Literal
-
-from ruamel.yaml.comments import CommentedMap, CommentedSeq
+from itertools import islice
+from time import perf_counter
+from typing import ClassVar, Literal
 
 from ilograph_cli.core.constants import RESTRICTED_RESOURCE_ID_CHARS
-from ilograph_cli.core.index import (
-    build_resource_locations,
-    perspective_identifier,
+from ilograph_cli.core.identifiers import perspective_identifier
+from ilograph_cli.core.index import ResourceLocation, iter_resources
+from ilograph_cli.core.reference_fields import (
+    FieldPath,
+    ReferenceField,
+    iter_perspective_reference_fields,
 )
-from ilograph_cli.core.reference_fields import iter_reference_fields
-from ilograph_cli.core.references import parse_reference_components
+from ilograph_cli.core.references import (
+    ReferenceComponent,
+    parse_reference_components,
+    split_reference_list,
+)
+from ilograph_cli.core.resource_tree import ResourceTree
+from ilograph_cli.core.wildcards import WildcardIndex
+from ilograph_cli.core.yaml_types import YamlMapping
 
 ValidationMode = Literal["strict", "ilograph-native"]
+# Parts of the shared walk a rule reads; parts nobody needs are not walked.
+RuleNeed = Literal["resources", "perspectives", "aliases", "references", "imports"]
+# A top-level `resources` item (with its subtree) or `perspectives` item.
+UnitKey = tuple[Literal["resources", "perspectives"], int]
+
+_PERSPECTIVE_NEEDS: frozenset[RuleNeed] = frozenset({"perspectives", "aliases", "references"})
+_ALIAS_NEEDS: frozenset[RuleNeed] = frozenset({"aliases", "references"})
 
 
 @dataclass(slots=True)
@@ -28,152 +50,517 @@ class ValidationIssue:
     message: str
 
 
-class CheckResult:
-    """Validation result payload."""
+@dataclass(frozen=True, slots=True)
+class RuleCost:
+    """Time one rule spent in its hooks during a run, and what it reported."""
+
+    name: str
+    seconds: float
+    issues: int
 
-    def __init__(self, issues: list[ValidationIssue]) -> None:
+
+class CheckResult:
+    """Validation result payload; `complete` is False when validation stopped early."""
+
+    def __init__(
+        self,
+        issues: list[ValidationIssue],
+        costs: list[RuleCost] | None = None,
+        *,
+        complete: bool = True,
+    ) -> None:
         self.issues = issues
+        self.costs = costs or []
+        self.complete = complete
 
     @property
     def ok(self) -> bool:
         return not self.issues
 
 
+class DocumentFacts:
+    """Identifiers gathered by the walk so far, plus per-pass parse memos.
+
+    Passing the identifier sets up front marks the facts as preset: the walk
+    then trusts them instead of collecting its own.
+    """
+
+    def __init__(
+        self,
+        document: YamlMapping,
+        *,
+        resource_identifiers: set[str] | None = None,
+        perspective_identifiers: set[str] | None = None,
+        import_namespaces: set[str] | None = None,
+    ) -> None:
+        self.document = document
+        self.preset = resource_identifiers is not None
+        self.resources: list[ResourceLocation] = []
+        self.resource_identifiers = resource_identifiers or set()
+        self.perspective_identifiers = perspective_identifiers or set()
+        self.import_namespaces = import_namespaces or set()
+        self._components: dict[str, tuple[ReferenceComponent, ...]] = {}
+        self._parts: dict[str, list[str]] = {}
+        self._tree: ResourceTree | None = None
+        self._wildcards: WildcardIndex | None = None
+
+    def components(self, raw: str) -> tuple[ReferenceComponent, ...]:
+        """Parsed components of `raw`; each distinct string is parsed once per pass."""
+
+        parsed = self._components.get(raw)
+        if parsed is None:
+            parsed = self._components[raw] = parse_reference_components(raw)
+        return parsed
+
+    def parts(self, raw: str) -> list[str]:
+        split = self._parts.get(raw)
+        if split is None:
+            split = self._parts[raw] = split_reference_list(raw)
+        return split
+
+    def tree(self) -> ResourceTree:
+        """Resource tree over the walked resources (complete once perspectives are visited)."""
+
+        if self._tree is None:
+            locations = None if self.preset else self.resources
+            self._tree = ResourceTree(self.document, locations=locations)
+        return self._tree
+
+    def wildcards(self) -> WildcardIndex:
+        if self._wildcards is None:
+            self._wildcards = WildcardIndex(self.resource_identifiers)
+        return self._wildcards
+
+
+class ValidationRule:
+    """Visitor hooks called during the shared walk; override the ones a rule needs.
+
+    Hooks are generators of issues. Subclasses declare their issue code as
+    `name` and the parts of the walk they read as `needs`; parts no selected
+    rule needs are skipped. Rules with `blocks_writes` off are reported by
+    `check` but never refuse a mutation.
+    """
+
+    name: ClassVar[str]
+    summary: ClassVar[str]
+    needs: ClassVar[frozenset[RuleNeed]]
+    modes: ClassVar[frozenset[ValidationMode]] = frozenset({"strict", "ilograph-native"})
+    blocks_writes: ClassVar[bool] = True
+
+    def __init__(self, *, mode: ValidationMode) -> None:
+        self.mode = mode
+
+    def visit_resource(
+        self,
+        location: ResourceLocation,
+        facts: DocumentFacts,
+    ) -> Iterator[ValidationIssue]:
+        return iter(())
+
+    def visit_perspective(
+        self,
+        index: int,
+        perspective: YamlMapping,
+        facts: DocumentFacts,
+    ) -> Iterator[ValidationIssue]:
+        return iter(())
+
+    def visit_alias(
+        self,
+        path: FieldPath,
+        alias: YamlMapping,
+        facts: DocumentFacts,
+    ) -> Iterator[ValidationIssue]:
+        return iter(())
+
+    def visit_reference(
+        self,
+        field: ReferenceField,
+        aliases: set[str],
+        facts: DocumentFacts,
+    ) -> Iterator[ValidationIssue]:
+        return iter(())
+
+    def finish(self, facts: DocumentFacts) -> Iterator[ValidationIssue]:
+        return iter(())
+
+
 def validate_document(
-    document: CommentedMap,
+    document: YamlMapping,
     *,
     mode: ValidationMode = "ilograph-native",
+    only_rules: Collection[str] = (),
+    ignore_rules: Collection[str] = (),
+    max_issues: int | None = None,
 ) -> CheckResult:
-    """Run consistency checks required by CLI."""
+    """Run consistency checks required by CLI; deselected rules never run.
+
+    With `max_issues`, validation stops as soon as that many issues are found.
+    """
+
+    run = stream_validation(
+        document,
+        mode=mode,
+        only_rules=only_rules,
+        ignore_rules=ignore_rules,
+    )
+    issues = list(islice(run, max_issues))
+    return CheckResult(issues, run.costs, complete=run.complete)
 
-    issues: list[ValidationIssue] = []
 
-    issues.extend(_check_duplicate_resource_ids(document))
-    issues.extend(_check_duplicate_perspective_ids(document))
-    issues.extend(_check_restricted_chars(document))
-    issues.extend(_check_broken_references(document, mode=mode))
-    return CheckResult(issues)
+def stream_validation(
+    document: YamlMapping,
+    *,
+    mode: ValidationMode = "ilograph-native",
+    only_rules: Collection[str] = (),
+    ignore_rules: Collection[str] = (),
+) -> ValidationRun:
+    """Lazy `validate_document`: iterate the result to walk the document."""
 
+    selected = select_rules(mode, only_rules=only_rules, ignore_rules=ignore_rules)
+    return ValidationRun(document, [rule(mode=mode) for rule in selected])
 
-def _check_duplicate_resource_ids(document: CommentedMap) -> list[ValidationIssue]:
-    explicit_ids: list[tuple[str, str]] = []
-    for location in build_resource_locations(document):
+
+def select_rules(
+    mode: ValidationMode,
+    *,
+    only_rules: Collection[str] = (),
+    ignore_rules: Collection[str] = (),
+) -> list[type[ValidationRule]]:
+    """Registered rules that apply to `mode` and survive the only/ignore filters.
+
+    Names no rule has match nothing; see `unknown_rule_names`.
+    """
+
+    return [
+        rule
+        for rule in RULES
+        if mode in rule.modes
+        and (not only_rules or rule.name in only_rules)
+        and rule.name not in ignore_rules
+    ]
+
+
+def unknown_rule_names(names: Collection[str]) -> list[str]:
+    """Names in `names` that no registered rule has, sorted."""
+
+    return sorted(set(names).difference(rule.name for rule in RULES))
+
+
+def run_rules(document: YamlMapping, rules: list[ValidationRule]) -> CheckResult:
+    """Walk `document` once with `rules` and collect everything they report."""
+
+    run = ValidationRun(document, rules)
+    return CheckResult(list(run), run.costs, complete=run.complete)
+
+
+class ValidationRun:
+    """One walk of a document: iterating yields issues as the rules find them.
+
+    Stopping early skips the rest of the walk; `complete` tells whether it
+    ran to the end. `costs` covers whatever part of the walk ran. With
+    `units`, only those top-level items are visited and `facts` must be
+    preset with the identifiers of the whole document.
+    """
+
+    def __init__(
+        self,
+        document: YamlMapping,
+        rules: list[ValidationRule],
+        *,
+        facts: DocumentFacts | None = None,
+        units: Collection[UnitKey] | None = None,
+    ) -> None:
+        self.document = document
+        self.rules = rules
+        self.facts = facts or DocumentFacts(document)
+        self.units = units
+        self.complete = False
+        self._seconds = [0.0] * len(rules)
+        self._counts = [0] * len(rules)
+        self._pending: list[ValidationIssue] = []
+        self._needs: frozenset[RuleNeed] = frozenset().union(*(rule.needs for rule in rules))
+        self._on_resource = _overriding(rules, "visit_resource")
+        self._on_perspective = _overriding(rules, "visit_perspective")
+        self._on_alias = _overriding(rules, "visit_alias")
+        self._on_reference = _overriding(rules, "visit_reference")
+
+    @property
+    def costs(self) -> list[RuleCost]:
+        return [
+            RuleCost(name=rule.name, seconds=seconds, issues=count)
+            for rule, seconds, count in zip(self.rules, self._seconds, self._counts, strict=True)
+        ]
+
+    def __iter__(self) -> Iterator[ValidationIssue]:
+        document = self.document
+        facts = self.facts
+        collect = not facts.preset
+
+        resources = document.get("resources") if "resources" in self._needs else None
+        if isinstance(resources, list):
+            indexes = self._unit_indexes("resources", len(resources))
+            for location in iter_resources(resources, indexes=indexes):
+                if collect:
+                    facts.resources.append(location)
+                    for key in ("id", "name"):
+                        value = location.node.get(key)
+                        if isinstance(value, str) and value.strip():
+                            facts.resource_identifiers.add(value.strip())
+                for position, rule in self._on_resource:
+                    self._collect(position, rule.visit_resource(location, facts))
+                if self._pending:
+                    yield from self._flush()
+
+        imports = document.get("imports") if collect and "imports" in self._needs else None
+        if isinstance(imports, list):
+            for item in imports:
+                if not isinstance(item, dict):
+                    continue
+                namespace = item.get("namespace")
+                if isinstance(namespace, str) and namespace.strip():
+                    facts.import_namespaces.add(namespace.strip())
+
+        perspectives = document.get("perspectives") if self._needs & _PERSPECTIVE_NEEDS else None
+        if isinstance(perspectives, list):
+            # Ids first (top level only), so references can be judged on sight.
+            for perspective in perspectives if collect else ():
+                if isinstance(perspective, dict):
+                    perspective_id = perspective_identifier(perspective)
+                    if perspective_id is not None:
+                        facts.perspective_identifiers.add(perspective_id)
+            indexes = self._unit_indexes("perspectives", len(perspectives))
+            for index in range(len(perspectives)) if indexes is None else indexes:
+                perspective = perspectives[index]
+                if isinstance(perspective, dict):
+                    yield from self._walk_perspective(index, perspective, facts)
+
+        for position, rule in enumerate(self.rules):
+            self._collect(position, rule.finish(facts))
+            yield from self._flush()
+        self.complete = True
+
+    def _unit_indexes(self, section: str, size: int) -> list[int] | None:
+        if self.units is None:
+            return None
+        return sorted({index for name, index in self.units if name == section and index < size})
+
+    def _walk_perspective(
+        self,
+        index: int,
+        perspective: YamlMapping,
+        facts: DocumentFacts,
+    ) -> Iterator[ValidationIssue]:
+        for position, rule in self._on_perspective:
+            self._collect(position, rule.visit_perspective(index, perspective, facts))
+        if self._pending:
+            yield from self._flush()
+
+        base = FieldPath(None, "perspectives", index)
+        aliases: set[str] = set()
+        raw_aliases = perspective.get("aliases") if self._needs & _ALIAS_NEEDS else None
+        if isinstance(raw_aliases, list):
+            for alias_index, alias in enumerate(raw_aliases):
+                if not isinstance(alias, dict):
+                    continue
+                alias_name = alias.get("alias")
+                if isinstance(alias_name, str):
+                    aliases.add(alias_name)
+                path = FieldPath(base, "aliases", alias_index)
+                for position, rule in self._on_alias:
+                    self._collect(position, rule.visit_alias(path, alias, facts))
+                if self._pending:
+                    yield from self._flush()
+
+        if "references" not in self._needs:
+            return
+        # `instanceOf` frequently points to imported type paths and cannot be checked
+        # as regular resource references without import/type resolution, so only
+        # perspective fields are visited.
+        perspective_id = perspective_identifier(perspective)
+        seconds, counts = self._seconds, self._counts
+        for field in iter_perspective_reference_fields(perspective, perspective_id, base):
+            # Parsed here so the shared cost is not billed to whichever rule asks first.
+            facts.components(field.value)
+            # `_collect` inlined: this is the hottest loop of the walk.
+            pending = self._pending
+            for position, rule in self._on_reference:
+                before = len(pending)
+                started = perf_counter()
+                pending.extend(rule.visit_reference(field, aliases, facts))
+                seconds[position] += perf_counter() - started
+                counts[position] += len(pending) - before
+            if pending:
+                yield from self._flush()
+
+    def _collect(self, position: int, issues: Iterator[ValidationIssue]) -> None:
+        pending = self._pending
+        before = len(pending)
+        started = perf_counter()
+        pending.extend(issues)
+        self._seconds[position] += perf_counter() - started
+        self._counts[position] += len(pending) - before
+
+    def _flush(self) -> list[ValidationIssue]:
+        # A walked node's issues go out together, once every rule has seen it.
+        found, self._pending = self._pending, []
+        return found
+
+
+def _overriding(rules: list[ValidationRule], hook: str) -> list[tuple[int, ValidationRule]]:
+    default = getattr(ValidationRule, hook)
+    return [
+        (position, rule)
+        for position, rule in enumerate(rules)
+        if getattr(type(rule), hook) is not default
+    ]
+
+
+class _DuplicateResourceIds(ValidationRule):
+    name = "duplicate-resource-id"
+    summary = "explicit resource ids must be unique"
+    needs = frozenset({"resources"})
+
+    def __init__(self, *, mode: ValidationMode) -> None:
+        super().__init__(mode=mode)
+        # id -> its first holder, until a second holder reports it
+        self._first: dict[str, ResourceLocation | None] = {}
+
+    def visit_resource(
+        self,
+        location: ResourceLocation,
+        facts: DocumentFacts,
+    ) -> Iterator[ValidationIssue]:
         raw_id = location.node.get("id")
-        if not isinstance(raw_id, str):
-            continue
-        resource_id = raw_id.strip()
-        if not resource_id:
-            continue
-        explicit_ids.append((resource_id, location.path))
-
-    counter = Counter(item[0] for item in explicit_ids)
-    issues: list[ValidationIssue] = []
-    for identifier, path in explicit_ids:
-        if counter[identifier] <= 1:
-            continue
-        issues.append(
-            ValidationIssue(
-                code="duplicate-resource-id",
-                path=path,
-                message=f"duplicate resource id: {identifier} (ids must be unique)",
-            )
+        if not isinstance(raw_id, str) or not raw_id.strip():
+            return
+        identifier = raw_id.strip()
+        if identifier not in self._first:
+            self._first[identifier] = location
+            return
+        first = self._first[identifier]
+        if first is not None:
+            self._first[identifier] = None
+            yield self._issue(identifier, first.path)
+        yield self._issue(identifier, location.path)
+
+    def _issue(self, identifier: str, path: str) -> ValidationIssue:
+        return ValidationIssue(
+            code=self.name,
+            path=path,
+            message=f"duplicate resource id: {identifier} (ids must be unique)",
         )
-    return issues
 
 
-def _check_duplicate_perspective_ids(document: CommentedMap) -> list[ValidationIssue]:
-    perspectives = document.get("perspectives")
-    if not isinstance(perspectives, CommentedSeq):
-        return []
+class _DuplicatePerspectiveIds(ValidationRule):
+    name = "duplicate-perspective-id"
+    summary = "explicit perspective ids must be unique"
+    needs = frozenset({"perspectives"})
 
-    explicit_ids: list[tuple[str, int]] = []
-    for index, perspective in enumerate(perspectives):
-        if not isinstance(perspective, CommentedMap):
-            continue
+    def __init__(self, *, mode: ValidationMode) -> None:
+        super().__init__(mode=mode)
+        self._first: dict[str, int | None] = {}
+
+    def visit_perspective(
+        self,
+        index: int,
+        perspective: YamlMapping,
+        facts: DocumentFacts,
+    ) -> Iterator[ValidationIssue]:
         raw_id = perspective.get("id")
-        if not isinstance(raw_id, str):
-            continue
-        perspective_id = raw_id.strip()
-        if not perspective_id:
-            continue
-        explicit_ids.append((perspective_id, index))
-
-    counter = Counter(item[0] for item in explicit_ids)
-    issues: list[ValidationIssue] = []
-    for identifier, index in explicit_ids:
-        if counter[identifier] <= 1:
-            continue
-        issues.append(
-            ValidationIssue(
-                code="duplicate-perspective-id",
-                path=f"perspectives[{index}]",
-                message=f"duplicate perspective id: {identifier} (ids must be unique)",
-            )
+        if not isinstance(raw_id, str) or not raw_id.strip():
+            return
+        identifier = raw_id.strip()
+        if identifier not in self._first:
+            self._first[identifier] = index
+            return
+        first = self._first[identifier]
+        if first is not None:
+            self._first[identifier] = None
+            yield self._issue(identifier, first)
+        yield self._issue(identifier, index)
+
+    def _issue(self, identifier: str, index: int) -> ValidationIssue:
+        return ValidationIssue(
+            code=self.name,
+            path=f"perspectives[{index}]",
+            message=f"duplicate perspective id: {identifier} (ids must be unique)",
         )
-    return issues
 
 
-def _check_restricted_chars(document: CommentedMap) -> list[ValidationIssue]:
-    issues: list[ValidationIssue] = []
-    for location in build_resource_locations(document):
+class _RestrictedResourceIdChars(ValidationRule):
+    name = "restricted-resource-id-char"
+    summary = "resource ids use letters, digits, ., -, _"
+    needs = frozenset({"resources"})
+
+    def visit_resource(
+        self,
+        location: ResourceLocation,
+        facts: DocumentFacts,
+    ) -> Iterator[ValidationIssue]:
         raw_id = location.node.get("id")
-        if isinstance(raw_id, str):
-            bad = _first_restricted_char(raw_id)
-            if bad is not None:
-                issues.append(
-                    ValidationIssue(
-                        code="restricted-resource-id-char",
-                        path=f"{location.path}.id",
-                        message=(
-                            f"resource id contains restricted char '{bad}' "
-                            "(use letters, digits, ., -, _)"
-                        ),
-                    )
-                )
+        if not isinstance(raw_id, str):
+            return
+        bad = _first_restricted_char(raw_id)
+        if bad is None:
+            return
+        yield ValidationIssue(
+            code=self.name,
+            path=f"{location.path}.id",
+            message=(
+                f"resource id contains restricted char '{bad}' (use letters, digits, ., -, _)"
+            ),
+        )
+
 
+class _NameNeedsId(ValidationRule):
+    name = "name-needs-id"
+    summary = "resources named with restricted chars need an explicit id"
+    needs = frozenset({"resources"})
+
+    def visit_resource(
+        self,
+        location: ResourceLocation,
+        facts: DocumentFacts,
+    ) -> Iterator[ValidationIssue]:
         raw_name = location.node.get("name")
-        if isinstance(raw_name, str) and "id" not in location.node:
-            bad = _first_restricted_char(raw_name)
-            if bad is not None:
-                issues.append(
-                    ValidationIssue(
-                        code="name-needs-id",
-                        path=f"{location.path}.name",
-                        message=(
-                            "resource name has restricted char and requires explicit id "
-                            f"('{bad}'; add a clean `id` field)"
-                        ),
-                    )
-                )
-
-    perspectives = document.get("perspectives")
-    if isinstance(perspectives, CommentedSeq):
-        for perspective_index, perspective in enumerate(perspectives):
-            if not isinstance(perspective, CommentedMap):
-                continue
-            aliases = perspective.get("aliases")
-            if not isinstance(aliases, CommentedSeq):
-                continue
-            for alias_index, alias in enumerate(aliases):
-                if not isinstance(alias, CommentedMap):
-                    continue
-                alias_value = alias.get("alias")
-                if not isinstance(alias_value, str):
-                    continue
-                bad = _first_restricted_char(alias_value)
-                if bad is None:
-                    continue
-                issues.append(
-                    ValidationIssue(
-                        code="restricted-alias-char",
-                        path=f"perspectives[{perspective_index}].aliases[{alias_index}].alias",
-                        message=(
-                            f"alias contains restricted char '{bad}' "
-                            "(use letters, digits, ., -, _)"
-                        ),
-                    )
-                )
-    return issues
+        if not isinstance(raw_name, str) or "id" in location.node:
+            return
+        bad = _first_restricted_char(raw_name)
+        if bad is None:
+            return
+        yield ValidationIssue(
+            code=self.name,
+            path=f"{location.path}.name",
+            message=(
+                "resource name has restricted char and requires explicit id "
+                f"('{bad}'; add a clean `id` field)"
+            ),
+        )
+
+
+class _RestrictedAliasChars(ValidationRule):
+    name = "restricted-alias-char"
+    summary = "aliases use letters, digits, ., -, _"
+    needs = frozenset({"aliases"})
+
+    def visit_alias(
+        self,
+        path: FieldPath,
+        alias: YamlMapping,
+        facts: DocumentFacts,
+    ) -> Iterator[ValidationIssue]:
+        alias_value = alias.get("alias")
+        if not isinstance(alias_value, str):
+            return
+        bad = _first_restricted_char(alias_value)
+        if bad is None:
+            return
+        yield ValidationIssue(
+            code=self.name,
+            path=f"{path}.alias",
+            message=(f"alias contains restricted char '{bad}' (use letters, digits, ., -, _)"),
+        )
 
 
 def _first_restricted_char(value: str) -> str | None:
@@ -183,102 +570,138 @@ def _first_restricted_char(value: str) -> str | None:
     return None
 
 
-def _check_broken_references(
-    document: CommentedMap,
-    *,
-    mode: ValidationMode,
-) -> list[ValidationIssue]:
-    issues: list[ValidationIssue] = []
-    perspective_aliases = _build_perspective_aliases(document)
-    import_namespaces = _build_import_namespaces(document)
-    known_identifiers = _collect_known_identifiers(document)
-    emitted: set[tuple[str, str]] = set()
-
-    # `instanceOf` frequently points to imported type paths and cannot be checked
-    # as regular resource references without import/type resolution.
-    for field in iter_reference_fields(document, include_instance_of=False):
-        aliases = perspective_aliases.get(field.perspective, set())
-        for component in parse_reference_components(field.value):
+class _BrokenReferences(ValidationRule):
+    name = "broken-reference"
+    summary = "references name a resource, perspective, alias or imported namespace"
+    needs = frozenset({"resources", "perspectives", "aliases", "references", "imports"})
+
+    def visit_reference(
+        self,
+        field: ReferenceField,
+        aliases: set[str],
+        facts: DocumentFacts,
+    ) -> Iterator[ValidationIssue]:
+        reported: set[str] = set()
+        for component in facts.components(field.value):
             token = component.token
-            if component.special or component.wildcard:
+            if component.special or (component.wildcard and not component.namespaced):
                 continue
-            if token in known_identifiers or token in aliases:
+            if token in facts.resource_identifiers or token in aliases:
+                continue
+            if token in facts.perspective_identifiers or token in reported:
                 continue
             if component.namespaced:
                 namespace = token.split("::", 1)[0]
-                if namespace in import_namespaces:
+                if namespace in facts.import_namespaces:
                     continue
-                if mode == "ilograph-native":
+                if self.mode == "ilograph-native":
                     continue
-            if (field.path, token) in emitted:
+            reported.add(token)
+            yield ValidationIssue(
+                code=self.name,
+                path=field.path,
+                message=(
+                    f"unknown reference '{token}' (not found in resources, aliases, or imports)"
+                ),
+            )
+
+
+class _UnmatchedWildcards(ValidationRule):
+    name = "unmatched-wildcard"
+    summary = "`*` references match at least one resource id or name"
+    needs = frozenset({"resources", "aliases", "references"})
+    # Ilograph renders stale wildcards as matching nothing, so edits stay allowed.
+    modes = frozenset({"strict"})
+    blocks_writes = False
+
+    def __init__(self, *, mode: ValidationMode) -> None:
+        super().__init__(mode=mode)
+        self._matches: dict[str, bool] = {}
+
+    def visit_reference(
+        self,
+        field: ReferenceField,
+        aliases: set[str],
+        facts: DocumentFacts,
+    ) -> Iterator[ValidationIssue]:
+        reported: set[str] = set()
+        for component in facts.components(field.value):
+            token = component.token
+            if not component.wildcard or component.namespaced or token in aliases:
+                continue
+            matched = self._matches.get(token)
+            if matched is None:
+                matched = self._matches[token] = facts.wildcards().any_match(token)
+            if matched or token in reported:
                 continue
-            emitted.add((field.path, token))
-            issues.append(
-                ValidationIssue(
-                    code="broken-reference",
-                    path=field.path,
-                    message=(
-                        f"unknown reference '{token}' "
-                        "(not found in resources, aliases, or imports)"
-                    ),
-                )
+            reported.add(token)
+            yield ValidationIssue(
+                code=self.name,
+                path=field.path,
+                message=f"wildcard '{token}' matches no resource id or name",
             )
-    return issues
-
-
-def _collect_known_identifiers(document: CommentedMap) -> set[str]:
-    known: set[str] = set()
-    for location in build_resource_locations(document):
-        resource_id = location.node.get("id")
-        if isinstance(resource_id, str) and resource_id.strip():
-            known.add(resource_id.strip())
-        resource_name = location.node.get("name")
-        if isinstance(resource_name, str) and resource_name.strip():
-            known.add(resource_name.strip())
-
-    perspectives = document.get("perspectives")
-    if isinstance(perspectives, CommentedSeq):
-        for perspective in perspectives:
-            if not isinstance(perspective, CommentedMap):
+
+
+class _ReferencePaths(ValidationRule):
+    """Every component exists somewhere (otherwise `broken-reference` fires);
+    here the path itself must lead from parent to child. Perspective fields
+    have no anchor resource, so `../` parts are left alone.
+    """
+
+    name = "unresolved-path"
+    summary = "`a/b` paths lead from each parent to its child"
+    needs = frozenset({"resources", "aliases", "references"})
+    # Ilograph's native check accepts such paths; edits elsewhere stay allowed.
+    modes = frozenset({"strict"})
+    blocks_writes = False
+
+    def visit_reference(
+        self,
+        field: ReferenceField,
+        aliases: set[str],
+        facts: DocumentFacts,
+    ) -> Iterator[ValidationIssue]:
+        value = field.value
+        if "/" not in value:
+            return
+        tree = facts.tree()
+        for part in facts.parts(value):
+            components = facts.components(part)
+            if len(components) < 2 or any(
+                component.special
+                or component.wildcard
+                or component.namespaced
+                or component.token in aliases
+                or not tree.lookup(component.token)
+                for component in components
+            ):
                 continue
-            perspective_id = perspective_identifier(perspective)
-            if perspective_id is not None:
-                known.add(perspective_id)
-    return known
+            resolution = tree.resolve(part)
+            if resolution.status != "unresolved":
+                continue
+            failed = len(resolution.steps) - 1
+            yield ValidationIssue(
+                code=self.name,
+                path=field.path,
+                message=(
+                    f"path '{part.strip()}' does not resolve: "
+                    f"'{components[failed].token}' is not a child of "
+                    f"'{components[failed - 1].token}'"
+                ),
+            )
 
 
-def _build_perspective_aliases(document: CommentedMap) -> dict[str | None, set[str]]:
-    result: dict[str | None, set[str]] = {}
-    perspectives = document.get("perspectives")
-    if not isinstance(perspectives, CommentedSeq):
-        return result
+# Registry, in report order.
+RULES: tuple[type[ValidationRule], ...] = (
+    _DuplicateResourceIds,
+    _DuplicatePerspectiveIds,
+    _RestrictedResourceIdChars,
+    _NameNeedsId,
+    _RestrictedAliasChars,
+    _BrokenReferences,
+    _UnmatchedWildcards,
+    _ReferencePaths,
+)
 
-    for perspective in perspectives:
-        if not isinstance(perspective, CommentedMap):
-            continue
-        perspective_id = perspective_identifier(perspective)
-        aliases_set: set[str] = set()
-        aliases = perspective.get("aliases")
-        if isinstance(aliases, CommentedSeq):
-            for alias in aliases:
-                if not isinstance(alias, CommentedMap):
-                    continue
-                alias_name = alias.get("alias")
-                if isinstance(alias_name, str):
-                    aliases_set.add(alias_name)
-        result[perspective_id] = aliases_set
-    return result
-
-
-def _build_import_namespaces(document: CommentedMap) -> set[str]:
-    namespaces: set[str] = set()
-    imports = document.get("imports")
-    if not isinstance(imports, CommentedSeq):
-        return namespaces
-    for item in imports:
-        if not isinstance(item, CommentedMap):
-            continue
-        namespace = item.get("namespace")
-        if isinstance(namespace, str) and namespace.strip():
-            namespaces.add(namespace.strip())
-    return namespaces
+# Rules a mutation may leave failing; the pre-write check skips them.
+WRITE_EXEMPT_RULES = frozenset(rule.name for rule in RULES if not rule.blocks_writes)
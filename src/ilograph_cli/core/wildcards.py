@@ -0,0 +1,82 @@
+"""Glob matching of `*` reference tokens against resource ids/names."""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_left
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+
+# Distinct wildcard tokens kept compiled; diagrams reuse a handful of patterns.
+_PATTERN_CACHE_SIZE = 4_096
+
+
+@dataclass(frozen=True, slots=True)
+class WildcardPattern:
+    """Compiled glob token: `*` matches any run of characters, the rest is literal."""
+
+    token: str
+    prefix: str
+    suffix: str
+    regex: re.Pattern[str]
+
+    def matches(self, identifier: str) -> bool:
+        return self.regex.fullmatch(identifier) is not None
+
+
+@lru_cache(maxsize=_PATTERN_CACHE_SIZE)
+def compile_wildcard(token: str) -> WildcardPattern:
+    """Compile `token`; literal text before the first and after the last `*` becomes anchors."""
+
+    pieces = token.split("*")
+    prefix = pieces[0]
+    suffix = pieces[-1] if len(pieces) > 1 else ""
+    regex = re.compile(".*".join(re.escape(piece) for piece in pieces), re.DOTALL)
+    return WildcardPattern(token=token, prefix=prefix, suffix=suffix, regex=regex)
+
+
+class WildcardIndex:
+    """Identifiers sorted forwards and reversed, so prefix and suffix anchors bisect.
+
+    A pattern only scans the identifiers sharing its narrower anchor; patterns
+    with neither a literal prefix nor a literal suffix fall back to a full scan.
+    """
+
+    def __init__(self, identifiers: Iterable[str]) -> None:
+        self._forward = sorted(set(identifiers))
+        self._reversed = sorted(identifier[::-1] for identifier in self._forward)
+
+    def matches(self, token: str) -> list[str]:
+        """Identifiers matching `token`, sorted."""
+
+        pattern = compile_wildcard(token)
+        return sorted(filter(pattern.matches, self._candidates(pattern)))
+
+    def any_match(self, token: str) -> bool:
+        """Whether at least one identifier matches `token`."""
+
+        pattern = compile_wildcard(token)
+        return any(map(pattern.matches, self._candidates(pattern)))
+
+    def _candidates(self, pattern: WildcardPattern) -> Iterable[str]:
+        prefix_lo, prefix_hi = _prefix_range(self._forward, pattern.prefix)
+        suffix_lo, suffix_hi = _prefix_range(self._reversed, pattern.suffix[::-1])
+        if prefix_hi - prefix_lo <= suffix_hi - suffix_lo:
+            return self._forward[prefix_lo:prefix_hi]
+        return (item[::-1] for item in self._reversed[suffix_lo:suffix_hi])
+
+
+def _prefix_range(ordered: list[str], prefix: str) -> tuple[int, int]:
+    if not prefix:
+        return 0, len(ordered)
+    lo = bisect_left(ordered, prefix)
+    hi = lo
+    # Items sharing `prefix` are contiguous from `lo`; bisect past them on the successor string.
+    last = ord(prefix[-1])
+    if last < 0x10FFFF:
+        hi = bisect_left(ordered, prefix[:-1] + chr(last + 1), lo)
+    else:
+        while hi < len(ordered) and ordered[hi].startswith(prefix):
+            hi += 1
+    return lo, hi
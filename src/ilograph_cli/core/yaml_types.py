@@ -2,7 +2,14 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from ruamel.yaml.comments import CommentedMap, CommentedSeq
 
 type YamlScalar = str | int | float | bool | None
 type YamlNode = CommentedMap | CommentedSeq | YamlScalar
+
+# Containers accepted by read helpers: CommentedMap/CommentedSeq from round-trip
+# loads, plain dict/list from the read-only loader.
+type YamlMapping = dict[Any, Any]
+type YamlSequence = list[Any]
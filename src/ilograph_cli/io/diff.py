@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 import re
-from collections.abc import Iterable
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
-from difflib import unified_diff
 
 from rich.console import Console
 from rich.text import Text
 
+from ilograph_cli.io.line_diff import Opcode, diff_opcodes, grouped_opcodes, hunk_lines
+
 
 @dataclass(slots=True)
 class DiffSummary:
@@ -35,77 +37,88 @@ _TOP_LEVEL_SECTION_LINE_RE = re.compile(
 _DEFAULT_TOUCHED_SECTIONS: tuple[str, ...] = ("resources", "contexts", "perspectives")
 
 
-def build_unified_diff(before: str, after: str, path: str) -> list[str]:
-    """Build unified diff lines."""
+@dataclass(slots=True)
+class TextDiff:
+    """One line diff of a mutation; stats, sections and rendering all read from it."""
+
+    before_lines: list[str]
+    after_lines: list[str]
+    fromfile: str
+    tofile: str
+    hunks: list[list[Opcode]]
+
+    def summary(self) -> DiffSummary:
+        """Collect +/-, hunk count without rendering any lines."""
+
+        summary = DiffSummary(hunks=len(self.hunks))
+        for tag, i1, i2, j1, j2 in _changed_opcodes(self.hunks):
+            if tag != "insert":
+                summary.deleted += i2 - i1
+            if tag != "delete":
+                summary.added += j2 - j1
+        return summary
+
+    def touched_sections(
+        self,
+        *,
+        sections: tuple[str, ...] = _DEFAULT_TOUCHED_SECTIONS,
+    ) -> list[SectionDiff]:
+        """Attribute +/- lines to the top-level section they fall in."""
+
+        before_sections = _SectionIndex(self.before_lines)
+        after_sections = _SectionIndex(self.after_lines)
+        counts = {section: SectionDiff(name=section) for section in sections}
+        for tag, i1, i2, j1, j2 in _changed_opcodes(self.hunks):
+            if tag != "insert":
+                for index in range(i1, i2):
+                    touched = counts.get(before_sections.name_at(index) or "")
+                    if touched is not None:
+                        touched.deleted += 1
+            if tag != "delete":
+                for index in range(j1, j2):
+                    touched = counts.get(after_sections.name_at(index) or "")
+                    if touched is not None:
+                        touched.added += 1
+        return [touched for touched in counts.values() if touched.added or touched.deleted]
+
+    def line_count(self) -> int:
+        """Number of lines `iter_lines` yields."""
+
+        if not self.hunks:
+            return 0
+        total = 2
+        for group in self.hunks:
+            total += 1
+            for tag, i1, i2, j1, j2 in group:
+                total += i2 - i1 if tag == "equal" else (i2 - i1) + (j2 - j1)
+        return total
+
+    def iter_lines(self) -> Iterator[str]:
+        """Render unified diff lines lazily, hunk by hunk."""
+
+        if not self.hunks:
+            return
+        yield f"--- {self.fromfile}"
+        yield f"+++ {self.tofile}"
+        for group in self.hunks:
+            yield from hunk_lines(self.before_lines, self.after_lines, group)
+
+
+def build_diff(before: str, after: str, path: str) -> TextDiff:
+    """Diff `before` against `after` once; rendering is deferred to `iter_lines`."""
 
     normalized_path = _normalize_path_for_diff(path)
-    return list(
-        unified_diff(
-            before.splitlines(keepends=False),
-            after.splitlines(keepends=False),
-            fromfile=f"a/{normalized_path}",
-            tofile=f"b/{normalized_path}",
-            lineterm="",
-        )
+    before_lines = before.splitlines(keepends=False)
+    after_lines = after.splitlines(keepends=False)
+    return TextDiff(
+        before_lines=before_lines,
+        after_lines=after_lines,
+        fromfile=f"a/{normalized_path}",
+        tofile=f"b/{normalized_path}",
+        hunks=list(grouped_opcodes(diff_opcodes(before_lines, after_lines))),
     )
 
 
-def summarize_diff(lines: Iterable[str]) -> DiffSummary:
-    """Collect +/-, hunk count from unified diff output."""
-
-    summary = DiffSummary()
-    for line in lines:
-        if line.startswith("@@"):
-            summary.hunks += 1
-            continue
-        if line.startswith("+++"):
-            continue
-        if line.startswith("---"):
-            continue
-        if line.startswith("+"):
-            summary.added += 1
-            continue
-        if line.startswith("-"):
-            summary.deleted += 1
-    return summary
-
-
-def summarize_touched_sections(
-    before: str,
-    after: str,
-    *,
-    sections: tuple[str, ...] = _DEFAULT_TOUCHED_SECTIONS,
-) -> list[SectionDiff]:
-    """Summarize touched top-level sections by +/- line counts."""
-
-    before_blocks = _extract_top_level_blocks(before)
-    after_blocks = _extract_top_level_blocks(after)
-    touched: list[SectionDiff] = []
-
-    for section in sections:
-        before_block = before_blocks.get(section, [])
-        after_block = after_blocks.get(section, [])
-        if before_block == after_block:
-            continue
-
-        section_diff = unified_diff(
-            before_block,
-            after_block,
-            fromfile=f"a/{section}",
-            tofile=f"b/{section}",
-            lineterm="",
-        )
-        summary = summarize_diff(section_diff)
-        touched.append(
-            SectionDiff(
-                name=section,
-                added=summary.added,
-                deleted=summary.deleted,
-            )
-        )
-    return touched
-
-
 def print_diff(console: Console, lines: Iterable[str]) -> None:
     """Print colored diff."""
 
@@ -129,22 +142,28 @@ def _normalize_path_for_diff(path: str) -> str:
     return normalized or path
 
 
-def _extract_top_level_blocks(raw: str) -> dict[str, list[str]]:
-    lines = raw.splitlines(keepends=False)
-    starts: list[tuple[int, str]] = []
-    for index, line in enumerate(lines):
-        if line.startswith(" "):
-            continue
-        match = _TOP_LEVEL_SECTION_LINE_RE.match(line)
-        if match is None:
-            continue
-        starts.append((index, match.group("name")))
-
-    if not starts:
-        return {}
-
-    blocks: dict[str, list[str]] = {}
-    for idx, (start_index, name) in enumerate(starts):
-        end_index = starts[idx + 1][0] if idx + 1 < len(starts) else len(lines)
-        blocks[name] = lines[start_index:end_index]
-    return blocks
+def _changed_opcodes(hunks: list[list[Opcode]]) -> Iterator[Opcode]:
+    for group in hunks:
+        for opcode in group:
+            if opcode[0] != "equal":
+                yield opcode
+
+
+class _SectionIndex:
+    """Maps line numbers to the top-level section (`name:` line) containing them."""
+
+    def __init__(self, lines: list[str]) -> None:
+        self.starts: list[int] = []
+        self.names: list[str] = []
+        for index, line in enumerate(lines):
+            if line.startswith(" "):
+                continue
+            match = _TOP_LEVEL_SECTION_LINE_RE.match(line)
+            if match is None:
+                continue
+            self.starts.append(index)
+            self.names.append(match.group("name"))
+
+    def name_at(self, index: int) -> str | None:
+        position = bisect_right(self.starts, index) - 1
+        return self.names[position] if position >= 0 else None
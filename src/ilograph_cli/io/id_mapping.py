@@ -0,0 +1,56 @@
+"""Id mapping files for bulk renames: CSV rows or a JSON object."""
+
+from __future__ import annotations
+
+import csv
+import json
+from pathlib import Path
+
+from ilograph_cli.core.errors import ValidationError
+from ilograph_cli.io.yaml_io import read_text
+
+_CSV_HEADER = ("from", "to")
+
+
+def load_id_mapping(path: Path) -> list[tuple[str, str]]:
+    """`(old, new)` pairs in file order; duplicates are kept for the caller to reject."""
+
+    suffix = path.suffix.lower()
+    if suffix == ".json":
+        return _json_pairs(read_text(path), path)
+    if suffix == ".csv":
+        return _csv_pairs(read_text(path), path)
+    raise ValidationError(
+        f"unsupported mapping file type: {path.suffix or '(none)'} (use .csv or .json)"
+    )
+
+
+def _json_pairs(text: str, path: Path) -> list[tuple[str, str]]:
+    try:
+        loaded = json.loads(text, object_pairs_hook=list)
+    except json.JSONDecodeError as exc:
+        raise ValidationError(f"json parse error in {path}: {exc}") from exc
+    if not isinstance(loaded, list) or not all(isinstance(pair, tuple) for pair in loaded):
+        raise ValidationError(f"mapping file must hold a JSON object of old -> new ids: {path}")
+    pairs: list[tuple[str, str]] = []
+    for old, new in loaded:
+        if not isinstance(new, str):
+            raise ValidationError(f"mapping value for {old} must be a string id: {path}")
+        pairs.append((old, new))
+    return pairs
+
+
+def _csv_pairs(text: str, path: Path) -> list[tuple[str, str]]:
+    pairs: list[tuple[str, str]] = []
+    for line_number, row in enumerate(csv.reader(text.splitlines()), start=1):
+        cells = [cell.strip() for cell in row]
+        if not any(cells):
+            continue
+        if len(cells) != 2:
+            raise ValidationError(
+                f"mapping row {line_number} needs exactly 2 columns (old,new): {path}"
+            )
+        if line_number == 1 and tuple(cell.lower() for cell in cells) == _CSV_HEADER:
+            continue
+        pairs.append((cells[0], cells[1]))
+    return pairs
@@ -0,0 +1,300 @@
+"""Line diff engine: patience anchors, bounded Myers gaps, difflib-shaped output."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Iterator, Sequence
+from typing import Literal
+
+type OpcodeTag = Literal["equal", "replace", "insert", "delete"]
+type Opcode = tuple[OpcodeTag, int, int, int, int]
+type _Block = tuple[int, int, int]
+type _Range = tuple[int, int, int, int]
+
+# Upper bound on edit distance explored per anchor-free gap. Past it the gap is
+# reported as one replacement, keeping worst-case cost at O((N + M) * bound).
+_MAX_GAP_EDIT_COST = 512
+
+
+def diff_opcodes(a: Sequence[str], b: Sequence[str]) -> list[Opcode]:
+    """Opcodes turning `a` into `b`, in `difflib.SequenceMatcher.get_opcodes` format."""
+
+    opcodes: list[Opcode] = []
+    i = j = 0
+    for ai, bj, size in matching_blocks(a, b):
+        if i < ai and j < bj:
+            opcodes.append(("replace", i, ai, j, bj))
+        elif i < ai:
+            opcodes.append(("delete", i, ai, j, bj))
+        elif j < bj:
+            opcodes.append(("insert", i, ai, j, bj))
+        i, j = ai + size, bj + size
+        if size:
+            opcodes.append(("equal", ai, i, bj, j))
+    return opcodes
+
+
+def matching_blocks(a: Sequence[str], b: Sequence[str]) -> list[_Block]:
+    """Increasing `(i, j, size)` runs with `a[i:i+size] == b[j:j+size]`, plus sentinel."""
+
+    interned: dict[str, int] = {}
+    left = [interned.setdefault(line, len(interned)) for line in a]
+    right = [interned.setdefault(line, len(interned)) for line in b]
+
+    blocks: list[_Block] = []
+    pending: list[_Block | _Range] = [(0, len(left), 0, len(right))]
+    while pending:
+        task = pending.pop()
+        if len(task) == 3:
+            blocks.append(task)
+            continue
+        alo, ahi, blo, bhi = task
+        pending.extend(reversed(_split_range(left, right, alo, ahi, blo, bhi)))
+
+    return [*_merge_adjacent(blocks), (len(left), len(right), 0)]
+
+
+def grouped_opcodes(opcodes: list[Opcode], context: int = 3) -> Iterator[list[Opcode]]:
+    """Hunks with `context` lines around changes (`get_grouped_opcodes` semantics)."""
+
+    codes = list(opcodes) or [("equal", 0, 1, 0, 1)]
+    if codes[0][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[0]
+        codes[0] = (tag, max(i1, i2 - context), i2, max(j1, j2 - context), j2)
+    if codes[-1][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[-1]
+        codes[-1] = (tag, i1, min(i2, i1 + context), j1, min(j2, j1 + context))
+
+    group: list[Opcode] = []
+    for tag, i1, i2, j1, j2 in codes:
+        if tag == "equal" and i2 - i1 > context * 2:
+            group.append((tag, i1, min(i2, i1 + context), j1, min(j2, j1 + context)))
+            yield group
+            group = []
+            i1, j1 = max(i1, i2 - context), max(j1, j2 - context)
+        group.append((tag, i1, i2, j1, j2))
+    if group and not (len(group) == 1 and group[0][0] == "equal"):
+        yield group
+
+
+def unified_diff_lines(
+    a: Sequence[str],
+    b: Sequence[str],
+    *,
+    fromfile: str,
+    tofile: str,
+    context: int = 3,
+) -> Iterator[str]:
+    """Unified diff lines without terminators (`difflib.unified_diff(lineterm="")` format)."""
+
+    started = False
+    for group in grouped_opcodes(diff_opcodes(a, b), context):
+        if not started:
+            started = True
+            yield f"--- {fromfile}"
+            yield f"+++ {tofile}"
+        yield from hunk_lines(a, b, group)
+
+
+def hunk_lines(a: Sequence[str], b: Sequence[str], group: list[Opcode]) -> Iterator[str]:
+    """`@@` header plus body lines for one group from `grouped_opcodes`."""
+
+    first, last = group[0], group[-1]
+    yield f"@@ -{_format_range(first[1], last[2])} +{_format_range(first[3], last[4])} @@"
+    for tag, i1, i2, j1, j2 in group:
+        if tag == "equal":
+            for line in a[i1:i2]:
+                yield f" {line}"
+            continue
+        if tag in {"replace", "delete"}:
+            for line in a[i1:i2]:
+                yield f"-{line}"
+        if tag in {"replace", "insert"}:
+            for line in b[j1:j2]:
+                yield f"+{line}"
+
+
+def _split_range(
+    a: list[int],
+    b: list[int],
+    alo: int,
+    ahi: int,
+    blo: int,
+    bhi: int,
+) -> list[_Block | _Range]:
+    """Matches and sub-ranges (in order) for `a[alo:ahi]` vs `b[blo:bhi]`."""
+
+    prefix = 0
+    while alo + prefix < ahi and blo + prefix < bhi and a[alo + prefix] == b[blo + prefix]:
+        prefix += 1
+    suffix = 0
+    while (
+        alo + prefix < ahi - suffix
+        and blo + prefix < bhi - suffix
+        and a[ahi - suffix - 1] == b[bhi - suffix - 1]
+    ):
+        suffix += 1
+
+    head: list[_Block | _Range] = []
+    tail: list[_Block | _Range] = []
+    if prefix:
+        head.append((alo, blo, prefix))
+    if suffix:
+        tail.append((ahi - suffix, bhi - suffix, suffix))
+    alo, blo = alo + prefix, blo + prefix
+    ahi, bhi = ahi - suffix, bhi - suffix
+    if alo == ahi or blo == bhi:
+        return [*head, *tail]
+
+    anchors = _unique_anchors(a, b, alo, ahi, blo, bhi)
+    if not anchors:
+        return [*head, *_bounded_myers(a, b, alo, ahi, blo, bhi), *tail]
+
+    middle: list[_Block | _Range] = []
+    cursor_a, cursor_b = alo, blo
+    for i, j in anchors:
+        if cursor_a < i or cursor_b < j:
+            middle.append((cursor_a, i, cursor_b, j))
+        middle.append((i, j, 1))
+        cursor_a, cursor_b = i + 1, j + 1
+    if cursor_a < ahi or cursor_b < bhi:
+        middle.append((cursor_a, ahi, cursor_b, bhi))
+    return [*head, *middle, *tail]
+
+
+def _unique_anchors(
+    a: list[int],
+    b: list[int],
+    alo: int,
+    ahi: int,
+    blo: int,
+    bhi: int,
+) -> list[tuple[int, int]]:
+    """Longest increasing run of lines occurring exactly once on each side."""
+
+    counts: dict[int, int] = {}
+    for index in range(alo, ahi):
+        counts[a[index]] = counts.get(a[index], 0) + 1
+    positions_in_b: dict[int, int] = {}
+    b_counts: dict[int, int] = {}
+    for index in range(blo, bhi):
+        value = b[index]
+        if counts.get(value) != 1:
+            continue
+        b_counts[value] = b_counts.get(value, 0) + 1
+        positions_in_b[value] = index
+
+    pairs = [
+        (index, positions_in_b[a[index]])
+        for index in range(alo, ahi)
+        if counts[a[index]] == 1 and b_counts.get(a[index]) == 1
+    ]
+    if not pairs:
+        return []
+
+    # Patience sorting over b positions; `links` rebuilds the longest chain.
+    tails: list[int] = []
+    tail_pairs: list[int] = []
+    links: list[int] = [-1] * len(pairs)
+    for pair_index, (_i, j) in enumerate(pairs):
+        slot = bisect_left(tails, j)
+        if slot:
+            links[pair_index] = tail_pairs[slot - 1]
+        if slot == len(tails):
+            tails.append(j)
+            tail_pairs.append(pair_index)
+        else:
+            tails[slot] = j
+            tail_pairs[slot] = pair_index
+
+    chain: list[tuple[int, int]] = []
+    cursor = tail_pairs[-1]
+    while cursor != -1:
+        chain.append(pairs[cursor])
+        cursor = links[cursor]
+    chain.reverse()
+    return chain
+
+
+def _bounded_myers(
+    a: list[int],
+    b: list[int],
+    alo: int,
+    ahi: int,
+    blo: int,
+    bhi: int,
+) -> list[_Block]:
+    """Myers O(ND) matches for one gap; no matches once the cost bound is exceeded."""
+
+    n, m = ahi - alo, bhi - blo
+    max_cost = min(n + m, _MAX_GAP_EDIT_COST)
+    frontier: dict[int, int] = {1: 0}
+    trace: list[dict[int, int]] = []
+    for cost in range(max_cost + 1):
+        trace.append(dict(frontier))
+        for diagonal in range(-cost, cost + 1, 2):
+            if diagonal == -cost or (
+                diagonal != cost and frontier[diagonal - 1] < frontier[diagonal + 1]
+            ):
+                x = frontier[diagonal + 1]
+            else:
+                x = frontier[diagonal - 1] + 1
+            y = x - diagonal
+            while x < n and y < m and a[alo + x] == b[blo + y]:
+                x += 1
+                y += 1
+            frontier[diagonal] = x
+            if x >= n and y >= m:
+                return _myers_backtrack(trace, n, m, alo, blo)
+    return []
+
+
+def _myers_backtrack(
+    trace: list[dict[int, int]],
+    n: int,
+    m: int,
+    alo: int,
+    blo: int,
+) -> list[_Block]:
+    matches: list[tuple[int, int]] = []
+    x, y = n, m
+    for cost in range(len(trace) - 1, -1, -1):
+        frontier = trace[cost]
+        diagonal = x - y
+        if diagonal == -cost or (
+            diagonal != cost and frontier[diagonal - 1] < frontier[diagonal + 1]
+        ):
+            previous = diagonal + 1
+        else:
+            previous = diagonal - 1
+        previous_x = frontier[previous] if cost else 0
+        previous_y = previous_x - previous if cost else 0
+        while x > previous_x and y > previous_y:
+            x -= 1
+            y -= 1
+            matches.append((x, y))
+        x, y = previous_x, previous_y
+
+    return _merge_adjacent([(alo + i, blo + j, 1) for i, j in reversed(matches)])
+
+
+def _merge_adjacent(blocks: list[_Block]) -> list[_Block]:
+    merged: list[_Block] = []
+    for i, j, size in blocks:
+        if merged:
+            last_i, last_j, last_size = merged[-1]
+            if last_i + last_size == i and last_j + last_size == j:
+                merged[-1] = (last_i, last_j, last_size + size)
+                continue
+        merged.append((i, j, size))
+    return merged
+
+
+def _format_range(start: int, stop: int) -> str:
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return f"{beginning}"
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
@@ -0,0 +1,92 @@
+"""Pre-formatted listing output (plain/tsv/ndjson) written in buffered chunks."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from typing import IO, Literal
+
+type OutputFormat = Literal["table", "plain", "tsv", "ndjson"]
+
+OUTPUT_FORMATS: tuple[OutputFormat, ...] = ("table", "plain", "tsv", "ndjson")
+MACHINE_FORMATS: frozenset[OutputFormat] = frozenset({"tsv", "ndjson"})
+
+_CHUNK_CHARS = 1 << 16
+_TSV_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+@dataclass(slots=True)
+class TableView:
+    """Rows of one listing, independent of how they end up rendered."""
+
+    title: str
+    columns: list[str]
+    rows: list[list[str]] = field(default_factory=list)
+    records: list[Mapping[str, object]] = field(default_factory=list)
+
+    def add_row(self, *cells: str, record: Mapping[str, object] | None = None) -> None:
+        """Append display cells; `record` is the ndjson object (defaults to the cells)."""
+
+        self.rows.append(list(cells))
+        if record is None:
+            record = {
+                _record_key(column): cell for column, cell in zip(self.columns, cells, strict=True)
+            }
+        self.records.append(record)
+
+
+def table_lines(view: TableView, output_format: OutputFormat) -> Iterator[str]:
+    """Render `view` as lines for a non-rich format."""
+
+    if output_format == "ndjson":
+        for record in view.records:
+            yield json.dumps(record, ensure_ascii=False, default=str)
+        return
+    if output_format == "tsv":
+        yield "\t".join(_record_key(column) for column in view.columns)
+        for row in view.rows:
+            yield "\t".join(cell.translate(_TSV_ESCAPES) for cell in row)
+        return
+    if output_format == "plain":
+        yield from _plain_lines(view)
+        return
+    raise ValueError(f"no line rendering for output format: {output_format}")
+
+
+def write_lines(stream: IO[str], lines: Iterable[str]) -> None:
+    """Write newline-terminated `lines` to `stream` in large chunks."""
+
+    chunk: list[str] = []
+    size = 0
+    for line in lines:
+        chunk.append(line)
+        size += len(line) + 1
+        if size >= _CHUNK_CHARS:
+            stream.write("\n".join(chunk) + "\n")
+            chunk = []
+            size = 0
+    if chunk:
+        stream.write("\n".join(chunk) + "\n")
+    stream.flush()
+
+
+def _plain_lines(view: TableView) -> Iterator[str]:
+    rows = [[" ".join(cell.splitlines()) for cell in row] for row in view.rows]
+    widths = [len(column) for column in view.columns]
+    for row in rows:
+        for index, cell in enumerate(row):
+            widths[index] = max(widths[index], len(cell))
+
+    yield view.title
+    yield _aligned(view.columns, widths)
+    for row in rows:
+        yield _aligned(row, widths)
+
+
+def _aligned(cells: list[str], widths: list[int]) -> str:
+    return "  ".join(cell.ljust(width) for cell, width in zip(cells, widths, strict=True)).rstrip()
+
+
+def _record_key(column: str) -> str:
+    return column.strip().lower().replace(" ", "_")
@@ -0,0 +1,361 @@
+"""On-disk parse cache for read-only commands."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+from contextlib import suppress
+from dataclasses import dataclass
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+
+from ruamel.yaml import __version__ as ruamel_version
+
+from ilograph_cli import __version__
+from ilograph_cli.core.validation_snapshot import ValidationSnapshot
+from ilograph_cli.core.yaml_types import YamlMapping, YamlSequence
+from ilograph_cli.io.yaml_io import (
+    YamlFormatProfile,
+    parse_document_readonly,
+    scan_source,
+)
+
+CACHE_DIR_ENV = "ILOGRAPH_CLI_CACHE_DIR"
+CACHE_DISABLE_ENV = "ILOGRAPH_CLI_NO_CACHE"
+CACHE_MAX_BYTES_ENV = "ILOGRAPH_CLI_CACHE_MAX_BYTES"
+DEFAULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+_CACHE_SCHEMA = 4
+_ENTRY_SUFFIX = ".pickle"
+# Ends in the entry suffix so eviction weighs and ages it like any entry.
+_VALIDATION_SUFFIX = ".validation.pickle"
+_UNPICKLE_ERRORS: tuple[type[Exception], ...] = (
+    OSError,
+    EOFError,
+    pickle.PickleError,
+    AttributeError,
+    ImportError,
+    IndexError,
+    TypeError,
+    ValueError,
+)
+
+
+@dataclass(slots=True)
+class CachedDocument:
+    """Parsed read-only document payload stored in cache entries."""
+
+    document: YamlMapping
+    format_profile: YamlFormatProfile
+
+
+@dataclass(frozen=True, slots=True)
+class _EntryKey:
+    path: str
+    size: int
+    mtime_ns: int
+    digest: str
+
+
+class ParseCache:
+    """Size-bounded LRU cache of parsed diagrams keyed by file fingerprint."""
+
+    def __init__(self, directory: Path, *, max_bytes: int = DEFAULT_CACHE_MAX_BYTES) -> None:
+        self.directory = directory
+        self.max_bytes = max(max_bytes, 0)
+
+    def get(self, path: Path, raw: bytes) -> CachedDocument | None:
+        """Return cached parse for `path` when fingerprint matches `raw`."""
+
+        payload = self._load(path, raw, _ENTRY_SUFFIX)
+        return payload if isinstance(payload, CachedDocument) else None
+
+    def put(self, path: Path, raw: bytes, cached: CachedDocument) -> None:
+        """Store parse result for `path`; failures leave cache unchanged."""
+
+        self._store(path, raw, _ENTRY_SUFFIX, cached)
+
+    def get_validation(self, path: Path, raw: bytes) -> ValidationSnapshot | None:
+        """Validation snapshot of `path` when fingerprint matches `raw`.
+
+        Kept in a file of its own so reading it does not unpickle the document.
+        """
+
+        payload = self._load(path, raw, _VALIDATION_SUFFIX)
+        return payload if isinstance(payload, ValidationSnapshot) else None
+
+    def put_validation(self, path: Path, raw: bytes, snapshot: ValidationSnapshot) -> None:
+        self._store(path, raw, _VALIDATION_SUFFIX, snapshot)
+
+    def discard(self, path: Path) -> None:
+        """Drop every entry stored for `path`."""
+
+        try:
+            resolved = str(path.resolve())
+        except OSError:
+            return
+        for suffix in (_ENTRY_SUFFIX, _VALIDATION_SUFFIX):
+            self._discard(self._entry_path(resolved, suffix))
+
+    def _load(self, path: Path, raw: bytes, suffix: str) -> object | None:
+        key = _entry_key(path, raw)
+        if key is None or not _is_private(self.directory, directory=True):
+            return None
+        entry_path = self._entry_path(key.path, suffix)
+        try:
+            with entry_path.open("rb") as handle:
+                # Unpickling runs code: only read what no other user could have written.
+                if not _is_private(handle.fileno(), directory=False):
+                    return None
+                header = pickle.load(handle)
+                if header != _header(key):
+                    return None
+                payload: object = pickle.load(handle)
+        except FileNotFoundError:
+            return None
+        except _UNPICKLE_ERRORS:
+            self._discard(entry_path)
+            return None
+
+        with suppress(OSError):
+            os.utime(entry_path)
+        return payload
+
+    def _store(self, path: Path, raw: bytes, suffix: str, payload: object) -> None:
+        key = _entry_key(path, raw)
+        if key is None:
+            return
+        entry_path = self._entry_path(key.path, suffix)
+        temp_path: Path | None = None
+        try:
+            self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+            if not _is_private(self.directory, directory=True):
+                return
+            with NamedTemporaryFile(
+                mode="wb",
+                dir=self.directory,
+                prefix=".entry.",
+                suffix=".tmp",
+                delete=False,
+            ) as temp_file:
+                temp_path = Path(temp_file.name)
+                pickle.dump(_header(key), temp_file, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(payload, temp_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, entry_path)
+            temp_path = None
+        except (OSError, pickle.PickleError, RecursionError, TypeError, AttributeError):
+            return
+        finally:
+            if temp_path is not None:
+                self._discard(temp_path)
+        self._evict()
+
+    def _entry_path(self, resolved_path: str, suffix: str) -> Path:
+        name = hashlib.blake2b(resolved_path.encode("utf-8"), digest_size=16).hexdigest()
+        return self.directory / f"{name}{suffix}"
+
+    def _evict(self) -> None:
+        entries: list[tuple[int, int, Path]] = []
+        total = 0
+        try:
+            candidates = list(self.directory.glob(f"*{_ENTRY_SUFFIX}"))
+        except OSError:
+            return
+        for candidate in candidates:
+            try:
+                stat = candidate.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, candidate))
+            total += stat.st_size
+
+        entries.sort()
+        for _, size, candidate in entries:
+            if total <= self.max_bytes:
+                break
+            self._discard(candidate)
+            total -= size
+
+    @staticmethod
+    def _discard(path: Path) -> None:
+        with suppress(OSError):
+            path.unlink()
+
+
+def default_parse_cache() -> ParseCache | None:
+    """Cache configured from environment, or None when disabled."""
+
+    directory = cache_directory()
+    if directory is None:
+        return None
+
+    max_bytes = DEFAULT_CACHE_MAX_BYTES
+    raw_max_bytes = os.environ.get(CACHE_MAX_BYTES_ENV, "").strip()
+    if raw_max_bytes:
+        try:
+            max_bytes = int(raw_max_bytes)
+        except ValueError:
+            max_bytes = DEFAULT_CACHE_MAX_BYTES
+    return ParseCache(directory, max_bytes=max_bytes)
+
+
+def cache_directory() -> Path | None:
+    """Configured cache directory, or None when caching is disabled."""
+
+    if os.environ.get(CACHE_DISABLE_ENV, "").strip() not in {"", "0"}:
+        return None
+
+    configured_dir = os.environ.get(CACHE_DIR_ENV, "").strip()
+    if configured_dir:
+        return Path(configured_dir).expanduser()
+    xdg_cache = os.environ.get("XDG_CACHE_HOME", "").strip()
+    base = Path(xdg_cache).expanduser() if xdg_cache else Path.home() / ".cache"
+    return base / "ilograph-cli"
+
+
+def load_document_cached(path: Path) -> YamlMapping:
+    """Load plain read-only document, reusing cached parse when file is unchanged."""
+
+    raw = path.read_bytes()
+    return _parse_cached(path, raw, raw.decode("utf-8"))
+
+
+def parse_text_cached(path: Path, raw_text: str) -> YamlMapping:
+    """Plain read-only tree for `raw_text` (current content of `path`), via cache."""
+
+    return _parse_cached(path, raw_text.encode("utf-8"), raw_text)
+
+
+def _parse_cached(path: Path, raw: bytes, raw_text: str) -> YamlMapping:
+    cache = default_parse_cache()
+    if cache is not None:
+        cached = cache.get(path, raw)
+        if cached is not None:
+            return cached.document
+
+    scanned = scan_source(raw_text)
+    document = parse_document_readonly(raw_text, path=path, scanned=scanned)
+    if cache is not None:
+        cache.put(
+            path,
+            raw,
+            CachedDocument(document=document, format_profile=scanned.format_profile),
+        )
+    return document
+
+
+def store_document_cached(
+    path: Path,
+    text: str,
+    document: YamlMapping,
+    *,
+    format_profile: YamlFormatProfile,
+    validation: ValidationSnapshot | None = None,
+) -> None:
+    """Write-through freshly written document (and its validation) so next read hits the cache."""
+
+    cache = default_parse_cache()
+    if cache is None:
+        return
+    raw = text.encode("utf-8")
+    # Best effort: the file is already written, so a failure here only costs a re-parse.
+    try:
+        cache.put(
+            path,
+            raw,
+            CachedDocument(document=_plain_mapping(document), format_profile=format_profile),
+        )
+        if validation is not None:
+            cache.put_validation(path, raw, validation)
+    except Exception:
+        cache.discard(path)
+
+
+def load_validation_cached(path: Path, raw_text: str) -> ValidationSnapshot | None:
+    """Validation snapshot stored for `raw_text` (current content of `path`), if any."""
+
+    cache = default_parse_cache()
+    if cache is None:
+        return None
+    return cache.get_validation(path, raw_text.encode("utf-8"))
+
+
+def _plain_mapping(document: YamlMapping) -> YamlMapping:
+    """Strip round-trip containers so cached entries match read-only loads.
+
+    Copies with an explicit stack, so nesting depth cannot overflow it.
+    """
+
+    plain: YamlMapping = {}
+    pending: list[tuple[YamlMapping | YamlSequence, YamlMapping | YamlSequence]] = [
+        (document, plain)
+    ]
+    while pending:
+        source, target = pending.pop()
+        if isinstance(source, dict) and isinstance(target, dict):
+            for key, value in source.items():
+                target[key] = _plain_value(value, pending)
+        elif isinstance(source, list) and isinstance(target, list):
+            target.extend(_plain_value(item, pending) for item in source)
+    return plain
+
+
+def _plain_value(
+    value: object,
+    pending: list[tuple[YamlMapping | YamlSequence, YamlMapping | YamlSequence]],
+) -> object:
+    """Plain scalar, or an empty container queued on `pending` to be filled."""
+
+    if isinstance(value, dict):
+        mapping: YamlMapping = {}
+        pending.append((value, mapping))
+        return mapping
+    if isinstance(value, list):
+        sequence: YamlSequence = []
+        pending.append((value, sequence))
+        return sequence
+    if isinstance(value, str):
+        return str(value)
+    return value
+
+
+def _is_private(target: Path | int, *, directory: bool) -> bool:
+    """Owned by the current user, and nobody else may write to it (or list it)."""
+
+    getuid = getattr(os, "getuid", None)
+    if getuid is None:
+        # No POSIX ownership (Windows): the per-user profile ACLs apply.
+        return True
+    try:
+        stat = os.stat(target)
+    except OSError:
+        return False
+    forbidden = 0o077 if directory else 0o022
+    return stat.st_uid == getuid() and not stat.st_mode & forbidden
+
+
+def _entry_key(path: Path, raw: bytes) -> _EntryKey | None:
+    try:
+        resolved = path.resolve()
+        stat = resolved.stat()
+    except OSError:
+        return None
+    return _EntryKey(
+        path=str(resolved),
+        size=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+        digest=hashlib.blake2b(raw, digest_size=32).hexdigest(),
+    )
+
+
+def _header(key: _EntryKey) -> dict[str, object]:
+    return {
+        "schema": _CACHE_SCHEMA,
+        "version": __version__,
+        "ruamel": ruamel_version,
+        "path": key.path,
+        "size": key.size,
+        "mtime_ns": key.mtime_ns,
+        "digest": key.digest,
+    }
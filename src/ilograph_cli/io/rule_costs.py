@@ -0,0 +1,72 @@
+"""Per-rule validation cost from the last `check` run, kept in the cache directory."""
+
+from __future__ import annotations
+
+import json
+import os
+from contextlib import suppress
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+
+from ilograph_cli.core.validators import RuleCost
+from ilograph_cli.io.parse_cache import cache_directory
+
+_COSTS_FILE = "rule-costs.json"
+
+
+def load_rule_costs() -> dict[str, RuleCost]:
+    """Last recorded cost per rule name; empty when nothing was recorded."""
+
+    directory = cache_directory()
+    if directory is None:
+        return {}
+    try:
+        loaded = json.loads((directory / _COSTS_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(loaded, dict):
+        return {}
+    costs: dict[str, RuleCost] = {}
+    for name, entry in loaded.items():
+        if not isinstance(entry, dict):
+            continue
+        seconds = entry.get("seconds")
+        issues = entry.get("issues")
+        if isinstance(seconds, int | float) and isinstance(issues, int):
+            costs[name] = RuleCost(name=name, seconds=float(seconds), issues=issues)
+    return costs
+
+
+def store_rule_costs(costs: list[RuleCost]) -> None:
+    """Record `costs`, keeping earlier entries for rules this run skipped; best effort."""
+
+    directory = cache_directory()
+    if directory is None or not costs:
+        return
+    merged = load_rule_costs()
+    merged.update((cost.name, cost) for cost in costs)
+    payload = {
+        name: {"seconds": cost.seconds, "issues": cost.issues}
+        for name, cost in sorted(merged.items())
+    }
+    temp_path: Path | None = None
+    try:
+        directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        with NamedTemporaryFile(
+            mode="w",
+            encoding="utf-8",
+            dir=directory,
+            prefix=".rule-costs.",
+            suffix=".tmp",
+            delete=False,
+        ) as temp_file:
+            temp_path = Path(temp_file.name)
+            json.dump(payload, temp_file, indent=2)
+        os.replace(temp_path, directory / _COSTS_FILE)
+        temp_path = None
+    except OSError:
+        return
+    finally:
+        if temp_path is not None:
+            with suppress(OSError):
+                temp_path.unlink()
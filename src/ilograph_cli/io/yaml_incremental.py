@@ -0,0 +1,267 @@
+"""Incremental emit: re-serialize only the subtrees a mutation touched."""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+
+from ruamel.yaml.comments import CommentedMap, CommentedSeq
+
+from ilograph_cli.io.yaml_io import YamlFormatProfile, dump_document
+from ilograph_cli.io.yaml_sections import has_anchor_definitions
+from ilograph_cli.io.yaml_style import restore_style_only_replacements
+from ilograph_cli.io.yaml_tracking import MutationLog
+
+type _Container = CommentedMap | CommentedSeq
+type _Chain = list[tuple[_Container, object]]
+
+_UNIT_MARKER = "__ilograph_unit_marker__"
+_SEQUENCE_ITEM_PREFIX_RE = re.compile(r"^ *(?:- +)+$")
+
+
+@dataclass(frozen=True, slots=True)
+class _Unit:
+    """Entry of a clean container whose value is the topmost dirty node on its path."""
+
+    chain: _Chain
+    start: int
+    end: int
+
+
+def emit_document(
+    document: CommentedMap,
+    source: str,
+    *,
+    mutations: MutationLog,
+    format_profile: YamlFormatProfile | None = None,
+) -> str:
+    """Serialize mutated `document`, patching `source` in place when possible."""
+
+    patched = emit_incremental(
+        document,
+        source,
+        mutations=mutations,
+        format_profile=format_profile,
+    )
+    if patched is not None:
+        return patched
+    dumped = dump_document(document, format_profile=format_profile)
+    return restore_style_only_replacements(source, dumped)
+
+
+def emit_incremental(
+    document: CommentedMap,
+    source: str,
+    *,
+    mutations: MutationLog,
+    format_profile: YamlFormatProfile | None = None,
+) -> str | None:
+    """Re-emit only dirty subtrees over their source spans; None when a full dump is needed.
+
+    `document` must have been loaded from `source` and mutated under `track_mutations()`.
+    """
+
+    if "\r" in source or has_anchor_definitions(source):
+        return None
+    if mutations.is_dirty(document):
+        return None
+    if not mutations.nodes:
+        return source
+
+    lines = source.splitlines(keepends=True)
+    locator = _Locator(document, mutations, lines)
+    units: dict[tuple[int, object], _Unit] = {}
+    for node in mutations.nodes.values():
+        unit = locator.unit_for(node)
+        if unit is None:
+            return None
+        parent, entry = unit.chain[-1]
+        units.setdefault((id(parent), entry), unit)
+
+    ordered = sorted(units.values(), key=lambda unit: unit.start)
+    output: list[str] = []
+    cursor = 0
+    for unit in ordered:
+        if unit.start < cursor:
+            return None
+        original = lines[unit.start : unit.end]
+        emitted = _emit_unit(unit.chain, format_profile)
+        # Spans run up to the next sibling, so they hold the blank lines before
+        # it; a dump that would drop or add any is left to the full dump.
+        if emitted is None or _layout_counts(emitted) != _layout_counts(original):
+            return None
+        output.extend(lines[cursor : unit.start])
+        output.append(restore_style_only_replacements("".join(original), "".join(emitted)))
+        cursor = unit.end
+    output.extend(lines[cursor:])
+
+    patched = "".join(output)
+    if not patched.endswith("\n"):
+        patched += "\n"
+    return patched
+
+
+class _Locator:
+    """Finds units by descending clean containers along original source positions."""
+
+    def __init__(
+        self,
+        document: CommentedMap,
+        mutations: MutationLog,
+        lines: list[str],
+    ) -> None:
+        self.document = document
+        self.mutations = mutations
+        self.lines = lines
+        self._positions: dict[int, list[tuple[int, int]]] = {}
+
+    def unit_for(self, node: _Container) -> _Unit | None:
+        target = (node.lc.line, node.lc.col)
+        if target[0] is None or target[1] is None:
+            return None
+
+        chain: _Chain = []
+        current: _Container = self.document
+        while True:
+            index = self._entry_index(current, target)
+            if index is None:
+                return None
+            entry: object = list(current)[index] if isinstance(current, CommentedMap) else index
+            chain.append((current, entry))
+            child = current[entry]
+            if child is node or self.mutations.is_dirty(child):
+                break
+            if not isinstance(child, (CommentedMap, CommentedSeq)):
+                return None
+            current = child
+
+        # Flow collections are re-emitted whole from their (block) parent entry.
+        for depth, (container, _entry) in enumerate(chain):
+            if container.fa.flow_style():
+                chain = chain[:depth]
+                break
+        # Comments the parent holds for the entry are emitted with the parent.
+        while chain and chain[-1][1] in chain[-1][0].ca.items:
+            chain = chain[:-1]
+        if not chain:
+            return None
+        return self._span(chain)
+
+    def _span(self, chain: _Chain) -> _Unit | None:
+        parent, entry = chain[-1]
+        index = _entry_position_index(parent, entry)
+        start = self._checked_line(parent, index)
+        if start is None:
+            return None
+
+        end = len(self.lines)
+        for container, level_entry in reversed(chain):
+            next_index = _entry_position_index(container, level_entry) + 1
+            if next_index < len(container):
+                next_line = self._checked_line(container, next_index)
+                if next_line is None:
+                    return None
+                end = next_line
+                break
+        return _Unit(chain=chain, start=start, end=end)
+
+    def _entry_index(self, container: _Container, target: tuple[int, int]) -> int | None:
+        positions = self._positions_of(container)
+        if positions is None:
+            return None
+        index = bisect_right(positions, target) - 1
+        return index if index >= 0 else None
+
+    def _positions_of(self, container: _Container) -> list[tuple[int, int]] | None:
+        cached = self._positions.get(id(container))
+        if cached is not None:
+            return cached
+        try:
+            if isinstance(container, CommentedMap):
+                positions = [tuple(container.lc.key(key)) for key in container]
+            else:
+                positions = [tuple(container.lc.item(index)) for index in range(len(container))]
+        except KeyError:
+            return None
+        if positions != sorted(positions):
+            return None
+        typed = [(int(line), int(col)) for line, col in positions]
+        self._positions[id(container)] = typed
+        return typed
+
+    def _checked_line(self, container: _Container, index: int) -> int | None:
+        positions = self._positions_of(container)
+        if positions is None or index >= len(positions):
+            return None
+        line, col = positions[index]
+        if line >= len(self.lines):
+            return None
+        prefix = self.lines[line][:col]
+        if isinstance(container, CommentedSeq) or prefix.strip():
+            # Sequence items (and compact mapping keys) must follow their own `- `.
+            return line if _SEQUENCE_ITEM_PREFIX_RE.match(prefix) else None
+        return line
+
+
+def _entry_position_index(container: _Container, entry: object) -> int:
+    if isinstance(container, CommentedMap):
+        return list(container).index(entry)
+    assert isinstance(entry, int)
+    return entry
+
+
+def _emit_unit(chain: _Chain, format_profile: YamlFormatProfile | None) -> list[str] | None:
+    parent, entry = chain[-1]
+    leaf = parent[entry]
+    emitted = dump_document(_skeleton(chain, leaf), format_profile=format_profile)
+    marked = dump_document(_skeleton(chain, _UNIT_MARKER), format_profile=format_profile)
+
+    offsets = [index for index, line in enumerate(marked.splitlines()) if _UNIT_MARKER in line]
+    if len(offsets) != 1:
+        return None
+    return emitted.splitlines(keepends=True)[offsets[0] :]
+
+
+def _skeleton(chain: _Chain, leaf: object) -> CommentedMap:
+    """Single-path copy of `chain` so `leaf` dumps at its original depth and indent."""
+
+    node = leaf
+    at_end = True
+    for depth in range(len(chain) - 1, -1, -1):
+        container, entry = chain[depth]
+        position = _entry_position_index(container, entry)
+        # Keep non-first entries off a parent item's `- ` line, as in the source.
+        needs_placeholder = (
+            depth > 0 and isinstance(chain[depth - 1][0], CommentedSeq) and position > 0
+        )
+        shell: _Container
+        if isinstance(container, CommentedMap):
+            shell = CommentedMap()
+            if needs_placeholder:
+                shell["_" if entry != "_" else "__"] = None
+            shell[entry] = node
+        else:
+            shell = CommentedSeq()
+            if needs_placeholder:
+                shell.append(None)
+            shell.append(node)
+        # A span reaching past a container's last entry also covers its end
+        # comments (blank lines before the next section, for instance). The
+        # representer only emits them next to a (here empty) comment slot.
+        at_end = at_end and position == len(container) - 1
+        if at_end and container.ca.end:
+            shell.ca.comment = [None, None]
+            shell.ca.end = list(container.ca.end)
+        node = shell
+
+    assert isinstance(node, CommentedMap)
+    return node
+
+
+def _layout_counts(lines: list[str]) -> tuple[int, int]:
+    """Comment and blank line counts, which a faithful re-emit must both keep."""
+
+    comments = sum(1 for line in lines if "#" in line)
+    blanks = sum(1 for line in lines if not line.strip())
+    return comments, blanks
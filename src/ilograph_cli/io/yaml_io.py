@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import hashlib
+import mmap
 import os
 import re
 import time
@@ -18,8 +20,10 @@ from ruamel.yaml.comments import CommentedMap, CommentedSeq
 from ruamel.yaml.error import YAMLError
 
 from ilograph_cli.core.errors import ValidationError
+from ilograph_cli.core.yaml_types import YamlMapping
 from ilograph_cli.core.yaml_types import YamlNode as CoreYamlNode
 from ilograph_cli.core.yaml_types import YamlScalar as CoreYamlScalar
+from ilograph_cli.io.yaml_tracking import TrackingConstructor, TrackingRepresenter
 
 type YamlScalar = CoreYamlScalar
 type YamlNode = CoreYamlNode
@@ -34,6 +38,26 @@ class YamlFormatProfile:
     top_level_sequence_indents: dict[str, int]
     unquoted_reference_brackets: set[tuple[str, str]]
 
+
+@dataclass(frozen=True, slots=True)
+class FileFingerprint:
+    """File identity + content digest observed when a command read its source."""
+
+    inode: int
+    size: int
+    mtime_ns: int
+    digest: str
+    observed_ns: int
+
+
+@dataclass(slots=True)
+class ScannedSource:
+    """Loader-ready text plus format hints, produced by one pass over the source."""
+
+    normalized: str
+    format_profile: YamlFormatProfile
+
+
 _REFERENCE_KEYS: frozenset[str] = frozenset(
     {
         "from",
@@ -71,6 +95,9 @@ _MAP_KEY_LINE_RE = re.compile(
     r"^(?P<indent>\s*)(?P<key>[A-Za-z_][A-Za-z0-9_-]*)\s*:\s*(?:#.*)?$"
 )
 _LOCK_RETRY_INTERVAL_SECONDS = 0.05
+# Writes landing within this window of a read may share its mtime (coarse
+# filesystem clocks), so such fingerprints are always re-hashed before writing.
+_RACY_MTIME_WINDOW_NS = 2_000_000_000
 _LOCK_PREFIX = "."
 _LOCK_SUFFIX = ".ilograph.lock"
 
@@ -79,6 +106,8 @@ def build_yaml(profile: YamlFormatProfile | None = None) -> YAML:
     """Round-trip YAML parser/emitter."""
 
     yaml = YAML(typ="rt")
+    yaml.Constructor = TrackingConstructor
+    yaml.Representer = TrackingRepresenter
     yaml.preserve_quotes = True
     if profile is not None and profile.sequence_indent_style == "indentless":
         yaml.indent(mapping=2, sequence=2, offset=0)
@@ -88,13 +117,88 @@ def build_yaml(profile: YamlFormatProfile | None = None) -> YAML:
     return yaml
 
 
+def build_readonly_yaml() -> YAML:
+    """Safe YAML loader (C-accelerated when available) building plain dict/list trees."""
+
+    return YAML(typ="safe")
+
+
 def detect_format_profile(raw: str) -> YamlFormatProfile:
     """Infer emit formatting hints from source text."""
 
-    return YamlFormatProfile(
-        sequence_indent_style=_detect_sequence_indent_style(raw),
-        top_level_sequence_indents=_detect_top_level_sequence_indents(raw),
-        unquoted_reference_brackets=_detect_unquoted_reference_brackets(raw),
+    return scan_source(raw).format_profile
+
+
+def scan_source(raw: str) -> ScannedSource:
+    """Quote bracket references and collect format hints in a single line pass."""
+
+    out: list[str] = []
+    unquoted_brackets: set[tuple[str, str]] = set()
+    top_level_indents: dict[str, int] = {}
+    sequence_keys = 0
+    indentless_keys = 0
+    indented_keys = 0
+    # Key line (`key:` with empty value) waiting for the next content line.
+    pending_indent: int | None = None
+    pending_top_level_key: str | None = None
+
+    for line in raw.splitlines(keepends=True):
+        line_wo_nl = line.rstrip("\r\n")
+        stripped = line_wo_nl.strip()
+        if not stripped or stripped.startswith("#"):
+            out.append(line)
+            continue
+
+        if pending_indent is not None:
+            sequence_match = _SEQUENCE_LINE_RE.match(line_wo_nl)
+            if sequence_match is not None:
+                item_indent = len(sequence_match.group("indent"))
+                delta = item_indent - pending_indent
+                sequence_keys += 1
+                if delta == 0:
+                    indentless_keys += 1
+                elif delta >= 2:
+                    indented_keys += 1
+                if pending_top_level_key is not None:
+                    top_level_indents[pending_top_level_key] = item_indent
+            pending_indent = None
+            pending_top_level_key = None
+
+        key_match = _MAP_KEY_LINE_RE.match(line_wo_nl)
+        if key_match is not None:
+            pending_indent = len(key_match.group("indent"))
+            top_level_match = _TOP_LEVEL_KEY_LINE_RE.match(line_wo_nl)
+            if top_level_match is not None:
+                pending_top_level_key = top_level_match.group("key")
+            out.append(line)
+            continue
+
+        value_match = _KEY_VALUE_LINE_RE.match(line_wo_nl) if "[" in line_wo_nl else None
+        if value_match is None:
+            out.append(line)
+            continue
+        key = value_match.group("key")
+        value = value_match.group("value")
+        if key not in _REFERENCE_KEYS or value.startswith(("'", '"')):
+            out.append(line)
+            continue
+
+        unquoted_brackets.add((key, value.strip()))
+        escaped = value.replace("'", "''")
+        newline = "\n" if line.endswith("\n") else ""
+        out.append(
+            f"{value_match.group('prefix')}{key}: '{escaped}'{value_match.group('suffix')}{newline}"
+        )
+
+    return ScannedSource(
+        normalized="".join(out),
+        format_profile=YamlFormatProfile(
+            sequence_indent_style=(
+                "indentless" if sequence_keys and indentless_keys >= indented_keys else "indented"
+            ),
+            top_level_sequence_indents=top_level_indents,
+            unquoted_reference_brackets=unquoted_brackets,
+        ),
     )
 
 
@@ -104,6 +208,51 @@ def read_text(path: Path) -> str:
     return path.read_text(encoding="utf-8")
 
 
+def read_text_fingerprinted(path: Path) -> tuple[str, FileFingerprint]:
+    """Read UTF-8 text like `read_text`, fingerprinting the same mapped bytes."""
+
+    with path.open("rb") as handle:
+        stat = os.fstat(handle.fileno())
+        with _mapped(handle.fileno(), stat.st_size) as buffer:
+            digest = _digest(buffer)
+            text = str(buffer, "utf-8")
+    if "\r" in text:
+        # Match text-mode universal newlines used by `read_text`.
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    fingerprint = FileFingerprint(
+        inode=stat.st_ino,
+        size=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+        digest=digest,
+        observed_ns=time.time_ns(),
+    )
+    return text, fingerprint
+
+
+def fingerprint_matches(path: Path, expected: FileFingerprint) -> bool:
+    """Whether `path` still holds the content `expected` was taken from.
+
+    Unchanged inode/size/mtime is trusted unless the mtime was racy at read time;
+    otherwise the file is re-hashed through a read-only mapping.
+    """
+
+    try:
+        stat = path.stat()
+    except OSError:
+        return False
+    if stat.st_size != expected.size:
+        return False
+    metadata_unchanged = (stat.st_ino, stat.st_mtime_ns) == (expected.inode, expected.mtime_ns)
+    racy = expected.observed_ns - expected.mtime_ns < _RACY_MTIME_WINDOW_NS
+    if metadata_unchanged and not racy:
+        return True
+    try:
+        with path.open("rb") as handle, _mapped(handle.fileno(), stat.st_size) as buffer:
+            return _digest(buffer) == expected.digest
+    except OSError:
+        return False
+
+
 def build_lock_path(path: Path) -> Path:
     """Return sidecar lock-file path for a diagram file."""
 
@@ -157,14 +306,24 @@ def file_lock(path: Path, *, timeout_seconds: float = 0.0) -> Iterator[None]:
 def load_document(path: Path, *, format_profile: YamlFormatProfile | None = None) -> CommentedMap:
     """Load Ilograph YAML document."""
 
-    yaml = build_yaml(format_profile)
-    raw_text = read_text(path)
-    normalized = _quote_reference_bracket_scalars(raw_text)
-    try:
-        data = yaml.load(normalized)
-    except YAMLError as exc:
-        raise _yaml_error(exc, path=path) from exc
+    return parse_document(read_text(path), path=path, format_profile=format_profile)
 
+
+def parse_document(
+    raw_text: str,
+    *,
+    path: Path,
+    format_profile: YamlFormatProfile | None = None,
+    scanned: ScannedSource | None = None,
+) -> CommentedMap:
+    """Parse Ilograph YAML document from already-read source text.
+
+    Pass `scanned` (from `scan_source(raw_text)`) to reuse an existing scan.
+    """
+
+    if scanned is None:
+        scanned = scan_source(raw_text)
+    data = _load_normalized(build_yaml(format_profile), scanned.normalized, path=path)
     if data is None:
         return CommentedMap()
     if not isinstance(data, CommentedMap):
@@ -174,6 +333,32 @@ def load_document(path: Path, *, format_profile: YamlFormatProfile | None = None
     return data
 
 
+def load_document_readonly(path: Path) -> YamlMapping:
+    """Load Ilograph YAML document as plain dict/list tree (no round-trip metadata)."""
+
+    return parse_document_readonly(read_text(path), path=path)
+
+
+def parse_document_readonly(
+    raw_text: str,
+    *,
+    path: Path,
+    scanned: ScannedSource | None = None,
+) -> YamlMapping:
+    """Parse document for commands that never write; result must not be dumped back."""
+
+    if scanned is None:
+        scanned = scan_source(raw_text)
+    data = _load_normalized(build_readonly_yaml(), scanned.normalized, path=path)
+    if data is None:
+        return {}
+    if not isinstance(data, dict):
+        raise ValidationError(
+            f"yaml root must be a mapping/object (file: {path})"
+        )
+    return data
+
+
 def load_any_yaml(path: Path) -> YamlNode:
     """Load arbitrary YAML (for ops file)."""
 
@@ -222,11 +407,15 @@ def write_text(path: Path, text: str) -> None:
     path.write_text(text, encoding="utf-8")
 
 
-def write_text_atomic(path: Path, text: str, *, expected_before: str | None = None) -> None:
-    """Atomically replace text file, optionally guarding expected prior content."""
+def write_text_atomic(
+    path: Path,
+    text: str,
+    *,
+    expected: FileFingerprint | None = None,
+) -> None:
+    """Atomically replace text file, optionally guarding the fingerprint read earlier."""
 
-    current = read_text(path)
-    if expected_before is not None and current != expected_before:
+    if expected is not None and not fingerprint_matches(path, expected):
         raise ValidationError(
             "file changed while command was running; no write applied (retry command)"
         )
@@ -262,6 +451,20 @@ def write_text_atomic(path: Path, text: str, *, expected_before: str | None = No
                 temp_path.unlink()
 
 
+@contextmanager
+def _mapped(fileno: int, size: int) -> Iterator[mmap.mmap | bytes]:
+    if not size:
+        # Zero-length files cannot be mapped.
+        yield b""
+        return
+    with mmap.mmap(fileno, size, access=mmap.ACCESS_READ) as buffer:
+        yield buffer
+
+
+def _digest(buffer: mmap.mmap | bytes) -> str:
+    return hashlib.blake2b(buffer, digest_size=32).hexdigest()
+
+
 def _read_lock_owner_pid(lock_path: Path) -> int | None:
     try:
         raw = lock_path.read_text(encoding="utf-8")
@@ -308,29 +511,11 @@ def _pid_is_running(pid: int) -> bool:
     return True
 
 
-def _quote_reference_bracket_scalars(raw: str) -> str:
-    """Quote bracket expressions where Ilograph expects scalar references."""
-
-    out: list[str] = []
-    for line in raw.splitlines(keepends=True):
-        line_wo_nl = line.rstrip("\r\n")
-        match = _KEY_VALUE_LINE_RE.match(line_wo_nl)
-        if match is None:
-            out.append(line)
-            continue
-
-        key = match.group("key")
-        value = match.group("value")
-        if key not in _REFERENCE_KEYS or value.startswith(("'", '"')):
-            out.append(line)
-            continue
-
-        escaped = value.replace("'", "''")
-        newline = "\n" if line.endswith("\n") else ""
-        out.append(
-            f"{match.group('prefix')}{key}: '{escaped}'{match.group('suffix')}{newline}"
-        )
-    return "".join(out)
+def _load_normalized(yaml: YAML, normalized: str, *, path: Path) -> object:
+    try:
+        return yaml.load(normalized)
+    except YAMLError as exc:
+        raise _yaml_error(exc, path=path) from exc
 
 
 def _yaml_error(exc: YAMLError, *, path: Path) -> ValidationError:
@@ -344,73 +529,6 @@ def _yaml_error(exc: YAMLError, *, path: Path) -> ValidationError:
     return ValidationError(base)
 
 
-def _detect_sequence_indent_style(raw: str) -> SequenceIndentStyle:
-    deltas: list[int] = []
-    lines = raw.splitlines()
-
-    for index, line in enumerate(lines):
-        key_match = _MAP_KEY_LINE_RE.match(line)
-        if key_match is None:
-            continue
-        key_indent = len(key_match.group("indent"))
-        cursor = index + 1
-        while cursor < len(lines):
-            candidate = lines[cursor]
-            stripped = candidate.strip()
-            if not stripped or stripped.startswith("#"):
-                cursor += 1
-                continue
-            sequence_match = _SEQUENCE_LINE_RE.match(candidate)
-            if sequence_match is not None:
-                item_indent = len(sequence_match.group("indent"))
-                deltas.append(item_indent - key_indent)
-            break
-
-    if not deltas:
-        return "indented"
-    zero_delta = sum(1 for delta in deltas if delta == 0)
-    indented_delta = sum(1 for delta in deltas if delta >= 2)
-    return "indentless" if zero_delta >= indented_delta else "indented"
-
-
-def _detect_top_level_sequence_indents(raw: str) -> dict[str, int]:
-    result: dict[str, int] = {}
-    lines = raw.splitlines()
-
-    for index, line in enumerate(lines):
-        key_match = _TOP_LEVEL_KEY_LINE_RE.match(line)
-        if key_match is None:
-            continue
-        key = key_match.group("key")
-        cursor = index + 1
-        while cursor < len(lines):
-            candidate = lines[cursor]
-            stripped = candidate.strip()
-            if not stripped or stripped.startswith("#"):
-                cursor += 1
-                continue
-            sequence_match = _SEQUENCE_LINE_RE.match(candidate)
-            if sequence_match is not None:
-                result[key] = len(sequence_match.group("indent"))
-            break
-
-    return result
-
-
-def _detect_unquoted_reference_brackets(raw: str) -> set[tuple[str, str]]:
-    result: set[tuple[str, str]] = set()
-    for line in raw.splitlines(keepends=False):
-        match = _KEY_VALUE_LINE_RE.match(line)
-        if match is None:
-            continue
-        key = match.group("key")
-        value = match.group("value")
-        if key not in _REFERENCE_KEYS or value.startswith(("'", '"')):
-            continue
-        result.add((key, value.strip()))
-    return result
-
-
 def _apply_top_level_sequence_indents(
     raw: str,
     top_level_sequence_indents: dict[str, int],
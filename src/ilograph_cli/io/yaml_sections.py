@@ -0,0 +1,265 @@
+"""Top-level section splitting for mutations scoped to part of a diagram."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+from ruamel.yaml import YAML
+from ruamel.yaml.error import YAMLError
+
+from ilograph_cli.core.identifiers import perspective_identifier
+
+_TOP_LEVEL_KEY_RE = re.compile(r"^(?P<key>[A-Za-z_][A-Za-z0-9_-]*)\s*:(?P<rest>\s.*)?$")
+_HEADER_ONLY_RE = re.compile(r"^\s*(?:#.*)?$")
+# Anchor definitions (`&name`). Sections can only be split when no node is shared
+# across them, so any anchor (or merge key built on one) forces a full load.
+_ANCHOR_RE = re.compile(r"(?:^|[\s\[{,])&[^\s\[\]{},]")
+_ITEM_START_RE = re.compile(r"^(?P<indent> *)-(?:(?P<gap> +)(?P<rest>\S.*)?)?$")
+_ITEM_KEY_RE = re.compile(r"^(?P<key>id|name)\s*:(?P<value>\s.*)?$")
+_UNDECIDABLE = object()
+_SCALAR_LOADER = YAML(typ="safe")
+
+
+@dataclass(frozen=True, slots=True)
+class SectionScope:
+    """Top-level sections a mutation reads or writes.
+
+    With `perspective` set, only that item of `perspectives` is loaded.
+    """
+
+    sections: frozenset[str]
+    perspective: str | None = None
+
+
+def scope_sections(*sections: str) -> SectionScope:
+    """Scope covering whole top-level sections."""
+
+    return SectionScope(sections=frozenset(sections))
+
+
+def scope_perspective(perspective: str) -> SectionScope:
+    """Scope covering a single `perspectives` item, located by id/name."""
+
+    return SectionScope(sections=frozenset({"perspectives"}), perspective=perspective)
+
+
+@dataclass(frozen=True, slots=True)
+class _Span:
+    name: str
+    start: int
+    end: int
+
+
+@dataclass(slots=True)
+class ScopedSource:
+    """Source lines split into editable spans and a verbatim remainder."""
+
+    lines: list[str]
+    spans: list[_Span]
+    header: str = ""
+    item_index: int | None = None
+    item_count: int | None = None
+
+    @property
+    def section_names(self) -> list[str]:
+        return [span.name for span in self.spans]
+
+    def editable_text(self) -> str:
+        """Text of the scoped sections (or `header` + item) for round-trip parsing."""
+
+        parts = [self.header]
+        for span in self.spans:
+            parts.extend(self.lines[span.start : span.end])
+        return "".join(parts)
+
+    def splice(self, edited: str) -> str | None:
+        """Replace editable spans with `edited`; None when it no longer lines up."""
+
+        chunks = self._split_edited(edited)
+        if chunks is None:
+            return None
+
+        output: list[str] = []
+        cursor = 0
+        for span, chunk in zip(self.spans, chunks, strict=True):
+            output.extend(self.lines[cursor : span.start])
+            output.append(chunk)
+            cursor = span.end
+        output.extend(self.lines[cursor:])
+        spliced = "".join(output)
+        # Full re-emit always ends with a newline; keep scoped output identical.
+        if not spliced.endswith("\n"):
+            spliced += "\n"
+        return spliced
+
+    def _split_edited(self, edited: str) -> list[str] | None:
+        edited_lines = edited.splitlines(keepends=True)
+        if self.header:
+            if not edited_lines or edited_lines[0] != self.header:
+                return None
+            return ["".join(edited_lines[1:])]
+
+        starts: list[tuple[int, str]] = []
+        for index, line in enumerate(edited_lines):
+            match = _TOP_LEVEL_KEY_RE.match(line.rstrip("\r\n"))
+            if match is not None:
+                starts.append((index, match.group("key")))
+        if [name for _, name in starts] != self.section_names or starts[0][0] != 0:
+            return None
+
+        chunks: list[str] = []
+        for position, (start, _name) in enumerate(starts):
+            end = starts[position + 1][0] if position + 1 < len(starts) else len(edited_lines)
+            chunks.append("".join(edited_lines[start:end]))
+        return chunks
+
+
+def split_scoped_source(raw: str, scope: SectionScope) -> ScopedSource | None:
+    """Split `raw` for `scope`, or None when only a full load is safe."""
+
+    if has_anchor_definitions(raw):
+        return None
+
+    lines = raw.splitlines(keepends=True)
+    blocks = _top_level_blocks(lines)
+    if blocks is None:
+        return None
+
+    spans = [span for span in blocks if span.name in scope.sections]
+    if not spans:
+        return None
+
+    if scope.perspective is not None and len(spans) == 1 and spans[0].name == "perspectives":
+        item_source = _split_perspective_item(lines, spans[0], scope.perspective)
+        if item_source is not None:
+            return item_source
+
+    return ScopedSource(lines=lines, spans=spans)
+
+
+def has_anchor_definitions(raw: str) -> bool:
+    """True when `raw` defines anchors, i.e. nodes may be shared across the tree."""
+
+    return "&" in raw and _ANCHOR_RE.search(raw) is not None
+
+
+def _top_level_blocks(lines: list[str]) -> list[_Span] | None:
+    starts: list[tuple[int, str]] = []
+    for index, line in enumerate(lines):
+        text = line.rstrip("\r\n")
+        if not text.strip() or text.startswith(("#", " ")):
+            continue
+        if text.startswith("-") and not text.startswith(("---", "...")) and starts:
+            # Indentless sequence item belonging to the current section.
+            continue
+        match = _TOP_LEVEL_KEY_RE.match(text)
+        if match is None:
+            # Directives, document markers, flow/quoted roots: leave to the full loader.
+            return None
+        starts.append((index, match.group("key")))
+
+    names = [name for _, name in starts]
+    if not starts or len(set(names)) != len(names):
+        return None
+
+    spans: list[_Span] = []
+    for position, (start, name) in enumerate(starts):
+        end = starts[position + 1][0] if position + 1 < len(starts) else len(lines)
+        spans.append(_Span(name=name, start=start, end=end))
+    return spans
+
+
+def _split_perspective_item(
+    lines: list[str],
+    span: _Span,
+    perspective: str,
+) -> ScopedSource | None:
+    header = lines[span.start]
+    header_match = _TOP_LEVEL_KEY_RE.match(header.rstrip("\r\n"))
+    if header_match is None or not _HEADER_ONLY_RE.match(header_match.group("rest") or ""):
+        return None
+
+    item_starts: list[int] = []
+    item_indent: int | None = None
+    for index in range(span.start + 1, span.end):
+        text = lines[index].rstrip("\r\n")
+        stripped = text.lstrip(" ")
+        if not stripped or stripped.startswith("#"):
+            continue
+        indent = len(text) - len(stripped)
+        item_match = _ITEM_START_RE.match(text)
+        if item_indent is None:
+            if item_match is None:
+                return None
+            item_indent = indent
+        if item_match is not None and indent == item_indent:
+            item_starts.append(index)
+        elif indent <= item_indent:
+            return None
+
+    if not item_starts:
+        return None
+
+    matches: list[int] = []
+    for position, start in enumerate(item_starts):
+        end = item_starts[position + 1] if position + 1 < len(item_starts) else span.end
+        identifier = _item_identifier(lines[start:end])
+        if identifier is _UNDECIDABLE:
+            return None
+        if identifier == perspective:
+            matches.append(position)
+
+    if len(matches) != 1:
+        # Missing or ambiguous: let the full lookup report it.
+        return None
+
+    position = matches[0]
+    start = item_starts[position]
+    end = item_starts[position + 1] if position + 1 < len(item_starts) else span.end
+    return ScopedSource(
+        lines=lines,
+        spans=[_Span(name=span.name, start=start, end=end)],
+        header=header if header.endswith("\n") else f"{header}\n",
+        item_index=position,
+        item_count=len(item_starts),
+    )
+
+
+def _item_identifier(item_lines: list[str]) -> object:
+    first = item_lines[0].rstrip("\r\n")
+    first_match = _ITEM_START_RE.match(first)
+    if first_match is None:
+        return _UNDECIDABLE
+
+    candidates: list[str] = []
+    key_column: int | None = None
+    rest = first_match.group("rest")
+    if rest is not None:
+        key_column = len(first) - len(rest)
+        candidates.append(rest)
+    for line in item_lines[1:]:
+        text = line.rstrip("\r\n")
+        stripped = text.lstrip(" ")
+        if not stripped or stripped.startswith("#"):
+            continue
+        column = len(text) - len(stripped)
+        if key_column is None:
+            key_column = column
+        if column == key_column:
+            candidates.append(stripped)
+
+    values: dict[str, object] = {}
+    for candidate in candidates:
+        match = _ITEM_KEY_RE.match(candidate)
+        if match is None:
+            continue
+        raw_value = (match.group("value") or "").strip()
+        if not raw_value or raw_value.startswith(("|", ">")):
+            return _UNDECIDABLE
+        try:
+            loaded = _SCALAR_LOADER.load(f"value: {raw_value}\n")
+        except YAMLError:
+            return _UNDECIDABLE
+        values[match.group("key")] = loaded.get("value") if isinstance(loaded, dict) else None
+    return perspective_identifier(values)
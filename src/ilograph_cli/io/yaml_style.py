@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 import re
-from difflib import SequenceMatcher
+from collections.abc import Iterable
+from itertools import chain
 
 from ruamel.yaml.comments import CommentedMap, CommentedSeq
 
+from ilograph_cli.io.line_diff import diff_opcodes
+from ilograph_cli.io.yaml_tracking import MutationLog, anchored_nodes, iter_changed_nodes
+
 _BLOCK_HEADER_STYLE_RE = re.compile(r":\s*([|>])\d*([+-]?)$")
 _FLOW_STYLE_PUNCTUATION: frozenset[str] = frozenset("{}[],:")
 
@@ -19,10 +23,8 @@ def restore_style_only_replacements(before: str, after: str) -> str:
 
     before_lines = before.splitlines()
     after_lines = after.splitlines()
-    matcher = SequenceMatcher(a=before_lines, b=after_lines, autojunk=False)
-
     merged: list[str] = []
-    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+    for tag, i1, i2, j1, j2 in diff_opcodes(before_lines, after_lines):
         if tag == "equal":
             merged.extend(before_lines[i1:i2])
             continue
@@ -47,10 +49,14 @@ def restore_style_only_replacements(before: str, after: str) -> str:
 
 
 def snapshot_document_anchors(document: CommentedMap) -> dict[int, str]:
-    """Capture anchor names by node identity before mutation."""
+    """Capture anchor names by node identity before mutation.
 
+    Documents from the tracking loader only look at their anchor registry.
+    """
+
+    registry = anchored_nodes(document)
     snapshot: dict[int, str] = {}
-    for node in _iter_yaml_nodes(document):
+    for node in _iter_yaml_nodes(document) if registry is None else registry:
         anchor = _anchor_name(node)
         if anchor is None:
             continue
@@ -58,14 +64,29 @@ def snapshot_document_anchors(document: CommentedMap) -> dict[int, str]:
     return snapshot
 
 
-def restore_document_anchors(document: CommentedMap, snapshot: dict[int, str]) -> None:
-    """Restore snapshot anchors and clear conflicting generated anchors."""
+def restore_document_anchors(
+    document: CommentedMap,
+    snapshot: dict[int, str],
+    *,
+    mutations: MutationLog | None = None,
+) -> None:
+    """Restore snapshot anchors and clear conflicting generated anchors.
+
+    With the log of the mutation, only registry nodes and what the mutation
+    changed or created (copies keep their anchors) are checked.
+    """
 
     if not snapshot:
         return
 
+    registry = anchored_nodes(document)
+    candidates: Iterable[object] = (
+        _iter_yaml_nodes(document)
+        if mutations is None or registry is None
+        else chain(registry, iter_changed_nodes(mutations))
+    )
     preserved_names = set(snapshot.values())
-    for node in _iter_yaml_nodes(document):
+    for node in candidates:
         node_id = id(node)
         expected_name = snapshot.get(node_id)
         if expected_name is not None:
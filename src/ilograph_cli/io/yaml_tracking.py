@@ -0,0 +1,323 @@
+"""Round-trip containers that record which loaded nodes a mutation touched."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, SupportsIndex
+
+from ruamel.yaml.comments import CommentedMap, CommentedSeq
+from ruamel.yaml.constructor import RoundTripConstructor
+from ruamel.yaml.representer import RoundTripRepresenter
+
+from ilograph_cli.core.structural_hash import structural_digest
+from ilograph_cli.core.validators import UnitKey
+
+
+@dataclass(slots=True)
+class MutationLog:
+    """Loaded containers mutated in place, keyed by identity.
+
+    Each container's entries from before its first mutation are kept too, as
+    a shallow copy.
+    """
+
+    nodes: dict[int, CommentedMap | CommentedSeq] = field(default_factory=dict)
+    originals: dict[int, dict[Any, Any] | list[Any]] = field(default_factory=dict)
+
+    def record(self, node: CommentedMap | CommentedSeq) -> None:
+        key = id(node)
+        if key not in self.nodes:
+            self.nodes[key] = node
+            self.originals[key] = dict(node.items()) if isinstance(node, dict) else list(node)
+
+    def is_dirty(self, node: object) -> bool:
+        return self.nodes.get(id(node)) is node
+
+    def is_noop(self) -> bool:
+        """Whether every mutated container still holds the data it started with.
+
+        Loaded containers nested in a mutated one compare by identity: if one
+        of them changed, it is in the log itself.
+        """
+
+        return all(
+            structural_digest(self.originals[key], opaque=_is_loaded)
+            == structural_digest(node, opaque=_is_loaded)
+            for key, node in self.nodes.items()
+        )
+
+
+_ACTIVE_LOG: ContextVar[MutationLog | None] = ContextVar("_ACTIVE_LOG", default=None)
+
+
+@contextmanager
+def track_mutations() -> Iterator[MutationLog]:
+    """Record mutations of loaded containers made inside the block."""
+
+    log = MutationLog()
+    token = _ACTIVE_LOG.set(log)
+    try:
+        yield log
+    finally:
+        _ACTIVE_LOG.reset(token)
+
+
+class SectionLayout:
+    """Top-level `resources`/`perspectives` items of a loaded document, before a mutation.
+
+    Loaded containers keep their source line, so each one the mutation log
+    names maps back to the item it sat in by bisecting item start lines.
+    """
+
+    def __init__(self, document: CommentedMap) -> None:
+        self._document = document
+        sections = sorted((document.lc.key(name)[0], str(name)) for name in document)
+        self._section_lines = [line for line, _ in sections]
+        self._section_names = [name for _, name in sections]
+        self._items: dict[str, tuple[CommentedSeq, list[object], list[int]]] = {}
+        for name in ("resources", "perspectives"):
+            items = document.get(name)
+            if isinstance(items, CommentedSeq):
+                lines = [items.lc.item(index)[0] for index in range(len(items))]
+                self._items[name] = (items, list(items), lines)
+
+    def touched_units(self, log: MutationLog) -> set[UnitKey]:
+        """Items whose content may differ now, including ones added, removed or shifted."""
+
+        touched: set[UnitKey] = set()
+        for name in ("resources", "perspectives"):
+            items, before, _ = self._items.get(name, (None, [], []))
+            current = self._document.get(name)
+            if current is items and not log.is_dirty(current):
+                continue
+            after = current if isinstance(current, list) else []
+            for index in range(max(len(before), len(after))):
+                if index >= len(before) or index >= len(after) or before[index] is not after[index]:
+                    touched.add(_unit_key(name, index))
+
+        for node in log.nodes.values():
+            if node is self._document:
+                continue
+            line = node.lc.line
+            section = bisect_right(self._section_lines, line) - 1
+            if section < 0:
+                continue
+            name = self._section_names[section]
+            items, _, lines = self._items.get(name, (None, [], []))
+            if items is None or node is items:
+                continue
+            index = bisect_right(lines, line) - 1
+            if index >= 0:
+                touched.add(_unit_key(name, index))
+        return touched
+
+
+def anchored_nodes(document: CommentedMap) -> list[object] | None:
+    """Nodes the loader saw an anchor on, or None if `document` was not loaded by it."""
+
+    registry: list[object] | None = document.__dict__.get("_anchored")
+    return registry
+
+
+def iter_changed_nodes(log: MutationLog) -> Iterator[object]:
+    """Mutated containers, their values, and every node of subtrees built meanwhile.
+
+    Loaded containers below a mutated one are skipped: unless they are in
+    the log themselves, nothing in them changed.
+    """
+
+    stack: list[object] = list(log.nodes.values())
+    while stack:
+        node = stack.pop()
+        yield node
+        if isinstance(node, dict):
+            values: Iterable[object] = node.values()
+        elif isinstance(node, list):
+            values = node
+        else:
+            continue
+        for value in values:
+            if isinstance(value, (dict, list)) and _is_loaded(value):
+                continue
+            stack.append(value)
+
+
+def _is_loaded(node: object) -> bool:
+    return bool(getattr(node, "__dict__", {}).get("_loaded", False))
+
+
+def _unit_key(name: str, index: int) -> UnitKey:
+    return ("resources", index) if name == "resources" else ("perspectives", index)
+
+
+def _record(node: CommentedMap | CommentedSeq) -> None:
+    # Only loader-built nodes have source spans; fresh and deep-copied containers
+    # reach the tree through a mutation of some loaded container anyway.
+    log = _ACTIVE_LOG.get()
+    if log is not None and node.__dict__.get("_loaded", False):
+        log.record(node)
+
+
+class TrackedMap(CommentedMap):
+    """CommentedMap reporting in-place mutations to the active `MutationLog`."""
+
+    __slots__ = ()
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        _record(self)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        _record(self)
+        super().__delitem__(key)
+
+    def __ior__(self, other: Any) -> Any:  # type: ignore[misc]
+        _record(self)
+        return super().__ior__(other)
+
+    def insert(self, pos: Any, key: Any, value: Any, comment: Any = None) -> None:
+        _record(self)
+        super().insert(pos, key, value, comment)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        _record(self)
+        super().update(*args, **kwargs)
+
+    def pop(self, key: Any, *args: Any) -> Any:
+        _record(self)
+        return super().pop(key, *args)
+
+    def popitem(self, last: bool = True) -> Any:
+        _record(self)
+        return super().popitem(last)
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            _record(self)
+        return super().setdefault(key, default)
+
+    def move_to_end(self, key: Any, last: bool = True) -> None:
+        _record(self)
+        super().move_to_end(key, last)
+
+    def clear(self) -> None:
+        _record(self)
+        super().clear()
+
+
+class TrackedSeq(CommentedSeq):
+    """CommentedSeq reporting in-place mutations to the active `MutationLog`."""
+
+    __slots__ = ()
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        _record(self)
+        super().__setitem__(index, value)
+
+    def __delitem__(self, index: Any) -> None:
+        _record(self)
+        super().__delitem__(index)
+
+    def __iadd__(self, values: Any) -> Any:
+        _record(self)
+        return super().__iadd__(values)
+
+    def insert(self, index: Any, value: Any) -> None:
+        _record(self)
+        super().insert(index, value)
+
+    def append(self, value: Any) -> None:
+        _record(self)
+        super().append(value)
+
+    def extend(self, values: Any) -> None:
+        _record(self)
+        super().extend(values)
+
+    def pop(self, index: SupportsIndex = -1) -> Any:
+        _record(self)
+        return super().pop(index)
+
+    def remove(self, value: Any) -> None:
+        _record(self)
+        super().remove(value)
+
+    def clear(self) -> None:
+        _record(self)
+        super().clear()
+
+    def reverse(self) -> None:
+        _record(self)
+        super().reverse()
+
+    def sort(self, key: Any = None, reverse: bool = False) -> None:
+        _record(self)
+        super().sort(key=key, reverse=reverse)
+
+
+class _AnchorRecordingObjects(dict[Any, Any]):
+    """The constructor's node -> data memo, also collecting data built from anchored nodes."""
+
+    __slots__ = ("anchored",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.anchored: list[object] = []
+
+    def __setitem__(self, node: Any, data: Any) -> None:
+        if node.anchor is not None:
+            self.anchored.append(data)
+        super().__setitem__(node, data)
+
+
+class TrackingConstructor(RoundTripConstructor):
+    """Round-trip constructor building `TrackedMap`/`TrackedSeq` containers.
+
+    It also keeps a registry of the anchored nodes on the document root, so
+    anchor bookkeeping never has to sweep the whole tree. Neither adds a
+    stack frame per nesting level: ruamel constructs nested nodes recursively.
+    """
+
+    def construct_document(self, node: Any) -> Any:
+        objects = _AnchorRecordingObjects()
+        self.constructed_objects = objects
+        data = super().construct_document(node)
+        if isinstance(data, TrackedMap):
+            data.__dict__["_anchored"] = objects.anchored
+        return data
+
+    def construct_tracked_seq(self, node: Any) -> Iterator[TrackedSeq]:
+        data = TrackedSeq()
+        data._yaml_set_line_col(node.start_mark.line, node.start_mark.column)
+        yield data
+        data.extend(self.construct_rt_sequence(node, data))
+        self.set_collection_style(data, node)
+        data.__dict__["_loaded"] = True
+
+    def construct_tracked_map(self, node: Any) -> Iterator[TrackedMap]:
+        data = TrackedMap()
+        data._yaml_set_line_col(node.start_mark.line, node.start_mark.column)
+        yield data
+        self.construct_mapping(node, data, deep=True)
+        self.set_collection_style(data, node)
+        data.__dict__["_loaded"] = True
+
+
+TrackingConstructor.add_constructor(
+    "tag:yaml.org,2002:seq", TrackingConstructor.construct_tracked_seq
+)
+TrackingConstructor.add_constructor(
+    "tag:yaml.org,2002:map", TrackingConstructor.construct_tracked_map
+)
+
+
+class TrackingRepresenter(RoundTripRepresenter):
+    """Round-trip representer aware of tracked containers."""
+
+
+TrackingRepresenter.add_representer(TrackedMap, RoundTripRepresenter.represent_dict)
+TrackingRepresenter.add_representer(TrackedSeq, RoundTripRepresenter.represent_list)
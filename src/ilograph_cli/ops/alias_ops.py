@@ -6,19 +6,20 @@ from ruamel.yaml.comments import CommentedMap, CommentedSeq
 
 from ilograph_cli.core.errors import ValidationError
 from ilograph_cli.core.index import get_single_perspective
+from ilograph_cli.core.yaml_types import YamlMapping
 
 
-def list_aliases(document: CommentedMap, *, perspective: str) -> list[dict[str, object]]:
+def list_aliases(document: YamlMapping, *, perspective: str) -> list[dict[str, object]]:
     """List aliases for a perspective."""
 
     location = get_single_perspective(document, perspective)
     aliases = location.node.get("aliases")
     rows: list[dict[str, object]] = []
-    if not isinstance(aliases, CommentedSeq):
+    if not isinstance(aliases, list):
         return rows
 
     for index, item in enumerate(aliases, start=1):
-        if not isinstance(item, CommentedMap):
+        if not isinstance(item, dict):
             continue
         alias_name = item.get("alias")
         alias_for = item.get("for")
@@ -120,7 +121,7 @@ def remove_alias(document: CommentedMap, *, perspective: str, alias: str) -> boo
     return True
 
 
-def _ensure_aliases(perspective: CommentedMap) -> CommentedSeq:
+def _ensure_aliases(perspective: YamlMapping) -> CommentedSeq:
     aliases = perspective.get("aliases")
     if isinstance(aliases, CommentedSeq):
         return aliases
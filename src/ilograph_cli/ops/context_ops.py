@@ -8,18 +8,20 @@ from ruamel.yaml.comments import CommentedMap, CommentedSeq
 
 from ilograph_cli.core.errors import ValidationError
 from ilograph_cli.core.references import replace_reference_identifier
+from ilograph_cli.core.traversal import iter_containers
+from ilograph_cli.core.yaml_types import YamlMapping
 
 
-def list_contexts(document: CommentedMap) -> list[dict[str, object]]:
+def list_contexts(document: YamlMapping) -> list[dict[str, object]]:
     """Return context metadata rows."""
 
     rows: list[dict[str, object]] = []
     contexts = document.get("contexts")
-    if not isinstance(contexts, CommentedSeq):
+    if not isinstance(contexts, list):
         return rows
 
     for index, context in enumerate(contexts, start=1):
-        if not isinstance(context, CommentedMap):
+        if not isinstance(context, dict):
             continue
         name = context.get("name")
         if not isinstance(name, str):
@@ -31,7 +33,7 @@ def list_contexts(document: CommentedMap) -> list[dict[str, object]]:
                 "name": name,
                 "extends": _as_optional_str(context.get("extends")),
                 "hidden": bool(hidden) if isinstance(hidden, bool) else False,
-                "hasRoots": isinstance(context.get("roots"), CommentedSeq),
+                "hasRoots": isinstance(context.get("roots"), list),
             }
         )
     return rows
@@ -283,17 +285,9 @@ def _normalize_insert_index(index_1_based: int, *, size: int, allow_end: bool =
 
 
 def _clear_anchors(node: CommentedMap | CommentedSeq) -> None:
-    if isinstance(node, CommentedMap):
-        node.yaml_set_anchor(None)
-        for value in node.values():
-            if isinstance(value, (CommentedMap, CommentedSeq)):
-                _clear_anchors(value)
-        return
-
-    node.yaml_set_anchor(None)
-    for item in node:
+    for item in iter_containers(node):
         if isinstance(item, (CommentedMap, CommentedSeq)):
-            _clear_anchors(item)
+            item.yaml_set_anchor(None)
 
 
 def _as_optional_str(value: object) -> str | None:
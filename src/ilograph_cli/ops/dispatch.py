@@ -6,6 +6,7 @@ from functools import singledispatch
 
 from ruamel.yaml.comments import CommentedMap
 
+from ilograph_cli.core.index import DocumentIndex
 from ilograph_cli.core.ops_models import (
     FmtStableOp,
     GroupCreateOp,
@@ -19,6 +20,7 @@ from ilograph_cli.core.ops_models import (
     RelationRemoveMatchOp,
     RelationRemoveOp,
     RenameResourceIdOp,
+    RenameResourceIdsOp,
     RenameResourceOp,
     ResourceCloneOp,
     ResourceCreateOp,
@@ -40,43 +42,62 @@ from ilograph_cli.ops.resource_ops import (
     move_resource,
     rename_resource,
     rename_resource_id,
+    rename_resource_ids,
 )
 
 
 @singledispatch
-def apply_op(op: object, document: CommentedMap) -> bool:
-    """Apply single validated operation."""
+def apply_op(op: object, document: CommentedMap, index: DocumentIndex) -> bool:
+    """Apply single validated operation, keeping `index` current."""
 
     raise TypeError(f"unsupported op: {type(op).__name__}")
 
 
 @apply_op.register
-def _apply_rename_resource(op: RenameResourceOp, document: CommentedMap) -> bool:
-    return rename_resource(document, resource_id=op.id, new_name=op.name)
+def _apply_rename_resource(
+    op: RenameResourceOp,
+    document: CommentedMap,
+    index: DocumentIndex,
+) -> bool:
+    return rename_resource(document, resource_id=op.id, new_name=op.name, index=index)
 
 
 @apply_op.register
-def _apply_resource_create(op: ResourceCreateOp, document: CommentedMap) -> bool:
+def _apply_resource_create(
+    op: ResourceCreateOp,
+    document: CommentedMap,
+    index: DocumentIndex,
+) -> bool:
     return create_resource(
         document,
         resource_id=op.id,
         name=op.name,
         parent_id=op.parent,
         subtitle=op.subtitle,
+        index=index,
     )
 
 
 @apply_op.register
-def _apply_resource_delete(op: ResourceDeleteOp, document: CommentedMap) -> bool:
+def _apply_resource_delete(
+    op: ResourceDeleteOp,
+    document: CommentedMap,
+    index: DocumentIndex,
+) -> bool:
     return delete_resource(
         document,
         resource_id=op.id,
         delete_subtree=op.delete_subtree,
+        index=index,
     )
 
 
 @apply_op.register
-def _apply_resource_clone(op: ResourceCloneOp, document: CommentedMap) -> bool:
+def _apply_resource_clone(
+    op: ResourceCloneOp,
+    document: CommentedMap,
+    index: DocumentIndex,
+) -> bool:
     return clone_resource(
         document,
         resource_id=op.id,
@@ -84,42 +105,74 @@ def _apply_resource_clone(op: ResourceCloneOp, document: CommentedMap) -> bool:
         new_parent_id=op.new_parent,
         new_name=op.new_name,
         with_children=op.with_children,
+        index=index,
     )
 
 
 @apply_op.register
-def _apply_rename_resource_id(op: RenameResourceIdOp, document: CommentedMap) -> bool:
-    return rename_resource_id(document, old_id=op.from_, new_id=op.to)
+def _apply_rename_resource_id(
+    op: RenameResourceIdOp,
+    document: CommentedMap,
+    index: DocumentIndex,
+) -> bool:
+    return rename_resource_id(document, old_id=op.from_, new_id=op.to, index=index)
 
 
 @apply_op.register
-def _apply_move_resource(op: MoveResourceOp, document: CommentedMap) -> bool:
+def _apply_rename_resource_ids(
+    op: RenameResourceIdsOp,
+    document: CommentedMap,
+    index: DocumentIndex,
+) -> bool:
+    return rename_resource_ids(document, mapping=op.mapping, index=index)
+
+
+@apply_op.register
+def _apply_move_resource(
+    op: MoveResourceOp,
+    document: CommentedMap,
+    index: DocumentIndex,
+) -> bool:
     return move_resource(
         document,
         resource_id=op.id,
         new_parent_id=op.new_parent,
         inherit_style_from_parent=op.inherit_style_from_parent,
+        index=index,
     )
 
 
 @apply_op.register
-def _apply_group_create(op: GroupCreateOp, document: CommentedMap) -> bool:
+def _apply_group_create(
+    op: GroupCreateOp,
+    document: CommentedMap,
+    index: DocumentIndex,
+) -> bool:
     return create_group(
         document,
         group_id=op.id,
         name=op.name,
         parent_id=op.parent,
         subtitle=op.subtitle,
+        index=index,
     )
 
 
 @apply_op.register
-def _apply_move_many(op: MoveManyOp, document: CommentedMap) -> bool:
-    return move_many(document, ids=op.ids, new_parent_id=op.new_parent)
+def _apply_move_many(
+    op: MoveManyOp,
+    document: CommentedMap,
+    index: DocumentIndex,
+) -> bool:
+    return move_many(document, ids=op.ids, new_parent_id=op.new_parent, index=index)
 
 
 @apply_op.register
-def _apply_relation_add(op: RelationAddOp, document: CommentedMap) -> bool:
+def _apply_relation_add(
+    op: RelationAddOp,
+    document: CommentedMap,
+    index: DocumentIndex,
+) -> bool:
     return add_relation(
         document,
         perspective_id=op.perspective,
@@ -131,29 +184,48 @@ def _apply_relation_add(op: RelationAddOp, document: CommentedMap) -> bool:
         arrow_direction=op.arrow_direction,
         color=op.color,
         secondary=op.secondary,
+        index=index,
     )
 
 
 @apply_op.register
-def _apply_relation_add_many(op: RelationAddManyOp, document: CommentedMap) -> bool:
+def _apply_relation_add_many(
+    op: RelationAddManyOp,
+    document: CommentedMap,
+    index: DocumentIndex,
+) -> bool:
     return (
         add_relation_many(
             document,
             perspectives=op.target.perspectives,
             contexts=op.target.contexts,
             template=op.to_payload(),
+            index=index,
         )
         > 0
     )
 
 
 @apply_op.register
-def _apply_relation_remove(op: RelationRemoveOp, document: CommentedMap) -> bool:
-    return remove_relation(document, perspective_id=op.perspective, index_1_based=op.index)
+def _apply_relation_remove(
+    op: RelationRemoveOp,
+    document: CommentedMap,
+    index: DocumentIndex,
+) -> bool:
+    return remove_relation(
+        document,
+        perspective_id=op.perspective,
+        index_1_based=op.index,
+        index=index,
+    )
 
 
 @apply_op.register
-def _apply_relation_remove_match(op: RelationRemoveMatchOp, document: CommentedMap) -> bool:
+def _apply_relation_remove_match(
+    op: RelationRemoveMatchOp,
+    document: CommentedMap,
+    index: DocumentIndex,
+) -> bool:
     return (
         remove_relations_match_many(
             document,
@@ -161,13 +233,18 @@ def _apply_relation_remove_match(op: RelationRemoveMatchOp, document: CommentedM
             contexts=op.target.contexts,
             match_template=op.match.to_payload(),
             require_match=op.require_match,
+            index=index,
         )
         > 0
     )
 
 
 @apply_op.register
-def _apply_relation_edit(op: RelationEditOp, document: CommentedMap) -> bool:
+def _apply_relation_edit(
+    op: RelationEditOp,
+    document: CommentedMap,
+    index: DocumentIndex,
+) -> bool:
     return edit_relation(
         document,
         perspective_id=op.perspective,
@@ -185,11 +262,16 @@ def _apply_relation_edit(op: RelationEditOp, document: CommentedMap) -> bool:
         clear_via=op.clear_via,
         clear_label=op.clear_label,
         clear_description=op.clear_description,
+        index=index,
     )
 
 
 @apply_op.register
-def _apply_relation_edit_match(op: RelationEditMatchOp, document: CommentedMap) -> bool:
+def _apply_relation_edit_match(
+    op: RelationEditMatchOp,
+    document: CommentedMap,
+    index: DocumentIndex,
+) -> bool:
     return (
         edit_relations_match_many(
             document,
@@ -199,22 +281,29 @@ def _apply_relation_edit_match(op: RelationEditMatchOp, document: CommentedMap)
             set_template=op.set_.to_payload() if op.set_ is not None else None,
             clear_fields=op.clear,
             require_match=op.require_match,
+            index=index,
         )
         > 0
     )
 
 
 @apply_op.register
-def _apply_fmt_stable(op: FmtStableOp, document: CommentedMap) -> bool:
+def _apply_fmt_stable(
+    op: FmtStableOp,
+    document: CommentedMap,
+    index: DocumentIndex,
+) -> bool:
     del op
     del document
+    del index
     return False
 
 
 def apply_ops_batch(document: CommentedMap, ops: list[Operation]) -> bool:
     """Apply a validated operation list in order."""
 
+    index = DocumentIndex(document)
     changed = False
     for op in ops:
-        changed = apply_op(op, document) or changed
+        changed = apply_op(op, document, index) or changed
     return changed
@@ -5,11 +5,7 @@ from __future__ import annotations
 from ruamel.yaml.comments import CommentedMap, CommentedSeq
 
 from ilograph_cli.core.errors import ValidationError
-from ilograph_cli.core.index import (
-    build_resource_id_index,
-    ensure_children,
-    get_single_resource_by_id,
-)
+from ilograph_cli.core.index import DocumentIndex, ensure_children
 from ilograph_cli.core.normalize import is_none_token
 from ilograph_cli.ops.resource_ops import move_resource, move_resource_to_root
 
@@ -21,11 +17,12 @@ def create_group(
     name: str,
     parent_id: str,
     subtitle: str | None = None,
+    index: DocumentIndex | None = None,
 ) -> bool:
     """Create group resource under parent."""
 
-    index = build_resource_id_index(document)
-    if group_id in index:
+    index = index if index is not None else DocumentIndex(document)
+    if index.has_resource_id(group_id):
         raise ValidationError(
             f"resource id already exists: {group_id} (group id must be unique)"
         )
@@ -44,15 +41,23 @@ def create_group(
         if not isinstance(resources, CommentedSeq):
             raise ValidationError("resources is not an array/list (invalid diagram structure)")
         resources.append(group)
+        index.record_added(group, parent=None, container=resources)
         return True
 
-    parent = get_single_resource_by_id(document, parent_id)
+    parent = index.resource_by_id(parent_id)
     children = ensure_children(parent.node)
     children.append(group)
+    index.record_added(group, parent=parent.node, container=children)
     return True
 
 
-def move_many(document: CommentedMap, *, ids: list[str], new_parent_id: str) -> bool:
+def move_many(
+    document: CommentedMap,
+    *,
+    ids: list[str],
+    new_parent_id: str,
+    index: DocumentIndex | None = None,
+) -> bool:
     """Move multiple resources under the same parent."""
 
     seen: set[str] = set()
@@ -64,13 +69,21 @@ def move_many(document: CommentedMap, *, ids: list[str], new_parent_id: str) ->
             )
         seen.add(resource_id)
 
+    index = index if index is not None else DocumentIndex(document)
     changed = False
     for resource_id in ids:
         if is_none_token(new_parent_id):
-            changed = move_resource_to_root(document, resource_id=resource_id) or changed
+            changed = (
+                move_resource_to_root(document, resource_id=resource_id, index=index) or changed
+            )
             continue
         changed = (
-            move_resource(document, resource_id=resource_id, new_parent_id=new_parent_id)
+            move_resource(
+                document,
+                resource_id=resource_id,
+                new_parent_id=new_parent_id,
+                index=index,
+            )
             or changed
         )
     return changed
@@ -6,19 +6,20 @@ from ruamel.yaml.comments import CommentedMap, CommentedSeq
 
 from ilograph_cli.core.errors import ValidationError
 from ilograph_cli.core.index import get_single_perspective
+from ilograph_cli.core.yaml_types import YamlMapping
 
 
-def list_overrides(document: CommentedMap, *, perspective: str) -> list[dict[str, object]]:
+def list_overrides(document: YamlMapping, *, perspective: str) -> list[dict[str, object]]:
     """List overrides for a perspective."""
 
     location = get_single_perspective(document, perspective)
     overrides = location.node.get("overrides")
     rows: list[dict[str, object]] = []
-    if not isinstance(overrides, CommentedSeq):
+    if not isinstance(overrides, list):
         return rows
 
     for index, item in enumerate(overrides, start=1):
-        if not isinstance(item, CommentedMap):
+        if not isinstance(item, dict):
             continue
         resource_id = item.get("resourceId")
         if not isinstance(resource_id, str):
@@ -153,7 +154,7 @@ def remove_override(document: CommentedMap, *, perspective: str, resource_id: st
     return True
 
 
-def _ensure_overrides(perspective: CommentedMap) -> CommentedSeq:
+def _ensure_overrides(perspective: YamlMapping) -> CommentedSeq:
     overrides = perspective.get("overrides")
     if isinstance(overrides, CommentedSeq):
         return overrides
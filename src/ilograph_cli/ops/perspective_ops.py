@@ -9,9 +9,11 @@ from ruamel.yaml.comments import CommentedMap, CommentedSeq
 from ilograph_cli.core.errors import ValidationError
 from ilograph_cli.core.index import build_perspective_locations, get_single_perspective
 from ilograph_cli.core.references import replace_reference_identifier
+from ilograph_cli.core.traversal import iter_containers
+from ilograph_cli.core.yaml_types import YamlMapping, YamlSequence
 
 
-def list_perspectives(document: CommentedMap) -> list[dict[str, object]]:
+def list_perspectives(document: YamlMapping) -> list[dict[str, object]]:
     """Return perspective metadata rows."""
 
     rows: list[dict[str, object]] = []
@@ -25,8 +27,8 @@ def list_perspectives(document: CommentedMap) -> list[dict[str, object]]:
                 "name": _as_optional_str(node.get("name")),
                 "extends": _as_optional_str(node.get("extends")),
                 "orientation": _as_optional_str(node.get("orientation")),
-                "hasRelations": isinstance(node.get("relations"), CommentedSeq),
-                "hasSequence": isinstance(node.get("sequence"), CommentedMap),
+                "hasRelations": isinstance(node.get("relations"), list),
+                "hasSequence": isinstance(node.get("sequence"), dict),
             }
         )
     return rows
@@ -247,18 +249,10 @@ def _normalize_insert_index(index_1_based: int, *, size: int, allow_end: bool =
     return index_1_based - 1
 
 
-def _clear_anchors(node: CommentedMap | CommentedSeq) -> None:
-    if isinstance(node, CommentedMap):
-        node.yaml_set_anchor(None)
-        for value in node.values():
-            if isinstance(value, (CommentedMap, CommentedSeq)):
-                _clear_anchors(value)
-        return
-
-    node.yaml_set_anchor(None)
-    for item in node:
+def _clear_anchors(node: YamlMapping | YamlSequence) -> None:
+    for item in iter_containers(node):
         if isinstance(item, (CommentedMap, CommentedSeq)):
-            _clear_anchors(item)
+            item.yaml_set_anchor(None)
 
 
 def _as_optional_str(value: object) -> str | None:
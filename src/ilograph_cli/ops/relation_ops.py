@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from ruamel.yaml.comments import CommentedMap, CommentedSeq
 
 from ilograph_cli.core.errors import ValidationError
-from ilograph_cli.core.index import build_perspective_locations, get_single_perspective
+from ilograph_cli.core.index import DocumentIndex
 from ilograph_cli.core.relation_types import (
     RelationClearField,
     RelationTemplate,
@@ -49,6 +49,7 @@ def add_relation(
     arrow_direction: str | None,
     color: str | None,
     secondary: bool | None,
+    index: DocumentIndex | None = None,
 ) -> bool:
     """Add relation to perspective."""
 
@@ -57,7 +58,8 @@ def add_relation(
             "relation requires from or to (set --from and/or --to)"
         )
 
-    perspective = get_single_perspective(document, perspective_id)
+    index = index if index is not None else DocumentIndex(document)
+    perspective = index.perspective(perspective_id)
     relations = perspective.node.get("relations")
     if not isinstance(relations, CommentedSeq):
         relations = CommentedSeq()
@@ -82,6 +84,7 @@ def add_relation(
         relation["secondary"] = secondary
 
     relations.append(relation)
+    index.record_references_changed()
     return True
 
 
@@ -91,10 +94,12 @@ def add_relation_many(
     perspectives: list[str] | str,
     contexts: list[str] | None,
     template: RelationTemplate,
+    index: DocumentIndex | None = None,
 ) -> int:
     """Add same templated relation to multiple perspectives/contexts."""
 
-    perspective_ids = _resolve_perspectives(document, perspectives)
+    index = index if index is not None else DocumentIndex(document)
+    perspective_ids = _resolve_perspectives(index, perspectives)
     context_names = _resolve_contexts(document, contexts)
     payloads = _expand_payload_templates(template, context_names)
 
@@ -112,15 +117,23 @@ def add_relation_many(
                 arrow_direction=_as_str(payload.get("arrowDirection")),
                 color=_as_str(payload.get("color")),
                 secondary=_as_bool(payload.get("secondary")),
+                index=index,
             )
             added += 1
     return added
 
 
-def remove_relation(document: CommentedMap, *, perspective_id: str, index_1_based: int) -> bool:
+def remove_relation(
+    document: CommentedMap,
+    *,
+    perspective_id: str,
+    index_1_based: int,
+    index: DocumentIndex | None = None,
+) -> bool:
     """Remove relation by 1-based index."""
 
-    perspective = get_single_perspective(document, perspective_id)
+    index = index if index is not None else DocumentIndex(document)
+    perspective = index.perspective(perspective_id)
     relations = perspective.node.get("relations")
     if not isinstance(relations, CommentedSeq):
         raise ValidationError(
@@ -135,6 +148,7 @@ def remove_relation(document: CommentedMap, *, perspective_id: str, index_1_base
             f"(valid range: 1..{len(relations)})"
         )
     relations.pop(idx)
+    index.record_references_changed()
     return True
 
 
@@ -145,30 +159,35 @@ def remove_relations_match_many(
     contexts: list[str] | None,
     match_template: RelationTemplate,
     require_match: bool,
+    index: DocumentIndex | None = None,
 ) -> int:
     """Remove relations matched by templates across many perspectives."""
 
-    perspective_ids = _resolve_perspectives(document, perspectives)
+    index = index if index is not None else DocumentIndex(document)
+    perspective_ids = _resolve_perspectives(index, perspectives)
     context_names = _resolve_contexts(document, contexts)
     match_payloads = _expand_payload_templates(match_template, context_names)
 
     removed = 0
     for perspective_id in perspective_ids:
-        relations = _get_relations_seq(document, perspective_id, create=False)
+        relations = _get_relations_seq(index, perspective_id, create=False)
         if relations is None:
             continue
 
         to_delete: list[int] = []
-        for index, relation in enumerate(relations):
+        for position, relation in enumerate(relations):
             if not isinstance(relation, CommentedMap):
                 continue
             if any(_relation_matches(relation, payload) for payload in match_payloads):
-                to_delete.append(index)
+                to_delete.append(position)
 
-        for index in reversed(to_delete):
-            relations.pop(index)
+        for position in reversed(to_delete):
+            relations.pop(position)
             removed += 1
 
+    if removed:
+        index.record_references_changed()
+
     if require_match and removed == 0:
         raise ValidationError(
             "no relations matched for relation.remove-match "
@@ -195,10 +214,12 @@ def edit_relation(
     clear_via: bool,
     clear_label: bool,
     clear_description: bool,
+    index: DocumentIndex | None = None,
 ) -> bool:
     """Edit relation by 1-based index."""
 
-    perspective = get_single_perspective(document, perspective_id)
+    index = index if index is not None else DocumentIndex(document)
+    perspective = index.perspective(perspective_id)
     relations = perspective.node.get("relations")
     if not isinstance(relations, CommentedSeq):
         raise ValidationError(
@@ -235,6 +256,7 @@ def edit_relation(
         relation["secondary"] = secondary
 
     _validate_relation_integrity(relation)
+    index.record_references_changed()
     return before != _relation_snapshot(relation)
 
 
@@ -247,18 +269,20 @@ def edit_relations_match_many(
     set_template: RelationTemplate | None,
     clear_fields: Sequence[RelationClearField],
     require_match: bool,
+    index: DocumentIndex | None = None,
 ) -> int:
     """Edit all relations that match template across perspectives/contexts."""
 
     _validate_clear_fields(clear_fields)
 
-    perspective_ids = _resolve_perspectives(document, perspectives)
+    index = index if index is not None else DocumentIndex(document)
+    perspective_ids = _resolve_perspectives(index, perspectives)
     context_names = _resolve_contexts(document, contexts)
     edit_specs = _expand_edit_specs(match_template, set_template, context_names)
 
     edited = 0
     for perspective_id in perspective_ids:
-        relations = _get_relations_seq(document, perspective_id, create=False)
+        relations = _get_relations_seq(index, perspective_id, create=False)
         if relations is None:
             continue
         for relation in relations:
@@ -276,6 +300,8 @@ def edit_relations_match_many(
                     edited += 1
                 break
 
+    if edited:
+        index.record_references_changed()
     if require_match and edited == 0:
         raise ValidationError(
             "no relations matched for relation.edit-match "
@@ -297,12 +323,12 @@ def _as_bool(value: object) -> bool | None:
 
 
 def _get_relations_seq(
-    document: CommentedMap,
+    index: DocumentIndex,
     perspective_id: str,
     *,
     create: bool,
 ) -> CommentedSeq | None:
-    perspective = get_single_perspective(document, perspective_id)
+    perspective = index.perspective(perspective_id)
     relations = perspective.node.get("relations")
     if isinstance(relations, CommentedSeq):
         return relations
@@ -365,8 +391,8 @@ def _relation_snapshot(relation: Mapping[str, object]) -> tuple[tuple[str, objec
     return tuple((str(key), value) for key, value in relation.items())
 
 
-def _resolve_perspectives(document: CommentedMap, target: list[str] | str) -> list[str]:
-    available = [item.identifier for item in build_perspective_locations(document)]
+def _resolve_perspectives(index: DocumentIndex, target: list[str] | str) -> list[str]:
+    available = [item.identifier for item in index.perspective_locations()]
     if not available:
         raise ValidationError(
             "diagram has no perspectives (cannot apply relation operation)"
@@ -382,7 +408,7 @@ def _resolve_perspectives(document: CommentedMap, target: list[str] | str) -> li
             raise ValidationError(
                 f"target.perspectives has duplicate: {perspective_id}"
             )
-        get_single_perspective(document, perspective_id)
+        index.perspective(perspective_id)
         seen.add(perspective_id)
         selected.append(perspective_id)
     return selected
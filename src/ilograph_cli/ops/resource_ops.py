@@ -2,20 +2,18 @@
 
 from __future__ import annotations
 
+from collections import Counter
+from collections.abc import Mapping
 from copy import deepcopy
 
 from ruamel.yaml.comments import CommentedMap, CommentedSeq
 
 from ilograph_cli.core.errors import ValidationError
-from ilograph_cli.core.index import (
-    build_resource_id_index,
-    ensure_children,
-    get_single_resource_by_id,
-    resource_identifier,
-)
+from ilograph_cli.core.identifiers import resource_identifier
+from ilograph_cli.core.index import DocumentIndex, ensure_children
 from ilograph_cli.core.normalize import is_none_token
-from ilograph_cli.core.reference_fields import iter_reference_fields
-from ilograph_cli.core.references import replace_reference_identifier
+from ilograph_cli.core.traversal import iter_containers
+from ilograph_cli.core.yaml_types import YamlMapping, YamlSequence
 
 
 def create_resource(
@@ -25,11 +23,12 @@ def create_resource(
     name: str,
     parent_id: str,
     subtitle: str | None = None,
+    index: DocumentIndex | None = None,
 ) -> bool:
     """Create resource under parent or root."""
 
-    existing = build_resource_id_index(document)
-    if resource_id in existing:
+    index = index if index is not None else DocumentIndex(document)
+    if index.has_resource_id(resource_id):
         raise ValidationError(f"resource id already exists: {resource_id}")
 
     resource = CommentedMap()
@@ -41,26 +40,42 @@ def create_resource(
     if is_none_token(parent_id):
         root = _ensure_root_resources(document)
         root.append(resource)
+        index.record_added(resource, parent=None, container=root)
         return True
 
-    parent = get_single_resource_by_id(document, parent_id)
+    parent = index.resource_by_id(parent_id)
     children = ensure_children(parent.node)
     children.append(resource)
+    index.record_added(resource, parent=parent.node, container=children)
     return True
 
 
-def rename_resource(document: CommentedMap, *, resource_id: str, new_name: str) -> bool:
+def rename_resource(
+    document: CommentedMap,
+    *,
+    resource_id: str,
+    new_name: str,
+    index: DocumentIndex | None = None,
+) -> bool:
     """Rename resource display name."""
 
-    location = get_single_resource_by_id(document, resource_id)
+    index = index if index is not None else DocumentIndex(document)
+    location = index.resource_by_id(resource_id)
     current_name = location.node.get("name")
     if isinstance(current_name, str) and current_name == new_name:
         return False
     location.node["name"] = new_name
+    index.record_renamed(location.node)
     return True
 
 
-def rename_resource_id(document: CommentedMap, *, old_id: str, new_id: str) -> bool:
+def rename_resource_id(
+    document: CommentedMap,
+    *,
+    old_id: str,
+    new_id: str,
+    index: DocumentIndex | None = None,
+) -> bool:
     """Rename resource identifier and rewrite all references."""
 
     if old_id == new_id:
@@ -68,26 +83,71 @@ def rename_resource_id(document: CommentedMap, *, old_id: str, new_id: str) -> b
             "old/new ids are identical (choose a different value for --to)"
         )
 
-    existing = build_resource_id_index(document)
-    if new_id in existing:
+    index = index if index is not None else DocumentIndex(document)
+    if index.has_resource_id(new_id):
         raise ValidationError(
             f"target id already exists: {new_id} (resource ids must be unique)"
         )
 
-    location = get_single_resource_by_id(document, old_id)
+    location = index.resource_by_id(old_id)
     old_identifier = resource_identifier(location.node)
     if old_identifier is None:
         raise ValidationError(
             f"resource has no identifier: {old_id} (set an explicit id before rename)"
         )
 
-    anchor = location.node.yaml_anchor()
-    location.node["id"] = new_id
-    if anchor is not None and anchor.value is not None:
-        # Keep explicit anchor labels even if node content changes.
-        location.node.yaml_set_anchor(anchor.value, always_dump=True)
+    _set_resource_id(location.node, new_id)
+    index.record_renamed(location.node)
+
+    index.references().replace_identifier(old_identifier, new_id)
+    return True
+
+
+def rename_resource_ids(
+    document: CommentedMap,
+    *,
+    mapping: Mapping[str, str],
+    index: DocumentIndex | None = None,
+) -> bool:
+    """Rename many resource identifiers at once and rewrite references in one pass."""
+
+    if not mapping:
+        raise ValidationError("id mapping is empty (pass at least one old=new pair)")
+    for old_id, new_id in mapping.items():
+        if old_id == new_id:
+            raise ValidationError(
+                f"old/new ids are identical: {old_id} (drop the pair or choose a different id)"
+            )
+    targets = Counter(mapping.values())
+    for new_id, count in targets.items():
+        if count > 1:
+            raise ValidationError(
+                f"target id used more than once: {new_id} (each new id must be unique)"
+            )
+
+    index = index if index is not None else DocumentIndex(document)
+    for new_id in targets:
+        # Targets freed by the same mapping (swaps, chains) are fine.
+        if new_id not in mapping and index.has_resource_id(new_id):
+            raise ValidationError(
+                f"target id already exists: {new_id} (resource ids must be unique)"
+            )
+
+    locations = {old_id: index.resource_by_id(old_id) for old_id in mapping}
+    renames: dict[str, str] = {}
+    for old_id, location in locations.items():
+        old_identifier = resource_identifier(location.node)
+        if old_identifier is None:
+            raise ValidationError(
+                f"resource has no identifier: {old_id} (set an explicit id before rename)"
+            )
+        renames[old_identifier] = mapping[old_id]
 
-    _rewrite_reference_strings(document, old_identifier, new_id)
+    for old_id, location in locations.items():
+        _set_resource_id(location.node, mapping[old_id])
+        index.record_renamed(location.node)
+
+    index.references().replace_identifiers(renames)
     return True
 
 
@@ -97,15 +157,17 @@ def move_resource(
     resource_id: str,
     new_parent_id: str,
     inherit_style_from_parent: bool = False,
+    index: DocumentIndex | None = None,
 ) -> bool:
     """Move resource subtree under new parent."""
 
-    location = get_single_resource_by_id(document, resource_id)
-    target_parent = get_single_resource_by_id(document, new_parent_id)
+    index = index if index is not None else DocumentIndex(document)
+    location = index.resource_by_id(resource_id)
+    target_parent = index.resource_by_id(new_parent_id)
 
     if location.node is target_parent.node:
         raise ValidationError("resource cannot be parent of itself (same --id and --new-parent)")
-    if _is_descendant(location.node, target_parent.node):
+    if index.is_descendant(target_parent.node, ancestor=location.node):
         raise ValidationError(
             "resource cannot be moved under its own descendant (would create a cycle)"
         )
@@ -119,6 +181,12 @@ def move_resource(
     source_container = location.container
     source_container.pop(location.index)
     target_children.append(location.node)
+    index.record_moved(
+        location.node,
+        parent=target_parent.node,
+        container=target_children,
+        previous_container=source_container,
+    )
     if inherit_style_from_parent:
         _clear_resource_style_for_inheritance(location.node)
     return True
@@ -129,16 +197,19 @@ def delete_resource(
     *,
     resource_id: str,
     delete_subtree: bool = False,
+    index: DocumentIndex | None = None,
 ) -> bool:
     """Delete resource by explicit id."""
 
-    location = get_single_resource_by_id(document, resource_id)
+    index = index if index is not None else DocumentIndex(document)
+    location = index.resource_by_id(resource_id)
     children = location.node.get("children")
     has_children = isinstance(children, CommentedSeq) and len(children) > 0
     if has_children and not delete_subtree:
         raise ValidationError("resource has children; pass --delete-subtree")
 
     location.container.pop(location.index)
+    index.record_removed(location.node, container=location.container)
     return True
 
 
@@ -150,14 +221,25 @@ def clone_resource(
     new_parent_id: str | None,
     new_name: str | None = None,
     with_children: bool = False,
+    index: DocumentIndex | None = None,
 ) -> bool:
     """Clone resource under parent or root."""
 
-    existing = build_resource_id_index(document)
-    if new_id in existing:
+    index = index if index is not None else DocumentIndex(document)
+    if index.has_resource_id(new_id):
         raise ValidationError(f"resource id already exists: {new_id}")
 
-    source = get_single_resource_by_id(document, resource_id)
+    source = index.resource_by_id(resource_id)
+    if with_children:
+        # Every explicit id below the source is already taken by the source itself.
+        duplicate_descendant = next(index.explicit_ids_below(source.node), None)
+        if duplicate_descendant is not None:
+            raise ValidationError(
+                "cannot clone subtree with explicit child ids; "
+                f"conflicting id: {duplicate_descendant}. "
+                "Use --shallow or rename child ids after clone."
+            )
+
     clone = deepcopy(source.node)
     _clear_anchors(clone)
 
@@ -166,43 +248,58 @@ def clone_resource(
         clone["name"] = new_name
     if not with_children:
         clone.pop("children", None)
-    else:
-        duplicate_descendant = _first_explicit_descendant_id(clone, existing_ids=set(existing))
-        if duplicate_descendant is not None:
-            raise ValidationError(
-                "cannot clone subtree with explicit child ids; "
-                f"conflicting id: {duplicate_descendant}. "
-                "Use --shallow or rename child ids after clone."
-            )
 
     if new_parent_id is None:
         source.container.append(clone)
+        index.record_added(clone, parent=source.parent, container=source.container)
         return True
 
     if is_none_token(new_parent_id):
         root = _ensure_root_resources(document)
         root.append(clone)
+        index.record_added(clone, parent=None, container=root)
         return True
 
-    parent = get_single_resource_by_id(document, new_parent_id)
+    parent = index.resource_by_id(new_parent_id)
     children = ensure_children(parent.node)
     children.append(clone)
+    index.record_added(clone, parent=parent.node, container=children)
     return True
 
 
-def move_resource_to_root(document: CommentedMap, *, resource_id: str) -> bool:
+def move_resource_to_root(
+    document: CommentedMap,
+    *,
+    resource_id: str,
+    index: DocumentIndex | None = None,
+) -> bool:
     """Move resource subtree to top-level resources."""
 
-    location = get_single_resource_by_id(document, resource_id)
+    index = index if index is not None else DocumentIndex(document)
+    location = index.resource_by_id(resource_id)
     if location.parent is None:
         return False
     source_container = location.container
     source_container.pop(location.index)
     root = _ensure_root_resources(document)
     root.append(location.node)
+    index.record_moved(
+        location.node,
+        parent=None,
+        container=root,
+        previous_container=source_container,
+    )
     return True
 
 
+def _set_resource_id(node: YamlMapping, new_id: str) -> None:
+    anchor = node.yaml_anchor() if isinstance(node, CommentedMap) else None
+    node["id"] = new_id
+    if isinstance(node, CommentedMap) and anchor is not None and anchor.value is not None:
+        # Keep explicit anchor labels even if node content changes.
+        node.yaml_set_anchor(anchor.value, always_dump=True)
+
+
 def _ensure_root_resources(document: CommentedMap) -> CommentedSeq:
     resources = document.get("resources")
     if isinstance(resources, CommentedSeq):
@@ -212,67 +309,7 @@ def _ensure_root_resources(document: CommentedMap) -> CommentedSeq:
     return new_resources
 
 
-def _is_descendant(ancestor: CommentedMap, node: CommentedMap) -> bool:
-    children = ancestor.get("children")
-    if not isinstance(children, CommentedSeq):
-        return False
-    for child in children:
-        if not isinstance(child, CommentedMap):
-            continue
-        if child is node:
-            return True
-        if _is_descendant(child, node):
-            return True
-    return False
-
-
-def _rewrite_reference_strings(document: CommentedMap, old: str, new: str) -> None:
-    for field in iter_reference_fields(document):
-        value = field.container.get(field.key)
-        if not isinstance(value, str):
-            continue
-        updated = replace_reference_identifier(value, old, new)
-        if updated != value:
-            field.container[field.key] = updated
-
-    _rewrite_context_strings(document, old, new)
-
-
-def _rewrite_context_strings(document: CommentedMap, old: str, new: str) -> None:
-    contexts = document.get("contexts")
-    if not isinstance(contexts, CommentedSeq):
-        return
-    for context in contexts:
-        if not isinstance(context, CommentedMap):
-            continue
-        for key, value in list(context.items()):
-            if not isinstance(value, str):
-                continue
-            updated = replace_reference_identifier(value, old, new)
-            if updated != value:
-                context[key] = updated
-
-
-def _first_explicit_descendant_id(node: CommentedMap, *, existing_ids: set[str]) -> str | None:
-    children = node.get("children")
-    if not isinstance(children, CommentedSeq):
-        return None
-
-    for child in children:
-        if not isinstance(child, CommentedMap):
-            continue
-        raw_id = child.get("id")
-        if isinstance(raw_id, str) and raw_id.strip():
-            child_id = raw_id.strip()
-            if child_id in existing_ids:
-                return child_id
-        nested = _first_explicit_descendant_id(child, existing_ids=existing_ids)
-        if nested is not None:
-            return nested
-    return None
-
-
-def _clear_resource_style_for_inheritance(resource: CommentedMap) -> bool:
+def _clear_resource_style_for_inheritance(resource: YamlMapping) -> bool:
     """Drop explicit style so resource follows parent styling."""
 
     if "style" not in resource:
@@ -281,15 +318,7 @@ def _clear_resource_style_for_inheritance(resource: CommentedMap) -> bool:
     return True
 
 
-def _clear_anchors(node: CommentedMap | CommentedSeq) -> None:
-    if isinstance(node, CommentedMap):
-        node.yaml_set_anchor(None)
-        for value in node.values():
-            if isinstance(value, (CommentedMap, CommentedSeq)):
-                _clear_anchors(value)
-        return
-
-    node.yaml_set_anchor(None)
-    for item in node:
+def _clear_anchors(node: YamlMapping | YamlSequence) -> None:
+    for item in iter_containers(node):
         if isinstance(item, (CommentedMap, CommentedSeq)):
-            _clear_anchors(item)
+            item.yaml_set_anchor(None)
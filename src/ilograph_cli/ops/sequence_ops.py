@@ -6,25 +6,26 @@ from ruamel.yaml.comments import CommentedMap, CommentedSeq
 
 from ilograph_cli.core.errors import ValidationError
 from ilograph_cli.core.index import get_single_perspective
+from ilograph_cli.core.yaml_types import YamlMapping
 
 _ACTION_KEYS: tuple[str, ...] = ("to", "toAndBack", "toAsync", "restartAt")
 
 
-def list_sequence_steps(document: CommentedMap, *, perspective: str) -> list[dict[str, object]]:
+def list_sequence_steps(document: YamlMapping, *, perspective: str) -> list[dict[str, object]]:
     """List sequence steps in perspective."""
 
     location = get_single_perspective(document, perspective)
     sequence = location.node.get("sequence")
-    if not isinstance(sequence, CommentedMap):
+    if not isinstance(sequence, dict):
         return []
 
     steps = sequence.get("steps")
-    if not isinstance(steps, CommentedSeq):
+    if not isinstance(steps, list):
         return []
 
     rows: list[dict[str, object]] = []
     for index, step in enumerate(steps, start=1):
-        if not isinstance(step, CommentedMap):
+        if not isinstance(step, dict):
             continue
         row: dict[str, object] = {
             "perspective": location.identifier,
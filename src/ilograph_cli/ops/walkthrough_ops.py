@@ -6,19 +6,20 @@ from ruamel.yaml.comments import CommentedMap, CommentedSeq
 
 from ilograph_cli.core.errors import ValidationError
 from ilograph_cli.core.index import get_single_perspective
+from ilograph_cli.core.yaml_types import YamlMapping
 
 
-def list_walkthrough_slides(document: CommentedMap, *, perspective: str) -> list[dict[str, object]]:
+def list_walkthrough_slides(document: YamlMapping, *, perspective: str) -> list[dict[str, object]]:
     """List walkthrough slides for perspective."""
 
     location = get_single_perspective(document, perspective)
     walkthrough = location.node.get("walkthrough")
-    if not isinstance(walkthrough, CommentedSeq):
+    if not isinstance(walkthrough, list):
         return []
 
     rows: list[dict[str, object]] = []
     for index, slide in enumerate(walkthrough, start=1):
-        if not isinstance(slide, CommentedMap):
+        if not isinstance(slide, dict):
             continue
         rows.append(
             {
@@ -179,7 +180,7 @@ def remove_walkthrough_slide(
     return True
 
 
-def _ensure_walkthrough(perspective: CommentedMap) -> CommentedSeq:
+def _ensure_walkthrough(perspective: YamlMapping) -> CommentedSeq:
     walkthrough = perspective.get("walkthrough")
     if isinstance(walkthrough, CommentedSeq):
         return walkthrough
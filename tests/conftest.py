@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from ilograph_cli.io.parse_cache import CACHE_DIR_ENV
+
+
+@pytest.fixture(autouse=True)
+def _isolated_parse_cache(
+    tmp_path_factory: pytest.TempPathFactory,
+    monkeypatch: pytest.MonkeyPatch,
+) -> Path:
+    cache_dir = tmp_path_factory.mktemp("parse-cache")
+    monkeypatch.setenv(CACHE_DIR_ENV, str(cache_dir))
+    return cache_dir
@@ -616,6 +616,62 @@ def test_rename_resource_id_updates_exact_tokens_only(tmp_path: Path) -> None:
     assert "postgres_replica" not in after
 
 
+def test_rename_resource_ids_swaps_and_chains_in_one_pass(tmp_path: Path) -> None:
+    diagram = _write_yaml(
+        tmp_path,
+        (
+            "resources:\n"
+            "  - id: app\n"
+            "  - id: db\n"
+            "  - id: cache\n"
+            "perspectives:\n"
+            "  - id: Runtime\n"
+            "    relations:\n"
+            "      - from: app\n"
+            "        to: db, cache\n"
+            "contexts:\n"
+            "  - name: prod\n"
+            "    roots: app/db\n"
+        ),
+    )
+    mapping_file = tmp_path / "ids.csv"
+    mapping_file.write_text("from,to\ncache,redis\n", encoding="utf-8")
+
+    result = runner.invoke(
+        app,
+        [
+            "rename",
+            "resource-ids",
+            "--file",
+            str(diagram),
+            "--map",
+            "app=db,db=app",
+            "--mapping-file",
+            str(mapping_file),
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    after = diagram.read_text(encoding="utf-8")
+    assert "  - id: db\n  - id: app\n  - id: redis\n" in after
+    assert "      - from: db\n        to: app, redis\n" in after
+    assert "roots: db/app\n" in after
+
+
+def test_rename_resource_ids_rejects_taken_target_and_keeps_file(tmp_path: Path) -> None:
+    diagram = _write_yaml(tmp_path, "resources:\n  - id: app\n  - id: db\n  - id: cache\n")
+    before = diagram.read_text(encoding="utf-8")
+
+    result = runner.invoke(
+        app,
+        ["rename", "resource-ids", "--file", str(diagram), "--map", "app=db", "--map", "x=y"],
+    )
+
+    assert result.exit_code == 1
+    assert "target id already exists: db" in result.output
+    assert diagram.read_text(encoding="utf-8") == before
+
+
 def test_move_resource_rejects_move_under_descendant_and_keeps_file(tmp_path: Path) -> None:
     base = Path("tests/golden/rename_id")
     diagram = _copy_fixture(base / "input.yaml", tmp_path)
@@ -971,6 +1027,8 @@ def test_load_document_accepts_unquoted_wildcard_reference_for_check_fmt_and_imp
             "resources:\n"
             "  - id: cert\n"
             "    name: Certificate\n"
+            "  - id: cdn\n"
+            "    name: d111.cloudfront.net\n"
             "perspectives:\n"
             "  - id: DNS\n"
             "    name: DNS\n"
@@ -1131,6 +1189,44 @@ def test_check_mode_strict_vs_ilograph_native_and_rule_filters(tmp_path: Path) -
     assert "broken-reference" in only_result.output
 
 
+def test_check_list_rules_reports_cost_of_the_last_run(tmp_path: Path) -> None:
+    diagram = _write_yaml(tmp_path, "resources:\n  - id: app\n")
+
+    before = runner.invoke(app, ["check", "--list-rules", "--json"])
+    assert before.exit_code == 0, before.output
+    rules = {rule["rule"]: rule for rule in json.loads(before.output)["rules"]}
+    assert rules["unresolved-path"]["modes"] == ["strict"]
+    assert rules["broken-reference"]["lastMs"] is None
+
+    run = runner.invoke(
+        app,
+        ["check", "--file", str(diagram), "--only-rule", "duplicate-resource-id"],
+    )
+    assert run.exit_code == 0, run.output
+
+    after = runner.invoke(app, ["check", "--list-rules", "--json"])
+    rules = {rule["rule"]: rule for rule in json.loads(after.output)["rules"]}
+    assert rules["duplicate-resource-id"]["lastIssues"] == 0
+    assert rules["duplicate-resource-id"]["lastMs"] is not None
+    assert rules["broken-reference"]["lastMs"] is None
+
+    unknown = runner.invoke(
+        app,
+        [
+            "check",
+            "--file",
+            str(diagram),
+            "--ignore-rule",
+            "nope",
+            "--only-rule",
+            "broken-reference",
+        ],
+    )
+    assert unknown.exit_code == 0, unknown.output
+    assert "warning: unknown rule: nope (ignored" in unknown.output
+    assert "check ok" in unknown.output
+
+
 def test_fmt_stable_is_noop_roundtrip(tmp_path: Path) -> None:
     base = Path("tests/golden/rename_id")
     diagram = _copy_fixture(base / "input.yaml", tmp_path, name="fmt_noop.yaml")
@@ -1171,6 +1267,40 @@ def test_check_json_output_has_summary_by_code() -> None:
     assert payload["summary"]["by_code"]["broken-reference"] >= 1
 
 
+def test_check_stops_early_and_streams_ndjson(tmp_path: Path) -> None:
+    relations = "".join(f"      - from: app\n        to: ghost{n}\n" for n in range(20))
+    diagram = _write_yaml(
+        tmp_path,
+        "resources:\n  - id: app\nperspectives:\n  - id: Runtime\n    relations:\n" + relations,
+    )
+
+    fail_fast = runner.invoke(app, ["check", "--file", str(diagram), "--fail-fast", "--json"])
+    assert fail_fast.exit_code == 1
+    payload = json.loads(fail_fast.output)
+    assert payload["complete"] is False
+    assert payload["summary"]["total"] == 1
+
+    streamed = runner.invoke(
+        app,
+        ["check", "--file", str(diagram), "--max-issues", "5", "--ndjson"],
+    )
+    assert streamed.exit_code == 1
+    *issues, summary = [json.loads(line) for line in streamed.output.splitlines()]
+    assert [issue["path"] for issue in issues] == [
+        f"perspectives[0].relations[{n}].to" for n in range(5)
+    ]
+    assert summary["complete"] is False
+    assert summary["summary"]["by_code"] == {"broken-reference": 5}
+
+    everything = runner.invoke(app, ["check", "--file", str(diagram), "--ndjson"])
+    assert json.loads(everything.output.splitlines()[-1])["complete"] is True
+    assert len(everything.output.splitlines()) == 21
+
+    invalid = runner.invoke(app, ["check", "--file", str(diagram), "--max-issues", "0"])
+    assert invalid.exit_code == 1
+    assert "invalid --max-issues: 0" in invalid.output
+
+
 def test_resolve_and_find_commands_explain_reference_resolution(tmp_path: Path) -> None:
     diagram = _write_yaml(
         tmp_path,
@@ -1224,6 +1354,157 @@ def test_resolve_and_find_commands_explain_reference_resolution(tmp_path: Path)
     assert "alias" in find_result.output
 
 
+def test_wildcards_resolve_to_matches_and_unmatched_ones_fail_strict_check(
+    tmp_path: Path,
+) -> None:
+    diagram = _write_yaml(
+        tmp_path,
+        (
+            "resources:\n"
+            "  - id: svc-api\n"
+            "  - id: svc-db\n"
+            "  - id: web\n"
+            "  - id: partner\n"
+            "perspectives:\n"
+            "  - id: Runtime\n"
+            "    relations:\n"
+            "      - from: web\n"
+            "        to: svc-*\n"
+            "      - from: web\n"
+            "        to: scv-*\n"
+            "      - from: web\n"
+            '        to: "*tner"\n'
+        ),
+    )
+
+    resolve_result = runner.invoke(
+        app,
+        ["resolve", "--file", str(diagram), "--ref", "svc-*, scv-*", "--json"],
+    )
+    assert resolve_result.exit_code == 0, resolve_result.output
+    rows = json.loads(resolve_result.output)["rows"]
+    assert [(row["token"], row["status"], row["details"]) for row in rows] == [
+        ("svc-*", "wildcard", "resources[0], resources[1]"),
+        ("scv-*", "unmatched-wildcard", "-"),
+    ]
+
+    # Ilograph itself tolerates stale wildcards; only strict mode flags them.
+    native_result = runner.invoke(app, ["check", "--file", str(diagram)])
+    assert native_result.exit_code == 0, native_result.output
+
+    strict_check = ["check", "--file", str(diagram), "--mode", "strict", "--json"]
+    check_result = runner.invoke(app, strict_check)
+    assert check_result.exit_code == 1, check_result.output
+    issues = json.loads(check_result.output)["issues"]
+    assert [(issue["code"], issue["path"]) for issue in issues] == [
+        ("unmatched-wildcard", "perspectives[0].relations[1].to"),
+    ]
+
+    # Nor do they block writes, even one removing a wildcard's last match.
+    delete_result = runner.invoke(
+        app,
+        ["resource", "delete", "--file", str(diagram), "--id", "partner"],
+    )
+    assert delete_result.exit_code == 0, delete_result.output
+    issues = json.loads(runner.invoke(app, strict_check).output)["issues"]
+    assert [issue["path"] for issue in issues] == [
+        "perspectives[0].relations[1].to",
+        "perspectives[0].relations[2].to",
+    ]
+
+    impact_result = runner.invoke(
+        app,
+        ["impact", "--file", str(diagram), "--resource-id", "svc-db", "--json"],
+    )
+    assert impact_result.exit_code == 0, impact_result.output
+    hits = json.loads(impact_result.output)["hits"]
+    assert [hit["value"] for hit in hits] == ["svc-db", "svc-*"]
+
+
+def test_paths_resolve_through_the_tree_in_resolve_check_and_impact(tmp_path: Path) -> None:
+    diagram = _write_yaml(
+        tmp_path,
+        (
+            "resources:\n"
+            "  - id: platform\n"
+            "    children:\n"
+            "      - id: api\n"
+            "      - id: db\n"
+            "  - id: edge\n"
+            "perspectives:\n"
+            "  - id: Runtime\n"
+            "    relations:\n"
+            "      - from: platform/api\n"
+            "        to: edge/db\n"
+        ),
+    )
+
+    resolve_result = runner.invoke(
+        app,
+        [
+            "resolve",
+            "--file",
+            str(diagram),
+            "--ref",
+            "platform/db, ../db",
+            "--relative-to",
+            "api",
+            "--json",
+        ],
+    )
+    assert resolve_result.exit_code == 0, resolve_result.output
+    rows = json.loads(resolve_result.output)["rows"]
+    assert [(row["token"], row["status"], row["details"]) for row in rows] == [
+        ("platform", "resolved", "resources[0]"),
+        ("db", "resolved", "resources[0].children[1]"),
+        ("db", "resolved", "resources[0].children[1]"),
+    ]
+
+    native_result = runner.invoke(app, ["check", "--file", str(diagram)])
+    assert native_result.exit_code == 0, native_result.output
+
+    strict_result = runner.invoke(
+        app,
+        ["check", "--file", str(diagram), "--mode", "strict", "--json"],
+    )
+    assert strict_result.exit_code == 1, strict_result.output
+    issues = json.loads(strict_result.output)["issues"]
+    assert [(issue["code"], issue["path"]) for issue in issues] == [
+        ("unresolved-path", "perspectives[0].relations[0].to"),
+    ]
+    assert "'db' is not a child of 'edge'" in issues[0]["message"]
+
+    impact_result = runner.invoke(
+        app,
+        ["impact", "--file", str(diagram), "--resource-id", "api", "--json"],
+    )
+    assert impact_result.exit_code == 0, impact_result.output
+    hits = json.loads(impact_result.output)["hits"]
+    assert [(hit["path"], hit["target"]) for hit in hits] == [
+        ("resources[0].children[0]", "resources[0].children[0]"),
+        ("perspectives[0].relations[0].from", "resources[0].children[0]"),
+    ]
+
+    # A stale path the edit does not touch leaves unrelated writes allowed.
+    add_result = runner.invoke(
+        app,
+        [
+            "relation",
+            "add",
+            "--file",
+            str(diagram),
+            "--perspective",
+            "Runtime",
+            "--from",
+            "edge",
+            "--to",
+            "platform",
+        ],
+    )
+    assert add_result.exit_code == 0, add_result.output
+    assert "      - from: edge\n        to: platform\n" in diagram.read_text(encoding="utf-8")
+
+
 def test_apply_fmt_stable_only_is_noop(tmp_path: Path) -> None:
     base = Path("tests/golden/apply_ops")
     diagram = _copy_fixture(base / "input.yaml", tmp_path, name="fmt_ops_input.yaml")
@@ -2556,3 +2837,47 @@ def test_walkthrough_remove_rejects_out_of_range_index_and_keeps_file(tmp_path:
     assert result.exit_code == 1
     assert "walkthrough slide index out of range: 2" in result.output
     assert diagram.read_text(encoding="utf-8") == before
+
+
+def test_listing_output_formats_write_plain_rows(tmp_path: Path) -> None:
+    diagram = _write_yaml(
+        tmp_path,
+        (
+            "resources:\n"
+            "  - id: app\n"
+            "  - id: db\n"
+            "perspectives:\n"
+            "  - id: Runtime\n"
+            "    relations:\n"
+            "      - from: app\n"
+            "        to: db\n"
+            '        label: "reads\\ttwice"\n'
+        ),
+    )
+    command = ["relation", "ls", "--file", str(diagram)]
+
+    plain_result = runner.invoke(app, command)
+    tsv_result = runner.invoke(app, ["--format", "tsv", *command])
+    ndjson_result = runner.invoke(app, ["--format", "ndjson", *command])
+
+    assert plain_result.exit_code == 0, plain_result.output
+    assert "┃" not in plain_result.output
+    assert plain_result.output.splitlines()[0] == "Relations"
+    assert plain_result.output.splitlines()[-1] == "total: 1"
+    assert tsv_result.exit_code == 0, tsv_result.output
+    assert tsv_result.output.splitlines() == [
+        "perspective\tindex\tfrom\tto\tvia\tlabel\tdirection\tsecondary",
+        "Runtime\t1\tapp\tdb\t-\treads\\ttwice\t-\tFalse",
+    ]
+    assert ndjson_result.exit_code == 0, ndjson_result.output
+    record = json.loads(ndjson_result.output)
+    assert (record["from_"], record["to"], record["label"]) == ("app", "db", "reads\ttwice")
+
+
+def test_unknown_output_format_is_rejected(tmp_path: Path) -> None:
+    diagram = _write_yaml(tmp_path, "resources:\n  - id: app\n")
+
+    result = runner.invoke(app, ["--format", "xml", "perspective", "ls", "--file", str(diagram)])
+
+    assert result.exit_code == 1
+    assert "unknown output format: xml" in result.output
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import time
+
+from hypothesis import given, settings
+from hypothesis import strategies as st
+from pydantic import ValidationError as PydanticValidationError
+from ruamel.yaml.comments import CommentedMap, CommentedSeq
+
+from ilograph_cli.core.errors import ValidationError
+from ilograph_cli.core.index import (
+    DocumentIndex,
+    build_resource_locations,
+    get_single_resource_by_id,
+)
+from ilograph_cli.core.ops_models import OpsFile
+from ilograph_cli.ops.dispatch import apply_op, apply_ops_batch
+
+_IDS = ["a", "b", "c", "d", "e", "f"]
+_ID = st.sampled_from(_IDS)
+_PARENT = st.sampled_from([*_IDS, "none"])
+_OP = st.one_of(
+    st.builds(
+        lambda i, p: {"op": "resource.create", "id": i, "name": i, "parent": p}, _ID, _PARENT
+    ),
+    st.builds(lambda i, p: {"op": "move.resource", "id": i, "newParent": p}, _ID, _ID),
+    st.builds(
+        lambda i: {"op": "resource.delete", "id": i, "deleteSubtree": True},
+        _ID,
+    ),
+    st.builds(
+        lambda i, n, deep: {"op": "resource.clone", "id": i, "newId": n, "withChildren": deep},
+        _ID,
+        _ID,
+        st.booleans(),
+    ),
+    st.builds(lambda i, n: {"op": "rename.resource-id", "from": i, "to": n}, _ID, _ID),
+    st.builds(
+        lambda ids, p: {"op": "group.move-many", "ids": ids, "newParent": p},
+        st.lists(_ID, min_size=1, max_size=3, unique=True),
+        _PARENT,
+    ),
+)
+
+
+def _lookup(lookup: object, resource_id: str) -> tuple[str, int, str, int] | str:
+    try:
+        location = lookup(resource_id)  # type: ignore[operator]
+    except ValidationError as exc:
+        return str(exc)
+    return (location.path, location.index, location.identifier, id(location.node))
+
+
+@settings(max_examples=150, deadline=None)
+@given(raw_ops=st.lists(_OP, min_size=1, max_size=12))
+def test_index_matches_fresh_lookups_after_every_op(raw_ops: list[dict[str, object]]) -> None:
+    document = CommentedMap(
+        {
+            "resources": CommentedSeq(
+                [
+                    CommentedMap({"id": "a", "name": "A"}),
+                    CommentedMap({"name": "unnamed-parent", "children": CommentedSeq()}),
+                ]
+            )
+        }
+    )
+    index = DocumentIndex(document)
+    for raw_op in raw_ops:
+        try:
+            (op,) = OpsFile.model_validate({"ops": [raw_op]}).ops
+            apply_op(op, document, index)
+        except (ValidationError, PydanticValidationError):
+            continue
+        for resource_id in _IDS:
+            expected = _lookup(lambda rid: get_single_resource_by_id(document, rid), resource_id)
+            assert _lookup(index.resource_by_id, resource_id) == expected
+
+        parents = {id(item.node): item.parent for item in build_resource_locations(document)}
+        nodes = [item.node for item in build_resource_locations(document)]
+        for node in nodes:
+            ancestors: set[int] = set()
+            current = parents[id(node)]
+            while current is not None:
+                ancestors.add(id(current))
+                current = parents[id(current)]
+            for other in nodes:
+                assert index.is_descendant(node, ancestor=other) == (id(other) in ancestors)
+
+
+def test_preorder_tree_answers_ancestry_subtrees_and_paths() -> None:
+    document = CommentedMap(
+        {
+            "resources": CommentedSeq(
+                [
+                    CommentedMap(
+                        {
+                            "id": "a",
+                            "children": CommentedSeq(
+                                [
+                                    CommentedMap(
+                                        {"id": "b", "children": CommentedSeq([{"id": "c"}])}
+                                    ),
+                                    "not-a-resource",
+                                    CommentedMap({"name": "d"}),
+                                ]
+                            ),
+                        }
+                    ),
+                    CommentedMap({"id": "e"}),
+                ]
+            )
+        }
+    )
+    locations = build_resource_locations(document)
+    tree = locations[0].tree
+    a, b, c, d, e = (location.order for location in locations)
+    assert [tree.order(location.node) for location in locations] == [a, b, c, d, e]
+
+    assert [location.identifier for location in locations] == ["a", "b", "c", "d", "e"]
+    assert [location.path for location in locations] == [
+        "resources[0]",
+        "resources[0].children[0]",
+        "resources[0].children[0].children[0]",
+        "resources[0].children[2]",
+        "resources[1]",
+    ]
+    assert (tree.parent(c), tree.depth(c), tree.parent(e), tree.depth(e)) == (b, 2, -1, 0)
+    assert [len(tree.subtree(order)) for order in (a, b, c, d, e)] == [4, 2, 1, 1, 1]
+    assert tree.contains(a, c) and tree.contains(a, d) and not tree.contains(b, d)
+    assert not tree.contains(a, a) and not tree.contains(a, e)
+
+    index = DocumentIndex(document)
+    assert list(index.explicit_ids_below(document["resources"][0])) == ["b", "c"]
+
+
+def test_batch_of_creates_and_moves_stays_linear() -> None:
+    count = 2_000
+    ops = [{"op": "group.create", "id": "group", "name": "Group", "parent": "none"}]
+    ops += [
+        {"op": "resource.create", "id": f"r{n}", "name": f"R{n}", "parent": "none"}
+        for n in range(count)
+    ]
+    ops += [{"op": "move.resource", "id": f"r{n}", "newParent": "group"} for n in range(count)]
+    document = CommentedMap({"resources": CommentedSeq()})
+
+    started = time.perf_counter()
+    assert apply_ops_batch(document, OpsFile.model_validate({"ops": ops}).ops)
+    elapsed = time.perf_counter() - started
+
+    assert len(document["resources"]) == 1
+    assert len(document["resources"][0]["children"]) == count
+    # Per-op tree walks made this take tens of seconds.
+    assert elapsed < 10
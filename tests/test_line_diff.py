@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import difflib
+
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from ilograph_cli.io.diff import build_diff
+from ilograph_cli.io.line_diff import diff_opcodes, unified_diff_lines
+
+_LINES = st.lists(st.sampled_from(["a", "b", "c", "  - id: x", "    name: y", ""]), max_size=40)
+_UNIQUE_LINES = st.lists(
+    st.from_regex(r"[a-z]{1,6}", fullmatch=True),
+    max_size=40,
+    unique=True,
+)
+
+
+def _apply(before: list[str], after: list[str]) -> list[str]:
+    rebuilt: list[str] = []
+    cursor_a = cursor_b = 0
+    for tag, i1, i2, j1, j2 in diff_opcodes(before, after):
+        assert (i1, j1) == (cursor_a, cursor_b)
+        if tag == "equal":
+            assert before[i1:i2] == after[j1:j2]
+            rebuilt.extend(before[i1:i2])
+        else:
+            rebuilt.extend(after[j1:j2])
+        cursor_a, cursor_b = i2, j2
+    assert (cursor_a, cursor_b) == (len(before), len(after))
+    return rebuilt
+
+
+@settings(max_examples=200, deadline=None)
+@given(before=_LINES, after=_LINES)
+def test_opcodes_rebuild_target_for_repetitive_lines(before: list[str], after: list[str]) -> None:
+    assert _apply(before, after) == after
+
+
+@settings(max_examples=200, deadline=None)
+@given(
+    before=_UNIQUE_LINES,
+    edits=st.lists(
+        st.tuples(st.sampled_from(["insert", "delete", "replace"]), st.integers(0, 40)),
+        max_size=5,
+    ),
+)
+def test_unified_diff_matches_difflib_for_unique_lines(
+    before: list[str],
+    edits: list[tuple[str, int]],
+) -> None:
+    after = list(before)
+    for number, (kind, position) in enumerate(edits):
+        index = min(position, len(after))
+        if kind == "insert":
+            after.insert(index, f"NEW{number}")
+        elif after:
+            index = min(index, len(after) - 1)
+            if kind == "delete":
+                del after[index]
+            else:
+                after[index] = f"CHANGED{number}"
+
+    ours = list(unified_diff_lines(before, after, fromfile="a/f", tofile="b/f"))
+    reference = list(difflib.unified_diff(before, after, "a/f", "b/f", lineterm=""))
+
+    assert ours == reference
+
+
+def test_unrelated_documents_stay_bounded() -> None:
+    before = [f"    key: {index % 7}" for index in range(20_000)]
+    after = [f"      key: {index % 5}" for index in range(20_000)]
+
+    assert diff_opcodes(before, after) == [("replace", 0, 20_000, 0, 20_000)]
+
+
+def test_mutation_diff_shares_one_result_across_stats_sections_and_rendering() -> None:
+    before = "resources:\n  - id: app\n    name: App\nperspectives:\n  - id: Runtime\n"
+    after = before.replace("name: App", "name: API") + "    relations: []\n"
+
+    diff = build_diff(before, after, "/tmp/diagram.yaml")
+    lines = list(diff.iter_lines())
+
+    assert lines == list(
+        difflib.unified_diff(
+            before.splitlines(),
+            after.splitlines(),
+            "a/tmp/diagram.yaml",
+            "b/tmp/diagram.yaml",
+            lineterm="",
+        )
+    )
+    assert diff.line_count() == len(lines)
+    summary = diff.summary()
+    assert (summary.added, summary.deleted, summary.hunks) == (2, 1, 1)
+    assert [(s.name, s.added, s.deleted) for s in diff.touched_sections()] == [
+        ("resources", 1, 1),
+        ("perspectives", 1, 0),
+    ]
+
+
+def test_moved_child_hunks_are_pinned_where_they_differ_from_difflib() -> None:
+    # `move resource` of r24 from p0 to p1. Patience anchors slide the repeated
+    # `style: plural` lines differently from SequenceMatcher; both diffs apply.
+    child = "      - id: {0}\n        name: {1}\n        style: plural\n"
+    parent = "  - id: {0}\n    style: plural\n    children:\n"
+    before = (
+        "resources:\n"
+        + parent.format("p0")
+        + child.format("r1", "R1")
+        + child.format("r24", "R24")
+        + parent.format("p1")
+        + child.format("r38", "R38")
+        + child.format("r48", "R48")
+    ).splitlines()
+    after = (
+        "resources:\n"
+        + parent.format("p0")
+        + child.format("r1", "R1")
+        + parent.format("p1")
+        + child.format("r38", "R38")
+        + child.format("r48", "R48")
+        + child.format("r24", "R24")
+    ).splitlines()
+
+    ours = list(unified_diff_lines(before, after, fromfile="a/f", tofile="b/f"))
+
+    assert ours == [
+        "--- a/f",
+        "+++ b/f",
+        "@@ -5,9 +5,6 @@",
+        "       - id: r1",
+        "         name: R1",
+        "         style: plural",
+        "-      - id: r24",
+        "-        name: R24",
+        "-        style: plural",
+        "   - id: p1",
+        "     style: plural",
+        "     children:",
+        "@@ -16,4 +13,7 @@",
+        "         style: plural",
+        "       - id: r48",
+        "         name: R48",
+        "+        style: plural",
+        "+      - id: r24",
+        "+        name: R24",
+        "         style: plural",
+    ]
+    assert ours != list(difflib.unified_diff(before, after, "a/f", "b/f", lineterm=""))
+    assert _apply(before, after) == after
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from ilograph_cli import cli_support
+from ilograph_cli.cli import app
+from ilograph_cli.core.validation_snapshot import ValidationSnapshot
+from ilograph_cli.io import parse_cache
+from ilograph_cli.io.parse_cache import (
+    CACHE_DISABLE_ENV,
+    CachedDocument,
+    ParseCache,
+    default_parse_cache,
+    load_document_cached,
+    store_document_cached,
+)
+from ilograph_cli.io.yaml_io import detect_format_profile, parse_document, parse_document_readonly
+
+runner = CliRunner()
+
+_DIAGRAM = (
+    "resources:\n"
+    "  - id: app\n"
+    "    name: App\n"
+    "  - id: db\n"
+    "    name: DB\n"
+    "perspectives:\n"
+    "  - id: Runtime\n"
+    "    relations:\n"
+    "      - from: app\n"
+    "        to: db\n"
+)
+
+
+def _forbid_parse(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _fail(*args: object, **kwargs: object) -> None:
+        raise AssertionError("cache miss: YAML was parsed")
+
+    monkeypatch.setattr(parse_cache, "parse_document_readonly", _fail)
+
+
+def test_warm_read_skips_yaml_parsing(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    diagram = tmp_path / "diagram.yaml"
+    diagram.write_text(_DIAGRAM, encoding="utf-8")
+
+    cold = load_document_cached(diagram)
+    _forbid_parse(monkeypatch)
+    warm = load_document_cached(diagram)
+
+    assert warm == cold
+    assert warm is not cold
+
+
+def test_changed_content_invalidates_entry(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    diagram = tmp_path / "diagram.yaml"
+    diagram.write_text(_DIAGRAM, encoding="utf-8")
+    load_document_cached(diagram)
+
+    stat = diagram.stat()
+    diagram.write_text(_DIAGRAM.replace("name: DB", "name: Db"), encoding="utf-8")
+    os.utime(diagram, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    document = load_document_cached(diagram)
+    assert document["resources"][1]["name"] == "Db"
+
+
+def test_cache_can_be_disabled(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(CACHE_DISABLE_ENV, "1")
+    assert default_parse_cache() is None
+
+    diagram = tmp_path / "diagram.yaml"
+    diagram.write_text(_DIAGRAM, encoding="utf-8")
+    load_document_cached(diagram)
+    _forbid_parse(monkeypatch)
+    with pytest.raises(AssertionError, match="cache miss"):
+        load_document_cached(diagram)
+
+
+def test_lru_eviction_keeps_recent_entries_within_budget(tmp_path: Path) -> None:
+    cache = ParseCache(tmp_path / "cache", max_bytes=0)
+    diagrams: list[Path] = []
+    for index in range(3):
+        diagram = tmp_path / f"diagram{index}.yaml"
+        diagram.write_text(_DIAGRAM, encoding="utf-8")
+        diagrams.append(diagram)
+
+    first_raw = diagrams[0].read_bytes()
+    payload = CachedDocument(
+        document=parse_document_readonly(_DIAGRAM, path=diagrams[0]),
+        format_profile=detect_format_profile(_DIAGRAM),
+    )
+    cache.put(diagrams[0], first_raw, payload)
+    assert cache.get(diagrams[0], first_raw) is None
+
+    cache.max_bytes = 10 * 1024 * 1024
+    for diagram in diagrams:
+        cache.put(diagram, diagram.read_bytes(), payload)
+    entries = sorted((tmp_path / "cache").glob("*.pickle"))
+    assert len(entries) == 3
+    for age, entry in enumerate(entries, start=1):
+        os.utime(entry, ns=(age, age))
+    entry_sizes = [entry.stat().st_size for entry in entries]
+
+    cache.get(diagrams[0], first_raw)
+    cache.max_bytes = sum(entry_sizes) - 1
+    cache.put(diagrams[2], diagrams[2].read_bytes(), payload)
+
+    assert cache.get(diagrams[0], first_raw) is not None
+    assert cache.get(diagrams[1], diagrams[1].read_bytes()) is None
+
+
+def test_mutation_writes_through_to_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    diagram = tmp_path / "diagram.yaml"
+    diagram.write_text(_DIAGRAM, encoding="utf-8")
+
+    result = runner.invoke(
+        app,
+        ["rename", "resource", "--file", str(diagram), "--id", "db", "--name", "Postgres"],
+    )
+    assert result.exit_code == 0, result.output
+
+    _forbid_parse(monkeypatch)
+    document = load_document_cached(diagram)
+    assert document["resources"][1]["name"] == "Postgres"
+    assert type(document["resources"]) is list
+
+
+def test_consecutive_mutations_validate_against_cached_snapshot(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    diagram = tmp_path / "diagram.yaml"
+    diagram.write_text(_DIAGRAM, encoding="utf-8")
+    relation_edit = ["relation", "edit", "--file", str(diagram), "--perspective", "Runtime"]
+
+    result = runner.invoke(
+        app,
+        ["rename", "resource", "--file", str(diagram), "--id", "db", "--name", "Postgres"],
+    )
+    assert result.exit_code == 0, result.output
+    cache = default_parse_cache()
+    assert cache is not None
+    assert list(cache.directory.glob("*.validation.pickle"))
+
+    def _no_rebuild(*args: object, **kwargs: object) -> None:
+        raise AssertionError("validation snapshot was rebuilt")
+
+    monkeypatch.setattr(cli_support, "ValidationSnapshot", _no_rebuild)
+    result = runner.invoke(app, [*relation_edit, "--index", "1", "--label", "reads"])
+    assert result.exit_code == 0, result.output
+
+    result = runner.invoke(app, [*relation_edit, "--index", "1", "--to", "ghost"])
+    assert result.exit_code == 1
+    assert "broken-reference" in result.output
+    assert "to: db" in diagram.read_text(encoding="utf-8")
+
+
+def test_scoped_mutation_parses_only_its_section_on_a_warm_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    diagram = tmp_path / "diagram.yaml"
+    diagram.write_text(_DIAGRAM, encoding="utf-8")
+    relation_edit = ["relation", "edit", "--file", str(diagram), "--perspective", "Runtime"]
+    parsed: list[str] = []
+
+    def _recording(raw_text: str, **kwargs: object) -> object:
+        parsed.append(raw_text)
+        return parse_document(raw_text, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(cli_support, "parse_document", _recording)
+    safe_loads: list[str] = []
+
+    def _counting(raw_text: str, **kwargs: object) -> object:
+        safe_loads.append(raw_text)
+        return parse_document_readonly(raw_text, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(parse_cache, "parse_document_readonly", _counting)
+
+    # Cold cache: validation needs the whole document, so it is safe-loaded once.
+    result = runner.invoke(app, [*relation_edit, "--index", "1", "--label", "reads"])
+    assert result.exit_code == 0, result.output
+    assert len(safe_loads) == 1
+
+    # Warm cache (written through above): only the perspective item is parsed.
+    parsed.clear()
+    safe_loads.clear()
+    result = runner.invoke(app, [*relation_edit, "--index", "1", "--label", "writes"])
+    assert result.exit_code == 0, result.output
+    assert not safe_loads
+    assert parsed and all("resources:" not in text for text in parsed)
+    assert "label: writes" in diagram.read_text(encoding="utf-8")
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX ownership only")
+def test_entries_are_not_unpickled_from_a_shared_directory(tmp_path: Path) -> None:
+    diagram = tmp_path / "diagram.yaml"
+    diagram.write_text(_DIAGRAM, encoding="utf-8")
+    cache = ParseCache(tmp_path / "cache")
+    payload = CachedDocument(
+        document=parse_document_readonly(_DIAGRAM, path=diagram),
+        format_profile=detect_format_profile(_DIAGRAM),
+    )
+    raw = diagram.read_bytes()
+    cache.put(diagram, raw, payload)
+    assert (cache.directory.stat().st_mode & 0o777) == 0o700
+    assert cache.get(diagram, raw) is not None
+
+    (entry,) = cache.directory.glob("*.pickle")
+    entry.chmod(0o666)
+    assert cache.get(diagram, raw) is None
+    entry.chmod(0o600)
+    cache.directory.chmod(0o755)
+    assert cache.get(diagram, raw) is None
+    cache.put(diagram, raw, payload)
+    cache.directory.chmod(0o700)
+    assert cache.get(diagram, raw) is not None
+
+
+def test_write_through_is_best_effort_and_handles_deep_trees(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    diagram = tmp_path / "diagram.yaml"
+    diagram.write_text(_DIAGRAM, encoding="utf-8")
+    profile = detect_format_profile(_DIAGRAM)
+    deep: dict[str, object] = {"id": "r0"}
+    node = deep
+    for level in range(1, 5_000):
+        child: dict[str, object] = {"id": f"r{level}"}
+        node["children"] = [child]
+        node = child
+    document = {"resources": [deep]}
+
+    store_document_cached(diagram, _DIAGRAM, document, format_profile=profile)
+    cache = default_parse_cache()
+    assert cache is not None
+    # Pickling this deep a tree may overflow; the write itself already succeeded.
+    cached = cache.get(diagram, _DIAGRAM.encode("utf-8"))
+    assert cached is None or cached.document == document
+
+    def _broken(*args: object, **kwargs: object) -> None:
+        raise RuntimeError("cache is broken")
+
+    load_document_cached(diagram)
+    monkeypatch.setattr(ParseCache, "put_validation", _broken)
+    snapshot = ValidationSnapshot(parse_document_readonly(_DIAGRAM, path=diagram))
+    store_document_cached(
+        diagram, _DIAGRAM, {"resources": []}, format_profile=profile, validation=snapshot
+    )
+    assert cache.get(diagram, _DIAGRAM.encode("utf-8")) is None
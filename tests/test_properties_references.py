@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import random
 import string
 
 from hypothesis import assume, given, settings
 from hypothesis import strategies as st
 
 from ilograph_cli.core.references import (
+    compile_identifier_rewrite,
     contains_identifier,
     replace_reference_identifier,
     split_reference_list,
@@ -92,3 +94,29 @@ def test_replace_reference_identifier_respects_identifier_boundaries(
 
     assert replace_reference_identifier(left_blocked, old, new) == left_blocked
     assert replace_reference_identifier(right_blocked, old, new) == right_blocked
+
+
+@settings(max_examples=120)
+@given(
+    ids=st.lists(_IDENTIFIER, min_size=1, max_size=6, unique=True),
+    order=st.randoms(use_true_random=False),
+    tokens=st.lists(st.integers(0, 5), min_size=1, max_size=10),
+)
+def test_identifier_rewrite_applies_permutations_simultaneously(
+    ids: list[str],
+    order: random.Random,
+    tokens: list[int],
+) -> None:
+    targets = list(ids)
+    order.shuffle(targets)
+    mapping = dict(zip(ids, targets, strict=True))
+    raw = ", ".join(ids[index % len(ids)] for index in tokens)
+
+    # Sequential renames through unique placeholders give the simultaneous result.
+    expected = raw
+    for position, old in enumerate(ids):
+        expected = replace_reference_identifier(expected, old, f"tmp::{position}")
+    for position, old in enumerate(ids):
+        expected = replace_reference_identifier(expected, f"tmp::{position}", mapping[old])
+
+    assert compile_identifier_rewrite(mapping)(raw) == expected
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
@@ -8,10 +9,22 @@ from hypothesis import given, settings
 from hypothesis import strategies as st
 
 from ilograph_cli.core.errors import ValidationError
+from ilograph_cli.core.validators import validate_document
 from ilograph_cli.io.yaml_io import (
+    _KEY_VALUE_LINE_RE,
+    _MAP_KEY_LINE_RE,
+    _REFERENCE_KEYS,
+    _SEQUENCE_LINE_RE,
+    _TOP_LEVEL_KEY_LINE_RE,
+    SequenceIndentStyle,
+    YamlFormatProfile,
     detect_format_profile,
     dump_document,
     load_document,
+    load_document_readonly,
+    read_text,
+    read_text_fingerprinted,
+    scan_source,
     write_text_atomic,
 )
 
@@ -21,6 +34,13 @@ _BRACKET_ATOM = st.from_regex(r"[A-Za-z0-9_.*/-]{1,10}", fullmatch=True)
 _BRACKET_VALUE = st.lists(_BRACKET_ATOM, min_size=1, max_size=4, unique=True).map(
     lambda atoms: "[" + ", ".join(atoms) + "]"
 )
+_SOURCE_LINE = st.tuples(
+    st.sampled_from(("", "  ", "    ", "      ")),
+    st.sampled_from(("", "- ")),
+    st.sampled_from(("resources", "perspectives", "children", "to", "from", "via", "name")),
+    st.sampled_from(("", " [a, b]", " '[a]'", " x", " [c]  # note", " [a]]")),
+).map(lambda parts: f"{parts[0]}{parts[1]}{parts[2]}:{parts[3]}")
+_SOURCE_FILLER = st.sampled_from(("", "# note", "  # note", "  - x", "- [a]", "\r"))
 
 
 def _top_level_sequence_indent(raw: str, key: str) -> int | None:
@@ -146,13 +166,233 @@ def test_format_profile_round_trip_is_stable(
         assert second_dump == first_dump
 
 
+@settings(max_examples=50, deadline=None)
+@given(
+    key=_REFERENCE_KEY,
+    bracket_value=_BRACKET_VALUE,
+    resource_id=_IDENTIFIER,
+)
+def test_readonly_load_matches_round_trip_load(
+    key: str,
+    bracket_value: str,
+    resource_id: str,
+) -> None:
+    raw = (
+        "resources:\n"
+        f"  - id: {resource_id}\n"
+        "    name: App\n"
+        "    children:\n"
+        "      - id: child/x\n"
+        "perspectives:\n"
+        "  - id: Runtime\n"
+        "    relations:\n"
+        f"      - {key}: {bracket_value}\n"
+    )
+
+    with TemporaryDirectory() as raw_tmp_dir:
+        diagram = Path(raw_tmp_dir) / "diagram.yaml"
+        diagram.write_text(raw, encoding="utf-8")
+
+        round_trip = load_document(diagram)
+        readonly = load_document_readonly(diagram)
+
+        assert type(readonly) is dict
+        assert type(readonly["perspectives"][0]["relations"]) is list
+        assert readonly == round_trip
+        assert readonly["perspectives"][0]["relations"][0][key] == bracket_value
+        for mode in ("ilograph-native", "strict"):
+            readonly_issues = validate_document(readonly, mode=mode).issues
+            assert readonly_issues == validate_document(round_trip, mode=mode).issues
+
+
+def test_readonly_load_reports_parse_errors_like_round_trip(tmp_path: Path) -> None:
+    diagram = tmp_path / "diagram.yaml"
+    diagram.write_text("resources: [\n", encoding="utf-8")
+
+    with pytest.raises(ValidationError, match="yaml parse error"):
+        load_document_readonly(diagram)
+
+    diagram.write_text("- just\n- a list\n", encoding="utf-8")
+    with pytest.raises(ValidationError, match="yaml root must be a mapping"):
+        load_document_readonly(diagram)
+
+
+@settings(max_examples=50, deadline=None)
+@given(
+    indentless=st.booleans(),
+    gap=st.sampled_from(("", "\n", "  # note\n", "\n# note\n\n")),
+    resource_id=_IDENTIFIER,
+    bracket_value=_BRACKET_VALUE,
+)
+def test_scan_source_collects_profile_and_quotes_in_one_pass(
+    indentless: bool,
+    gap: str,
+    resource_id: str,
+    bracket_value: str,
+) -> None:
+    item = "" if indentless else "  "
+    raw = (
+        "resources:\n"
+        f"{gap}{item}- id: {resource_id}\n"
+        "perspectives:\n"
+        f"{gap}{item}- id: Runtime\n"
+        f"{item}  relations:\n"
+        f"{gap}{item}  {item}- from: {resource_id}\n"
+        f"{item}  {item}  to: {bracket_value}  # target\n"
+    )
+
+    scanned = scan_source(raw)
+
+    assert (scanned.normalized, scanned.format_profile) == _legacy_scan(raw)
+    assert scanned.format_profile.sequence_indent_style == (
+        "indentless" if indentless else "indented"
+    )
+    assert scanned.format_profile.top_level_sequence_indents == {
+        "resources": len(item),
+        "perspectives": len(item),
+    }
+    assert scanned.format_profile.unquoted_reference_brackets == {("to", bracket_value)}
+    assert f"to: '{bracket_value}'  # target\n" in scanned.normalized
+
+
+@settings(max_examples=300, deadline=None)
+@given(
+    lines=st.lists(st.one_of(_SOURCE_LINE, _SOURCE_FILLER), max_size=30),
+    trailing_newline=st.booleans(),
+)
+def test_scan_source_matches_the_multi_pass_scan(lines: list[str], trailing_newline: bool) -> None:
+    raw = "\n".join(lines) + ("\n" if trailing_newline else "")
+
+    scanned = scan_source(raw)
+
+    assert (scanned.normalized, scanned.format_profile) == _legacy_scan(raw)
+
+
 def test_atomic_write_rejects_unexpected_prior_content(tmp_path: Path) -> None:
     diagram = tmp_path / "diagram.yaml"
     diagram.write_text("resources: []\n", encoding="utf-8")
+    _, fingerprint = read_text_fingerprinted(diagram)
+    stat = diagram.stat()
+    # Same size and restored mtime: only the content digest can tell them apart.
+    diagram.write_text("resources: {}\n", encoding="utf-8")
+    os.utime(diagram, ns=(stat.st_atime_ns, stat.st_mtime_ns))
 
     with pytest.raises(ValidationError, match="file changed while command was running"):
         write_text_atomic(
             diagram,
             "resources:\n  - id: app\n    name: App\n",
-            expected_before="resources:\n  - id: old\n    name: Old\n",
+            expected=fingerprint,
         )
+    assert diagram.read_text(encoding="utf-8") == "resources: {}\n"
+
+
+@pytest.mark.parametrize("raw", ["", "a: 1\n", "a: 1\r\nb: 2\r\n", "a: é\rb: 2"])
+def test_fingerprinted_read_matches_text_mode_read(tmp_path: Path, raw: str) -> None:
+    diagram = tmp_path / "diagram.yaml"
+    diagram.write_bytes(raw.encode("utf-8"))
+
+    text, fingerprint = read_text_fingerprinted(diagram)
+
+    assert text == read_text(diagram)
+    assert fingerprint.size == len(raw.encode("utf-8"))
+    write_text_atomic(diagram, "b: 2\n", expected=fingerprint)
+    assert diagram.read_text(encoding="utf-8") == "b: 2\n"
+
+
+# Multi-pass scan `scan_source` replaced; kept as the differential oracle.
+def _legacy_scan(raw: str) -> tuple[str, YamlFormatProfile]:
+    return _legacy_quote_reference_bracket_scalars(raw), YamlFormatProfile(
+        sequence_indent_style=_legacy_detect_sequence_indent_style(raw),
+        top_level_sequence_indents=_legacy_detect_top_level_sequence_indents(raw),
+        unquoted_reference_brackets=_legacy_detect_unquoted_reference_brackets(raw),
+    )
+
+
+def _legacy_quote_reference_bracket_scalars(raw: str) -> str:
+    """Quote bracket expressions where Ilograph expects scalar references."""
+
+    out: list[str] = []
+    for line in raw.splitlines(keepends=True):
+        line_wo_nl = line.rstrip("\r\n")
+        match = _KEY_VALUE_LINE_RE.match(line_wo_nl)
+        if match is None:
+            out.append(line)
+            continue
+
+        key = match.group("key")
+        value = match.group("value")
+        if key not in _REFERENCE_KEYS or value.startswith(("'", '"')):
+            out.append(line)
+            continue
+
+        escaped = value.replace("'", "''")
+        newline = "\n" if line.endswith("\n") else ""
+        out.append(f"{match.group('prefix')}{key}: '{escaped}'{match.group('suffix')}{newline}")
+    return "".join(out)
+
+
+def _legacy_detect_sequence_indent_style(raw: str) -> SequenceIndentStyle:
+    deltas: list[int] = []
+    lines = raw.splitlines()
+
+    for index, line in enumerate(lines):
+        key_match = _MAP_KEY_LINE_RE.match(line)
+        if key_match is None:
+            continue
+        key_indent = len(key_match.group("indent"))
+        cursor = index + 1
+        while cursor < len(lines):
+            candidate = lines[cursor]
+            stripped = candidate.strip()
+            if not stripped or stripped.startswith("#"):
+                cursor += 1
+                continue
+            sequence_match = _SEQUENCE_LINE_RE.match(candidate)
+            if sequence_match is not None:
+                item_indent = len(sequence_match.group("indent"))
+                deltas.append(item_indent - key_indent)
+            break
+
+    if not deltas:
+        return "indented"
+    zero_delta = sum(1 for delta in deltas if delta == 0)
+    indented_delta = sum(1 for delta in deltas if delta >= 2)
+    return "indentless" if zero_delta >= indented_delta else "indented"
+
+
+def _legacy_detect_top_level_sequence_indents(raw: str) -> dict[str, int]:
+    result: dict[str, int] = {}
+    lines = raw.splitlines()
+
+    for index, line in enumerate(lines):
+        key_match = _TOP_LEVEL_KEY_LINE_RE.match(line)
+        if key_match is None:
+            continue
+        key = key_match.group("key")
+        cursor = index + 1
+        while cursor < len(lines):
+            candidate = lines[cursor]
+            stripped = candidate.strip()
+            if not stripped or stripped.startswith("#"):
+                cursor += 1
+                continue
+            sequence_match = _SEQUENCE_LINE_RE.match(candidate)
+            if sequence_match is not None:
+                result[key] = len(sequence_match.group("indent"))
+            break
+
+    return result
+
+
+def _legacy_detect_unquoted_reference_brackets(raw: str) -> set[tuple[str, str]]:
+    result: set[tuple[str, str]] = set()
+    for line in raw.splitlines(keepends=False):
+        match = _KEY_VALUE_LINE_RE.match(line)
+        if match is None:
+            continue
+        key = match.group("key")
+        value = match.group("value")
+        if key not in _REFERENCE_KEYS or value.startswith(("'", '"')):
+            continue
+        result.add((key, value.strip()))
+    return result
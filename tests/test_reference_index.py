@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import copy
+from itertools import chain
+
+from hypothesis import given, settings
+from hypothesis import strategies as st
+from ruamel.yaml.comments import CommentedMap, CommentedSeq
+
+from ilograph_cli.core.ops_models import OpsFile
+from ilograph_cli.core.reference_fields import iter_context_fields, iter_reference_fields
+from ilograph_cli.core.reference_index import ReferenceIndex
+from ilograph_cli.core.references import contains_identifier, replace_reference_identifier
+from ilograph_cli.core.yaml_types import YamlMapping
+from ilograph_cli.ops.dispatch import apply_ops_batch
+
+_IDS = ["a", "b", "a.b", "My a"]
+_VALUE = st.one_of(
+    st.sampled_from(_IDS),
+    st.builds(
+        lambda template, left, right: template.format(left, right),
+        st.sampled_from(["{}/{}", "{}, {}", "[{}]", "{}({})", "{} *{}", "../{}", "{}::{}"]),
+        st.sampled_from(_IDS),
+        st.sampled_from(_IDS),
+    ),
+)
+_RELATION = st.fixed_dictionaries({"from": _VALUE}, optional={"to": _VALUE, "via": _VALUE})
+
+
+@st.composite
+def _documents(draw: st.DrawFn) -> YamlMapping:
+    return {
+        "resources": [{"id": "a", "instanceOf": draw(_VALUE)}],
+        "perspectives": [
+            {
+                "id": "Runtime",
+                "relations": draw(st.lists(_RELATION, max_size=6)),
+                "aliases": [{"alias": "x", "for": draw(_VALUE)}],
+            }
+        ],
+        "contexts": [{"name": "prod", "roots": draw(_VALUE)}],
+    }
+
+
+def _scan(document: YamlMapping) -> list[tuple[str, str]]:
+    fields = chain(iter_reference_fields(document), iter_context_fields(document))
+    return [(field.path, field.value) for field in fields]
+
+
+@settings(max_examples=150, deadline=None)
+@given(
+    document=_documents(),
+    renames=st.lists(st.tuples(st.sampled_from(_IDS), st.sampled_from(_IDS)), max_size=4),
+)
+def test_index_matches_full_scan_across_renames(
+    document: YamlMapping,
+    renames: list[tuple[str, str]],
+) -> None:
+    expected = copy.deepcopy(document)
+    index = ReferenceIndex(document)
+    for old, new in renames:
+        index.replace_identifier(old, new)
+        for field in chain(iter_reference_fields(expected), iter_context_fields(expected)):
+            field.container[field.key] = replace_reference_identifier(field.value, old, new)
+
+        assert _scan(document) == _scan(expected)
+        for identifier in _IDS:
+            assert [(field.path, field.value) for field in index.fields_mentioning(identifier)] == [
+                (path, value)
+                for path, value in _scan(document)
+                if contains_identifier(value, identifier)
+            ]
+
+
+def test_batch_rename_sees_relations_added_earlier_in_the_batch() -> None:
+    document = CommentedMap(
+        {
+            "resources": CommentedSeq([CommentedMap({"id": "api"}), CommentedMap({"id": "web"})]),
+            "perspectives": CommentedSeq([CommentedMap({"id": "Runtime"})]),
+        }
+    )
+    ops = [
+        {"op": "rename.resource-id", "from": "web", "to": "site"},
+        {"op": "relation.add", "perspective": "Runtime", "from": "site", "to": "api"},
+        {"op": "rename.resource-id", "from": "api", "to": "edge"},
+    ]
+
+    assert apply_ops_batch(document, OpsFile.model_validate({"ops": ops}).ops)
+
+    assert dict(document["perspectives"][0]["relations"][0]) == {"from": "site", "to": "edge"}
+
+
+def test_field_paths_are_formatted_from_shared_segments() -> None:
+    document: YamlMapping = {
+        "resources": [{"id": "x"}, {"id": "y", "children": [{"id": "z", "instanceOf": "T"}]}],
+        "perspectives": [
+            {"id": "P", "relations": [{"from": "x", "to": "y"}]},
+            {
+                "id": "S",
+                "sequence": {
+                    "start": "x",
+                    "steps": [{"to": "y"}, {"subSequence": {"steps": [{"toAsync": "z"}]}}],
+                },
+            },
+        ],
+        "contexts": [{"name": "prod", "roots": "x"}],
+    }
+    fields = list(chain(iter_reference_fields(document), iter_context_fields(document)))
+
+    assert [field.path for field in fields] == [
+        "resources[1].children[0].instanceOf",
+        "perspectives[0].relations[0].from",
+        "perspectives[0].relations[0].to",
+        "perspectives[1].sequence.start",
+        "perspectives[1].sequence.steps[0].to",
+        "perspectives[1].sequence.steps[1].subSequence.steps[0].toAsync",
+        "contexts[0].name",
+        "contexts[0].roots",
+    ]
+    assert fields[1].at is fields[2].at
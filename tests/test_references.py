@@ -1,6 +1,17 @@
 from __future__ import annotations
 
-from ilograph_cli.core.references import extract_reference_tokens, split_reference_list
+import dataclasses
+
+import pytest
+
+from ilograph_cli.core.references import (
+    clear_reference_cache,
+    contains_identifier,
+    extract_reference_tokens,
+    parse_reference_components,
+    reference_cache_stats,
+    split_reference_list,
+)
 
 
 def test_split_reference_list_does_not_split_commas_inside_fn_calls() -> None:
@@ -20,3 +31,17 @@ def test_extract_reference_tokens_strips_clone_suffix_and_skips_wildcards() -> N
     assert "Resource A" in tokens
     assert "Load Balancer" in tokens
     assert "Port *" not in tokens
+
+
+def test_repeated_reference_strings_are_parsed_once_and_shared() -> None:
+    clear_reference_cache()
+
+    first = parse_reference_components("[*.internal], api, db")
+    assert extract_reference_tokens("[*.internal], api, db") == {"api", "db"}
+    assert contains_identifier("[*.internal], api, db", "*.internal")
+    assert parse_reference_components("[*.internal], api, db") is first
+
+    stats = reference_cache_stats()
+    assert (stats.hits, stats.misses, stats.size) == (3, 1, 1)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first[0].token = "changed"  # type: ignore[misc]
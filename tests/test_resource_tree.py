@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import time
+
+from ilograph_cli.core.resource_tree import ResourceTree
+from ilograph_cli.core.yaml_types import YamlMapping
+
+_DOCUMENT: YamlMapping = {
+    "resources": [
+        {
+            "id": "platform",
+            "children": [
+                {"id": "api", "children": [{"name": "Handler"}]},
+                {"id": "db", "name": "Database"},
+            ],
+        },
+        {"id": "edge", "children": [{"name": "Handler"}]},
+        {"id": "shared"},
+    ]
+}
+
+
+def _paths(tree: ResourceTree, part: str, anchor: YamlMapping | None = None) -> list[str]:
+    return [tree.location(node).path for node in tree.resolve(part, anchor=anchor).nodes]
+
+
+def test_absolute_paths_walk_children_by_id_or_name() -> None:
+    tree = ResourceTree(_DOCUMENT)
+
+    assert _paths(tree, "platform/api/Handler") == ["resources[0].children[0].children[0]"]
+    assert _paths(tree, "platform/Database") == ["resources[0].children[1]"]
+    assert tree.resolve("Handler").status == "ambiguous"
+
+    missing = tree.resolve("edge/db")
+    assert missing.status == "unresolved"
+    assert [len(step) for step in missing.steps] == [1, 0]
+
+
+def test_relative_paths_start_from_the_anchor() -> None:
+    tree = ResourceTree(_DOCUMENT)
+    (handler,) = tree.resolve("api/Handler").nodes
+
+    assert tree.resolve("../db", anchor=handler).status == "unresolved"
+    assert _paths(tree, "../../db", anchor=handler) == ["resources[0].children[1]"]
+    assert _paths(tree, ".../shared", anchor=handler) == ["resources[2]"]
+    assert _paths(tree, ".../api/Handler", anchor=handler) == [
+        "resources[0].children[0].children[0]"
+    ]
+    assert tree.resolve("../../../../db", anchor=handler).status == "unresolved"
+    assert tree.resolve("../db").status == "relative"
+
+
+def test_wide_trees_resolve_each_step_by_lookup() -> None:
+    width = 20_000
+    document: YamlMapping = {
+        "resources": [
+            {"id": f"group{g}", "children": [{"id": f"g{g}-r{n}"} for n in range(width // 10)]}
+            for g in range(10)
+        ]
+    }
+    tree = ResourceTree(document)
+
+    started = time.perf_counter()
+    for n in range(width // 10):
+        assert tree.resolve(f"group9/g9-r{n}").status == "resolved"
+        assert tree.resolve(f"group0/g9-r{n}").status == "unresolved"
+    elapsed = time.perf_counter() - started
+
+    # Scanning siblings per step is quadratic here.
+    assert elapsed < 2
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from copy import deepcopy
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from ilograph_cli import cli_support
+from ilograph_cli.cli import app
+from ilograph_cli.core.structural_hash import structural_digest
+from ilograph_cli.io.yaml_io import parse_document
+from ilograph_cli.io.yaml_tracking import track_mutations
+
+runner = CliRunner()
+
+_DIAGRAM = """\
+resources:
+  - id: api  # public entry
+    name: "API"
+  - id: db
+perspectives:
+  - id: Runtime
+    relations:
+      - from: api
+        to: db
+        label: reads
+"""
+
+
+def test_digest_covers_data_but_not_presentation() -> None:
+    document = parse_document(_DIAGRAM, path=Path("diagram.yaml"))
+    plain = {
+        "resources": [{"id": "api", "name": "API"}, {"id": "db"}],
+        "perspectives": [
+            {"id": "Runtime", "relations": [{"from": "api", "to": "db", "label": "reads"}]}
+        ],
+    }
+
+    assert structural_digest(document) == structural_digest(plain)
+    assert structural_digest({"a": 1, "b": 2}) != structural_digest({"b": 2, "a": 1})
+    assert structural_digest(["1"]) != structural_digest([1])
+    assert structural_digest([True]) != structural_digest([1])
+    assert structural_digest([[], ["x"]]) != structural_digest([["x"], []])
+
+    deep: list[object] = []
+    node = deep
+    for _ in range(10_000):
+        node.append([])
+        node = node[0]  # type: ignore[assignment]
+    assert structural_digest(deep) != structural_digest([])
+
+
+def test_log_tells_rewrites_of_equal_data_from_changes() -> None:
+    document = parse_document(_DIAGRAM, path=Path("diagram.yaml"))
+    relations = document["perspectives"][0]["relations"]
+
+    with track_mutations() as rewritten:
+        relations[0]["label"] = "reads"
+        document["resources"][0]["name"] = "API"
+        relations.append(relations.pop(0))
+    assert rewritten.nodes and rewritten.is_noop()
+
+    with track_mutations() as relabeled:
+        relations[0]["label"] = "writes"
+        relations[0]["label"] = "reads"
+        del relations[0]["to"]
+    assert not relabeled.is_noop()
+
+    # A loaded node replaced by an equal copy only matches itself.
+    document = parse_document(_DIAGRAM, path=Path("diagram.yaml"))
+    with track_mutations() as replaced:
+        document["resources"][1] = deepcopy(document["resources"][1])
+    assert not replaced.is_noop()
+
+
+def test_runner_reports_no_changes_without_dumping(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    diagram = tmp_path / "diagram.yaml"
+    diagram.write_text(_DIAGRAM, encoding="utf-8")
+    ops = tmp_path / "ops.yaml"
+    ops.write_text(
+        "ops:\n"
+        "  - op: relation.add\n"
+        "    perspective: Runtime\n"
+        "    from: db\n"
+        "    to: api\n"
+        "  - op: relation.remove\n"
+        "    perspective: Runtime\n"
+        "    index: 2\n",
+        encoding="utf-8",
+    )
+
+    def _unexpected(*args: object, **kwargs: object) -> None:
+        raise AssertionError("a no-op mutation was validated or serialized")
+
+    monkeypatch.setattr(cli_support, "emit_document", _unexpected)
+    monkeypatch.setattr(cli_support, "_validate_for_write", _unexpected)
+    result = runner.invoke(app, ["apply", "--file", str(diagram), "--ops", str(ops)])
+
+    assert result.exit_code == 0, result.output
+    assert "no changes (document already matches requested state)" in result.output
+    assert diagram.read_text(encoding="utf-8") == _DIAGRAM
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from ilograph_cli.core.index import DocumentIndex, build_resource_locations
+from ilograph_cli.core.reference_fields import iter_reference_fields
+from ilograph_cli.core.traversal import iter_containers, walk_preorder
+from ilograph_cli.core.validation_snapshot import ValidationSnapshot
+from ilograph_cli.core.validators import validate_document
+from ilograph_cli.core.yaml_types import YamlMapping
+from ilograph_cli.io.yaml_io import parse_document, parse_document_readonly
+
+
+def test_walk_preorder_expands_each_item_after_yielding_it() -> None:
+    tree = {"a": ["b", "c"], "b": ["d"], "c": [], "d": []}
+    seen: list[str] = []
+
+    for item in walk_preorder(["a", "e"], lambda item: tree.get(item)):
+        seen.append(item)
+        if item == "c":
+            tree["c"] = ["added"]
+
+    assert seen == ["a", "b", "d", "c", "added", "e"]
+    assert [type(node).__name__ for node in iter_containers({"x": [{"y": 1}, 2], "z": {}})] == [
+        "dict",
+        "list",
+        "dict",
+        "dict",
+    ]
+
+
+def _deep_document(depth: int, chains: int) -> YamlMapping:
+    resources: list[YamlMapping] = []
+    steps: list[YamlMapping] = []
+    for chain in range(chains):
+        node: YamlMapping = {"id": f"c{chain}-0", "instanceOf": "Base"}
+        step: YamlMapping = {"to": f"c{chain}-0"}
+        resources.append(node)
+        steps.append(step)
+        for level in range(1, depth):
+            child: YamlMapping = {"id": f"c{chain}-{level}", "instanceOf": "Base"}
+            node["children"] = [child]
+            node = child
+            nested: YamlMapping = {"to": f"c{chain}-{level}"}
+            step["subSequence"] = {"steps": [nested]}
+            step = nested
+    return {
+        "resources": resources,
+        "perspectives": [{"id": "Flow", "sequence": {"start": "c0-0", "steps": steps}}],
+    }
+
+
+def test_deep_nesting_walks_every_level_in_order() -> None:
+    depth, chains = 5_000, 2
+    document = _deep_document(depth, chains)
+
+    locations = build_resource_locations(document)
+    fields = list(iter_reference_fields(document))
+    index = DocumentIndex(document)
+    deepest = locations[depth - 1]
+
+    assert len(locations) == depth * chains
+    assert len(fields) == 2 * depth * chains + 1
+    assert deepest.path == "resources[0]" + ".children[0]" * (depth - 1)
+    assert fields[-1].path.endswith(".subSequence.steps[0].to")
+    assert index.is_descendant(deepest.node, ancestor=locations[0].node)
+    assert sum(1 for _ in index.explicit_ids_below(locations[0].node)) == depth - 1
+    assert ValidationSnapshot(document).ok
+    assert not validate_document(document, mode="strict").issues
+
+
+def _deep_yaml(depth: int, steps: int) -> str:
+    lines = ["resources:"]
+    indent = "  "
+    for level in range(depth):
+        lines.append(f"{indent}- id: r{level}")
+        if level < depth - 1:
+            lines.append(f"{indent}  children:")
+            indent += "    "
+    lines += ["perspectives:", "  - id: Flow", "    sequence:", "      start: r0", "      steps:"]
+    indent = "        "
+    for level in range(steps):
+        lines.append(f"{indent}- to: r{depth - 1 - level}")
+        if level < steps - 1:
+            lines += [f"{indent}  subSequence:", f"{indent}    steps:"]
+            indent += "      "
+    return "\n".join(lines) + "\n"
+
+
+@pytest.mark.parametrize("loader", [parse_document, parse_document_readonly])
+def test_deep_yaml_file_parses_and_walks_end_to_end(
+    tmp_path: Path, loader: Callable[..., YamlMapping]
+) -> None:
+    # As deep as ruamel's own recursive composer/constructor allows under pytest.
+    depth, steps = 100, 60
+    diagram = tmp_path / "diagram.yaml"
+    diagram.write_text(_deep_yaml(depth, steps), encoding="utf-8")
+
+    document = loader(diagram.read_text(encoding="utf-8"), path=diagram)
+    locations = build_resource_locations(document)
+    fields = list(iter_reference_fields(document))
+
+    assert [location.node["id"] for location in locations] == [f"r{n}" for n in range(depth)]
+    assert locations[-1].path == "resources[0]" + ".children[0]" * (depth - 1)
+    assert [field.value for field in fields] == ["r0", *(f"r{depth - 1 - n}" for n in range(steps))]
+    assert fields[-1].path.endswith(".subSequence.steps[0].to")
+    assert ValidationSnapshot(document).ok
+    assert not validate_document(document, mode="strict").issues
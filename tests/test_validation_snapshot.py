@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Callable
+from pathlib import Path
+
+from ruamel.yaml.comments import CommentedMap
+
+from ilograph_cli.core.validation_snapshot import ValidationSnapshot
+from ilograph_cli.core.validators import UnitKey, ValidationIssue, validate_document
+from ilograph_cli.core.yaml_types import YamlMapping
+from ilograph_cli.io.yaml_io import dump_document, parse_document
+from ilograph_cli.io.yaml_tracking import SectionLayout, track_mutations
+
+_DIAGRAM = """\
+resources:
+  - id: platform
+    children:
+      - id: api
+      - id: db
+  - id: edge
+    children:
+      - id: cdn
+        name: d111.cloudfront.net
+  - id: shared
+perspectives:
+  - id: Runtime
+    relations:
+      - from: platform/api
+        to: db
+  - id: Edge
+    relations:
+      - from: cdn
+        to: "[*.cloudfront.net]"
+  - id: Notes
+    relations:
+      - from: shared
+        to: edge
+        label: hello
+"""
+
+
+def _document(text: str = _DIAGRAM) -> CommentedMap:
+    return parse_document(text, path=Path("diagram.yaml"))
+
+
+def _issues(issues: list[ValidationIssue]) -> Counter[tuple[str, str]]:
+    return Counter((issue.code, issue.path) for issue in issues)
+
+
+def _assert_matches_full_run(snapshot: ValidationSnapshot, document: YamlMapping) -> None:
+    full = validate_document(document, mode="strict").issues
+    assert _issues(snapshot.issues()) == _issues(full)
+    assert snapshot.ok == (not full)
+
+
+def _edit(
+    document: CommentedMap,
+    snapshot: ValidationSnapshot,
+    edit: Callable[[CommentedMap], None],
+) -> tuple[CommentedMap, list[UnitKey]]:
+    # Each CLI invocation mutates a freshly loaded document, so reload first.
+    document = _document(dump_document(document))
+    layout = SectionLayout(document)
+    with track_mutations() as mutations:
+        edit(document)
+    return document, snapshot.update(document, layout.touched_units(mutations))
+
+
+def test_an_edit_inside_one_perspective_rechecks_only_that_perspective() -> None:
+    document = _document()
+    snapshot = ValidationSnapshot(document)
+    assert snapshot.ok
+
+    def relabel(doc: CommentedMap) -> None:
+        doc["perspectives"][2]["relations"][0]["label"] = "bye"
+
+    document, rechecked = _edit(document, snapshot, relabel)
+    assert rechecked == [("perspectives", 2)]
+    _assert_matches_full_run(snapshot, document)
+
+
+def test_changed_definitions_recheck_the_perspectives_that_reference_them() -> None:
+    document = _document()
+    snapshot = ValidationSnapshot(document)
+
+    def rename_db(doc: CommentedMap) -> None:
+        doc["resources"][0]["children"][1]["id"] = "database"
+
+    document, rechecked = _edit(document, snapshot, rename_db)
+    assert rechecked == [("resources", 0), ("perspectives", 0)]
+    broken = ("broken-reference", "perspectives[0].relations[0].to")
+    assert _issues(snapshot.issues()) == {broken: 1}
+    _assert_matches_full_run(snapshot, document)
+
+    def move_api(doc: CommentedMap) -> None:
+        api = doc["resources"][0]["children"].pop(0)
+        doc["resources"][2]["children"] = [api]
+
+    document, _ = _edit(document, snapshot, move_api)
+    assert ("unresolved-path", "perspectives[0].relations[0].from") in _issues(snapshot.issues())
+    _assert_matches_full_run(snapshot, document)
+
+    def drop_cdn_name(doc: CommentedMap) -> None:
+        del doc["resources"][1]["children"][0]["name"]
+
+    document, rechecked = _edit(document, snapshot, drop_cdn_name)
+    assert ("perspectives", 1) in rechecked
+    assert ("unmatched-wildcard", "perspectives[1].relations[0].to") in _issues(snapshot.issues())
+    _assert_matches_full_run(snapshot, document)
+
+
+def test_duplicates_and_added_or_removed_units_stay_in_step() -> None:
+    document = _document()
+    snapshot = ValidationSnapshot(document)
+
+    def add_units(doc: CommentedMap) -> None:
+        doc["resources"].append({"id": "api"})
+        doc["perspectives"].append({"id": "Runtime", "relations": [{"from": "api", "to": "x"}]})
+
+    document, rechecked = _edit(document, snapshot, add_units)
+    assert ("resources", 3) in rechecked and ("perspectives", 3) in rechecked
+    assert _issues(snapshot.issues())[("duplicate-resource-id", "resources[3]")] == 1
+    _assert_matches_full_run(snapshot, document)
+
+    def remove_units(doc: CommentedMap) -> None:
+        doc["resources"].pop()
+        doc["perspectives"].pop()
+
+    document, _ = _edit(document, snapshot, remove_units)
+    assert snapshot.ok
+    _assert_matches_full_run(snapshot, document)
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterator
+
+from ilograph_cli.core.index import ResourceLocation
+from ilograph_cli.core.reference_fields import FieldPath, ReferenceField
+from ilograph_cli.core.validators import (
+    DocumentFacts,
+    ValidationIssue,
+    ValidationRule,
+    run_rules,
+    unknown_rule_names,
+    validate_document,
+)
+from ilograph_cli.core.yaml_types import YamlMapping
+
+
+class _CountingDict(dict[str, object]):
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        super().__init__(*args, **kwargs)
+        self.reads: Counter[str] = Counter()
+
+    def get(self, key: str, default: object = None) -> object:
+        self.reads[key] += 1
+        return super().get(key, default)
+
+
+class _Recorder(ValidationRule):
+    name = "seen"
+    summary = "records the walk"
+    needs = frozenset({"resources", "aliases", "references"})
+
+    def __init__(self) -> None:
+        super().__init__(mode="strict")
+        self.events: list[str] = []
+
+    def visit_resource(
+        self,
+        location: ResourceLocation,
+        facts: DocumentFacts,
+    ) -> Iterator[ValidationIssue]:
+        self.events.append(f"resource {location.identifier}")
+        return iter(())
+
+    def visit_alias(
+        self,
+        path: FieldPath,
+        alias: YamlMapping,
+        facts: DocumentFacts,
+    ) -> Iterator[ValidationIssue]:
+        self.events.append(f"alias {path}")
+        return iter(())
+
+    def visit_reference(
+        self,
+        field: ReferenceField,
+        aliases: set[str],
+        facts: DocumentFacts,
+    ) -> Iterator[ValidationIssue]:
+        self.events.append(f"reference {field.path} {sorted(aliases)}")
+        return iter(())
+
+    def finish(self, facts: DocumentFacts) -> Iterator[ValidationIssue]:
+        yield ValidationIssue(code="seen", path="-", message=str(len(self.events)))
+
+
+def _document() -> _CountingDict:
+    return _CountingDict(
+        {
+            "resources": [{"id": "api", "children": [{"id": "db"}]}],
+            "perspectives": [
+                {
+                    "id": "Runtime",
+                    "aliases": [{"alias": "data", "for": "db"}],
+                    "relations": [{"from": "api", "to": "data"}, {"from": "ghost", "to": "db"}],
+                }
+            ],
+        }
+    )
+
+
+def test_all_rules_share_one_walk_of_the_document() -> None:
+    document = _document()
+    first, second = _Recorder(), _Recorder()
+
+    result = run_rules(document, [first, second])
+
+    assert (
+        first.events
+        == second.events
+        == [
+            "resource api",
+            "resource db",
+            "alias perspectives[0].aliases[0]",
+            "reference perspectives[0].relations[0].from ['data']",
+            "reference perspectives[0].relations[0].to ['data']",
+            "reference perspectives[0].relations[1].from ['data']",
+            "reference perspectives[0].relations[1].to ['data']",
+            "reference perspectives[0].aliases[0].for ['data']",
+        ]
+    )
+    assert [issue.code for issue in result.issues] == ["seen", "seen"]
+    assert [(cost.name, cost.issues) for cost in result.costs] == [("seen", 1), ("seen", 1)]
+    assert document.reads["resources"] == document.reads["perspectives"] == 1
+
+
+def test_strict_validation_walks_the_document_once() -> None:
+    document = _document()
+
+    issues = validate_document(document, mode="strict").issues
+
+    assert [(issue.code, issue.path) for issue in issues] == [
+        ("broken-reference", "perspectives[0].relations[1].from"),
+    ]
+    assert document.reads["resources"] == document.reads["perspectives"] == 1
+
+
+def test_deselected_rules_and_the_walk_parts_only_they_need_never_run() -> None:
+    document = _document()
+
+    result = validate_document(document, mode="strict", only_rules={"duplicate-resource-id"})
+
+    assert result.issues == []
+    assert [cost.name for cost in result.costs] == ["duplicate-resource-id"]
+    assert document.reads["perspectives"] == 0
+
+
+def test_ignored_rules_drop_out_of_the_run() -> None:
+    result = validate_document(_document(), mode="strict", ignore_rules={"broken-reference"})
+
+    assert result.issues == []
+    assert "broken-reference" not in {cost.name for cost in result.costs}
+
+
+def test_unknown_rule_names_select_nothing() -> None:
+    result = validate_document(_document(), only_rules={"nope"}, ignore_rules={"gone"})
+
+    assert result.issues == []
+    assert result.costs == []
+    assert unknown_rule_names({"nope", "broken-reference", "gone"}) == ["gone", "nope"]
+
+
+def _noisy_document(count: int) -> _CountingDict:
+    return _CountingDict(
+        {
+            "resources": [{"id": "api"}],
+            "perspectives": [
+                {"id": f"p{n}", "relations": [{"from": "api", "to": f"ghost{n}"}]}
+                for n in range(count)
+            ],
+        }
+    )
+
+
+def test_max_issues_stops_the_walk_early() -> None:
+    document = _noisy_document(50)
+
+    result = validate_document(document, mode="strict", max_issues=3)
+
+    assert [issue.path for issue in result.issues] == [
+        f"perspectives[{n}].relations[0].to" for n in range(3)
+    ]
+    assert not result.complete
+    assert validate_document(_noisy_document(50), mode="strict").complete
+
+
+def test_duplicates_are_reported_on_the_second_sighting() -> None:
+    document: YamlMapping = {
+        "resources": [{"id": "a"}, {"id": "b"}, {"id": "a"}, {"id": "b"}, {"id": "a"}]
+    }
+
+    issues = validate_document(document, only_rules={"duplicate-resource-id"}).issues
+
+    assert [issue.path for issue in issues] == [
+        "resources[0]",
+        "resources[2]",
+        "resources[1]",
+        "resources[3]",
+        "resources[4]",
+    ]
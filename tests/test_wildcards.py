@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import re
+import time
+
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from ilograph_cli.core.wildcards import WildcardIndex
+
+_PIECES = ["a", "b", ".", "-", "ab", "*"]
+_TEXT = st.lists(st.sampled_from(_PIECES), max_size=6).map("".join)
+
+
+def _brute_force(identifiers: list[str], token: str) -> list[str]:
+    regex = ".*".join(re.escape(piece) for piece in token.split("*"))
+    return sorted({item for item in identifiers if re.fullmatch(regex, item, re.DOTALL)})
+
+
+@settings(max_examples=400, deadline=None)
+@given(
+    identifiers=st.lists(_TEXT.filter(lambda text: "*" not in text), max_size=20),
+    token=_TEXT,
+)
+def test_index_matches_brute_force_scan(identifiers: list[str], token: str) -> None:
+    index = WildcardIndex(identifiers)
+
+    expected = _brute_force(identifiers, token)
+    assert index.matches(token) == expected
+    assert index.any_match(token) == bool(expected)
+
+
+def test_anchored_patterns_stay_fast_on_large_diagrams() -> None:
+    index = WildcardIndex(
+        identifier for n in range(50_000) for identifier in (f"svc-{n}.internal", f"Service {n}")
+    )
+
+    started = time.perf_counter()
+    for n in range(2_000):
+        assert index.matches(f"svc-{n}*")
+        assert index.any_match(f"*-{n}.internal")
+        assert not index.any_match(f"svc-{n}*.external")
+    elapsed = time.perf_counter() - started
+
+    assert index.matches("svc-4999*.internal") == [
+        "svc-4999.internal",
+        *(f"svc-4999{d}.internal" for d in range(10)),
+    ]
+    # A linear scan per pattern takes tens of seconds here.
+    assert elapsed < 5
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import copy
+import io
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from rich.console import Console
+from ruamel.yaml.comments import CommentedMap
+
+from ilograph_cli.cli_support import MutationRunner, OutputSink
+from ilograph_cli.io import yaml_incremental
+from ilograph_cli.io.yaml_incremental import emit_document, emit_incremental
+from ilograph_cli.io.yaml_io import dump_document, parse_document, scan_source
+from ilograph_cli.io.yaml_style import restore_style_only_replacements
+from ilograph_cli.io.yaml_tracking import track_mutations
+
+_PATH = Path("diagram.yaml")
+_DIAGRAM = (
+    "# diagram\n"
+    "resources:\n"
+    "  - id: app\n"
+    "    name:    App   # odd spacing stays untouched\n"
+    "  - id: db\n"
+    "    name: DB\n"
+    "    style: {color: red,  icon: db}\n"
+    "perspectives:\n"
+    "  # leading comment\n"
+    "  - id: Runtime\n"
+    "    relations:\n"
+    "      - from: app\n"
+    "        to: db  # inline\n"
+    "      # after relations\n"
+    "  - name: Flow\n"
+    "    relations:\n"
+    "      - from: db\n"
+    "        to: app\n"
+)
+
+
+def _load(raw: str) -> CommentedMap:
+    scanned = scan_source(raw)
+    return parse_document(
+        raw,
+        path=_PATH,
+        format_profile=scanned.format_profile,
+        scanned=scanned,
+    )
+
+
+def _full_emit(document: CommentedMap, raw: str) -> str:
+    dumped = dump_document(document, format_profile=scan_source(raw).format_profile)
+    return restore_style_only_replacements(raw, dumped)
+
+
+def test_one_field_change_dumps_only_its_mapping(monkeypatch: pytest.MonkeyPatch) -> None:
+    document = _load(_DIAGRAM)
+    dumped: list[str] = []
+
+    def _recording(*args: object, **kwargs: object) -> str:
+        text = dump_document(*args, **kwargs)  # type: ignore[arg-type]
+        dumped.append(text)
+        return text
+
+    monkeypatch.setattr(yaml_incremental, "dump_document", _recording)
+    with track_mutations() as mutations:
+        document["perspectives"][1]["relations"][0]["to"] = "db"
+
+    patched = emit_incremental(document, _DIAGRAM, mutations=mutations)
+
+    assert patched == _DIAGRAM.replace("        to: app\n", "        to: db\n")
+    assert dumped
+    assert all("App" not in text and "Runtime" not in text for text in dumped)
+
+
+def test_appended_item_keeps_comments_and_untouched_sections() -> None:
+    document = _load(_DIAGRAM)
+    with track_mutations() as mutations:
+        relations = document["perspectives"][0]["relations"]
+        relations.append(CommentedMap([("from", "db"), ("to", "app")]))
+
+    patched = emit_incremental(document, _DIAGRAM, mutations=mutations)
+
+    assert patched is not None
+    assert "    name:    App   # odd spacing stays untouched\n" in patched
+    # The full dump re-spaces `resources`; the edited section must match it exactly.
+    full = _full_emit(document, _DIAGRAM)
+    assert patched.partition("perspectives:")[2] == full.partition("perspectives:")[2]
+
+
+def test_flow_collection_is_reemitted_from_its_block_parent() -> None:
+    document = _load(_DIAGRAM)
+    with track_mutations() as mutations:
+        document["resources"][1]["style"]["color"] = "blue"
+
+    patched = emit_incremental(document, _DIAGRAM, mutations=mutations)
+
+    assert patched == _DIAGRAM.replace(
+        "    style: {color: red,  icon: db}\n",
+        "    style: {color: blue, icon: db}\n",
+    )
+
+
+def test_fresh_and_copied_nodes_are_not_tracked() -> None:
+    document = _load(_DIAGRAM)
+    with track_mutations() as mutations:
+        clone = copy.deepcopy(document["perspectives"][0])
+        clone["id"] = "Clone"
+        fresh = CommentedMap()
+        fresh["id"] = "Fresh"
+
+    assert mutations.nodes == {}
+    assert emit_incremental(document, _DIAGRAM, mutations=mutations) == _DIAGRAM
+
+
+_SECTIONS = (
+    "perspectives:\n"
+    "  - id: Runtime\n"
+    "    relations:\n"
+    "      - from: app\n"
+    "        to: db\n"
+    "\n"
+    "  - id: Empty\n"
+    "    relations: []\n"
+    "    walkthrough: []\n"
+    "\n"
+    "contexts:\n"
+    "  - name: Default\n"
+)
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        pytest.param(
+            lambda document: document["perspectives"][1]["walkthrough"].append(
+                CommentedMap([("select", "app")])
+            ),
+            id="walkthrough-add",
+        ),
+        pytest.param(
+            lambda document: document["perspectives"][1].__setitem__("id", "Flow"),
+            id="id-change",
+        ),
+        pytest.param(
+            lambda document: document["perspectives"][0]["relations"].append(
+                CommentedMap([("from", "db"), ("to", "app")])
+            ),
+            id="relation-add-before-blank",
+        ),
+    ],
+)
+def test_blank_lines_between_sections_match_the_full_dump(
+    mutate: Callable[[CommentedMap], object],
+) -> None:
+    document = _load(_SECTIONS)
+    with track_mutations() as mutations:
+        mutate(document)
+
+    patched = emit_incremental(document, _SECTIONS, mutations=mutations)
+
+    assert patched is not None
+    assert patched == _full_emit(document, _SECTIONS)
+
+
+@pytest.mark.parametrize(
+    ("raw", "mutate"),
+    [
+        pytest.param(
+            _DIAGRAM.replace("    name: DB\n", "    name: &db DB\n"),
+            lambda document: document["resources"][0].__setitem__("name", "A"),
+            id="anchors",
+        ),
+        pytest.param(
+            _DIAGRAM.replace("\n", "\r\n"),
+            lambda document: document["resources"][0].__setitem__("name", "A"),
+            id="crlf",
+        ),
+        pytest.param(
+            _DIAGRAM,
+            lambda document: document.__setitem__("contexts", []),
+            id="root-key-added",
+        ),
+        pytest.param(
+            _DIAGRAM,
+            lambda document: document["perspectives"][0]["relations"].pop(0),
+            id="comment-removed",
+        ),
+        pytest.param(
+            _SECTIONS,
+            lambda document: document["perspectives"][0]["relations"].pop(),
+            id="blank-line-removed",
+        ),
+    ],
+)
+def test_incremental_emit_falls_back_to_full_dump(
+    raw: str,
+    mutate: Callable[[CommentedMap], object],
+) -> None:
+    document = _load(raw)
+    with track_mutations() as mutations:
+        mutate(document)
+
+    assert emit_incremental(document, raw, mutations=mutations) is None
+    emitted = emit_document(
+        document,
+        raw,
+        mutations=mutations,
+        format_profile=scan_source(raw).format_profile,
+    )
+    assert emitted == _full_emit(document, raw)
+
+
+def _nested_resources(depth: int) -> str:
+    lines = ["resources:"]
+    indent = "  "
+    for level in range(depth):
+        lines.append(f"{indent}- id: r{level}")
+        if level < depth - 1:
+            lines.append(f"{indent}  children:")
+            indent += "    "
+    return "\n".join(lines) + "\n"
+
+
+def test_deep_resource_tree_mutates_through_the_runner(tmp_path: Path) -> None:
+    depth = 100
+    raw = _nested_resources(depth)
+    diagram = tmp_path / "diagram.yaml"
+    diagram.write_text(raw, encoding="utf-8")
+    console = Console(file=io.StringIO())
+    runner = MutationRunner(console=console, output=OutputSink(console=console))
+
+    def rename_deepest(document: CommentedMap) -> bool:
+        node = document["resources"][0]
+        for _ in range(depth - 1):
+            node = node["children"][0]
+        node["name"] = "Leaf"
+        return True
+
+    # Loading must not add stack frames per level on top of ruamel's own.
+    runner.run(file_path=diagram, dry_run=False, diff_mode="none", mutator=rename_deepest)
+
+    after = diagram.read_text(encoding="utf-8")
+    assert after.startswith(raw)
+    assert after.endswith(f"- id: r{depth - 1}\n" + " " * (4 * depth) + "name: Leaf\n")
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from ilograph_cli import cli_support
+from ilograph_cli.cli import app
+from ilograph_cli.io.yaml_io import parse_document
+from ilograph_cli.io.yaml_sections import (
+    scope_perspective,
+    scope_sections,
+    split_scoped_source,
+)
+
+runner = CliRunner()
+
+_DIAGRAM = (
+    "# diagram\n"
+    "resources:\n"
+    "  - id: app\n"
+    "    name:    App   # odd spacing stays untouched\n"
+    "  - id: db\n"
+    "    name: DB\n"
+    "perspectives:\n"
+    "  - id: Runtime\n"
+    "    relations:\n"
+    "      - from: app\n"
+    "        to: db\n"
+    "  # between perspectives\n"
+    "  - name: Flow\n"
+    "    relations:\n"
+    "      - from: db\n"
+    "        to: app\n"
+    "contexts:\n"
+    "  - name: prod\n"
+)
+
+
+def _record_parsed_texts(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    parsed: list[str] = []
+
+    def _recording(raw_text: str, **kwargs: object) -> object:
+        parsed.append(raw_text)
+        return parse_document(raw_text, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(cli_support, "parse_document", _recording)
+    return parsed
+
+
+def _run_full(monkeypatch: pytest.MonkeyPatch, args: list[str]) -> str:
+    with monkeypatch.context() as patch:
+        patch.setattr(cli_support, "split_scoped_source", lambda raw, scope: None)
+        result = runner.invoke(app, args)
+    assert result.exit_code == 0, result.output
+    return result.output
+
+
+def test_perspective_item_scope_parses_only_target_item(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    scoped_file = tmp_path / "scoped.yaml"
+    full_file = tmp_path / "full.yaml"
+    scoped_file.write_text(_DIAGRAM, encoding="utf-8")
+    full_file.write_text(_DIAGRAM, encoding="utf-8")
+    args = ["relation", "add", "--perspective", "Flow", "--from", "app", "--to", "db"]
+
+    parsed = _record_parsed_texts(monkeypatch)
+    result = runner.invoke(app, [*args[:2], "--file", str(scoped_file), *args[2:]])
+    assert result.exit_code == 0, result.output
+
+    assert parsed == [
+        "perspectives:\n  - name: Flow\n    relations:\n      - from: db\n        to: app\n"
+    ]
+    assert scoped_file.read_text(encoding="utf-8") == _DIAGRAM.replace(
+        "        to: app\n",
+        "        to: app\n      - from: app\n        to: db\n",
+    )
+
+    _run_full(monkeypatch, [*args[:2], "--file", str(full_file), *args[2:]])
+    assert full_file.read_text(encoding="utf-8") == scoped_file.read_text(encoding="utf-8")
+
+
+def test_section_scope_keeps_other_sections_verbatim(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    diagram = tmp_path / "diagram.yaml"
+    diagram.write_text(_DIAGRAM, encoding="utf-8")
+
+    parsed = _record_parsed_texts(monkeypatch)
+    result = runner.invoke(
+        app,
+        ["context", "create", "--file", str(diagram), "--name", "stage", "--extends", "prod"],
+    )
+    assert result.exit_code == 0, result.output
+
+    assert parsed == ["contexts:\n  - name: prod\n"]
+    assert diagram.read_text(encoding="utf-8") == (
+        _DIAGRAM + "  - name: stage\n    extends: prod\n"
+    )
+
+
+def test_scoped_mutation_still_validates_against_whole_document(tmp_path: Path) -> None:
+    diagram = tmp_path / "diagram.yaml"
+    diagram.write_text(_DIAGRAM, encoding="utf-8")
+
+    result = runner.invoke(
+        app,
+        [
+            "relation",
+            "add",
+            "--file",
+            str(diagram),
+            "--perspective",
+            "Runtime",
+            "--from",
+            "app",
+            "--to",
+            "missing",
+        ],
+    )
+
+    assert result.exit_code == 1
+    assert "mutation would produce invalid document" in result.output
+    assert diagram.read_text(encoding="utf-8") == _DIAGRAM
+
+
+def test_split_falls_back_when_sections_cannot_be_isolated() -> None:
+    anchored = _DIAGRAM.replace("    name: DB\n", "    name: &db DB\n")
+    assert split_scoped_source(anchored, scope_sections("perspectives")) is None
+    assert split_scoped_source("%YAML 1.2\n---\n" + _DIAGRAM, scope_sections("contexts")) is None
+    assert split_scoped_source(_DIAGRAM, scope_sections("imports")) is None
+
+
+def test_split_uses_whole_section_when_item_is_ambiguous() -> None:
+    duplicated = _DIAGRAM.replace("  - name: Flow\n", "  - name: Runtime\n")
+
+    scoped = split_scoped_source(duplicated, scope_perspective("Runtime"))
+
+    assert scoped is not None
+    assert scoped.item_index is None
+    assert scoped.editable_text().startswith("perspectives:\n  - id: Runtime\n")
+    assert scoped.editable_text().endswith("        to: app\n")
+
+
+def test_split_locates_indentless_quoted_perspective_item() -> None:
+    raw = (
+        "resources:\n"
+        "- id: app\n"
+        "perspectives:\n"
+        "- id: 'Other'\n"
+        "- name: Runtime\n"
+        '  id: "Main view"\n'
+        "  relations: []\n"
+    )
+
+    scoped = split_scoped_source(raw, scope_perspective("Main view"))
+
+    assert scoped is not None
+    assert scoped.item_index == 1
+    assert scoped.editable_text() == (
+        'perspectives:\n- name: Runtime\n  id: "Main view"\n  relations: []\n'
+    )
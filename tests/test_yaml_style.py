@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from copy import deepcopy
+from pathlib import Path
+
+import pytest
+from ruamel.yaml.comments import CommentedMap
+
+from ilograph_cli.io import yaml_style
+from ilograph_cli.io.yaml_io import dump_document, parse_document
+from ilograph_cli.io.yaml_style import restore_document_anchors, snapshot_document_anchors
+from ilograph_cli.io.yaml_tracking import anchored_nodes, track_mutations
+
+_DIAGRAM = """\
+resources:
+  - id: base
+    style: &boxed
+      color: red
+  - id: app
+    name: &app-name App
+    style: *boxed
+  - id: db
+perspectives:
+  - id: Runtime
+    relations:
+      - from: app
+        to: db
+"""
+
+
+def test_loader_registers_only_anchored_nodes() -> None:
+    document = parse_document(_DIAGRAM, path=Path("diagram.yaml"))
+
+    registry = anchored_nodes(document)
+
+    assert registry == [document["resources"][0]["style"], "App"]
+    assert registry[0] is document["resources"][1]["style"]
+    assert anchored_nodes(CommentedMap()) is None
+
+
+def test_restore_checks_registry_and_changed_nodes_only(monkeypatch: pytest.MonkeyPatch) -> None:
+    document = parse_document(_DIAGRAM, path=Path("diagram.yaml"))
+
+    def _no_sweep(node: object) -> list[object]:
+        raise AssertionError("full-document anchor sweep")
+
+    monkeypatch.setattr(yaml_style, "_iter_yaml_nodes", _no_sweep)
+    snapshot = snapshot_document_anchors(document)
+    with track_mutations() as mutations:
+        resources = document["resources"]
+        resources.append(deepcopy(resources[0]))
+        resources[2]["style"] = resources[0]["style"]
+    restore_document_anchors(document, snapshot, mutations=mutations)
+
+    dumped = dump_document(document)
+    assert dumped.count("&boxed") == 1
+    assert dumped.count("&app-name") == 1
+    assert "    style: *boxed\n  - id: db\n    style: *boxed\n" in dumped
+    assert "  - id: base\n    style:\n      color: red\n" in dumped